@@ -12,11 +12,14 @@ from app.database import Base
 # Importar todos os modelos para que o Alembic os detecte
 from app.models import (
     avaliacao,
+    chave_idempotencia,
     ciclo,
     ciclo_avaliacao,
     colaborador,
     eixo_avaliacao,
     entrega_outstanding,
+    exclusao_ciclo,
+    rascunho,
     registro_valor,
 )
 
@@ -0,0 +1,42 @@
+"""índices por papel e data nas listagens de avaliações
+
+Revision ID: a8b9c0d1e2f3
+Revises: f7a8b9c0d1e2
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a8b9c0d1e2f3"
+down_revision: Union[str, None] = "f7a8b9c0d1e2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDICES = [
+    ("ix_avaliacoes_avaliador_created_at", "avaliacoes", ["avaliador_id", "created_at"]),
+    ("ix_avaliacoes_avaliado_created_at", "avaliacoes", ["avaliado_id", "created_at"]),
+    (
+        "ix_avaliacoes_gestor_colaborador_created_at",
+        "avaliacoes_gestor",
+        ["colaborador_id", "created_at"],
+    ),
+    (
+        "ix_avaliacoes_gestor_gestor_created_at",
+        "avaliacoes_gestor",
+        ["gestor_id", "created_at"],
+    ),
+]
+
+
+def upgrade() -> None:
+    for nome, tabela, colunas in INDICES:
+        op.create_index(nome, tabela, colunas, unique=False)
+
+
+def downgrade() -> None:
+    for nome, tabela, _ in reversed(INDICES):
+        op.drop_index(nome, table_name=tabela)
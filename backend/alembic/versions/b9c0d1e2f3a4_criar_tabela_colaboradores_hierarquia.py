@@ -0,0 +1,71 @@
+"""criar tabela de fechamento colaboradores_hierarquia
+
+Revision ID: b9c0d1e2f3a4
+Revises: a8b9c0d1e2f3
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b9c0d1e2f3a4"
+down_revision: Union[str, None] = "a8b9c0d1e2f3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LOTE_INSERCAO = 1000
+
+
+def upgrade() -> None:
+    tabela = op.create_table(
+        "colaboradores_hierarquia",
+        sa.Column("ancestral_id", sa.Integer(), nullable=False),
+        sa.Column("descendente_id", sa.Integer(), nullable=False),
+        sa.Column("profundidade", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["ancestral_id"], ["colaboradores.id"]),
+        sa.ForeignKeyConstraint(["descendente_id"], ["colaboradores.id"]),
+        sa.PrimaryKeyConstraint("ancestral_id", "descendente_id"),
+    )
+    op.create_index(
+        "ix_colaboradores_hierarquia_descendente_profundidade",
+        "colaboradores_hierarquia",
+        ["descendente_id", "profundidade"],
+        unique=False,
+    )
+
+    # Preenche a tabela a partir de gestor_id (cada colaborador sobe a própria
+    # cadeia; um ciclo em gestor_id encerra a subida)
+    gestores = dict(
+        op.get_bind().execute(sa.text("SELECT id, gestor_id FROM colaboradores")).all()
+    )
+    registros = []
+    for colaborador_id in gestores:
+        atual = colaborador_id
+        profundidade = 0
+        vistos = set()
+        while atual is not None and atual in gestores and atual not in vistos:
+            vistos.add(atual)
+            registros.append(
+                {
+                    "ancestral_id": atual,
+                    "descendente_id": colaborador_id,
+                    "profundidade": profundidade,
+                }
+            )
+            atual = gestores[atual]
+            profundidade += 1
+
+    for inicio in range(0, len(registros), LOTE_INSERCAO):
+        op.bulk_insert(tabela, registros[inicio : inicio + LOTE_INSERCAO])
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_colaboradores_hierarquia_descendente_profundidade",
+        table_name="colaboradores_hierarquia",
+    )
+    op.drop_table("colaboradores_hierarquia")
@@ -0,0 +1,50 @@
+"""índices por período em registros de valor e entregas outstanding
+
+Revision ID: c0d1e2f3a4b5
+Revises: b9c0d1e2f3a4
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c0d1e2f3a4b5"
+down_revision: Union[str, None] = "b9c0d1e2f3a4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDICES = [
+    (
+        "ix_registros_valor_colaborador_created_at",
+        "registros_valor",
+        ["colaborador_id", "created_at"],
+    ),
+    (
+        "ix_registros_valor_status_created_at",
+        "registros_valor",
+        ["status_aprovacao", "created_at"],
+    ),
+    (
+        "ix_entregas_outstanding_colaborador_created_at",
+        "entregas_outstanding",
+        ["colaborador_id", "created_at"],
+    ),
+    (
+        "ix_entregas_outstanding_status_created_at",
+        "entregas_outstanding",
+        ["status_aprovacao", "created_at"],
+    ),
+]
+
+
+def upgrade() -> None:
+    for nome, tabela, colunas in INDICES:
+        op.create_index(nome, tabela, colunas, unique=False)
+
+
+def downgrade() -> None:
+    for nome, tabela, _ in reversed(INDICES):
+        op.drop_index(nome, table_name=tabela)
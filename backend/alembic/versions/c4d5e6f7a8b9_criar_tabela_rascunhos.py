@@ -0,0 +1,51 @@
+"""criar tabela rascunhos
+
+Revision ID: c4d5e6f7a8b9
+Revises: b1c2d3e4f5a6
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4d5e6f7a8b9"
+down_revision: Union[str, None] = "b1c2d3e4f5a6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "rascunhos",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("colaborador_id", sa.Integer(), nullable=False),
+        sa.Column("chave", sa.String(length=150), nullable=False),
+        sa.Column("conteudo", sa.JSON(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.ForeignKeyConstraint(["colaborador_id"], ["colaboradores.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "colaborador_id", "chave", name="uq_rascunhos_colaborador_chave"
+        ),
+    )
+    op.create_index(op.f("ix_rascunhos_id"), "rascunhos", ["id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_rascunhos_id"), table_name="rascunhos")
+    op.drop_table("rascunhos")
@@ -0,0 +1,66 @@
+"""criar tabela chaves_idempotencia
+
+Revision ID: d5e6f7a8b9c0
+Revises: c4d5e6f7a8b9
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import mysql
+
+# revision identifiers, used by Alembic.
+revision: str = "d5e6f7a8b9c0"
+down_revision: Union[str, None] = "c4d5e6f7a8b9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "chaves_idempotencia",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("chave", sa.String(length=255), nullable=False),
+        sa.Column("principal", sa.String(length=64), nullable=False),
+        sa.Column("metodo", sa.String(length=10), nullable=False),
+        sa.Column("rota", sa.String(length=255), nullable=False),
+        sa.Column("hash_requisicao", sa.String(length=64), nullable=False),
+        sa.Column("status_code", sa.Integer(), nullable=True),
+        sa.Column("tipo_conteudo", sa.String(length=100), nullable=True),
+        sa.Column(
+            "corpo_resposta",
+            sa.Text().with_variant(mysql.MEDIUMTEXT(), "mysql"),
+            nullable=True,
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.Column("expira_em", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "chave", "principal", name="uq_chaves_idempotencia_chave_principal"
+        ),
+    )
+    op.create_index(
+        op.f("ix_chaves_idempotencia_id"), "chaves_idempotencia", ["id"], unique=False
+    )
+    op.create_index(
+        op.f("ix_chaves_idempotencia_expira_em"),
+        "chaves_idempotencia",
+        ["expira_em"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f("ix_chaves_idempotencia_expira_em"), table_name="chaves_idempotencia"
+    )
+    op.drop_index(op.f("ix_chaves_idempotencia_id"), table_name="chaves_idempotencia")
+    op.drop_table("chaves_idempotencia")
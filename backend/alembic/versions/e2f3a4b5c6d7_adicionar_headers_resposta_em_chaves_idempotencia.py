@@ -0,0 +1,29 @@
+"""adicionar headers_resposta em chaves_idempotencia
+
+Revision ID: e2f3a4b5c6d7
+Revises: d1e2f3a4b5c6
+Create Date: 2026-10-19 20:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e2f3a4b5c6d7"
+down_revision: Union[str, None] = "d1e2f3a4b5c6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "chaves_idempotencia",
+        sa.Column("headers_resposta", sa.Text(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("chaves_idempotencia", "headers_resposta")
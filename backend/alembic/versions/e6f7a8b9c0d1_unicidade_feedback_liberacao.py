@@ -0,0 +1,41 @@
+"""unicidade de ciclo e colaborador em feedback_liberacao
+
+Revision ID: e6f7a8b9c0d1
+Revises: d5e6f7a8b9c0
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e6f7a8b9c0d1"
+down_revision: Union[str, None] = "d5e6f7a8b9c0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Remove duplicatas antigas mantendo a liberação mais recente de cada par
+    op.execute(
+        """
+        DELETE antiga FROM feedback_liberacao AS antiga
+        JOIN feedback_liberacao AS recente
+          ON antiga.ciclo_id = recente.ciclo_id
+         AND antiga.colaborador_id = recente.colaborador_id
+         AND antiga.id < recente.id
+        """
+    )
+    op.create_unique_constraint(
+        "uq_feedback_liberacao_ciclo_colaborador",
+        "feedback_liberacao",
+        ["ciclo_id", "colaborador_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        "uq_feedback_liberacao_ciclo_colaborador", "feedback_liberacao", type_="unique"
+    )
@@ -0,0 +1,76 @@
+"""criar tabela exclusoes_ciclo
+
+Revision ID: f7a8b9c0d1e2
+Revises: e6f7a8b9c0d1
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f7a8b9c0d1e2"
+down_revision: Union[str, None] = "e6f7a8b9c0d1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "exclusoes_ciclo",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("ciclo_id", sa.Integer(), nullable=False),
+        sa.Column("ciclo_nome", sa.String(length=255), nullable=False),
+        sa.Column(
+            "status",
+            sa.Enum(
+                "pendente",
+                "em_andamento",
+                "concluida",
+                "falhou",
+                name="statusexclusaociclo",
+            ),
+            nullable=False,
+        ),
+        sa.Column("etapa", sa.String(length=50), nullable=True),
+        sa.Column("total_registros", sa.Integer(), nullable=False),
+        sa.Column("registros_removidos", sa.Integer(), nullable=False),
+        sa.Column("erro", sa.Text(), nullable=True),
+        sa.Column("solicitado_por_id", sa.Integer(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.Column("concluido_em", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["solicitado_por_id"],
+            ["colaboradores.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_exclusoes_ciclo_id"), "exclusoes_ciclo", ["id"], unique=False
+    )
+    op.create_index(
+        op.f("ix_exclusoes_ciclo_ciclo_id"),
+        "exclusoes_ciclo",
+        ["ciclo_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_exclusoes_ciclo_ciclo_id"), table_name="exclusoes_ciclo")
+    op.drop_index(op.f("ix_exclusoes_ciclo_id"), table_name="exclusoes_ciclo")
+    op.drop_table("exclusoes_ciclo")
@@ -1,14 +1,22 @@
 from typing import Optional
 
+from app.core.cache_respostas import Dependencia, resposta_em_cache
+from app.core.campos import CamposParams, get_campos, listagem_parcial
+from app.core.exceptions import ValidationException
+from app.core.incluidos import IncluidosParams, get_incluidos
+from app.core.pagination import PaginacaoParams, get_paginacao
 from app.core.security import get_current_colaborador
+from app.core.serializacao import resposta_json, resposta_modelo
 from app.database import get_db
 from app.models.colaborador import Colaborador
 from app.schemas.avaliacao import (
+    PROJECAO_AVALIACAO,
     AvaliacaoCreate,
     AvaliacaoListResponse,
     AvaliacaoResponse,
     AvaliacaoUpdate,
     FeedbackResponse,
+    montar_lista_avaliacoes,
 )
 from app.services.avaliacao import AvaliacaoService
 from fastapi import APIRouter, Depends
@@ -27,7 +35,11 @@ def create_avaliacao(
     current_colaborador: Colaborador = Depends(get_current_colaborador),
     service: AvaliacaoService = Depends(get_avaliacao_service),
 ):
-    return service.create(avaliacao, current_colaborador)
+    return resposta_modelo(
+        service.create(avaliacao, current_colaborador),
+        AvaliacaoResponse,
+        status_code=201,
+    )
 
 
 @router.get("/", response_model=AvaliacaoListResponse)
@@ -36,12 +48,46 @@ def get_avaliacoes(
     avaliador_id: Optional[int] = None,
     avaliado_id: Optional[int] = None,
     tipo: Optional[str] = None,
+    paginacao: PaginacaoParams = Depends(get_paginacao),
+    campos: CamposParams = Depends(get_campos),
+    incluidos: IncluidosParams = Depends(get_incluidos),
     current_colaborador: Colaborador = Depends(get_current_colaborador),
     service: AvaliacaoService = Depends(get_avaliacao_service),
 ):
-    return service.get_avaliacoes(
-        ciclo_id, avaliador_id, avaliado_id, tipo, current_colaborador
+    """
+    Lista avaliações. Use fields= e include= para receber apenas parte dos
+    campos (ex: fields=id,avaliado_id,tipo&include=eixos), ou
+    included=colaboradores para receber avaliador e avaliado uma vez só, em
+    included.colaboradores.
+    """
+    selecao = PROJECAO_AVALIACAO.resolver(campos)
+    if selecao and incluidos.colaboradores:
+        raise ValidationException(
+            "Use included=colaboradores sem fields/include", field="included"
+        )
+    opcoes = selecao.opcoes() if selecao else ()
+    if incluidos.colaboradores:
+        # Só os eixos: avaliador e avaliado vêm à parte, em um único SELECT
+        opcoes = PROJECAO_AVALIACAO.inclusoes["eixos_detalhados"].carregar()
+    resultado = service.get_avaliacoes(
+        ciclo_id,
+        avaliador_id,
+        avaliado_id,
+        tipo,
+        current_colaborador,
+        paginacao,
+        opcoes=opcoes,
     )
+    if selecao:
+        return listagem_parcial(selecao, "avaliacoes", resultado)
+    if incluidos.colaboradores:
+        return resposta_json(
+            service.incluir_colaboradores(
+                montar_lista_avaliacoes(resultado, embutir_colaboradores=False),
+                resultado["avaliacoes"],
+            )
+        )
+    return resposta_json(montar_lista_avaliacoes(resultado))
 
 
 @router.get("/{avaliacao_id}", response_model=AvaliacaoResponse)
@@ -50,7 +96,9 @@ def get_avaliacao(
     current_colaborador: Colaborador = Depends(get_current_colaborador),
     service: AvaliacaoService = Depends(get_avaliacao_service),
 ):
-    return service.get(avaliacao_id, current_colaborador)
+    return resposta_modelo(
+        service.get(avaliacao_id, current_colaborador), AvaliacaoResponse
+    )
 
 
 @router.put("/{avaliacao_id}", response_model=AvaliacaoResponse)
@@ -60,7 +108,10 @@ def update_avaliacao(
     current_colaborador: Colaborador = Depends(get_current_colaborador),
     service: AvaliacaoService = Depends(get_avaliacao_service),
 ):
-    return service.update(avaliacao_id, avaliacao, current_colaborador)
+    return resposta_modelo(
+        service.update(avaliacao_id, avaliacao, current_colaborador),
+        AvaliacaoResponse,
+    )
 
 
 @router.get("/ciclo/{ciclo_id}/feedback", response_model=FeedbackResponse)
@@ -69,7 +120,9 @@ def get_feedback(
     current_colaborador: Colaborador = Depends(get_current_colaborador),
     service: AvaliacaoService = Depends(get_avaliacao_service),
 ):
-    return service.get_feedback(ciclo_id, current_colaborador)
+    return resposta_modelo(
+        service.get_feedback(ciclo_id, current_colaborador), FeedbackResponse
+    )
 
 
 @router.get(
@@ -79,11 +132,21 @@ def get_feedback(
 def get_avaliacoes_colaborador_admin(
     colaborador_id: int,
     ciclo_id: Optional[int] = None,
+    incluidos: IncluidosParams = Depends(get_incluidos),
     current_colaborador: Colaborador = Depends(get_current_colaborador),
     service: AvaliacaoService = Depends(get_avaliacao_service),
 ):
-    return service.get_avaliacoes_colaborador_admin(
-        colaborador_id, ciclo_id, current_colaborador
+    """
+    Avaliações recebidas pelo colaborador (apenas admin). Use
+    included=colaboradores para receber avaliador e avaliado uma vez só.
+    """
+    return resposta_json(
+        service.get_avaliacoes_colaborador_admin(
+            colaborador_id,
+            ciclo_id,
+            current_colaborador,
+            incluir_colaboradores=incluidos.colaboradores,
+        )
     )
 
 
@@ -98,4 +161,19 @@ def get_feedback_admin(
     service: AvaliacaoService = Depends(get_avaliacao_service),
 ):
     """Endpoint admin para buscar feedback de qualquer colaborador"""
-    return service.get_feedback_admin(ciclo_id, colaborador_id, current_colaborador)
+    return resposta_em_cache(
+        service.db,
+        "avaliacoes.feedback_admin",
+        {"ciclo_id": ciclo_id, "colaborador_id": colaborador_id},
+        [
+            Dependencia("colaboradores"),
+            Dependencia("eixos_avaliacao"),
+            Dependencia("avaliacoes", ciclo_id),
+            Dependencia("avaliacoes_eixos", ciclo_id),
+        ],
+        lambda: service.get_feedback_admin(
+            ciclo_id, colaborador_id, current_colaborador
+        ),
+        modelo=FeedbackResponse,
+        usar_cache=current_colaborador.is_admin,
+    )
@@ -1,9 +1,17 @@
-from typing import Optional
-
+from typing import Any, Dict, List, Optional
+
+from app.core.cache_http import cache_referencia, resposta_condicional
+from app.core.cache_respostas import Dependencia, resposta_em_cache
+from app.core.campos import CamposParams, get_campos, listagem_parcial
+from app.core.exceptions import ValidationException
+from app.core.incluidos import IncluidosParams, get_incluidos
+from app.core.pagination import PaginacaoParams, get_paginacao
 from app.core.security import get_current_colaborador
+from app.core.serializacao import resposta_json
 from app.database import get_db
 from app.models.colaborador import Colaborador
 from app.schemas.avaliacao_gestor import (
+    PROJECAO_AVALIACAO_GESTOR,
     AvaliacaoGestorCreate,
     AvaliacaoGestorListResponse,
     AvaliacaoGestorResponse,
@@ -11,7 +19,7 @@ from app.schemas.avaliacao_gestor import (
     PerguntasAvaliacaoGestorResponse,
 )
 from app.services.avaliacao_gestor import AvaliacaoGestorService
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from sqlalchemy.orm import Session
 
 router = APIRouter(prefix="/avaliacoes-gestor", tags=["avaliacoes-gestor"])
@@ -23,12 +31,37 @@ def get_avaliacao_gestor_service(
     return AvaliacaoGestorService(db)
 
 
+def _opcoes_listagem(incluidos: IncluidosParams) -> List[Any]:
+    """Com included=colaboradores, carrega só as respostas (gestor vem à parte)"""
+    if incluidos.colaboradores:
+        return list(PROJECAO_AVALIACAO_GESTOR.inclusoes["respostas"].carregar())
+    return []
+
+
+def _listagem(
+    service: AvaliacaoGestorService,
+    resultado: Dict[str, Any],
+    incluidos: IncluidosParams,
+):
+    """Resultado do service como resposta, com o envelope included se pedido"""
+    if incluidos.colaboradores:
+        return resposta_json(service.incluir_colaboradores(resultado))
+    return resultado
+
+
 @router.get("/perguntas", response_model=PerguntasAvaliacaoGestorResponse)
 def get_perguntas(
+    request: Request,
     service: AvaliacaoGestorService = Depends(get_avaliacao_gestor_service),
 ):
-    """Retorna as perguntas disponíveis para avaliação de gestor"""
-    return service.get_perguntas()
+    """Retorna as perguntas disponíveis para avaliação de gestor (com ETag)"""
+    return resposta_condicional(
+        request,
+        service.get_versao_perguntas(),
+        service.get_perguntas,
+        modelo=PerguntasAvaliacaoGestorResponse,
+        cache_control=cache_referencia(),
+    )
 
 
 @router.post("/", response_model=AvaliacaoGestorResponse, status_code=201)
@@ -46,13 +79,33 @@ def get_avaliacoes_gestor(
     ciclo_id: Optional[int] = None,
     colaborador_id: Optional[int] = None,
     gestor_id: Optional[int] = None,
+    paginacao: PaginacaoParams = Depends(get_paginacao),
+    campos: CamposParams = Depends(get_campos),
+    incluidos: IncluidosParams = Depends(get_incluidos),
     current_colaborador: Colaborador = Depends(get_current_colaborador),
     service: AvaliacaoGestorService = Depends(get_avaliacao_gestor_service),
 ):
-    """Lista avaliações de gestor com filtros opcionais"""
-    return service.get_avaliacoes(
-        ciclo_id, colaborador_id, gestor_id, current_colaborador
+    """
+    Lista avaliações de gestor com filtros opcionais.
+    Use fields= e include= para receber apenas parte dos campos, ou
+    included=colaboradores para receber os gestores uma vez só.
+    """
+    selecao = PROJECAO_AVALIACAO_GESTOR.resolver(campos)
+    if selecao and incluidos.colaboradores:
+        raise ValidationException(
+            "Use included=colaboradores sem fields/include", field="included"
+        )
+    resultado = service.get_avaliacoes(
+        ciclo_id,
+        colaborador_id,
+        gestor_id,
+        current_colaborador,
+        paginacao,
+        opcoes=selecao.opcoes() if selecao else _opcoes_listagem(incluidos),
     )
+    if selecao:
+        return listagem_parcial(selecao, "avaliacoes", resultado)
+    return _listagem(service, resultado, incluidos)
 
 
 @router.get("/{avaliacao_id}", response_model=AvaliacaoGestorResponse)
@@ -83,13 +136,18 @@ def update_avaliacao_gestor(
 def get_avaliacoes_gestor_colaborador_admin(
     colaborador_id: int,
     ciclo_id: Optional[int] = None,
+    incluidos: IncluidosParams = Depends(get_incluidos),
     current_colaborador: Colaborador = Depends(get_current_colaborador),
     service: AvaliacaoGestorService = Depends(get_avaliacao_gestor_service),
 ):
     """Endpoint admin para buscar avaliações de gestor realizadas por um colaborador"""
-    return service.get_avaliacoes_colaborador_admin(
-        colaborador_id, ciclo_id, current_colaborador
+    resultado = service.get_avaliacoes_colaborador_admin(
+        colaborador_id,
+        ciclo_id,
+        current_colaborador,
+        opcoes=_opcoes_listagem(incluidos),
     )
+    return _listagem(service, resultado, incluidos)
 
 
 @router.get(
@@ -99,11 +157,15 @@ def get_avaliacoes_gestor_colaborador_admin(
 def get_avaliacoes_gestor_gestor_admin(
     gestor_id: int,
     ciclo_id: Optional[int] = None,
+    incluidos: IncluidosParams = Depends(get_incluidos),
     current_colaborador: Colaborador = Depends(get_current_colaborador),
     service: AvaliacaoGestorService = Depends(get_avaliacao_gestor_service),
 ):
     """Endpoint admin para buscar avaliações de gestor recebidas por um gestor"""
-    return service.get_avaliacoes_gestor_admin(gestor_id, ciclo_id, current_colaborador)
+    resultado = service.get_avaliacoes_gestor_admin(
+        gestor_id, ciclo_id, current_colaborador, opcoes=_opcoes_listagem(incluidos)
+    )
+    return _listagem(service, resultado, incluidos)
 
 
 @router.get(
@@ -117,4 +179,18 @@ def get_feedback_gestor_admin(
     service: AvaliacaoGestorService = Depends(get_avaliacao_gestor_service),
 ):
     """Endpoint admin para buscar feedback de gestor (avaliações recebidas)"""
-    return service.get_avaliacoes_gestor_admin(gestor_id, ciclo_id, current_colaborador)
+    return resposta_em_cache(
+        service.db,
+        "avaliacoes_gestor.feedback_admin",
+        {"ciclo_id": ciclo_id, "gestor_id": gestor_id},
+        [
+            Dependencia("colaboradores"),
+            Dependencia("avaliacoes_gestor", ciclo_id),
+            Dependencia("avaliacoes_gestor_respostas", ciclo_id),
+        ],
+        lambda: service.get_avaliacoes_gestor_admin(
+            gestor_id, ciclo_id, current_colaborador
+        ),
+        modelo=AvaliacaoGestorListResponse,
+        usar_cache=current_colaborador.is_admin,
+    )
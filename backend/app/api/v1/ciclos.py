@@ -1,6 +1,9 @@
 import logging
 from typing import Optional
 
+from app.core.cache_http import resposta_condicional
+from app.core.cache_respostas import Dependencia, resposta_em_cache
+from app.core.pagination import PaginacaoParams, get_paginacao
 from app.core.security import get_current_colaborador
 from app.database import get_db
 from app.models.colaborador import Colaborador
@@ -11,8 +14,14 @@ from app.schemas.ciclo import (
     CicloResponse,
     CicloUpdate,
 )
-from app.services import CicloService
-from fastapi import APIRouter, Depends
+from app.schemas.distribuicao_pares import (
+    DistribuicaoParesRequest,
+    DistribuicaoParesResponse,
+)
+from app.schemas.exclusao_ciclo import ExclusaoCicloResponse
+from app.services import CicloService, DistribuicaoParesService
+from app.services.exclusao_ciclo import executar_exclusao_ciclo
+from fastapi import APIRouter, BackgroundTasks, Depends, Request
 from sqlalchemy.orm import Session
 
 logger = logging.getLogger(__name__)
@@ -24,6 +33,12 @@ def get_ciclo_service(db: Session = Depends(get_db)) -> CicloService:
     return CicloService(db)
 
 
+def get_distribuicao_pares_service(
+    db: Session = Depends(get_db),
+) -> DistribuicaoParesService:
+    return DistribuicaoParesService(db)
+
+
 @router.post("/", response_model=CicloResponse, status_code=201)
 def create_ciclo(
     ciclo: CicloCreate,
@@ -36,11 +51,25 @@ def create_ciclo(
 
 @router.get("/", response_model=CicloListResponse)
 def get_ciclos(
-    status: Optional[str] = None, service: CicloService = Depends(get_ciclo_service)
+    request: Request,
+    status: Optional[str] = None,
+    paginacao: PaginacaoParams = Depends(get_paginacao),
+    service: CicloService = Depends(get_ciclo_service),
 ):
-    """Lista todos os ciclos"""
-    ciclos, total = service.get_ciclos(status=status)
-    return {"ciclos": ciclos, "total": total}
+    """Lista todos os ciclos (responde 304 se os ciclos não mudaram)"""
+
+    def gerar():
+        pagina = service.get_ciclos(status=status, paginacao=paginacao)
+        return {"ciclos": pagina.itens, "total": pagina.total, "next_cursor": pagina.next_cursor}
+
+    assinatura, ultima_modificacao = service.get_versao()
+    return resposta_condicional(
+        request,
+        assinatura,
+        gerar,
+        modelo=CicloListResponse,
+        ultima_modificacao=ultima_modificacao,
+    )
 
 
 @router.get("/{ciclo_id}", response_model=CicloResponse)
@@ -61,10 +90,18 @@ def update_ciclo(
 
 
 @router.get("/ativo/aberto", response_model=CicloResponse)
-def get_ciclo_aberto(service: CicloService = Depends(get_ciclo_service)):
-    """Obtém o ciclo aberto ativo"""
-    ciclo = service.get_ciclo_aberto()
-    return ciclo
+def get_ciclo_aberto(
+    request: Request, service: CicloService = Depends(get_ciclo_service)
+):
+    """Obtém o ciclo aberto ativo (responde 304 se os ciclos não mudaram)"""
+    assinatura, ultima_modificacao = service.get_versao()
+    return resposta_condicional(
+        request,
+        assinatura,
+        service.get_ciclo_aberto,
+        modelo=CicloResponse,
+        ultima_modificacao=ultima_modificacao,
+    )
 
 
 @router.post("/{ciclo_id}/avancar-etapa", response_model=CicloResponse)
@@ -77,15 +114,30 @@ def avancar_etapa(
     return service.avancar_etapa(ciclo_id, current_colaborador)
 
 
-@router.delete("/{ciclo_id}", status_code=204)
+@router.delete("/{ciclo_id}", response_model=ExclusaoCicloResponse, status_code=202)
 def delete_ciclo(
     ciclo_id: int,
+    background_tasks: BackgroundTasks,
     current_colaborador: Colaborador = Depends(get_current_colaborador),
     service: CicloService = Depends(get_ciclo_service),
 ):
-    """Exclui um ciclo"""
-    service.delete_ciclo(ciclo_id, current_colaborador)
-    return None
+    """
+    Exclui um ciclo e todos os seus dados.
+    A remoção é feita em segundo plano; acompanhe por GET /ciclos/{ciclo_id}/exclusao.
+    """
+    exclusao = service.delete_ciclo(ciclo_id, current_colaborador)
+    background_tasks.add_task(executar_exclusao_ciclo, exclusao.id)
+    return exclusao
+
+
+@router.get("/{ciclo_id}/exclusao", response_model=ExclusaoCicloResponse)
+def get_exclusao(
+    ciclo_id: int,
+    current_colaborador: Colaborador = Depends(get_current_colaborador),
+    service: CicloService = Depends(get_ciclo_service),
+):
+    """Retorna o progresso da exclusão do ciclo"""
+    return service.get_exclusao(ciclo_id, current_colaborador)
 
 
 @router.get("/{ciclo_id}/acompanhamento", response_model=AcompanhamentoCicloResponse)
@@ -95,4 +147,35 @@ def get_acompanhamento(
     service: CicloService = Depends(get_ciclo_service),
 ):
     """Retorna o acompanhamento do ciclo com status de cada colaborador"""
-    return service.get_acompanhamento(ciclo_id, current_colaborador)
+    return resposta_em_cache(
+        service.db,
+        "ciclos.acompanhamento",
+        {"ciclo_id": ciclo_id},
+        [
+            Dependencia("colaboradores"),
+            Dependencia("ciclos", ciclo_id),
+            Dependencia("ciclos_avaliacao", ciclo_id),
+            Dependencia("pares_selecionados", ciclo_id),
+            Dependencia("avaliacoes", ciclo_id),
+            Dependencia("avaliacoes_gestor", ciclo_id),
+        ],
+        lambda: service.get_acompanhamento(ciclo_id, current_colaborador),
+        modelo=AcompanhamentoCicloResponse,
+        usar_cache=current_colaborador.is_admin,
+    )
+
+
+@router.post(
+    "/{ciclo_id}/distribuicao-pares", response_model=DistribuicaoParesResponse
+)
+def distribuir_pares(
+    ciclo_id: int,
+    request: DistribuicaoParesRequest,
+    current_colaborador: Colaborador = Depends(get_current_colaborador),
+    service: DistribuicaoParesService = Depends(get_distribuicao_pares_service),
+):
+    """
+    Distribui os pares do ciclo limitando as avaliações de pares por avaliador.
+    Com aplicar=false apenas retorna a proposta.
+    """
+    return service.distribuir(ciclo_id, request, current_colaborador)
@@ -1,10 +1,17 @@
 from typing import Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 
 from app.core.exceptions import ForbiddenException
+from app.core.pagination import PaginacaoParams, get_paginacao
 from app.core.security import get_current_colaborador
+from app.core.serializacao import resposta_json, resposta_modelo
+from app.core.validators import (
+    BUSCA_LIMITE_MAX,
+    BUSCA_LIMITE_PADRAO,
+    BUSCA_TERMO_MAX,
+)
 from app.database import get_db
 from app.models.colaborador import Colaborador
 from app.schemas.colaborador import (
@@ -26,12 +33,41 @@ def get_colaborador_service(db: Session = Depends(get_db)) -> ColaboradorService
 def get_colaboradores(
     departamento: Optional[str] = None,
     email: Optional[str] = None,
+    paginacao: PaginacaoParams = Depends(get_paginacao),
+    service: ColaboradorService = Depends(get_colaborador_service),
+):
+    # Linhas lidas sem objetos ORM e serializadas sem revalidar
+    pagina = service.get_colaboradores_linhas(
+        departamento=departamento, email=email, paginacao=paginacao
+    )
+    return resposta_json(
+        {
+            "colaboradores": [dict(linha) for linha in pagina.itens],
+            "total": pagina.total,
+            "next_cursor": pagina.next_cursor,
+        }
+    )
+
+
+# Declarada antes de /{colaborador_id} para não ser capturada por ela.
+# Os resultados já vêm serializados do índice em memória
+@router.get("/busca", response_model=ColaboradorListResponse)
+def buscar_colaboradores(
+    q: str = Query(
+        ...,
+        min_length=1,
+        max_length=BUSCA_TERMO_MAX,
+        description="Texto buscado em nome, email, cargo e departamento",
+    ),
+    limit: int = Query(BUSCA_LIMITE_PADRAO, ge=1, le=BUSCA_LIMITE_MAX),
+    current_colaborador: Colaborador = Depends(get_current_colaborador),
     service: ColaboradorService = Depends(get_colaborador_service),
 ):
-    colaboradores, total = service.get_colaboradores(
-        departamento=departamento, email=email
+    colaboradores = service.buscar(q, limit)
+    return resposta_modelo(
+        {"colaboradores": colaboradores, "total": len(colaboradores)},
+        ColaboradorListResponse,
     )
-    return {"colaboradores": colaboradores, "total": total}
 
 
 @router.get("/{colaborador_id}", response_model=ColaboradorResponse)
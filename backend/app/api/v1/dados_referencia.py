@@ -0,0 +1,33 @@
+from app.core.security import get_current_colaborador
+from app.database import get_db
+from app.models.colaborador import Colaborador
+from app.schemas.dados_referencia import DadosReferenciaVersaoResponse
+from app.services.dados_referencia import DadosReferenciaService
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+
+router = APIRouter(prefix="/dados-referencia", tags=["dados-referencia"])
+
+
+def get_dados_referencia_service(
+    db: Session = Depends(get_db),
+) -> DadosReferenciaService:
+    return DadosReferenciaService(db)
+
+
+@router.get("/versao", response_model=DadosReferenciaVersaoResponse)
+def get_versao(
+    current_colaborador: Colaborador = Depends(get_current_colaborador),
+    service: DadosReferenciaService = Depends(get_dados_referencia_service),
+):
+    """Versão dos dados de referência (eixos, valores, perguntas) deste processo"""
+    return service.get_versao()
+
+
+@router.post("/recarregar", response_model=DadosReferenciaVersaoResponse)
+def recarregar(
+    current_colaborador: Colaborador = Depends(get_current_colaborador),
+    service: DadosReferenciaService = Depends(get_dados_referencia_service),
+):
+    """Relê os dados de referência do banco neste processo (apenas admin)"""
+    return service.recarregar(current_colaborador)
@@ -1,10 +1,11 @@
 import json
 import logging
 
+from app.core.cache_http import cache_referencia, resposta_condicional
 from app.database import get_db
 from app.schemas.eixo_avaliacao import EixoAvaliacaoListResponse, EixoAvaliacaoResponse
 from app.services.eixo_avaliacao import EixoAvaliacaoService
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from sqlalchemy.orm import Session
 
 router = APIRouter(prefix="/eixos-avaliacao", tags=["eixos-avaliacao"])
@@ -18,16 +19,30 @@ def get_eixo_avaliacao_service(db: Session = Depends(get_db)) -> EixoAvaliacaoSe
 
 @router.get("/", response_model=EixoAvaliacaoListResponse)
 def get_eixos_avaliacao(
+    request: Request,
     service: EixoAvaliacaoService = Depends(get_eixo_avaliacao_service),
 ):
-    # O service retorna uma lista de modelos ORM `EixoAvaliacao`.
-    # O schema de resposta espera um dict com a chave "eixos".
-    eixos = service.get_all()
-    return {"eixos": eixos}
+    """Lista os eixos de avaliação com seus níveis (ETag dos dados de referência)"""
+    return resposta_condicional(
+        request,
+        service.get_versao(),
+        lambda: {"eixos": service.get_all()},
+        modelo=EixoAvaliacaoListResponse,
+        cache_control=cache_referencia(),
+    )
 
 
 @router.get("/{eixo_id}", response_model=EixoAvaliacaoResponse)
 def get_eixo_avaliacao(
-    eixo_id: int, service: EixoAvaliacaoService = Depends(get_eixo_avaliacao_service)
+    eixo_id: int,
+    request: Request,
+    service: EixoAvaliacaoService = Depends(get_eixo_avaliacao_service),
 ):
-    return service.get(eixo_id)
+    """Obtém um eixo de avaliação por ID (ETag dos dados de referência)"""
+    return resposta_condicional(
+        request,
+        service.get_versao(),
+        lambda: service.get(eixo_id),
+        modelo=EixoAvaliacaoResponse,
+        cache_control=cache_referencia(),
+    )
@@ -1,6 +1,14 @@
+from app.core.pagination import PaginacaoParams, get_paginacao
+from app.core.periodo import PeriodoParams, get_periodo
 from app.core.security import get_current_colaborador
+from app.core.serializacao import resposta_json
 from app.database import get_db
 from app.models.colaborador import Colaborador
+from app.schemas.aprovacao import (
+    AprovacaoLoteResponse,
+    AprovarLoteRequest,
+    ReprovarLoteRequest,
+)
 from app.schemas.entrega_outstanding import (
     AprovarEntregaOutstandingRequest,
     EntregaOutstandingCreate,
@@ -34,17 +42,19 @@ def create_entrega_outstanding(
 @router.get("/", response_model=EntregaOutstandingListResponse)
 def get_entregas_outstanding(
     colaborador_id: int = None,
+    paginacao: PaginacaoParams = Depends(get_paginacao),
+    periodo: PeriodoParams = Depends(get_periodo),
     current_colaborador: Colaborador = Depends(get_current_colaborador),
     service: EntregaOutstandingService = Depends(get_entrega_outstanding_service),
 ):
-    """Lista entregas outstanding do usuário logado ou de um colaborador específico (apenas admin)"""
+    """Lista entregas outstanding do usuário logado ou de um colaborador específico (apenas admin), por padrão na janela do ciclo aberto"""
     if colaborador_id is not None and current_colaborador.is_admin:
         # Admin pode ver entregas de qualquer colaborador
-        entregas = service.get_by_colaborador_id(colaborador_id)
+        pagina = service.get_by_colaborador_id(colaborador_id, paginacao, periodo)
     else:
         # Colaborador comum vê apenas suas próprias entregas
-        entregas = service.get_by_colaborador(current_colaborador)
-    return {"entregas": entregas, "total": len(entregas)}
+        pagina = service.get_by_colaborador(current_colaborador, paginacao, periodo)
+    return {"entregas": pagina.itens, "total": pagina.total, "next_cursor": pagina.next_cursor}
 
 
 @router.get("/{entrega_id}", response_model=EntregaOutstandingResponse)
@@ -78,18 +88,23 @@ def delete_entrega_outstanding(
 
 @router.get("/admin/pendentes", response_model=EntregaOutstandingListResponse)
 def get_entregas_pendentes(
+    paginacao: PaginacaoParams = Depends(get_paginacao),
+    periodo: PeriodoParams = Depends(get_periodo),
     current_colaborador: Colaborador = Depends(get_current_colaborador),
     service: EntregaOutstandingService = Depends(get_entrega_outstanding_service),
 ):
-    """Lista todas as entregas outstanding pendentes de aprovação (apenas admin)"""
+    """Lista as entregas outstanding pendentes de aprovação (apenas admin), por padrão de todos os ciclos"""
     if not current_colaborador.is_admin:
         raise HTTPException(
             status_code=403,
             detail="Acesso negado. Apenas administradores podem acessar esta funcionalidade.",
         )
 
-    entregas = service.get_all_pendentes()
-    return {"entregas": entregas, "total": len(entregas)}
+    # Linhas lidas sem objetos ORM e serializadas sem revalidar
+    pagina = service.get_all_pendentes_linhas(paginacao, periodo)
+    return resposta_json(
+        {"entregas": pagina.itens, "total": pagina.total, "next_cursor": pagina.next_cursor}
+    )
 
 
 @router.post("/{entrega_id}/aprovar", response_model=EntregaOutstandingResponse)
@@ -130,3 +145,48 @@ def reprovar_entrega_outstanding(
         return service.reprovar(entrega_id, current_colaborador, request.observacao)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.post("/admin/aprovar-lote", response_model=AprovacaoLoteResponse)
+def aprovar_entregas_em_lote(
+    request: AprovarLoteRequest,
+    current_colaborador: Colaborador = Depends(get_current_colaborador),
+    service: EntregaOutstandingService = Depends(get_entrega_outstanding_service),
+):
+    """
+    Aprova várias entregas outstanding pendentes de uma vez (apenas admin).
+    Retorna o resultado de cada ID: aprovado, ja_processado ou nao_encontrado.
+    """
+    if not current_colaborador.is_admin:
+        raise HTTPException(
+            status_code=403,
+            detail="Acesso negado. Apenas administradores podem aprovar entregas.",
+        )
+
+    return service.aprovar_em_lote(
+        request.ids, current_colaborador, request.observacao
+    )
+
+
+@router.post("/admin/reprovar-lote", response_model=AprovacaoLoteResponse)
+def reprovar_entregas_em_lote(
+    request: ReprovarLoteRequest,
+    current_colaborador: Colaborador = Depends(get_current_colaborador),
+    service: EntregaOutstandingService = Depends(get_entrega_outstanding_service),
+):
+    """
+    Reprova várias entregas outstanding pendentes de uma vez (apenas admin).
+    Retorna o resultado de cada ID: reprovado, ja_processado ou nao_encontrado.
+    """
+    if not current_colaborador.is_admin:
+        raise HTTPException(
+            status_code=403,
+            detail="Acesso negado. Apenas administradores podem reprovar entregas.",
+        )
+
+    try:
+        return service.reprovar_em_lote(
+            request.ids, current_colaborador, request.observacao
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
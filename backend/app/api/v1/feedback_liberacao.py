@@ -1,8 +1,11 @@
+from app.core.cache_respostas import Dependencia, resposta_em_cache
 from app.core.security import get_current_colaborador
 from app.database import get_db
 from app.models.colaborador import Colaborador
 from app.schemas.feedback_liberacao import (
     FeedbackLiberacaoListResponse,
+    FeedbackLiberacaoLoteRequest,
+    FeedbackLiberacaoLoteResponse,
     FeedbackLiberacaoResponse,
 )
 from app.services.feedback_liberacao import FeedbackLiberacaoService
@@ -52,6 +55,42 @@ def revogar_feedback(
     return service.revogar_feedback(ciclo_id, colaborador_id, current_colaborador)
 
 
+@router.post(
+    "/ciclo/{ciclo_id}/liberar-lote",
+    response_model=FeedbackLiberacaoLoteResponse,
+)
+def liberar_feedback_em_lote(
+    ciclo_id: int,
+    request: FeedbackLiberacaoLoteRequest,
+    current_colaborador: Colaborador = Depends(get_current_colaborador),
+    service: FeedbackLiberacaoService = Depends(get_feedback_liberacao_service),
+):
+    """
+    Libera o feedback de vários colaboradores em um ciclo: uma lista de IDs,
+    um departamento ou todos os liderados (diretos e indiretos) de um gestor.
+    Apenas administradores podem executar esta ação.
+    """
+    return service.liberar_em_lote(ciclo_id, request, current_colaborador)
+
+
+@router.post(
+    "/ciclo/{ciclo_id}/revogar-lote",
+    response_model=FeedbackLiberacaoLoteResponse,
+)
+def revogar_feedback_em_lote(
+    ciclo_id: int,
+    request: FeedbackLiberacaoLoteRequest,
+    current_colaborador: Colaborador = Depends(get_current_colaborador),
+    service: FeedbackLiberacaoService = Depends(get_feedback_liberacao_service),
+):
+    """
+    Revoga o feedback de vários colaboradores em um ciclo, com os mesmos
+    alvos de /liberar-lote.
+    Apenas administradores podem executar esta ação.
+    """
+    return service.revogar_em_lote(ciclo_id, request, current_colaborador)
+
+
 @router.get(
     "/ciclo/{ciclo_id}",
     response_model=FeedbackLiberacaoListResponse,
@@ -65,5 +104,17 @@ def get_liberacoes_por_ciclo(
     Lista todas as liberações de feedback de um ciclo.
     Apenas administradores podem executar esta ação.
     """
-    return service.get_by_ciclo(ciclo_id, current_colaborador)
+    return resposta_em_cache(
+        service.db,
+        "feedback_liberacao.por_ciclo",
+        {"ciclo_id": ciclo_id},
+        [
+            Dependencia("colaboradores"),
+            Dependencia("ciclos", ciclo_id),
+            Dependencia("feedback_liberacao", ciclo_id),
+        ],
+        lambda: service.get_by_ciclo(ciclo_id, current_colaborador),
+        modelo=FeedbackLiberacaoListResponse,
+        usar_cache=current_colaborador.is_admin,
+    )
 
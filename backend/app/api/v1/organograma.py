@@ -0,0 +1,72 @@
+from app.core.security import get_current_colaborador
+from app.database import get_db
+from app.models.colaborador import Colaborador
+from app.schemas.colaborador import ColaboradorListResponse
+from app.schemas.organograma import (
+    HierarquiaReconstrucaoResponse,
+    HierarquiaVerificacaoResponse,
+    OrganogramaResponse,
+)
+from app.services.hierarquia import HierarquiaService
+from fastapi import APIRouter, Depends
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm import Session
+
+router = APIRouter(prefix="/organograma", tags=["organograma"])
+
+
+def get_hierarquia_service(db: Session = Depends(get_db)) -> HierarquiaService:
+    return HierarquiaService(db)
+
+
+# A árvore vem pronta do índice em memória: é enviada direto, sem revalidar
+# cada nó pelo response_model (que fica apenas para a documentação)
+@router.get("/", response_model=OrganogramaResponse)
+def get_organograma(
+    current_colaborador: Colaborador = Depends(get_current_colaborador),
+    service: HierarquiaService = Depends(get_hierarquia_service),
+):
+    """Organograma completo dos colaboradores ativos"""
+    return JSONResponse(service.get_organograma())
+
+
+# Declaradas antes de /{colaborador_id} para não serem capturadas por ela
+@router.get("/fechamento/verificacao", response_model=HierarquiaVerificacaoResponse)
+def verificar_fechamento(
+    current_colaborador: Colaborador = Depends(get_current_colaborador),
+    service: HierarquiaService = Depends(get_hierarquia_service),
+):
+    """Compara a tabela de fechamento da hierarquia com gestor_id (apenas admin)"""
+    return service.verificar_fechamento(current_colaborador)
+
+
+@router.post(
+    "/fechamento/reconstruir", response_model=HierarquiaReconstrucaoResponse
+)
+def reconstruir_fechamento(
+    current_colaborador: Colaborador = Depends(get_current_colaborador),
+    service: HierarquiaService = Depends(get_hierarquia_service),
+):
+    """Recalcula a tabela de fechamento da hierarquia a partir de gestor_id (apenas admin)"""
+    return {"total_registros": service.reconstruir_fechamento(current_colaborador)}
+
+
+@router.get("/{colaborador_id}", response_model=OrganogramaResponse)
+def get_subarvore(
+    colaborador_id: int,
+    current_colaborador: Colaborador = Depends(get_current_colaborador),
+    service: HierarquiaService = Depends(get_hierarquia_service),
+):
+    """Organograma a partir de um colaborador (ele e todos abaixo dele)"""
+    return JSONResponse(service.get_subarvore(colaborador_id))
+
+
+@router.get("/{colaborador_id}/gestores", response_model=ColaboradorListResponse)
+def get_cadeia_gestores(
+    colaborador_id: int,
+    current_colaborador: Colaborador = Depends(get_current_colaborador),
+    service: HierarquiaService = Depends(get_hierarquia_service),
+):
+    """Cadeia de gestores do colaborador, do gestor direto até o topo"""
+    gestores = service.get_cadeia_gestores(colaborador_id)
+    return {"colaboradores": gestores, "total": len(gestores)}
@@ -0,0 +1,57 @@
+from app.core.security import get_current_colaborador
+from app.core.validators import RASCUNHO_CHAVE_PATTERN
+from app.database import get_db
+from app.models.colaborador import Colaborador
+from app.schemas.rascunho import RascunhoResponse, RascunhoSalvar
+from app.services.rascunho import RascunhoService
+from fastapi import APIRouter, Depends, Path
+from sqlalchemy.orm import Session
+
+router = APIRouter(prefix="/rascunhos", tags=["rascunhos"])
+
+ChaveRascunho = Path(
+    ...,
+    pattern=RASCUNHO_CHAVE_PATTERN,
+    description="Chave do formulário (ex: autoavaliacao:ciclo-3)",
+)
+
+
+def get_rascunho_service(db: Session = Depends(get_db)) -> RascunhoService:
+    return RascunhoService(db)
+
+
+@router.get("/{chave}", response_model=RascunhoResponse)
+def get_rascunho(
+    chave: str = ChaveRascunho,
+    current_colaborador: Colaborador = Depends(get_current_colaborador),
+    service: RascunhoService = Depends(get_rascunho_service),
+):
+    """Retorna o rascunho do usuário logado para o formulário informado"""
+    return service.get(chave, current_colaborador)
+
+
+@router.put("/{chave}", response_model=RascunhoResponse)
+def salvar_rascunho(
+    rascunho: RascunhoSalvar,
+    chave: str = ChaveRascunho,
+    imediato: bool = False,
+    current_colaborador: Colaborador = Depends(get_current_colaborador),
+    service: RascunhoService = Depends(get_rascunho_service),
+):
+    """
+    Salva o rascunho do usuário logado.
+
+    Salvamentos seguidos são agrupados no servidor e gravados quando a janela
+    de agrupamento fecha. Use `imediato=true` para gravar na hora.
+    """
+    return service.salvar(chave, rascunho.conteudo, current_colaborador, imediato)
+
+
+@router.delete("/{chave}", status_code=204)
+def descartar_rascunho(
+    chave: str = ChaveRascunho,
+    current_colaborador: Colaborador = Depends(get_current_colaborador),
+    service: RascunhoService = Depends(get_rascunho_service),
+):
+    """Descarta o rascunho do usuário logado (ex: após enviar o formulário)"""
+    service.descartar(chave, current_colaborador)
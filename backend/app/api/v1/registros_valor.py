@@ -1,6 +1,14 @@
+from app.core.pagination import PaginacaoParams, get_paginacao
+from app.core.periodo import PeriodoParams, get_periodo
 from app.core.security import get_current_colaborador
+from app.core.serializacao import resposta_json
 from app.database import get_db
 from app.models.colaborador import Colaborador
+from app.schemas.aprovacao import (
+    AprovacaoLoteResponse,
+    AprovarLoteRequest,
+    ReprovarLoteRequest,
+)
 from app.schemas.registro_valor import (
     AprovarRegistroValorRequest,
     RegistroValorCreate,
@@ -33,17 +41,21 @@ def create_registro_valor(
 @router.get("/", response_model=RegistroValorListResponse)
 def get_registros_valor(
     colaborador_id: int = None,
+    paginacao: PaginacaoParams = Depends(get_paginacao),
+    periodo: PeriodoParams = Depends(get_periodo),
     current_colaborador: Colaborador = Depends(get_current_colaborador),
     service: RegistroValorService = Depends(get_registro_valor_service),
 ):
-    """Lista registros de valor do usuário logado ou de um colaborador específico (apenas admin)"""
+    """Lista registros de valor do usuário logado ou de um colaborador específico (apenas admin), por padrão na janela do ciclo aberto"""
     if colaborador_id is not None and current_colaborador.is_admin:
         # Admin pode ver registros de qualquer colaborador
-        registros = service.get_by_colaborador(colaborador_id)
+        pagina = service.get_by_colaborador(colaborador_id, paginacao, periodo)
     else:
         # Colaborador comum vê apenas seus próprios registros
-        registros = service.get_by_colaborador(current_colaborador.id)
-    return {"registros": registros, "total": len(registros)}
+        pagina = service.get_by_colaborador(
+            current_colaborador.id, paginacao, periodo
+        )
+    return {"registros": pagina.itens, "total": pagina.total, "next_cursor": pagina.next_cursor}
 
 
 @router.get("/{registro_id}", response_model=RegistroValorResponse)
@@ -78,18 +90,23 @@ def delete_registro_valor(
 
 @router.get("/admin/pendentes", response_model=RegistroValorListResponse)
 def get_registros_pendentes(
+    paginacao: PaginacaoParams = Depends(get_paginacao),
+    periodo: PeriodoParams = Depends(get_periodo),
     current_colaborador: Colaborador = Depends(get_current_colaborador),
     service: RegistroValorService = Depends(get_registro_valor_service),
 ):
-    """Lista todos os registros de valor pendentes de aprovação (apenas admin)"""
+    """Lista os registros de valor pendentes de aprovação (apenas admin), por padrão de todos os ciclos"""
     if not current_colaborador.is_admin:
         raise HTTPException(
             status_code=403,
             detail="Acesso negado. Apenas administradores podem acessar esta funcionalidade.",
         )
 
-    registros = service.get_all_pendentes()
-    return {"registros": registros, "total": len(registros)}
+    # Linhas lidas sem objetos ORM e serializadas sem revalidar
+    pagina = service.get_all_pendentes_linhas(paginacao, periodo)
+    return resposta_json(
+        {"registros": pagina.itens, "total": pagina.total, "next_cursor": pagina.next_cursor}
+    )
 
 
 @router.post("/{registro_id}/aprovar", response_model=RegistroValorResponse)
@@ -130,3 +147,48 @@ def reprovar_registro_valor(
         return service.reprovar(registro_id, current_colaborador, request.observacao)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.post("/admin/aprovar-lote", response_model=AprovacaoLoteResponse)
+def aprovar_registros_em_lote(
+    request: AprovarLoteRequest,
+    current_colaborador: Colaborador = Depends(get_current_colaborador),
+    service: RegistroValorService = Depends(get_registro_valor_service),
+):
+    """
+    Aprova vários registros de valor pendentes de uma vez (apenas admin).
+    Retorna o resultado de cada ID: aprovado, ja_processado ou nao_encontrado.
+    """
+    if not current_colaborador.is_admin:
+        raise HTTPException(
+            status_code=403,
+            detail="Acesso negado. Apenas administradores podem aprovar registros.",
+        )
+
+    return service.aprovar_em_lote(
+        request.ids, current_colaborador, request.observacao
+    )
+
+
+@router.post("/admin/reprovar-lote", response_model=AprovacaoLoteResponse)
+def reprovar_registros_em_lote(
+    request: ReprovarLoteRequest,
+    current_colaborador: Colaborador = Depends(get_current_colaborador),
+    service: RegistroValorService = Depends(get_registro_valor_service),
+):
+    """
+    Reprova vários registros de valor pendentes de uma vez (apenas admin).
+    Retorna o resultado de cada ID: reprovado, ja_processado ou nao_encontrado.
+    """
+    if not current_colaborador.is_admin:
+        raise HTTPException(
+            status_code=403,
+            detail="Acesso negado. Apenas administradores podem reprovar registros.",
+        )
+
+    try:
+        return service.reprovar_em_lote(
+            request.ids, current_colaborador, request.observacao
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
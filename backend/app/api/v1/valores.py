@@ -1,7 +1,8 @@
+from app.core.cache_http import cache_referencia, resposta_condicional
 from app.database import get_db
 from app.schemas.registro_valor import ValorListResponse, ValorResponse
 from app.services.valor import ValorService
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from sqlalchemy.orm import Session
 
 router = APIRouter(prefix="/valores", tags=["valores"])
@@ -12,14 +13,30 @@ def get_valor_service(db: Session = Depends(get_db)) -> ValorService:
 
 
 @router.get("/", response_model=ValorListResponse)
-def get_valores(service: ValorService = Depends(get_valor_service)):
-    """Lista todos os valores disponíveis"""
-    valores = service.get_valores()
-    return {"valores": valores}
+def get_valores(
+    request: Request, service: ValorService = Depends(get_valor_service)
+):
+    """Lista todos os valores disponíveis (ETag dos dados de referência)"""
+    return resposta_condicional(
+        request,
+        service.get_versao(),
+        lambda: {"valores": service.get_valores()},
+        modelo=ValorListResponse,
+        cache_control=cache_referencia(),
+    )
 
 
 @router.get("/{valor_id}", response_model=ValorResponse)
-def get_valor(valor_id: int, service: ValorService = Depends(get_valor_service)):
-    """Obtém um valor por ID"""
-    valor = service.get_valor(valor_id)
-    return valor
+def get_valor(
+    valor_id: int,
+    request: Request,
+    service: ValorService = Depends(get_valor_service),
+):
+    """Obtém um valor por ID (ETag dos dados de referência)"""
+    return resposta_condicional(
+        request,
+        service.get_versao(),
+        lambda: service.get_valor(valor_id),
+        modelo=ValorResponse,
+        cache_control=cache_referencia(),
+    )
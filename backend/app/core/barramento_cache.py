@@ -0,0 +1,437 @@
+"""
+Barramento de invalidação dos caches em memória entre processos.
+
+Os caches por processo (respostas dos agregados do admin, estado dos ciclos,
+dados de referência, índice de busca) ficam desatualizados quando outro
+worker ou pod grava no banco. O barramento propaga essas escritas:
+
+1. Eventos da sessão registram as tabelas (e ciclos) que a transação
+   escreveu, como canais `tabela`, `tabela@<ciclo_id>` ou `tabela!` (ciclo
+   desconhecido). Só entram as tabelas de que algum cache se inscreveu.
+2. No commit, os canais são incrementados na tabela `versoes_cache`, na
+   mesma transação da escrita (se ela for desfeita, nada muda). Os canais
+   são gravados em ordem, o que evita deadlock entre transações que
+   escrevem nos mesmos canais.
+3. Depois do commit, os caches do próprio processo são avisados na hora e,
+   com um transporte configurado, os outros processos recebem um aviso para
+   consultar `versoes_cache` imediatamente.
+4. Cada processo consulta `versoes_cache` a cada
+   CACHE_BARRAMENTO_INTERVALO_SEGUNDOS e avisa seus caches dos canais que
+   mudaram. Esse é o atraso máximo da invalidação entre processos; o aviso
+   por transporte só o encurta, porque a tabela é sempre a fonte da verdade.
+
+Os transportes implementam `TransporteAviso`: `TransporteSocketUnix` (workers
+na mesma máquina, um socket de datagramas por processo em
+CACHE_BARRAMENTO_SOCKET_DIR) e `TransporteMemoria`, substituto local de um
+broker pub/sub para testes e para servir de modelo a outros transportes.
+"""
+
+import asyncio
+import glob
+import logging
+import os
+import socket
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Set,
+)
+
+from app.core.config import settings
+from app.database import SessionLocal
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import event, inspect
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.interfaces import MANYTOONE
+
+logger = logging.getLogger(__name__)
+
+# Chaves em session.info
+_CANAIS = "barramento_canais"  # canais escritos pela transação em andamento
+_VERSOES = "barramento_versoes"  # versões gravadas no commit em andamento
+
+# A linha de um ciclo é o próprio ciclo
+_TABELA_CICLOS = "ciclos"
+
+
+def nome_canal(tabela: str, ciclo_id: Optional[int] = None) -> str:
+    """Canal das escritas em uma tabela (e ciclo)"""
+    if ciclo_id is None:
+        return tabela
+    return f"{tabela}@{ciclo_id}"
+
+
+def nome_canal_todos_ciclos(tabela: str) -> str:
+    """Canal das escritas sem ciclo conhecido em uma tabela"""
+    return f"{tabela}!"
+
+
+def tabela_do_canal(canal: str) -> str:
+    return canal.split("@", 1)[0].rstrip("!")
+
+
+@dataclass(frozen=True)
+class _Inscricao:
+    tabelas: FrozenSet[str]
+    ao_alterar: Callable[[Set[str]], None]
+
+
+# ---------------------------------------------------------------------------
+# Transportes
+# ---------------------------------------------------------------------------
+
+
+class TransporteAviso(ABC):
+    """Avisa os outros processos de que `versoes_cache` mudou"""
+
+    @abstractmethod
+    def publicar(self) -> None:
+        """Envia o aviso; não pode bloquear nem levantar exceção"""
+
+    @abstractmethod
+    async def escutar(self, ao_receber: Callable[[], None]) -> None:
+        """Chama ao_receber a cada aviso de outro processo, até ser cancelado"""
+
+
+class TransporteSocketUnix(TransporteAviso):
+    """Um socket de datagramas por processo no diretório compartilhado"""
+
+    def __init__(self, diretorio: str):
+        self.diretorio = diretorio
+        self.caminho = os.path.join(diretorio, f"worker-{os.getpid()}.sock")
+        self._envio = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self._envio.setblocking(False)
+
+    def publicar(self) -> None:
+        for destino in glob.glob(os.path.join(self.diretorio, "worker-*.sock")):
+            if destino == self.caminho:
+                continue
+            try:
+                self._envio.sendto(b"1", destino)
+            except (ConnectionRefusedError, FileNotFoundError):
+                # Processo encerrado sem remover o socket
+                try:
+                    os.unlink(destino)
+                except OSError:
+                    pass
+            except OSError:
+                # Fila do destino cheia: ele já tem avisos pendentes
+                pass
+
+    async def escutar(self, ao_receber: Callable[[], None]) -> None:
+        os.makedirs(self.diretorio, exist_ok=True)
+        if os.path.exists(self.caminho):
+            os.unlink(self.caminho)
+        recepcao = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        recepcao.setblocking(False)
+        recepcao.bind(self.caminho)
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                await loop.sock_recv(recepcao, 16)
+                ao_receber()
+        finally:
+            recepcao.close()
+            try:
+                os.unlink(self.caminho)
+            except OSError:
+                pass
+
+
+class TransporteMemoria(TransporteAviso):
+    """Substituto local de um broker pub/sub: avisa as outras instâncias"""
+
+    _instancias: List["TransporteMemoria"] = []
+
+    def __init__(self):
+        self._ao_receber: Optional[Callable[[], None]] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def publicar(self) -> None:
+        for outro in list(self._instancias):
+            if outro is not self and outro._ao_receber and outro._loop:
+                outro._loop.call_soon_threadsafe(outro._ao_receber)
+
+    async def escutar(self, ao_receber: Callable[[], None]) -> None:
+        self._ao_receber = ao_receber
+        self._loop = asyncio.get_running_loop()
+        self._instancias.append(self)
+        try:
+            await asyncio.Event().wait()
+        finally:
+            self._instancias.remove(self)
+
+
+# ---------------------------------------------------------------------------
+# Barramento
+# ---------------------------------------------------------------------------
+
+
+class BarramentoCache:
+    """Propaga as escritas confirmadas aos caches deste e dos outros processos"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._inscricoes: List[_Inscricao] = []
+        self._tabelas: FrozenSet[str] = frozenset()
+        # Última versão conhecida de cada canal em versoes_cache
+        self._conhecidas: Dict[str, int] = {}
+        self._inicializado = False
+        self.transporte: Optional[TransporteAviso] = None
+
+    @property
+    def tabelas(self) -> FrozenSet[str]:
+        """Tabelas rastreadas (as de alguma inscrição)"""
+        return self._tabelas
+
+    def inscrever(
+        self, tabelas: Iterable[str], ao_alterar: Callable[[Set[str]], None]
+    ) -> None:
+        """
+        Avisa ao_alterar(canais) quando algum canal dessas tabelas mudar
+
+        O callback roda na thread que confirmou a transação ou na do
+        sincronizador, e deve apenas descartar ou marcar dados como
+        desatualizados.
+        """
+        inscricao = _Inscricao(frozenset(tabelas), ao_alterar)
+        with self._lock:
+            self._inscricoes.append(inscricao)
+            self._tabelas = self._tabelas | inscricao.tabelas
+
+    def notificar(self, canais: Set[str]) -> None:
+        """Repassa os canais alterados às inscrições interessadas"""
+        for inscricao in self._inscricoes:
+            interessados = {
+                canal
+                for canal in canais
+                if tabela_do_canal(canal) in inscricao.tabelas
+            }
+            if not interessados:
+                continue
+            try:
+                inscricao.ao_alterar(interessados)
+            except Exception as e:
+                logger.error(f"Erro ao invalidar cache: {str(e)}")
+
+    def registrar_confirmadas(self, versoes: Dict[str, int]) -> None:
+        """Versões gravadas por este processo (o sincronizador não as repete)"""
+        with self._lock:
+            for canal, versao in versoes.items():
+                if versao > self._conhecidas.get(canal, 0):
+                    self._conhecidas[canal] = versao
+
+    def inicializar(self) -> None:
+        """Lê as versões atuais como ponto de partida, sem avisar os caches"""
+        self._ler_versoes(avisar=False)
+
+    def sincronizar(self) -> Set[str]:
+        """Consulta versoes_cache e avisa os caches dos canais que mudaram"""
+        return self._ler_versoes(avisar=True)
+
+    def _ler_versoes(self, avisar: bool) -> Set[str]:
+        # Import local: os repositórios importam módulos que usam o barramento
+        from app.repositories.versao_cache import VersaoCacheRepository
+
+        db = SessionLocal()
+        try:
+            versoes = VersaoCacheRepository(db).get_versoes()
+        finally:
+            db.close()
+
+        with self._lock:
+            if self._inicializado:
+                alterados = {
+                    canal
+                    for canal, versao in versoes.items()
+                    if versao > self._conhecidas.get(canal, 0)
+                }
+            else:
+                # Sem ponto de partida, qualquer canal pode ter mudado
+                alterados = set(versoes) if avisar else set()
+            for canal in alterados | set(versoes):
+                self._conhecidas[canal] = max(
+                    self._conhecidas.get(canal, 0), versoes[canal]
+                )
+            self._inicializado = True
+
+        if alterados:
+            logger.debug(f"Canais de cache alterados por outro processo: {alterados}")
+            self.notificar(alterados)
+        return alterados
+
+
+barramento_cache = BarramentoCache()
+
+
+def configurar_transporte(transporte: Optional[TransporteAviso]) -> None:
+    """Troca o transporte de avisos entre processos (None desliga)"""
+    barramento_cache.transporte = transporte
+
+
+if settings.CACHE_BARRAMENTO_SOCKET_DIR:
+    configurar_transporte(TransporteSocketUnix(settings.CACHE_BARRAMENTO_SOCKET_DIR))
+
+
+# ---------------------------------------------------------------------------
+# Rastreamento das escritas
+# ---------------------------------------------------------------------------
+
+
+def _ciclos_do_objeto(obj: Any, tabela: str) -> Set[Optional[int]]:
+    """
+    Ciclos das linhas afetadas pela escrita de um objeto
+
+    Usa o ciclo_id (valores antigo e novo), o id quando o objeto é um ciclo,
+    ou o ciclo_id de um pai muitos-para-um já carregado (respostas de uma
+    avaliação, pares de um ciclo de avaliação). None quando não é possível
+    saber sem consultar o banco.
+    """
+    estado = inspect(obj)
+    atributo = "id" if tabela == _TABELA_CICLOS else "ciclo_id"
+    if atributo in estado.mapper.column_attrs:
+        historico = estado.attrs[atributo].history
+        ciclos = set(historico.added) | set(historico.deleted)
+        ciclos |= set(historico.unchanged)
+        ciclos.discard(None)
+        return ciclos or {None}
+
+    for relacao in estado.mapper.relationships:
+        if relacao.direction is not MANYTOONE or relacao.key not in estado.dict:
+            continue
+        pai = estado.dict[relacao.key]
+        ciclo_id = getattr(pai, "ciclo_id", None)
+        if ciclo_id is not None:
+            return {ciclo_id}
+    return {None}
+
+
+def _registrar(session: Session, tabela: str, ciclos: Iterable[Optional[int]]):
+    if tabela not in barramento_cache.tabelas:
+        return
+    canais = session.info.setdefault(_CANAIS, set())
+    canais.add(nome_canal(tabela))
+    for ciclo_id in ciclos:
+        if ciclo_id is None:
+            canais.add(nome_canal_todos_ciclos(tabela))
+        else:
+            canais.add(nome_canal(tabela, ciclo_id))
+
+
+def tem_escritas_pendentes(session: Session) -> bool:
+    """Se a transação da sessão já escreveu (ou vai escrever) algo"""
+    return bool(
+        session.info.get(_CANAIS) or session.new or session.dirty or session.deleted
+    )
+
+
+@event.listens_for(SessionLocal, "after_flush")
+def _rastrear_flush(session: Session, flush_context) -> None:
+    for objetos in (session.new, session.dirty, session.deleted):
+        for obj in objetos:
+            tabela = getattr(obj, "__tablename__", None)
+            if tabela is not None:
+                _registrar(session, tabela, _ciclos_do_objeto(obj, tabela))
+
+
+@event.listens_for(SessionLocal, "do_orm_execute")
+def _rastrear_dml(orm_execute_state) -> None:
+    # INSERT/UPDATE/DELETE em lote: o ciclo das linhas não é conhecido
+    if not (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        return
+    tabela = getattr(orm_execute_state.statement, "table", None)
+    nome = getattr(tabela, "name", None)
+    if nome is not None:
+        _registrar(orm_execute_state.session, nome, [None])
+
+
+@event.listens_for(SessionLocal, "before_commit")
+def _gravar_versoes(session: Session) -> None:
+    if not settings.CACHE_BARRAMENTO_HABILITADO:
+        return
+    # O flush do commit ainda não rodou: as escritas pendentes entram agora
+    session.flush()
+    canais = session.info.get(_CANAIS)
+    if not canais:
+        return
+    from app.repositories.versao_cache import VersaoCacheRepository
+
+    session.info[_VERSOES] = VersaoCacheRepository(session).incrementar(canais)
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _publicar(session: Session) -> None:
+    canais = session.info.pop(_CANAIS, None)
+    versoes = session.info.pop(_VERSOES, None)
+    if versoes:
+        barramento_cache.registrar_confirmadas(versoes)
+        if barramento_cache.transporte is not None:
+            barramento_cache.transporte.publicar()
+    if canais:
+        barramento_cache.notificar(canais)
+
+
+@event.listens_for(SessionLocal, "after_soft_rollback")
+def _descartar(session: Session, previous_transaction) -> None:
+    # Rollback de savepoint mantém o que a transação externa já escreveu
+    if previous_transaction.parent is None:
+        session.info.pop(_CANAIS, None)
+        session.info.pop(_VERSOES, None)
+
+
+# ---------------------------------------------------------------------------
+# Sincronização periódica
+# ---------------------------------------------------------------------------
+
+
+def inicializar_barramento() -> None:
+    """Ponto de partida das versões; em caso de erro a primeira sincronização avisa tudo"""
+    if not settings.CACHE_BARRAMENTO_HABILITADO:
+        return
+    try:
+        barramento_cache.inicializar()
+    except SQLAlchemyError as e:
+        logger.error(f"Erro ao ler versões do barramento de cache: {str(e)}")
+
+
+async def sincronizar_barramento_periodicamente() -> None:
+    """Consulta versoes_cache periodicamente ou ao receber um aviso"""
+    if not settings.CACHE_BARRAMENTO_HABILITADO:
+        return
+    loop = asyncio.get_running_loop()
+    aviso = asyncio.Event()
+    transporte = barramento_cache.transporte
+    escuta = None
+    if transporte is not None:
+        escuta = asyncio.create_task(
+            transporte.escutar(lambda: loop.call_soon_threadsafe(aviso.set))
+        )
+    try:
+        while True:
+            try:
+                await asyncio.wait_for(
+                    aviso.wait(), timeout=settings.CACHE_BARRAMENTO_INTERVALO_SEGUNDOS
+                )
+            except asyncio.TimeoutError:
+                pass
+            aviso.clear()
+            try:
+                await run_in_threadpool(barramento_cache.sincronizar)
+            except Exception as e:
+                logger.error(f"Erro ao sincronizar barramento de cache: {str(e)}")
+    finally:
+        if escuta is not None:
+            escuta.cancel()
@@ -0,0 +1,111 @@
+"""
+Requisições condicionais (ETag / Last-Modified / 304) para GETs cacheáveis.
+
+A rota informa uma versão barata do recurso (assinatura dos dados de
+referência, hash das linhas de uma tabela pequena etc.) antes de montar a
+resposta. Se o cliente já tem essa versão (If-None-Match, ou
+If-Modified-Since quando não há If-None-Match) a resposta é um 304 sem
+corpo, e o service e a serialização não chegam a rodar.
+
+A ETag é forte: o hash da versão e da versão da aplicação, que muda o
+formato das respostas.
+"""
+
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Callable, Optional, Type
+
+from app.core.config import settings
+from app.core.serializacao import resposta_json, resposta_modelo
+from fastapi import Request, status
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+from starlette.responses import Response
+
+# Cache-Control das rotas que sempre revalidam (304 quando nada mudou)
+CACHE_REVALIDAR = "no-cache"
+
+
+def cache_referencia() -> str:
+    """Cache-Control dos dados de referência, reaproveitados sem revalidar"""
+    return f"public, max-age={settings.CACHE_REFERENCIA_MAX_AGE_SEGUNDOS}"
+
+
+def calcular_etag(versao: Any) -> str:
+    """ETag forte para a versão do recurso"""
+    conteudo = f"{settings.APP_VERSION}|{versao}".encode()
+    return f'"{hashlib.sha256(conteudo).hexdigest()[:32]}"'
+
+
+def _etag_confere(if_none_match: str, etag: str) -> bool:
+    """Comparação fraca do If-None-Match (RFC 9110), como pede o GET"""
+    if if_none_match.strip() == "*":
+        return True
+    for candidata in if_none_match.split(","):
+        candidata = candidata.strip()
+        if candidata.startswith("W/"):
+            candidata = candidata[2:]
+        if candidata == etag:
+            return True
+    return False
+
+
+def _nao_modificado_desde(
+    if_modified_since: str, ultima_modificacao: datetime
+) -> bool:
+    try:
+        momento = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if ultima_modificacao.tzinfo is None:
+        ultima_modificacao = ultima_modificacao.replace(tzinfo=timezone.utc)
+    # O header tem precisão de segundos
+    return ultima_modificacao.replace(microsecond=0) <= momento
+
+
+def resposta_condicional(
+    request: Request,
+    versao: Any,
+    gerar: Callable[[], Any],
+    modelo: Optional[Type[BaseModel]] = None,
+    cache_control: str = CACHE_REVALIDAR,
+    ultima_modificacao: Optional[datetime] = None,
+) -> Response:
+    """
+    Responde 304 se o cliente já tem a versão, ou monta a resposta com gerar()
+
+    Args:
+        request: Requisição (headers condicionais)
+        versao: Versão atual do recurso; a ETag é derivada dela
+        gerar: Monta o conteúdo; só é chamada quando a resposta tem corpo
+        modelo: Schema de resposta usado para validar e serializar o conteúdo
+        cache_control: Valor do header Cache-Control
+        ultima_modificacao: Data de alteração do recurso (Last-Modified)
+    """
+    etag = calcular_etag(versao)
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if ultima_modificacao is not None:
+        if ultima_modificacao.tzinfo is None:
+            ultima_modificacao = ultima_modificacao.replace(tzinfo=timezone.utc)
+        headers["Last-Modified"] = format_datetime(
+            ultima_modificacao.astimezone(timezone.utc), usegmt=True
+        )
+
+    if_none_match = request.headers.get("if-none-match")
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_none_match is not None:
+        nao_modificado = _etag_confere(if_none_match, etag)
+    else:
+        nao_modificado = (
+            if_modified_since is not None
+            and ultima_modificacao is not None
+            and _nao_modificado_desde(if_modified_since, ultima_modificacao)
+        )
+    if nao_modificado:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    conteudo = gerar()
+    if modelo is not None:
+        return resposta_modelo(conteudo, modelo, headers=headers)
+    return resposta_json(jsonable_encoder(conteudo), headers=headers)
@@ -0,0 +1,268 @@
+"""
+Cache de respostas dos agregados administrativos, invalidado pelas escritas.
+
+Acompanhamento do ciclo, feedback de calibração e feedbacks de gestor são
+recalculados com dezenas de consultas a cada atualização da tela do admin,
+mesmo quando nada mudou. As respostas dessas rotas ficam guardadas já
+serializadas (bytes JSON), com uma chave formada pela rota, pelos parâmetros
+e pelo vetor de versões das tabelas de que a resposta depende.
+
+Versões
+-------
+Cada tabela tem contadores de versão, incrementados quando uma transação que
+escreveu nela faz commit, neste ou em outro processo (avisos do
+`app.core.barramento_cache`, sem TTL):
+
+- `tabela`: toda escrita na tabela
+- `tabela@<ciclo_id>`: escritas em linhas de um ciclo conhecido
+- `tabela!`: escritas em que o ciclo não é conhecido (DML em lote, linhas
+  sem ciclo_id), que valem para todos os ciclos
+
+Uma dependência com ciclo lê `tabela@<ciclo_id>` e `tabela!`; sem ciclo, lê
+`tabela`. Quando uma versão muda, a chave muda e a entrada antiga deixa de ser
+usada (e sai do LRU com o tempo).
+
+Armazenamento
+-------------
+`ArmazenamentoCache` é a interface; `CacheLRU` guarda entradas e versões na
+memória do processo. Um armazenamento compartilhado (Redis, por exemplo)
+implementa a mesma interface e é instalado com `configurar_armazenamento`.
+Escritas feitas por outros processos chegam pelo barramento em até
+CACHE_BARRAMENTO_INTERVALO_SEGUNDOS.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+)
+
+from app.core.barramento_cache import (
+    barramento_cache,
+    nome_canal,
+    nome_canal_todos_ciclos,
+    tem_escritas_pendentes,
+)
+from app.core.config import settings
+from app.core.serializacao import resposta_json, resposta_modelo
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+from starlette.responses import Response
+
+logger = logging.getLogger(__name__)
+
+# Tabelas lidas pelas respostas em cache; só as escritas nelas são rastreadas
+TABELAS_AGREGADOS: FrozenSet[str] = frozenset(
+    {
+        "colaboradores",
+        "ciclos",
+        "ciclos_avaliacao",
+        "pares_selecionados",
+        "avaliacoes",
+        "avaliacoes_eixos",
+        "avaliacoes_gestor",
+        "avaliacoes_gestor_respostas",
+        "feedback_liberacao",
+        "eixos_avaliacao",
+    }
+)
+
+
+@dataclass(frozen=True)
+class Dependencia:
+    """Tabela (e opcionalmente ciclo) de que uma resposta depende"""
+
+    tabela: str
+    ciclo_id: Optional[int] = None
+
+    def __post_init__(self):
+        if self.tabela not in TABELAS_AGREGADOS:
+            # Escritas em tabelas fora da lista não invalidariam a resposta
+            raise ValueError(f"Tabela sem rastreamento de versão: {self.tabela}")
+
+    def nomes_versao(self) -> Tuple[str, ...]:
+        if self.ciclo_id is None:
+            return (nome_canal(self.tabela),)
+        return (
+            nome_canal(self.tabela, self.ciclo_id),
+            nome_canal_todos_ciclos(self.tabela),
+        )
+
+
+class ArmazenamentoCache(ABC):
+    """Interface dos armazenamentos de entradas e versões do cache"""
+
+    @abstractmethod
+    def obter(self, chave: str) -> Optional[bytes]:
+        """Entrada guardada na chave, ou None"""
+
+    @abstractmethod
+    def gravar(self, chave: str, valor: bytes) -> None:
+        """Guarda uma entrada"""
+
+    @abstractmethod
+    def ler_versoes(self, nomes: Sequence[str]) -> Tuple[int, ...]:
+        """Versões atuais dos contadores, na ordem recebida (0 se nunca tocado)"""
+
+    @abstractmethod
+    def incrementar_versoes(self, nomes: Iterable[str]) -> None:
+        """Incrementa os contadores"""
+
+    @abstractmethod
+    def limpar(self) -> None:
+        """Remove todas as entradas (as versões continuam valendo)"""
+
+
+class CacheLRU(ArmazenamentoCache):
+    """Armazenamento na memória do processo, com descarte LRU das entradas"""
+
+    def __init__(self, max_itens: int):
+        self.max_itens = max_itens
+        self._lock = threading.Lock()
+        self._entradas: "OrderedDict[str, bytes]" = OrderedDict()
+        self._versoes: Dict[str, int] = {}
+
+    def obter(self, chave: str) -> Optional[bytes]:
+        with self._lock:
+            valor = self._entradas.get(chave)
+            if valor is not None:
+                self._entradas.move_to_end(chave)
+            return valor
+
+    def gravar(self, chave: str, valor: bytes) -> None:
+        with self._lock:
+            self._entradas[chave] = valor
+            self._entradas.move_to_end(chave)
+            while len(self._entradas) > self.max_itens:
+                self._entradas.popitem(last=False)
+
+    def ler_versoes(self, nomes: Sequence[str]) -> Tuple[int, ...]:
+        with self._lock:
+            return tuple(self._versoes.get(nome, 0) for nome in nomes)
+
+    def incrementar_versoes(self, nomes: Iterable[str]) -> None:
+        with self._lock:
+            for nome in nomes:
+                self._versoes[nome] = self._versoes.get(nome, 0) + 1
+
+    def limpar(self) -> None:
+        with self._lock:
+            self._entradas.clear()
+
+    def __len__(self) -> int:
+        return len(self._entradas)
+
+
+_armazenamento: ArmazenamentoCache = CacheLRU(settings.CACHE_RESPOSTAS_MAX_ITENS)
+
+
+def get_armazenamento() -> ArmazenamentoCache:
+    return _armazenamento
+
+
+def configurar_armazenamento(armazenamento: ArmazenamentoCache) -> None:
+    """Troca o armazenamento do cache (ex.: um armazenamento compartilhado)"""
+    global _armazenamento
+    _armazenamento = armazenamento
+
+
+def _publicar_versoes(canais: Set[str]) -> None:
+    try:
+        _armazenamento.incrementar_versoes(canais)
+    except Exception as e:
+        # Sem as novas versões o cache serviria dados antigos
+        logger.error(f"Erro ao publicar versões do cache de respostas: {str(e)}")
+        _armazenamento.limpar()
+
+
+barramento_cache.inscrever(TABELAS_AGREGADOS, _publicar_versoes)
+
+
+# ---------------------------------------------------------------------------
+# Respostas
+# ---------------------------------------------------------------------------
+
+
+def _montar_chave(
+    rota: str, parametros: Dict[str, Any], versoes: Tuple[int, ...]
+) -> str:
+    conteudo = json.dumps(
+        [settings.APP_VERSION, rota, parametros, versoes],
+        sort_keys=True,
+        default=str,
+    )
+    return f"{rota}:{hashlib.sha256(conteudo.encode()).hexdigest()}"
+
+
+def resposta_em_cache(
+    db: Session,
+    rota: str,
+    parametros: Dict[str, Any],
+    dependencias: Sequence[Dependencia],
+    gerar: Callable[[], Any],
+    modelo: Optional[Type[BaseModel]] = None,
+    usar_cache: bool = True,
+) -> Response:
+    """
+    Responde com a entrada do cache ou monta a resposta com gerar() e a guarda
+
+    As versões são lidas antes de gerar: uma escrita concorrente que termine
+    durante a geração muda a versão e a entrada gravada nunca é lida.
+
+    Args:
+        db: Sessão da requisição (não usa o cache se ela já escreveu algo)
+        rota: Identificador da rota
+        parametros: Parâmetros que mudam a resposta
+        dependencias: Tabelas (e ciclos) lidas para montar a resposta
+        gerar: Monta o conteúdo quando não há entrada
+        modelo: Schema de resposta usado para validar e serializar o conteúdo
+        usar_cache: Com False apenas gera (ex.: usuário sem acesso, para o
+            service aplicar as próprias regras e mensagens)
+    """
+    if not (usar_cache and settings.CACHE_RESPOSTAS_HABILITADO) or (
+        tem_escritas_pendentes(db)
+    ):
+        return _serializar(gerar(), modelo)
+
+    armazenamento = _armazenamento
+    nomes = [nome for dep in dependencias for nome in dep.nomes_versao()]
+    try:
+        chave = _montar_chave(rota, parametros, armazenamento.ler_versoes(nomes))
+        corpo = armazenamento.obter(chave)
+    except Exception as e:
+        logger.error(f"Erro ao ler o cache de respostas: {str(e)}")
+        return _serializar(gerar(), modelo)
+
+    if corpo is not None:
+        return Response(
+            corpo, media_type="application/json", headers={"X-Cache": "HIT"}
+        )
+
+    resposta = _serializar(gerar(), modelo)
+    resposta.headers["X-Cache"] = "MISS"
+    try:
+        armazenamento.gravar(chave, bytes(resposta.body))
+    except Exception as e:
+        logger.error(f"Erro ao gravar no cache de respostas: {str(e)}")
+    return resposta
+
+
+def _serializar(conteudo: Any, modelo: Optional[Type[BaseModel]]) -> Response:
+    if modelo is not None:
+        return resposta_modelo(conteudo, modelo)
+    return resposta_json(jsonable_encoder(conteudo))
@@ -0,0 +1,171 @@
+"""
+Seleção de campos (sparse fieldsets) nas listagens.
+
+`fields=` escolhe os campos simples da resposta e `include=` os campos que
+dependem de relacionamentos (ex: avaliador, eixos). O que não foi pedido não
+é carregado do banco (load_only / relacionamentos não carregados) nem
+serializado. Sem nenhum dos dois parâmetros a resposta continua completa.
+
+Exemplo: GET /avaliacoes?fields=id,avaliado_id,tipo&include=eixos
+"""
+
+import enum
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Sequence, Type
+
+from app.core.exceptions import ValidationException
+from app.core.serializacao import resposta_json
+from fastapi import Query
+from pydantic import BaseModel, create_model
+from sqlalchemy.orm import load_only
+from starlette.responses import Response
+
+
+@dataclass
+class CamposParams:
+    """Parâmetros fields/include recebidos na query string"""
+
+    fields: Optional[List[str]] = None
+    include: Optional[List[str]] = None
+
+    @property
+    def ativa(self) -> bool:
+        return self.fields is not None or self.include is not None
+
+
+def _separar(valor: Optional[str]) -> Optional[List[str]]:
+    if valor is None:
+        return None
+    return [parte.strip() for parte in valor.split(",") if parte.strip()]
+
+
+def get_campos(
+    fields: Optional[str] = Query(
+        None, description="Campos da resposta, separados por vírgula"
+    ),
+    include: Optional[str] = Query(
+        None, description="Relacionamentos a incluir, separados por vírgula"
+    ),
+) -> CamposParams:
+    """Dependência que lê os parâmetros fields/include da requisição"""
+    return CamposParams(fields=_separar(fields), include=_separar(include))
+
+
+@dataclass(frozen=True)
+class Inclusao:
+    """Campo da resposta que depende de relacionamentos"""
+
+    carregar: Callable[[], Sequence[Any]]  # Opções de carregamento (ex: selectinload)
+    extrair: Callable[[Any], Any]  # Valor do campo a partir do objeto ORM
+
+
+@dataclass(frozen=True)
+class ProjecaoRecurso:
+    """Campos disponíveis para seleção na listagem de um recurso"""
+
+    modelo: Any  # Modelo SQLAlchemy
+    resposta: Type[BaseModel]  # Schema de resposta completo
+    colunas: Sequence[str]  # Campos simples (mesmo nome do atributo do modelo)
+    inclusoes: Dict[str, Inclusao] = field(default_factory=dict)
+    # Colunas sempre carregadas (chave primária e ordenação da paginação)
+    carregar_sempre: Sequence[str] = ("id", "created_at")
+
+    def resolver(self, params: CamposParams) -> Optional["Selecao"]:
+        """
+        Valida os campos pedidos
+
+        Returns:
+            None quando a resposta completa deve ser usada
+        """
+        if not params.ativa:
+            return None
+
+        colunas = list(self.colunas) if params.fields is None else params.fields
+        inclusoes = params.include or []
+
+        invalidas = [c for c in colunas if c not in self.colunas]
+        if invalidas:
+            raise ValidationException(
+                f"Campos inválidos: {', '.join(invalidas)}. Valores aceitos: {', '.join(self.colunas)}",
+                field="fields",
+            )
+        invalidas = [i for i in inclusoes if i not in self.inclusoes]
+        if invalidas:
+            raise ValidationException(
+                f"Inclusões inválidas: {', '.join(invalidas)}. Valores aceitos: {', '.join(self.inclusoes)}",
+                field="include",
+            )
+
+        if "id" not in colunas:
+            colunas = ["id"] + colunas
+        return Selecao(
+            self,
+            list(dict.fromkeys(colunas)),
+            list(dict.fromkeys(inclusoes)),
+        )
+
+
+class Selecao:
+    """Campos escolhidos para uma requisição"""
+
+    def __init__(
+        self, projecao: ProjecaoRecurso, colunas: List[str], inclusoes: List[str]
+    ):
+        self.projecao = projecao
+        self.colunas = colunas
+        self.inclusoes = inclusoes
+        self.resposta = _modelo_parcial(
+            projecao.resposta, frozenset(colunas + inclusoes)
+        )
+
+    def opcoes(self) -> List[Any]:
+        """Opções de carregamento do SQLAlchemy para os campos escolhidos"""
+        modelo = self.projecao.modelo
+        carregar = dict.fromkeys(list(self.projecao.carregar_sempre) + self.colunas)
+        opcoes: List[Any] = [load_only(*(getattr(modelo, c) for c in carregar))]
+        for nome in self.inclusoes:
+            opcoes.extend(self.projecao.inclusoes[nome].carregar())
+        return opcoes
+
+    def serializar(self, obj: Any) -> Dict[str, Any]:
+        """Serializa o objeto ORM apenas com os campos escolhidos"""
+        dados = {}
+        for coluna in self.colunas:
+            valor = getattr(obj, coluna)
+            dados[coluna] = valor.value if isinstance(valor, enum.Enum) else valor
+        for nome in self.inclusoes:
+            dados[nome] = self.projecao.inclusoes[nome].extrair(obj)
+        return self.resposta.model_validate(dados, from_attributes=True).model_dump(
+            mode="json"
+        )
+
+
+@lru_cache(maxsize=256)
+def _modelo_parcial(
+    resposta: Type[BaseModel], campos: FrozenSet[str]
+) -> Type[BaseModel]:
+    """Cria (e reaproveita) o schema com apenas os campos escolhidos"""
+    definicoes = {
+        nome: (info.annotation, ...)
+        for nome, info in resposta.model_fields.items()
+        if nome in campos
+    }
+    return create_model(f"{resposta.__name__}Parcial", **definicoes)
+
+
+def listagem_parcial(
+    selecao: Selecao, chave: str, resultado: Dict[str, Any]
+) -> Response:
+    """
+    Monta a resposta de uma listagem apenas com os campos escolhidos
+
+    Retorna a resposta pronta para que o response_model completo da rota não
+    seja aplicado (ele preencheria de volta os campos omitidos).
+    """
+    return resposta_json(
+        {
+            **resultado,
+            chave: [selecao.serializar(item) for item in resultado[chave]],
+        }
+    )
@@ -9,6 +9,9 @@ class Settings(BaseSettings):
     APP_VERSION: str = "1.0.0"
     DEBUG: bool = True
     SQLALCHEMY_DEBUG: bool = False
+    # Relacionamento não declarado nas opções de carregamento de uma listagem
+    # levanta erro em vez de lazy load (habilitar em desenvolvimento e testes)
+    SQLALCHEMY_RAISELOAD: bool = False
     SECRET_KEY: str
 
     # Database
@@ -34,6 +37,56 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: str = "HS256"
     JWT_EXPIRATION_HOURS: int = 24
 
+    # Rascunhos
+    # Salvamentos do mesmo rascunho dentro desta janela são agrupados em memória
+    # e gravados com um único upsert quando a janela fecha (0 = gravar sempre)
+    RASCUNHO_JANELA_SEGUNDOS: float = 5.0
+
+    # Idempotência (header Idempotency-Key)
+    IDEMPOTENCIA_TTL_HORAS: int = 24
+    IDEMPOTENCIA_INTERVALO_LIMPEZA_SEGUNDOS: int = 600
+
+    # Exclusão de ciclos (registros removidos por transação)
+    EXCLUSAO_CICLO_LOTE: int = 1000
+
+    # Busca de colaboradores (índice em memória)
+    # Intervalo para conferir se outro processo alterou colaboradores
+    BUSCA_COLABORADORES_VERIFICACAO_SEGUNDOS: float = 30.0
+
+    # Cache HTTP (ETag / 304)
+    # Tempo em que o navegador reaproveita eixos, valores, perguntas e níveis
+    # sem revalidar; depois disso revalida com If-None-Match
+    CACHE_REFERENCIA_MAX_AGE_SEGUNDOS: int = 300
+
+    # Cache de respostas dos agregados administrativos (acompanhamento,
+    # feedbacks de calibração), invalidado a cada commit que altera as tabelas
+    CACHE_RESPOSTAS_HABILITADO: bool = True
+    CACHE_RESPOSTAS_MAX_ITENS: int = 512
+
+    # Estado dos ciclos em memória (ciclo aberto e etapas)
+    # Intervalo para conferir se outro processo alterou ciclos
+    CICLOS_ESTADO_VERIFICACAO_SEGUNDOS: float = 5.0
+
+    # Barramento de invalidação dos caches em memória entre processos
+    # (tabela versoes_cache). O intervalo é o atraso máximo para um processo
+    # perceber escritas de outro; com CACHE_BARRAMENTO_SOCKET_DIR (diretório
+    # compartilhado pelos workers da máquina) o aviso chega na hora
+    CACHE_BARRAMENTO_HABILITADO: bool = True
+    CACHE_BARRAMENTO_INTERVALO_SEGUNDOS: float = 2.0
+    CACHE_BARRAMENTO_SOCKET_DIR: str = ""
+
+    # Negociação de conteúdo das respostas
+    # Compressão (br/gzip, conforme Accept-Encoding) a partir do tamanho
+    # mínimo; corpos a partir de COMPRESSAO_THREADPOOL_BYTES são comprimidos
+    # (e convertidos para MessagePack) fora do event loop
+    COMPRESSAO_HABILITADA: bool = True
+    COMPRESSAO_TAMANHO_MINIMO: int = 1024
+    COMPRESSAO_THREADPOOL_BYTES: int = 65536
+    COMPRESSAO_GZIP_NIVEL: int = 6
+    COMPRESSAO_BROTLI_QUALIDADE: int = 5
+    # MessagePack (Accept: application/msgpack) nas listagens de admin
+    MSGPACK_HABILITADO: bool = True
+
     # Server
     HOST: str = "0.0.0.0"
     PORT: int = 8000
@@ -0,0 +1,224 @@
+"""
+Registro em memória dos dados de referência.
+
+Eixos de avaliação (com seus níveis), valores, perguntas da avaliação de
+gestor e níveis esperados por carreira mudam raramente, mas eram lidos do
+banco (ou de constantes espalhadas) a cada requisição. O registro carrega
+tudo na inicialização em estruturas imutáveis (dataclasses congeladas,
+tuplas e MappingProxyType), que podem ser compartilhadas entre threads sem
+cópia.
+
+Cada carga gera uma nova versão (`versao`, crescente por processo) e uma
+`assinatura` (hash do conteúdo, igual em todos os processos com os mesmos
+dados), usada como ETag das rotas que servem esses dados. Escritas em eixos,
+níveis ou valores feitas pela aplicação (em qualquer processo) descartam os
+dados pelo barramento de cache, e a próxima leitura recarrega. Depois de
+alterar essas tabelas direto no banco, chame `recarregar` (ou o endpoint
+POST /dados-referencia/recarregar em cada processo da aplicação).
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import Any, Mapping, Optional, Tuple
+
+from app.core.barramento_cache import barramento_cache
+from app.core.validators import NIVEIS_ESPERADOS_POR_CARREIRA
+from app.database import SessionLocal
+from app.schemas.avaliacao_gestor import (
+    CATEGORIAS_PERGUNTAS,
+    PERGUNTAS_ABERTAS,
+    PERGUNTAS_FECHADAS,
+)
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# Níveis esperados para níveis de carreira sem configuração
+NIVEIS_ESPERADOS_PADRAO: Tuple[int, ...] = (0, 0, 0, 0)
+
+
+def _congelar(valor: Any) -> Any:
+    """Cópia imutável de dicts e listas aninhados"""
+    if isinstance(valor, Mapping):
+        return MappingProxyType({k: _congelar(v) for k, v in valor.items()})
+    if isinstance(valor, (list, tuple)):
+        return tuple(_congelar(v) for v in valor)
+    return valor
+
+
+@dataclass(frozen=True)
+class NivelReferencia:
+    id: int
+    nivel: int
+    descricao: str
+
+
+@dataclass(frozen=True)
+class EixoReferencia:
+    id: int
+    codigo: str
+    nome: str
+    niveis: Tuple[NivelReferencia, ...]
+
+
+@dataclass(frozen=True)
+class ValorReferencia:
+    id: int
+    codigo: str
+    nome: str
+    icone: Optional[str]
+
+
+@dataclass(frozen=True)
+class DadosReferencia:
+    """Fotografia imutável dos dados de referência em uma versão"""
+
+    versao: int
+    assinatura: str
+    carregado_em: datetime
+    eixos: Tuple[EixoReferencia, ...]
+    valores: Tuple[ValorReferencia, ...]
+    categorias_perguntas: Mapping[str, str]
+    perguntas_fechadas: Mapping[str, Mapping[str, str]]
+    perguntas_abertas: Mapping[str, Mapping[str, str]]
+    niveis_esperados_por_carreira: Mapping[str, Tuple[int, ...]]
+    eixos_por_id: Mapping[int, EixoReferencia] = field(init=False)
+    valores_por_id: Mapping[int, ValorReferencia] = field(init=False)
+
+    def __post_init__(self):
+        object.__setattr__(
+            self, "eixos_por_id", MappingProxyType({e.id: e for e in self.eixos})
+        )
+        object.__setattr__(
+            self, "valores_por_id", MappingProxyType({v.id: v for v in self.valores})
+        )
+
+    def get_pergunta(self, codigo: str) -> Optional[Mapping[str, str]]:
+        """Informações de uma pergunta (fechada ou aberta) pelo código"""
+        pergunta = self.perguntas_fechadas.get(codigo)
+        if pergunta is None:
+            pergunta = self.perguntas_abertas.get(codigo)
+        return pergunta
+
+    def get_niveis_esperados(self, nivel_carreira: str) -> Tuple[int, ...]:
+        """Níveis esperados por eixo para um nível de carreira"""
+        return self.niveis_esperados_por_carreira.get(
+            nivel_carreira, NIVEIS_ESPERADOS_PADRAO
+        )
+
+
+class RegistroReferencia:
+    """Dados de referência do processo, trocados por inteiro a cada carga"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._dados: Optional[DadosReferencia] = None
+        self._versao = 0
+
+    @property
+    def carregado(self) -> bool:
+        return self._dados is not None
+
+    def obter(self, db: Session) -> DadosReferencia:
+        """Retorna a versão atual, carregando com a sessão recebida se preciso"""
+        dados = self._dados
+        if dados is None:
+            dados = self.recarregar(db)
+        return dados
+
+    def recarregar(self, db: Session) -> DadosReferencia:
+        """Lê os dados do banco e publica uma nova versão"""
+        # Import local: os repositórios importam este módulo
+        from app.repositories.eixo_avaliacao import EixoAvaliacaoRepository
+        from app.repositories.valor import ValorRepository
+
+        eixos = tuple(
+            EixoReferencia(
+                id=eixo.id,
+                codigo=eixo.codigo,
+                nome=eixo.nome,
+                niveis=tuple(
+                    NivelReferencia(id=n.id, nivel=n.nivel, descricao=n.descricao)
+                    for n in eixo.niveis
+                ),
+            )
+            for eixo in sorted(
+                EixoAvaliacaoRepository(db).get_all(), key=lambda e: e.id
+            )
+        )
+        valor_repository = ValorRepository(db)
+        valores = tuple(
+            ValorReferencia(id=v.id, codigo=v.codigo, nome=v.nome, icone=v.icone)
+            for v in valor_repository.get_all(order_by=valor_repository.model.id)
+        )
+
+        conteudo = {
+            "eixos": [asdict(eixo) for eixo in eixos],
+            "valores": [asdict(valor) for valor in valores],
+            "categorias_perguntas": CATEGORIAS_PERGUNTAS,
+            "perguntas_fechadas": PERGUNTAS_FECHADAS,
+            "perguntas_abertas": PERGUNTAS_ABERTAS,
+            "niveis_esperados_por_carreira": NIVEIS_ESPERADOS_POR_CARREIRA,
+        }
+        assinatura = hashlib.sha256(
+            json.dumps(conteudo, sort_keys=True, ensure_ascii=False).encode()
+        ).hexdigest()
+
+        with self._lock:
+            self._versao += 1
+            dados = DadosReferencia(
+                versao=self._versao,
+                assinatura=assinatura,
+                carregado_em=datetime.now(timezone.utc),
+                eixos=eixos,
+                valores=valores,
+                categorias_perguntas=_congelar(CATEGORIAS_PERGUNTAS),
+                perguntas_fechadas=_congelar(PERGUNTAS_FECHADAS),
+                perguntas_abertas=_congelar(PERGUNTAS_ABERTAS),
+                niveis_esperados_por_carreira=_congelar(NIVEIS_ESPERADOS_POR_CARREIRA),
+            )
+            self._dados = dados
+        logger.info(
+            f"Dados de referência carregados. Versão: {dados.versao}, "
+            f"eixos: {len(eixos)}, valores: {len(valores)}"
+        )
+        return dados
+
+    def invalidar(self) -> None:
+        """Descarta os dados; a próxima leitura recarrega do banco"""
+        with self._lock:
+            self._dados = None
+
+
+registro_referencia = RegistroReferencia()
+barramento_cache.inscrever(
+    {"eixos_avaliacao", "niveis_eixo", "valores"},
+    lambda canais: registro_referencia.invalidar(),
+)
+
+
+def carregar_dados_referencia() -> None:
+    """Carrega os dados de referência com uma sessão própria"""
+    db = SessionLocal()
+    try:
+        registro_referencia.recarregar(db)
+    except SQLAlchemyError as e:
+        # A primeira leitura tenta de novo
+        logger.error(f"Erro ao carregar dados de referência: {str(e)}")
+    finally:
+        db.close()
+
+
+async def carregar_dados_referencia_em_segundo_plano() -> None:
+    """Carrega os dados de referência na inicialização sem bloquear a aplicação"""
+    try:
+        await run_in_threadpool(carregar_dados_referencia)
+    except Exception as e:
+        logger.error(f"Erro ao carregar dados de referência: {str(e)}")
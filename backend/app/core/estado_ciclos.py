@@ -0,0 +1,159 @@
+"""
+Estado dos ciclos em memória (ciclo aberto e etapa de cada ciclo).
+
+Quase toda escrita (avaliações, escolha de pares, liberação de feedback)
+começa conferindo se o ciclo existe e em que etapa está, e várias leituras
+procuram o ciclo aberto. A tabela de ciclos muda poucas vezes por trimestre,
+então o processo guarda uma fotografia imutável de todos os ciclos e essas
+conferências viram leituras de memória.
+
+A fotografia é descartada quando a transação que cria, altera, avança ou
+exclui um ciclo é confirmada (`invalidar_ao_confirmar`) e quando o
+barramento de cache avisa de uma escrita em ciclos feita por outro processo.
+A assinatura da tabela, conferida no máximo a cada
+CICLOS_ESTADO_VERIFICACAO_SEGUNDOS, cobre escritas feitas fora da aplicação.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+from app.core.barramento_cache import barramento_cache
+from app.core.config import settings
+from app.models.ciclo import EtapaCiclo, StatusCiclo
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# Chave em session.info: invalidação pendente na transação da sessão
+_INVALIDAR = "estado_ciclos_invalidar"
+
+
+@dataclass(frozen=True)
+class CicloEstado:
+    """Colunas de um ciclo, sem vínculo com a sessão"""
+
+    id: int
+    nome: str
+    status: StatusCiclo
+    etapa_atual: EtapaCiclo
+    data_inicio: Optional[datetime]
+    data_fim: Optional[datetime]
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
+
+
+@dataclass(frozen=True)
+class EstadoCiclos:
+    """Fotografia dos ciclos em um instante"""
+
+    assinatura: str
+    ciclos: Mapping[int, CicloEstado]
+    aberto: Optional[CicloEstado]
+
+    def get(self, ciclo_id: int) -> Optional[CicloEstado]:
+        return self.ciclos.get(ciclo_id)
+
+
+class CacheEstadoCiclos:
+    """Estado dos ciclos do processo, recarregado quando a tabela muda"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._estado: Optional[EstadoCiclos] = None
+        self._verificado_em = 0.0
+        # Incrementada a cada invalidação: uma carga que começou antes não
+        # publica dados anteriores ao commit
+        self._geracao = 0
+
+    def obter(self, db: Session) -> EstadoCiclos:
+        """Retorna o estado atual, carregando com a sessão recebida se preciso"""
+        estado = self._estado
+        if estado is None:
+            return self.carregar(db)
+        if (
+            time.monotonic() - self._verificado_em
+            >= settings.CICLOS_ESTADO_VERIFICACAO_SEGUNDOS
+        ):
+            # Import local: o repositório de ciclos importa este módulo
+            from app.repositories.ciclo import CicloRepository
+
+            assinatura, _ = CicloRepository(db).get_assinatura()
+            if assinatura != estado.assinatura:
+                return self.carregar(db, assinatura)
+            self._verificado_em = time.monotonic()
+        return estado
+
+    def carregar(
+        self, db: Session, assinatura: Optional[str] = None
+    ) -> EstadoCiclos:
+        """Lê todos os ciclos e publica uma nova fotografia"""
+        from app.repositories.ciclo import CicloRepository
+
+        geracao = self._geracao
+        repository = CicloRepository(db)
+        if assinatura is None:
+            assinatura, _ = repository.get_assinatura()
+        ciclos = {
+            ciclo.id: CicloEstado(
+                id=ciclo.id,
+                nome=ciclo.nome,
+                status=ciclo.status,
+                etapa_atual=ciclo.etapa_atual,
+                data_inicio=ciclo.data_inicio,
+                data_fim=ciclo.data_fim,
+                created_at=ciclo.created_at,
+                updated_at=ciclo.updated_at,
+            )
+            for ciclo in repository.get_all()
+        }
+        # Mesmo critério de CicloRepository.get_aberto: o aberto mais recente
+        abertos = [c for c in ciclos.values() if c.status == StatusCiclo.ABERTO]
+        aberto = max(
+            abertos,
+            key=lambda c: (c.created_at is not None, c.created_at, c.id),
+            default=None,
+        )
+        estado = EstadoCiclos(
+            assinatura=assinatura, ciclos=MappingProxyType(ciclos), aberto=aberto
+        )
+
+        with self._lock:
+            if geracao == self._geracao:
+                self._estado = estado
+                self._verificado_em = time.monotonic()
+        logger.debug(
+            f"Estado dos ciclos carregado. Ciclos: {len(ciclos)}, "
+            f"aberto: {aberto.id if aberto else None}"
+        )
+        return estado
+
+    def invalidar(self) -> None:
+        """Descarta a fotografia; a próxima leitura recarrega do banco"""
+        with self._lock:
+            self._geracao += 1
+            self._estado = None
+
+    def invalidar_ao_confirmar(self, db: Session) -> None:
+        """Descarta a fotografia quando a transação de `db` for confirmada"""
+        if _INVALIDAR not in db.info:
+            event.listen(db, "after_commit", self._aplicar_invalidacao)
+            event.listen(db, "after_rollback", self._descartar_invalidacao)
+        db.info[_INVALIDAR] = True
+
+    def _aplicar_invalidacao(self, db: Session) -> None:
+        if db.info.get(_INVALIDAR):
+            db.info[_INVALIDAR] = False
+            self.invalidar()
+
+    def _descartar_invalidacao(self, db: Session) -> None:
+        db.info[_INVALIDAR] = False
+
+
+estado_ciclos = CacheEstadoCiclos()
+barramento_cache.inscrever({"ciclos"}, lambda canais: estado_ciclos.invalidar())
@@ -0,0 +1,341 @@
+"""
+Suporte ao header Idempotency-Key nos endpoints de criação.
+
+Conexões instáveis fazem o frontend repetir POSTs. Quando a requisição traz
+o header Idempotency-Key, a primeira execução reserva a chave para o
+colaborador autenticado e, ao final, guarda a resposta. Retentativas com a
+mesma chave e o mesmo corpo recebem a resposta guardada sem executar a
+operação de novo. A mesma chave com outro corpo é rejeitada.
+
+A resposta é guardada na própria transação do endpoint (get_db chama
+gravar_resposta_idempotente antes do commit), então só existe se a escrita
+foi confirmada. O middleware segura a resposta até a aplicação terminar:
+se o commit falhar, ou a requisição falhar de qualquer forma, a reserva da
+chave é liberada e a retentativa executa a operação de verdade.
+
+As chaves expiram após IDEMPOTENCIA_TTL_HORAS e são removidas por uma
+limpeza periódica.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+from app.core.config import settings
+from app.core.error_responses import create_error_response, get_request_id
+from app.core.security import get_token_subject
+from app.database import SessionLocal
+from app.models.chave_idempotencia import ChaveIdempotencia
+from app.repositories.chave_idempotencia import ChaveIdempotenciaRepository
+from fastapi import Request, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENCIA_HEADER = "Idempotency-Key"
+IDEMPOTENCIA_REPETIDA_HEADER = "Idempotent-Replayed"
+IDEMPOTENCIA_CHAVE_MAX = 255
+
+# Headers da resposta guardados e devolvidos na retentativa, além do
+# Content-Type (tipo_conteudo)
+HEADERS_REPETIDOS = ("location",)
+
+# Chave em request.state da resposta a guardar na transação do endpoint
+IDEMPOTENCIA_ESTADO = "idempotencia"
+
+# Rotas (POST) em que o header é respeitado
+ROTAS_IDEMPOTENTES = {
+    "/api/v1/avaliacoes",
+    "/api/v1/registros-valor",
+    "/api/v1/entregas-outstanding",
+}
+
+
+def _agora() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _rota(request: Request) -> str:
+    """Rota sem a barra final: /avaliacoes e /avaliacoes/ são a mesma operação"""
+    return request.url.path.rstrip("/")
+
+
+def _hash_requisicao(request: Request, corpo: bytes) -> str:
+    """Hash que identifica a requisição: método, rota, query string e corpo"""
+    conteudo = hashlib.sha256()
+    conteudo.update(request.method.encode())
+    conteudo.update(_rota(request).encode())
+    conteudo.update(request.url.query.encode())
+    conteudo.update(corpo)
+    return conteudo.hexdigest()
+
+
+def _repetir_corpo(corpo: bytes, receive: Receive) -> Receive:
+    """receive que entrega à aplicação o corpo já lido pelo middleware"""
+    entregue = False
+
+    async def receber() -> Message:
+        nonlocal entregue
+        if not entregue:
+            entregue = True
+            return {"type": "http.request", "body": corpo, "more_body": False}
+        return await receive()
+
+    return receber
+
+
+def _principal(request: Request) -> Optional[str]:
+    """Identifica o colaborador autenticado a partir do token Bearer"""
+    autorizacao = request.headers.get("Authorization", "")
+    esquema, _, token = autorizacao.partition(" ")
+    if esquema.lower() != "bearer" or not token:
+        return None
+    colaborador_id = get_token_subject(token)
+    return f"colaborador:{colaborador_id}" if colaborador_id is not None else None
+
+
+def _reservar(
+    chave: str, principal: str, hash_requisicao: str, request: Request
+) -> tuple:
+    """Reserva a chave; retorna (id do registro, reservado, registro existente)"""
+    db = SessionLocal()
+    try:
+        agora = _agora()
+        repository = ChaveIdempotenciaRepository(db)
+        registro, reservado = repository.reservar(
+            ChaveIdempotencia(
+                chave=chave,
+                principal=principal,
+                metodo=request.method,
+                rota=_rota(request),
+                hash_requisicao=hash_requisicao,
+                expira_em=agora + timedelta(hours=settings.IDEMPOTENCIA_TTL_HORAS),
+            ),
+            agora,
+        )
+        if not reservado:
+            # Nada a confirmar: a chave pertence a uma requisição anterior
+            db.expunge(registro)
+            return registro.id, False, registro
+        db.commit()
+        return registro.id, True, None
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def _liberar(registro_id: int) -> None:
+    """Libera a chave quando a requisição falhou ou a resposta não foi guardada"""
+    db = SessionLocal()
+    try:
+        ChaveIdempotenciaRepository(db).delete(registro_id)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+class RespostaIdempotente:
+    """Resposta da requisição que reservou a chave, montada a partir do send"""
+
+    def __init__(self, registro_id: int):
+        self.registro_id = registro_id
+        self.status_code: Optional[int] = None
+        self.tipo_conteudo: Optional[str] = None
+        self.headers: Dict[str, str] = {}
+        self.partes: List[bytes] = []
+        self.completa = False
+        self._escrita = False
+        # Só é True depois do commit da transação que guardou a resposta
+        self.gravada = False
+
+    def registrar(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.status_code = message["status"]
+            headers = Headers(raw=message["headers"])
+            self.tipo_conteudo = headers.get("content-type")
+            self.headers = {
+                nome: headers[nome] for nome in HEADERS_REPETIDOS if nome in headers
+            }
+        elif message["type"] == "http.response.body":
+            self.partes.append(message.get("body", b""))
+            self.completa = not message.get("more_body", False)
+
+    def gravar(self, db: Session) -> None:
+        """Guarda a resposta na sessão do endpoint, antes do commit"""
+        if not self.completa or self.status_code >= 500:
+            return
+        ChaveIdempotenciaRepository(db).update(
+            self.registro_id,
+            status_code=self.status_code,
+            tipo_conteudo=self.tipo_conteudo,
+            headers_resposta=json.dumps(self.headers) if self.headers else None,
+            corpo_resposta=b"".join(self.partes).decode("utf-8"),
+        )
+        self._escrita = True
+
+    def confirmar(self) -> None:
+        """Marca a resposta como guardada, após o commit da transação"""
+        self.gravada = self._escrita
+
+
+def resposta_idempotente(request: Request) -> Optional[RespostaIdempotente]:
+    """Resposta pendente da requisição, ou None se ela não usa Idempotency-Key"""
+    return getattr(request.state, IDEMPOTENCIA_ESTADO, None)
+
+
+class IdempotenciaMiddleware:
+    """Aplica o header Idempotency-Key aos POSTs de ROTAS_IDEMPOTENTES"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "POST":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope, receive)
+        chave = request.headers.get(IDEMPOTENCIA_HEADER)
+        if not chave or _rota(request) not in ROTAS_IDEMPOTENTES:
+            await self.app(scope, receive, send)
+            return
+
+        if len(chave) > IDEMPOTENCIA_CHAVE_MAX:
+            response = create_error_response(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                error_code="VALIDATION_ERROR",
+                message=f"{IDEMPOTENCIA_HEADER} deve ter no máximo {IDEMPOTENCIA_CHAVE_MAX} caracteres",
+                field=IDEMPOTENCIA_HEADER,
+                request_id=get_request_id(request),
+            )
+            await response(scope, receive, send)
+            return
+
+        principal = _principal(request)
+        if principal is None:
+            # Sem autenticação válida o endpoint responde 401 normalmente
+            await self.app(scope, receive, send)
+            return
+
+        corpo = await request.body()
+        hash_requisicao = _hash_requisicao(request, corpo)
+        receive = _repetir_corpo(corpo, receive)
+
+        try:
+            registro_id, reservado, existente = await run_in_threadpool(
+                _reservar, chave, principal, hash_requisicao, request
+            )
+        except SQLAlchemyError as e:
+            # Sem o armazenamento a requisição segue sem garantia de idempotência
+            logger.error(f"Erro ao reservar chave de idempotência: {str(e)}")
+            await self.app(scope, receive, send)
+            return
+
+        if not reservado:
+            response = self._responder_existente(request, existente, hash_requisicao)
+            await response(scope, receive, send)
+            return
+
+        # A resposta fica retida até a aplicação terminar (incluindo o commit
+        # de get_db, que roda depois de a resposta ser montada)
+        resposta = RespostaIdempotente(registro_id)
+        scope.setdefault("state", {})[IDEMPOTENCIA_ESTADO] = resposta
+        mensagens: List[Message] = []
+
+        async def reter(message: Message) -> None:
+            resposta.registrar(message)
+            mensagens.append(message)
+
+        try:
+            await self.app(scope, receive, reter)
+        except Exception:
+            await self._liberar(registro_id)
+            raise
+
+        if not resposta.gravada:
+            # Erro, rollback ou resposta que não passou pela transação
+            await self._liberar(registro_id)
+        for message in mensagens:
+            await send(message)
+
+    async def _liberar(self, registro_id: int) -> None:
+        try:
+            await run_in_threadpool(_liberar, registro_id)
+        except SQLAlchemyError as e:
+            logger.error(f"Erro ao liberar chave de idempotência: {str(e)}")
+
+    def _responder_existente(
+        self, request: Request, existente: ChaveIdempotencia, hash_requisicao: str
+    ) -> Response:
+        """Responde a uma retentativa de chave já utilizada"""
+        request_id = get_request_id(request)
+
+        if existente.hash_requisicao != hash_requisicao:
+            logger.warning(
+                f"Chave de idempotência reutilizada com outra requisição. Principal: {existente.principal}"
+            )
+            return create_error_response(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                error_code="IDEMPOTENCY_KEY_REUSED",
+                message=f"{IDEMPOTENCIA_HEADER} já utilizada com outra requisição",
+                field=IDEMPOTENCIA_HEADER,
+                request_id=request_id,
+            )
+
+        if existente.status_code is None:
+            return create_error_response(
+                status_code=status.HTTP_409_CONFLICT,
+                error_code="IDEMPOTENCY_REQUEST_IN_PROGRESS",
+                message="Requisição com esta chave ainda está em processamento",
+                field=IDEMPOTENCIA_HEADER,
+                request_id=request_id,
+            )
+
+        logger.debug(
+            f"Resposta idempotente reaproveitada. Principal: {existente.principal}, Rota: {existente.rota}"
+        )
+        headers = json.loads(existente.headers_resposta or "{}")
+        headers[IDEMPOTENCIA_REPETIDA_HEADER] = "true"
+        return Response(
+            content=existente.corpo_resposta,
+            status_code=existente.status_code,
+            media_type=existente.tipo_conteudo,
+            headers=headers,
+        )
+
+
+def remover_chaves_expiradas() -> int:
+    """Remove as chaves de idempotência expiradas"""
+    db = SessionLocal()
+    try:
+        removidas = ChaveIdempotenciaRepository(db).remover_expiradas(_agora())
+        db.commit()
+        if removidas:
+            logger.debug(f"{removidas} chave(s) de idempotência expirada(s) removida(s)")
+        return removidas
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.error(f"Erro ao remover chaves de idempotência expiradas: {str(e)}")
+        return 0
+    finally:
+        db.close()
+
+
+async def remover_chaves_expiradas_periodicamente() -> None:
+    """Loop de limpeza das chaves expiradas, executado durante o lifespan da aplicação"""
+    while True:
+        await run_in_threadpool(remover_chaves_expiradas)
+        await asyncio.sleep(settings.IDEMPOTENCIA_INTERVALO_LIMPEZA_SEGUNDOS)
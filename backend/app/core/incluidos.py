@@ -0,0 +1,72 @@
+"""
+Colaboradores incluídos uma vez só nas listagens de avaliações (side-loading).
+
+AvaliacaoResponse e AvaliacaoGestorResponse trazem o colaborador completo
+(avaliador, avaliado, gestor) em cada item; nas listagens de admin as mesmas
+pessoas se repetem milhares de vezes. Com `included=colaboradores` os itens
+trazem apenas os IDs (avaliador_id, avaliado_id, gestor_id) e os
+colaboradores vêm uma vez só, em `included.colaboradores` (ColaboradorResponse
+por id), lidos com um único SELECT ... IN. Sem o parâmetro a resposta
+continua a mesma.
+
+Exemplo: GET /avaliacoes/admin/colaborador/2?included=colaboradores
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, Mapping, Optional
+
+from app.core.exceptions import ValidationException
+from fastapi import Query
+
+# Recursos que podem ser incluídos à parte
+RECURSOS_INCLUIDOS = ("colaboradores",)
+
+
+@dataclass
+class IncluidosParams:
+    """Parâmetro included recebido na query string"""
+
+    recursos: FrozenSet[str] = field(default_factory=frozenset)
+
+    @property
+    def colaboradores(self) -> bool:
+        return "colaboradores" in self.recursos
+
+
+def get_incluidos(
+    included: Optional[str] = Query(
+        None,
+        description="Recursos relacionados enviados uma vez só, fora dos itens "
+        "(colaboradores), separados por vírgula",
+    ),
+) -> IncluidosParams:
+    """Dependência que lê e valida o parâmetro included da requisição"""
+    if included is None:
+        return IncluidosParams()
+
+    recursos = frozenset(
+        parte.strip() for parte in included.split(",") if parte.strip()
+    )
+    invalidos = sorted(recursos.difference(RECURSOS_INCLUIDOS))
+    if invalidos:
+        raise ValidationException(
+            f"Inclusões inválidas: {', '.join(invalidos)}. Valores aceitos: {', '.join(RECURSOS_INCLUIDOS)}",
+            field="included",
+        )
+    return IncluidosParams(recursos=recursos)
+
+
+def com_incluidos(
+    conteudo: Mapping[str, Any], colaboradores: Mapping[int, Dict[str, Any]]
+) -> Dict[str, Any]:
+    """
+    Conteúdo da listagem com o envelope included
+
+    Args:
+        conteudo: Listagem já no formato final, com os itens sem os colaboradores
+        colaboradores: ColaboradorResponse (dict) por id
+    """
+    return {
+        **conteudo,
+        "included": {"colaboradores": dict(sorted(colaboradores.items()))},
+    }
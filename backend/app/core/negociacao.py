@@ -0,0 +1,237 @@
+"""
+Negociação de conteúdo das respostas: compressão e MessagePack.
+
+Acompanhamento, feedbacks de calibração e listagens de admin chegam a
+megabytes de JSON repetitivo e trafegam por VPNs lentas. Este middleware,
+conforme os headers da requisição:
+
+- Accept: application/msgpack (com peso maior ou igual ao do JSON), nas
+  rotas de ROTAS_MSGPACK: converte a resposta JSON de sucesso para
+  MessagePack, mais compacto e mais rápido de decodificar no cliente;
+- Accept-Encoding: comprime com br ou gzip (o de maior peso; br no empate)
+  as respostas a partir de COMPRESSAO_TAMANHO_MINIMO bytes.
+
+A conversão e a compressão de corpos a partir de COMPRESSAO_THREADPOOL_BYTES
+rodam no threadpool, sem travar o event loop. Quando a requisição negocia
+compressão ou MessagePack, a ETag passa a ser fraca (mesmo conteúdo, outra
+representação), inclusive no 304; cache_http já compara If-None-Match de
+forma fraca.
+
+O corpo da resposta é acumulado antes do envio (as respostas da aplicação
+são montadas inteiras, não há streaming).
+"""
+
+import gzip
+import re
+from typing import Dict, List, Optional, Tuple
+
+import brotli
+import msgpack
+import orjson
+from app.core.config import settings
+from fastapi.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+MEDIA_JSON = "application/json"
+MEDIA_MSGPACK = "application/msgpack"
+
+# Agregados e listagens de admin que aceitam MessagePack
+ROTAS_MSGPACK = (
+    re.compile(r"^/api/v1/[^/]+/admin/"),
+    re.compile(r"^/api/v1/ciclos/\d+/acompanhamento/?$"),
+)
+
+# Tipos de conteúdo que compensa comprimir
+_TIPOS_COMPRIMIVEIS = (MEDIA_JSON, MEDIA_MSGPACK, "text/")
+
+# Codificações suportadas, da menos para a mais preferida no empate
+_CODIFICACOES = ("gzip", "br")
+
+
+def _qualidades(cabecalho: str) -> Dict[str, float]:
+    """Valores de um header Accept / Accept-Encoding com o peso (q) de cada um"""
+    qualidades = {}
+    for parte in cabecalho.split(","):
+        valor, *parametros = [item.strip() for item in parte.split(";")]
+        if not valor:
+            continue
+        peso = 1.0
+        for parametro in parametros:
+            nome, _, numero = parametro.partition("=")
+            if nome.strip().lower() == "q":
+                try:
+                    peso = float(numero)
+                except ValueError:
+                    peso = 0.0
+        qualidades[valor.lower()] = peso
+    return qualidades
+
+
+def escolher_codificacao(accept_encoding: Optional[str]) -> Optional[str]:
+    """br ou gzip, o de maior peso aceito pelo cliente; None sem compressão"""
+    if not accept_encoding:
+        return None
+    qualidades = _qualidades(accept_encoding)
+    padrao = qualidades.get("*", 0.0)
+    peso, _, codificacao = max(
+        (qualidades.get(nome, padrao), ordem, nome)
+        for ordem, nome in enumerate(_CODIFICACOES)
+    )
+    return codificacao if peso > 0 else None
+
+
+def prefere_msgpack(accept: Optional[str]) -> bool:
+    """Se o cliente pediu MessagePack com peso maior ou igual ao do JSON"""
+    if not accept:
+        return False
+    qualidades = _qualidades(accept)
+    peso_msgpack = max(
+        qualidades.get(MEDIA_MSGPACK, 0.0), qualidades.get("application/x-msgpack", 0.0)
+    )
+    peso_json = qualidades.get(
+        MEDIA_JSON, qualidades.get("application/*", qualidades.get("*/*", 0.0))
+    )
+    return peso_msgpack > 0 and peso_msgpack >= peso_json
+
+
+def json_para_msgpack(corpo: bytes) -> bytes:
+    """Converte um corpo JSON para MessagePack"""
+    return msgpack.packb(orjson.loads(corpo))
+
+
+def comprimir(corpo: bytes, codificacao: str) -> bytes:
+    """Comprime o corpo com br ou gzip, nos níveis configurados"""
+    if codificacao == "br":
+        return brotli.compress(corpo, quality=settings.COMPRESSAO_BROTLI_QUALIDADE)
+    return gzip.compress(corpo, compresslevel=settings.COMPRESSAO_GZIP_NIVEL, mtime=0)
+
+
+def _processar(
+    corpo: bytes, converter: bool, codificacao: Optional[str]
+) -> Tuple[bytes, Optional[str]]:
+    """
+    Converte e/ou comprime o corpo
+
+    Returns:
+        Corpo final e a codificação aplicada (None se ficou abaixo do mínimo)
+    """
+    if converter:
+        corpo = json_para_msgpack(corpo)
+    if codificacao is None or len(corpo) < settings.COMPRESSAO_TAMANHO_MINIMO:
+        return corpo, None
+    return comprimir(corpo, codificacao), codificacao
+
+
+class NegociacaoConteudoMiddleware:
+    """Converte para MessagePack e comprime as respostas conforme os headers"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        rota_msgpack = settings.MSGPACK_HABILITADO and any(
+            padrao.match(scope["path"]) for padrao in ROTAS_MSGPACK
+        )
+        converter = rota_msgpack and prefere_msgpack(headers.get("accept"))
+        codificacao = (
+            escolher_codificacao(headers.get("accept-encoding"))
+            if settings.COMPRESSAO_HABILITADA
+            else None
+        )
+        if not (rota_msgpack or settings.COMPRESSAO_HABILITADA):
+            await self.app(scope, receive, send)
+            return
+
+        resposta = _RespostaNegociada(send, rota_msgpack, converter, codificacao)
+        await self.app(scope, receive, resposta.enviar)
+
+
+class _RespostaNegociada:
+    """Acumula a resposta da aplicação e a envia convertida / comprimida"""
+
+    def __init__(
+        self,
+        send: Send,
+        rota_msgpack: bool,
+        converter: bool,
+        codificacao: Optional[str],
+    ):
+        self.send = send
+        self.rota_msgpack = rota_msgpack
+        self.converter = converter
+        self.codificacao = codificacao
+        self.inicio: Optional[Message] = None
+        self.partes: List[bytes] = []
+        self.repassar = False
+
+    def _ajustar_headers(self, headers: MutableHeaders, converter: bool) -> None:
+        """Vary e ETag fraca, iguais no 200 e no 304 da mesma requisição"""
+        if self.rota_msgpack:
+            headers.add_vary_header("Accept")
+        if settings.COMPRESSAO_HABILITADA:
+            headers.add_vary_header("Accept-Encoding")
+        etag = headers.get("etag")
+        if (converter or self.codificacao) and etag and not etag.startswith("W/"):
+            headers["etag"] = f"W/{etag}"
+
+    async def enviar(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.inicio = message
+            headers = Headers(raw=message["headers"])
+            status = message["status"]
+            self.repassar = (
+                status < 200
+                or status in (204, 304)
+                or "content-encoding" in headers
+                or not headers.get("content-type", "").startswith(_TIPOS_COMPRIMIVEIS)
+            )
+            if status == 304:
+                self._ajustar_headers(
+                    MutableHeaders(raw=message["headers"]), self.converter
+                )
+            if self.repassar:
+                await self.send(message)
+            return
+
+        if self.repassar or message["type"] != "http.response.body":
+            await self.send(message)
+            return
+
+        self.partes.append(message.get("body", b""))
+        if message.get("more_body", False):
+            return
+        await self._enviar_corpo(b"".join(self.partes))
+
+    async def _enviar_corpo(self, corpo: bytes) -> None:
+        headers = MutableHeaders(raw=self.inicio["headers"])
+        converter = (
+            self.converter
+            and self.inicio["status"] == 200
+            and headers.get("content-type", "").startswith(MEDIA_JSON)
+        )
+        self._ajustar_headers(headers, converter)
+
+        aplicada = None
+        if converter or self.codificacao is not None:
+            if len(corpo) >= settings.COMPRESSAO_THREADPOOL_BYTES:
+                corpo, aplicada = await run_in_threadpool(
+                    _processar, corpo, converter, self.codificacao
+                )
+            else:
+                corpo, aplicada = _processar(corpo, converter, self.codificacao)
+
+        if converter:
+            headers["content-type"] = MEDIA_MSGPACK
+        if aplicada is not None:
+            headers["content-encoding"] = aplicada
+        if converter or aplicada is not None:
+            headers["content-length"] = str(len(corpo))
+
+        await self.send(self.inicio)
+        await self.send({"type": "http.response.body", "body": corpo})
@@ -0,0 +1,98 @@
+"""
+Paginação por cursor (keyset) para os endpoints de listagem.
+
+Em vez de OFFSET, cada página continua a partir da última linha da página
+anterior: a consulta é ordenada por uma coluna estável mais o id como
+desempate, e o cursor guarda os valores dessas duas colunas na última linha
+retornada. O cursor é opaco para o cliente (JSON em base64).
+
+Sem `limit` e sem `cursor` as listagens continuam retornando tudo, como antes.
+O total só é calculado (com um COUNT separado) quando `incluir_total=true`.
+"""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Generic, List, Optional, TypeVar
+
+from app.core.exceptions import ValidationException
+from app.core.validators import PAGINACAO_LIMITE_MAX
+from fastapi import Query
+
+T = TypeVar("T")
+
+
+@dataclass
+class PaginacaoParams:
+    """Parâmetros de paginação recebidos na query string"""
+
+    limit: Optional[int] = None
+    cursor: Optional[str] = None
+    incluir_total: bool = False
+
+    @property
+    def ativa(self) -> bool:
+        return self.limit is not None or self.cursor is not None
+
+
+@dataclass
+class Pagina(Generic[T]):
+    """Página de resultados de uma listagem"""
+
+    itens: List[T]
+    next_cursor: Optional[str] = None  # Nulo na última página
+    total: Optional[int] = None  # Nulo quando não solicitado
+
+
+def get_paginacao(
+    limit: Optional[int] = Query(
+        None, ge=1, le=PAGINACAO_LIMITE_MAX, description="Itens por página"
+    ),
+    cursor: Optional[str] = Query(
+        None, description="Cursor retornado em next_cursor pela página anterior"
+    ),
+    incluir_total: bool = Query(
+        False, description="Calcula o total de itens (consulta adicional)"
+    ),
+) -> PaginacaoParams:
+    """Dependência que lê os parâmetros de paginação da requisição"""
+    if cursor is not None and limit is None:
+        limit = PAGINACAO_LIMITE_MAX
+    return PaginacaoParams(limit=limit, cursor=cursor, incluir_total=incluir_total)
+
+
+def codificar_cursor(valor_ordem: Any, id_: int) -> str:
+    """Gera o cursor opaco a partir da última linha da página"""
+    if isinstance(valor_ordem, (datetime, date)):
+        valor_ordem = valor_ordem.isoformat()
+    conteudo = json.dumps([valor_ordem, id_], separators=(",", ":"))
+    return base64.urlsafe_b64encode(conteudo.encode()).decode().rstrip("=")
+
+
+def decodificar_cursor(cursor: str, tipo_ordem: Optional[type] = None) -> tuple:
+    """
+    Lê o cursor gerado por codificar_cursor
+
+    Args:
+        cursor: Cursor recebido do cliente
+        tipo_ordem: Tipo Python da coluna de ordenação (para converter datas)
+
+    Raises:
+        ValidationException: Se o cursor for inválido
+    """
+    try:
+        preenchimento = "=" * (-len(cursor) % 4)
+        valor_ordem, id_ = json.loads(
+            base64.urlsafe_b64decode(cursor + preenchimento).decode()
+        )
+        if tipo_ordem is datetime and valor_ordem is not None:
+            valor_ordem = datetime.fromisoformat(valor_ordem)
+        elif tipo_ordem is date and valor_ordem is not None:
+            valor_ordem = date.fromisoformat(valor_ordem)
+        if not isinstance(id_, int):
+            raise ValueError("id inválido")
+        return valor_ordem, id_
+    except (ValueError, TypeError, binascii.Error, UnicodeDecodeError):
+        raise ValidationException("Cursor de paginação inválido", field="cursor")
@@ -0,0 +1,63 @@
+"""
+Filtro de período para as listagens que crescem com o histórico.
+
+As listagens de registros de valor e entregas outstanding aceitam uma janela
+de criação: `desde`/`ate` explícitos ou a janela de um ciclo (`ciclo_id`).
+Sem nenhum desses parâmetros a listagem mostra a janela do ciclo aberto;
+`todos=true` desliga a janela padrão e devolve todo o histórico.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from app.core.exceptions import ValidationException
+from fastapi import Query
+
+
+@dataclass
+class PeriodoParams:
+    """Parâmetros de período recebidos na query string"""
+
+    desde: Optional[datetime] = None
+    ate: Optional[datetime] = None
+    ciclo_id: Optional[int] = None
+    todos: bool = False
+
+    @property
+    def explicito(self) -> bool:
+        return (
+            self.desde is not None or self.ate is not None or self.ciclo_id is not None
+        )
+
+
+@dataclass
+class Janela:
+    """Intervalo de created_at já resolvido; limites nulos ficam abertos"""
+
+    desde: Optional[datetime] = None
+    ate: Optional[datetime] = None
+
+
+def get_periodo(
+    desde: Optional[datetime] = Query(
+        None, description="Criados a partir desta data/hora (inclusive)"
+    ),
+    ate: Optional[datetime] = Query(
+        None, description="Criados até esta data/hora (inclusive)"
+    ),
+    ciclo_id: Optional[int] = Query(
+        None, ge=1, description="Criados durante a janela do ciclo"
+    ),
+    todos: bool = Query(
+        False, description="Ignora a janela do ciclo aberto e lista todo o histórico"
+    ),
+) -> PeriodoParams:
+    """Dependência que lê e valida os parâmetros de período da requisição"""
+    if ciclo_id is not None and (desde is not None or ate is not None):
+        raise ValidationException(
+            "Informe ciclo_id ou desde/ate, não ambos", field="ciclo_id"
+        )
+    if desde is not None and ate is not None and desde > ate:
+        raise ValidationException("desde deve ser anterior a ate", field="desde")
+    return PeriodoParams(desde=desde, ate=ate, ciclo_id=ciclo_id, todos=todos)
@@ -5,6 +5,7 @@ from typing import Optional
 from app.core.config import settings
 from app.database import get_db
 from app.models.colaborador import Colaborador
+from app.repositories.identidade import mapa_identidade
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from google.auth.transport import requests
@@ -109,16 +110,24 @@ def verify_token(
         )
 
 
+def get_token_subject(token: str) -> Optional[int]:
+    """Retorna o ID do colaborador de um token JWT válido, ou None"""
+    try:
+        payload = jwt.decode(
+            token, settings.SECRET_KEY, algorithms=[settings.JWT_ALGORITHM]
+        )
+        return int(payload["sub"])
+    except (JWTError, KeyError, ValueError, TypeError):
+        return None
+
+
 def get_current_colaborador(
     token_data: dict = Depends(verify_token), db: Session = Depends(get_db)
 ):
     """Retorna o colaborador atual baseado no token"""
     try:
-        colaborador = (
-            db.query(Colaborador)
-            .filter(Colaborador.id == token_data["user_id"])
-            .first()
-        )
+        # Fica no mapa de identidade da requisição para os services
+        colaborador = mapa_identidade(db).get(Colaborador, token_data["user_id"])
         if colaborador is None:
             logger.warning(
                 f"Colaborador não encontrado no banco de dados. Colaborador ID: {token_data.get('user_id')}"
@@ -0,0 +1,112 @@
+"""
+Serialização rápida das respostas JSON.
+
+Com response_model, o FastAPI valida o retorno da rota, gera um dict Python
+(`model_dump`), o passa pelo json da biblioteca padrão e, quando o service já
+devolve o próprio schema de resposta, faz o dump e a validação duas vezes.
+Nas listagens grandes isso domina o tempo da requisição. Aqui ficam os
+caminhos mais curtos:
+
+- `RespostaJSON`: classe de resposta padrão da aplicação, com orjson.
+- `adaptador`: TypeAdapter por tipo, criado uma vez por processo (montar o
+  validador e o serializador de um schema é caro).
+- `resposta_modelo`: valida uma vez (sem validar de novo o que já é uma
+  instância do schema) e gera os bytes JSON direto no pydantic-core, sem o
+  dict intermediário.
+- `resposta_json`: conteúdo já no formato final (ex: montado direto das
+  linhas do banco, sem schema), apenas codificado com orjson.
+- `montar_linhas`: formato final a partir das linhas de um SELECT de colunas
+  (sem objetos ORM), na ordem dos campos do schema.
+"""
+
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from starlette.responses import Response
+
+# Mesmo formato do pydantic: datas UTC com "Z", chaves não-string convertidas
+_OPCOES_ORJSON = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+
+
+class RespostaJSON(JSONResponse):
+    """JSONResponse codificada com orjson"""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=_OPCOES_ORJSON)
+
+
+@lru_cache(maxsize=None)
+def adaptador(tipo: Any) -> TypeAdapter:
+    """TypeAdapter do tipo, reaproveitado entre requisições"""
+    return TypeAdapter(tipo)
+
+
+def _instancia_de(conteudo: Any, tipo: Any) -> bool:
+    return isinstance(tipo, type) and isinstance(conteudo, tipo)
+
+
+def serializar_modelo(conteudo: Any, tipo: Any) -> bytes:
+    """Bytes JSON do conteúdo no formato do tipo (valida se ainda não for o tipo)"""
+    tipo_adaptador = adaptador(tipo)
+    if not _instancia_de(conteudo, tipo):
+        conteudo = tipo_adaptador.validate_python(conteudo, from_attributes=True)
+    return tipo_adaptador.dump_json(conteudo)
+
+
+def resposta_modelo(
+    conteudo: Any,
+    tipo: Any,
+    status_code: int = 200,
+    headers: Optional[Mapping[str, str]] = None,
+) -> Response:
+    """
+    Resposta no formato do schema, sem o processamento do response_model
+
+    Args:
+        conteudo: Objetos ORM, dicts ou uma instância do schema
+        tipo: Schema (ou tipo como List[Schema]) da resposta
+        status_code: Status HTTP da resposta
+        headers: Headers adicionais
+    """
+    return Response(
+        serializar_modelo(conteudo, tipo),
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json",
+    )
+
+
+def resposta_json(
+    conteudo: Any,
+    status_code: int = 200,
+    headers: Optional[Mapping[str, str]] = None,
+) -> Response:
+    """Resposta com conteúdo já no formato final, sem validação"""
+    return RespostaJSON(conteudo, status_code=status_code, headers=headers)
+
+
+def montar_linhas(
+    linhas: Iterable[Mapping[str, Any]],
+    campos: Sequence[str],
+    anexos: Optional[Mapping[str, Callable[[Mapping[str, Any]], Any]]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Dicts no formato final a partir das linhas do banco, sem validação
+
+    Args:
+        linhas: Mapeamentos das linhas (ex: RowMapping), com uma coluna por campo
+        campos: Campos da resposta, na ordem do schema
+        anexos: Campos que não são colunas (relacionamentos), montados por uma
+            função que recebe a linha
+    """
+    anexos = anexos or {}
+    return [
+        {
+            campo: anexos[campo](linha) if campo in anexos else linha[campo]
+            for campo in campos
+        }
+        for linha in linhas
+    ]
@@ -6,7 +6,7 @@ usadas tanto em schemas Pydantic quanto em services.
 """
 
 import re
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from app.core.exceptions import ValidationException
 
@@ -34,6 +34,24 @@ NIVEIS_CARREIRA_VALIDOS = [
 # Pattern regex para nível de carreira
 NIVEL_CARREIRA_PATTERN = r"^(E|J[1-3]|P[1-3]|S[1-3]|ES[1-2]|Head)$"
 
+# Níveis esperados por nível de carreira para cada eixo
+# Formato: [Desenvolvimento contínuo, Influência, Operação e processos, Impacto]
+NIVEIS_ESPERADOS_POR_CARREIRA: Dict[str, List[int]] = {
+    "E": [1, 1, 1, 1],
+    "J1": [1, 1, 1, 1],
+    "J2": [2, 1, 2, 1],
+    "J3": [2, 2, 2, 2],
+    "P1": [3, 2, 3, 2],
+    "P2": [3, 2, 3, 3],
+    "P3": [4, 2, 4, 3],
+    "S1": [4, 3, 4, 3],
+    "S2": [4, 3, 4, 4],
+    "S3": [5, 3, 5, 4],
+    "ES1": [5, 4, 5, 4],
+    "ES2": [5, 4, 5, 4],
+    "Head": [5, 5, 5, 5],
+}
+
 # Perfis (papéis) válidos na hierarquia gestor -> lider -> liderados
 PERFIL_COLABORADOR = "colaborador"
 PERFIL_LIDER = "lider"
@@ -53,6 +71,21 @@ CAMPO_TEXTO_MAX = 500
 CAMPO_TEXTO_LONGO_MAX = 10000
 CAMPO_CODIGO_MAX = 50
 
+# Quantidade máxima de itens por requisição de aprovação/reprovação em lote
+APROVACAO_LOTE_MAX = 5000
+
+# Rascunhos de formulário: chave livre definida pelo frontend (ex: autoavaliacao:ciclo-3)
+RASCUNHO_CHAVE_PATTERN = r"^[a-z0-9][a-z0-9_:\-]{0,149}$"
+RASCUNHO_CONTEUDO_MAX = 200000  # Tamanho máximo do JSON serializado, em caracteres
+
+# Paginação
+PAGINACAO_LIMITE_MAX = 500
+
+# Busca de colaboradores (typeahead)
+BUSCA_LIMITE_PADRAO = 10
+BUSCA_LIMITE_MAX = 50
+BUSCA_TERMO_MAX = 100
+
 
 # =============================================================================
 # Validadores de Campos
@@ -1,4 +1,5 @@
 from app.core.config import settings
+from fastapi import Request
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
@@ -24,16 +25,28 @@ Dependência para obter a sessão do banco.
 Cada requisição que usar `get_db` terá uma transação aberta automaticamente:
 - Se o endpoint terminar sem erro, é feito `commit`.
 - Se acontecer qualquer exceção, é feito `rollback`.
+
+Nos POSTs com Idempotency-Key a resposta é guardada nesta mesma transação
+(ver app.core.idempotencia).
 """
 
 
-def get_db():
+def get_db(request: Request):
+    # Import tardio: app.core.idempotencia depende de SessionLocal
+    from app.core.idempotencia import resposta_idempotente
+
     db = SessionLocal()
     try:
         # Entrega a sessão para o endpoint / service
         yield db
-        # Se chegou aqui sem exceção, confirma a transação
+        # Se chegou aqui sem exceção, confirma a transação junto com a
+        # resposta idempotente, se houver
+        idempotente = resposta_idempotente(request)
+        if idempotente is not None:
+            idempotente.gravar(db)
         db.commit()
+        if idempotente is not None:
+            idempotente.confirmar()
     except Exception:
         # Qualquer erro durante o processamento da requisição faz rollback
         db.rollback()
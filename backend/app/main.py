@@ -1,5 +1,6 @@
 import logging
 import sys
+import asyncio
 from contextlib import asynccontextmanager
 
 from app.api.v1 import (
@@ -9,18 +10,39 @@ from app.api.v1 import (
     ciclos,
     ciclos_avaliacao,
     colaboradores,
+    dados_referencia,
     eixos_avaliacao,
     entregas_outstanding,
     feedback_liberacao,
     niveis_carreira,
+    organograma,
+    rascunhos,
     registros_valor,
     valores,
 )
+from app.core.barramento_cache import (
+    inicializar_barramento,
+    sincronizar_barramento_periodicamente,
+)
 from app.core.config import settings
+from app.core.dados_referencia import carregar_dados_referencia_em_segundo_plano
 from app.core.error_responses import create_error_response, get_request_id
 from app.core.exceptions import BaseAPIException
 from app.core.health import get_liveness_payload, get_readiness_payload
+from app.core.idempotencia import (
+    IdempotenciaMiddleware,
+    remover_chaves_expiradas_periodicamente,
+)
+from app.core.negociacao import NegociacaoConteudoMiddleware
+from app.core.serializacao import RespostaJSON
+from app.services.busca_colaboradores import carregar_indice_busca_em_segundo_plano
+from app.services.exclusao_ciclo import retomar_exclusoes_pendentes_em_segundo_plano
+from app.services.rascunho import (
+    descarregar_rascunhos_pendentes,
+    descarregar_rascunhos_periodicamente,
+)
 from fastapi import FastAPI, Request, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.exc import SQLAlchemyError
@@ -47,9 +69,35 @@ async def lifespan(app: FastAPI):
     logger.debug(
         "Aplicação iniciada. Certifique-se de que as migrations foram aplicadas."
     )
+    # Versões atuais do barramento antes de carregar os caches: escritas de
+    # outros processos a partir daqui invalidam o que for carregado
+    await run_in_threadpool(inicializar_barramento)
+    sincronizacao_barramento = asyncio.create_task(
+        sincronizar_barramento_periodicamente()
+    )
+    descarga_rascunhos = asyncio.create_task(descarregar_rascunhos_periodicamente())
+    limpeza_idempotencia = asyncio.create_task(
+        remover_chaves_expiradas_periodicamente()
+    )
+    # Exclusões de ciclo interrompidas por um reinício continuam de onde pararam
+    retomada_exclusoes = asyncio.create_task(
+        retomar_exclusoes_pendentes_em_segundo_plano()
+    )
+    carga_indice_busca = asyncio.create_task(carregar_indice_busca_em_segundo_plano())
+    carga_dados_referencia = asyncio.create_task(
+        carregar_dados_referencia_em_segundo_plano()
+    )
     yield
     # Shutdown
     logger.info("Encerrando aplicação...")
+    sincronizacao_barramento.cancel()
+    descarga_rascunhos.cancel()
+    limpeza_idempotencia.cancel()
+    retomada_exclusoes.cancel()
+    carga_indice_busca.cancel()
+    carga_dados_referencia.cancel()
+    # Grava rascunhos ainda dentro da janela de agrupamento
+    descarregar_rascunhos_pendentes(forcar=True)
 
 
 app = FastAPI(
@@ -57,8 +105,16 @@ app = FastAPI(
     version=settings.APP_VERSION,
     debug=settings.DEBUG,
     lifespan=lifespan,
+    default_response_class=RespostaJSON,
 )
 
+# Idempotency-Key nos POSTs de criação (registrado antes do CORS para ficar interno a ele)
+app.add_middleware(IdempotenciaMiddleware)
+
+# Compressão e MessagePack conforme Accept / Accept-Encoding (por fora da
+# idempotência, que guarda a resposta original em JSON)
+app.add_middleware(NegociacaoConteudoMiddleware)
+
 # Configurar CORS
 app.add_middleware(
     CORSMiddleware,
@@ -81,6 +137,9 @@ app.include_router(entregas_outstanding.router, prefix="/api/v1")
 app.include_router(valores.router, prefix="/api/v1")
 app.include_router(registros_valor.router, prefix="/api/v1")
 app.include_router(feedback_liberacao.router, prefix="/api/v1")
+app.include_router(rascunhos.router, prefix="/api/v1")
+app.include_router(organograma.router, prefix="/api/v1")
+app.include_router(dados_referencia.router, prefix="/api/v1")
 
 
 @app.get("/")
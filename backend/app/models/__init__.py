@@ -1,17 +1,23 @@
 from app.models import (
     avaliacao,
     avaliacao_gestor,
+    chave_idempotencia,
     ciclo,
     ciclo_avaliacao,
     colaborador,
+    colaborador_hierarquia,
     eixo_avaliacao,
     entrega_outstanding,
+    exclusao_ciclo,
     feedback_liberacao,
+    rascunho,
     registro_valor,
+    versao_cache,
 )
 
 __all__ = [
     "colaborador",
+    "colaborador_hierarquia",
     "eixo_avaliacao",
     "ciclo",
     "ciclo_avaliacao",
@@ -20,4 +26,8 @@ __all__ = [
     "entrega_outstanding",
     "feedback_liberacao",
     "registro_valor",
+    "rascunho",
+    "chave_idempotencia",
+    "exclusao_ciclo",
+    "versao_cache",
 ]
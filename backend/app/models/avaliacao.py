@@ -3,7 +3,7 @@ import enum
 from app.database import Base
 from sqlalchemy import Column, DateTime
 from sqlalchemy import Enum as SQLEnum
-from sqlalchemy import ForeignKey, Integer, Text
+from sqlalchemy import ForeignKey, Index, Integer, Text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -20,6 +20,11 @@ class TipoAvaliacao(str, enum.Enum):
 
 class Avaliacao(Base):
     __tablename__ = "avaliacoes"
+    __table_args__ = (
+        # Listagem "minhas avaliações": um índice por papel, na ordem da listagem
+        Index("ix_avaliacoes_avaliador_created_at", "avaliador_id", "created_at"),
+        Index("ix_avaliacoes_avaliado_created_at", "avaliado_id", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     ciclo_id = Column(Integer, ForeignKey("ciclos.id"), nullable=False)
@@ -1,5 +1,5 @@
 from app.database import Base
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -10,6 +10,15 @@ class AvaliacaoGestor(Base):
     """
 
     __tablename__ = "avaliacoes_gestor"
+    __table_args__ = (
+        # Listagem "minhas avaliações": um índice por papel, na ordem da listagem
+        Index(
+            "ix_avaliacoes_gestor_colaborador_created_at",
+            "colaborador_id",
+            "created_at",
+        ),
+        Index("ix_avaliacoes_gestor_gestor_created_at", "gestor_id", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     ciclo_id = Column(Integer, ForeignKey("ciclos.id"), nullable=False)
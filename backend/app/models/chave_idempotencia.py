@@ -0,0 +1,32 @@
+from app.database import Base
+from sqlalchemy import Column, DateTime, Integer, String, Text, UniqueConstraint
+from sqlalchemy.dialects import mysql
+from sqlalchemy.sql import func
+
+
+class ChaveIdempotencia(Base):
+    """
+    Resposta armazenada para uma requisição com header Idempotency-Key.
+    Uma retentativa com a mesma chave (e o mesmo corpo) recebe a resposta
+    armazenada sem executar novamente a operação.
+    """
+
+    __tablename__ = "chaves_idempotencia"
+    __table_args__ = (
+        UniqueConstraint(
+            "chave", "principal", name="uq_chaves_idempotencia_chave_principal"
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    chave = Column(String(255), nullable=False)
+    principal = Column(String(64), nullable=False)  # Ex: colaborador:12
+    metodo = Column(String(10), nullable=False)
+    rota = Column(String(255), nullable=False)
+    hash_requisicao = Column(String(64), nullable=False)  # SHA-256 do método, rota e corpo
+    status_code = Column(Integer, nullable=True)  # Nulo enquanto a requisição está em processamento
+    tipo_conteudo = Column(String(100), nullable=True)
+    headers_resposta = Column(Text, nullable=True)  # JSON com os headers repetidos (ex: Location)
+    corpo_resposta = Column(Text().with_variant(mysql.MEDIUMTEXT(), "mysql"), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    expira_em = Column(DateTime(timezone=True), nullable=False, index=True)
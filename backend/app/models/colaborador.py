@@ -77,3 +77,4 @@ class Colaborador(Base):
         foreign_keys="FeedbackLiberacao.liberado_por_id",
         back_populates="liberado_por",
     )
+    rascunhos = relationship("Rascunho", back_populates="colaborador")
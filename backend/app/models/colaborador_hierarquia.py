@@ -0,0 +1,29 @@
+from app.database import Base
+from sqlalchemy import Column, ForeignKey, Index, Integer
+
+
+class ColaboradorHierarquia(Base):
+    """
+    Tabela de fechamento (closure table) da hierarquia de colaboradores.
+    Guarda um registro para cada par (gestor em qualquer nível, colaborador)
+    com a distância entre eles, além do próprio colaborador com profundidade 0.
+    É mantida pelo ColaboradorService sempre que gestor_id muda.
+    """
+
+    __tablename__ = "colaboradores_hierarquia"
+    __table_args__ = (
+        # Cadeia de gestores de um colaborador, já ordenada por nível
+        Index(
+            "ix_colaboradores_hierarquia_descendente_profundidade",
+            "descendente_id",
+            "profundidade",
+        ),
+    )
+
+    ancestral_id = Column(
+        Integer, ForeignKey("colaboradores.id"), primary_key=True, nullable=False
+    )
+    descendente_id = Column(
+        Integer, ForeignKey("colaboradores.id"), primary_key=True, nullable=False
+    )
+    profundidade = Column(Integer, nullable=False)  # 0 = o próprio, 1 = gestor direto
@@ -1,7 +1,7 @@
 from enum import Enum as PyEnum
 
 from app.database import Base
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -14,6 +14,19 @@ class StatusAprovacao(str, PyEnum):
 
 class EntregaOutstanding(Base):
     __tablename__ = "entregas_outstanding"
+    __table_args__ = (
+        # Listagem por colaborador e pendentes de aprovação, filtradas por período
+        Index(
+            "ix_entregas_outstanding_colaborador_created_at",
+            "colaborador_id",
+            "created_at",
+        ),
+        Index(
+            "ix_entregas_outstanding_status_created_at",
+            "status_aprovacao",
+            "created_at",
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     colaborador_id = Column(Integer, ForeignKey("colaboradores.id"), nullable=False)
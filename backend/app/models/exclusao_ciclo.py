@@ -0,0 +1,52 @@
+import enum
+
+from app.database import Base
+from sqlalchemy import Column, DateTime
+from sqlalchemy import Enum as SQLEnum
+from sqlalchemy import ForeignKey, Integer, String, Text
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+
+
+def get_enum_values(enum_class):
+    return [member.value for member in enum_class]
+
+
+class StatusExclusaoCiclo(str, enum.Enum):
+    PENDENTE = "pendente"
+    EM_ANDAMENTO = "em_andamento"
+    CONCLUIDA = "concluida"
+    FALHOU = "falhou"
+
+
+class ExclusaoCiclo(Base):
+    """
+    Job de exclusão de um ciclo e de todos os seus dados.
+    Os registros dependentes são removidos em lotes, cada lote em sua própria
+    transação; o progresso fica gravado aqui para acompanhamento e retomada.
+    """
+
+    __tablename__ = "exclusoes_ciclo"
+
+    id = Column(Integer, primary_key=True, index=True)
+    # Sem FK: o ciclo é removido ao final do job
+    ciclo_id = Column(Integer, nullable=False, index=True)
+    ciclo_nome = Column(String(255), nullable=False)
+    status = Column(
+        SQLEnum(StatusExclusaoCiclo, values_callable=get_enum_values),
+        default=StatusExclusaoCiclo.PENDENTE,
+        nullable=False,
+    )
+    etapa = Column(String(50), nullable=True)  # Tabela em processamento
+    total_registros = Column(Integer, default=0, nullable=False)
+    registros_removidos = Column(Integer, default=0, nullable=False)
+    erro = Column(Text, nullable=True)
+    solicitado_por_id = Column(Integer, ForeignKey("colaboradores.id"), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+    concluido_em = Column(DateTime(timezone=True), nullable=True)
+
+    # Relacionamentos
+    solicitado_por = relationship("Colaborador")
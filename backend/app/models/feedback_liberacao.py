@@ -1,5 +1,5 @@
 from app.database import Base
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, UniqueConstraint
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -11,6 +11,11 @@ class FeedbackLiberacao(Base):
     """
 
     __tablename__ = "feedback_liberacao"
+    __table_args__ = (
+        UniqueConstraint(
+            "ciclo_id", "colaborador_id", name="uq_feedback_liberacao_ciclo_colaborador"
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     ciclo_id = Column(Integer, ForeignKey("ciclos.id"), nullable=False)
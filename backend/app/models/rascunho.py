@@ -0,0 +1,31 @@
+from app.database import Base
+from sqlalchemy import JSON, Column, DateTime, ForeignKey, Integer, String, UniqueConstraint
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+
+
+class Rascunho(Base):
+    """
+    Rascunho de formulário de avaliação.
+    Guarda um único registro por (colaborador, chave do formulário) com o
+    conteúdo em JSON, permitindo autosave sem regravar a avaliação completa.
+    """
+
+    __tablename__ = "rascunhos"
+    __table_args__ = (
+        UniqueConstraint(
+            "colaborador_id", "chave", name="uq_rascunhos_colaborador_chave"
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    colaborador_id = Column(Integer, ForeignKey("colaboradores.id"), nullable=False)
+    chave = Column(String(150), nullable=False)  # Ex: autoavaliacao:ciclo-3
+    conteudo = Column(JSON, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+    # Relacionamentos
+    colaborador = relationship("Colaborador", back_populates="rascunhos")
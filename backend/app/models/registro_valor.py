@@ -1,7 +1,16 @@
 from enum import Enum as PyEnum
 
 from app.database import Base
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Table, Text
+from sqlalchemy import (
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Table,
+    Text,
+)
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -22,6 +31,13 @@ class StatusAprovacao(str, PyEnum):
 
 class RegistroValor(Base):
     __tablename__ = "registros_valor"
+    __table_args__ = (
+        # Listagem por colaborador e pendentes de aprovação, filtradas por período
+        Index(
+            "ix_registros_valor_colaborador_created_at", "colaborador_id", "created_at"
+        ),
+        Index("ix_registros_valor_status_created_at", "status_aprovacao", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     colaborador_id = Column(Integer, ForeignKey("colaboradores.id"), nullable=False)
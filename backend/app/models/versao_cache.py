@@ -0,0 +1,19 @@
+from app.database import Base
+from sqlalchemy import BigInteger, Column, DateTime, String
+from sqlalchemy.sql import func
+
+
+class VersaoCache(Base):
+    """
+    Versão de um canal de invalidação dos caches em memória.
+    Incrementada na mesma transação das escritas e consultada periodicamente
+    por todos os processos da aplicação (ver app.core.barramento_cache).
+    """
+
+    __tablename__ = "versoes_cache"
+
+    nome = Column(String(150), primary_key=True)  # Ex: avaliacoes@3
+    versao = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
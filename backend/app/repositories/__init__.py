@@ -1,25 +1,35 @@
 from app.repositories.avaliacao import AvaliacaoRepository
 from app.repositories.avaliacao_gestor import AvaliacaoGestorRepository
 from app.repositories.base import BaseRepository
+from app.repositories.chave_idempotencia import ChaveIdempotenciaRepository
 from app.repositories.ciclo import CicloRepository
 from app.repositories.ciclo_avaliacao import CicloAvaliacaoRepository
 from app.repositories.colaborador import ColaboradorRepository
+from app.repositories.colaborador_hierarquia import ColaboradorHierarquiaRepository
 from app.repositories.eixo_avaliacao import EixoAvaliacaoRepository
 from app.repositories.entrega_outstanding import EntregaOutstandingRepository
+from app.repositories.exclusao_ciclo import ExclusaoCicloRepository
 from app.repositories.feedback_liberacao import FeedbackLiberacaoRepository
+from app.repositories.rascunho import RascunhoRepository
 from app.repositories.registro_valor import RegistroValorRepository
 from app.repositories.valor import ValorRepository
+from app.repositories.versao_cache import VersaoCacheRepository
 
 __all__ = [
     "AvaliacaoRepository",
     "AvaliacaoGestorRepository",
     "BaseRepository",
+    "ChaveIdempotenciaRepository",
     "CicloRepository",
     "CicloAvaliacaoRepository",
     "ColaboradorRepository",
+    "ColaboradorHierarquiaRepository",
     "EixoAvaliacaoRepository",
     "EntregaOutstandingRepository",
+    "ExclusaoCicloRepository",
     "FeedbackLiberacaoRepository",
+    "RascunhoRepository",
     "RegistroValorRepository",
     "ValorRepository",
+    "VersaoCacheRepository",
 ]
@@ -1,12 +1,34 @@
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Sequence
 
+from app.core.dados_referencia import registro_referencia
+from app.core.pagination import Pagina, PaginacaoParams
 from app.models.avaliacao import Avaliacao, AvaliacaoEixo, TipoAvaliacao
-from app.models.ciclo_avaliacao import CicloAvaliacao
-from app.models.colaborador import Colaborador
 from app.models.eixo_avaliacao import EixoAvaliacao
 from app.repositories.base import BaseRepository
-from sqlalchemy import and_
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import and_, select
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session, joinedload, selectinload
+
+# Colunas lidas pelas listagens por linhas (Core) de AvaliacaoResponse
+COLUNAS_AVALIACAO = (
+    "id",
+    "ciclo_id",
+    "avaliador_id",
+    "avaliado_id",
+    "tipo",
+    "avaliacao_geral",
+    "created_at",
+    "updated_at",
+)
+COLUNAS_AVALIACAO_EIXO = (
+    "id",
+    "avaliacao_id",
+    "eixo_id",
+    "nivel",
+    "justificativa",
+    "created_at",
+    "updated_at",
+)
 
 
 class AvaliacaoRepository(BaseRepository[Avaliacao]):
@@ -15,6 +37,16 @@ class AvaliacaoRepository(BaseRepository[Avaliacao]):
     def __init__(self, db: Session):
         super().__init__(Avaliacao, db)
 
+    def _opcoes_resposta(self) -> List[Any]:
+        """Relacionamentos lidos por AvaliacaoResponse"""
+        return [
+            selectinload(self.model.eixos)
+            .joinedload(AvaliacaoEixo.eixo)
+            .selectinload(EixoAvaliacao.niveis),
+            joinedload(self.model.avaliador),
+            joinedload(self.model.avaliado),
+        ]
+
     def get_by_filters(
         self,
         ciclo_id: Optional[int] = None,
@@ -25,7 +57,59 @@ class AvaliacaoRepository(BaseRepository[Avaliacao]):
         """Busca avaliações com filtros"""
         query = self._build_filter_query(ciclo_id, avaliador_id, avaliado_id, tipo)
 
-        return query.order_by(self.model.created_at.desc()).all()
+        return (
+            query.options(*self._opcoes_carregamento())
+            .order_by(self.model.created_at.desc())
+            .all()
+        )
+
+    def paginate_by_filters(
+        self,
+        ciclo_id: Optional[int] = None,
+        avaliador_id: Optional[int] = None,
+        avaliado_id: Optional[int] = None,
+        tipo: Optional[str] = None,
+        paginacao: Optional[PaginacaoParams] = None,
+        opcoes: Sequence[Any] = (),
+    ) -> Pagina[Avaliacao]:
+        """Busca avaliações com filtros, mais recentes primeiro, com paginação por cursor"""
+        return self.paginate(
+            self._build_filter_query(ciclo_id, avaliador_id, avaliado_id, tipo),
+            paginacao,
+            order_by=self.model.created_at,
+            descending=True,
+            options=self._opcoes_carregamento(opcoes),
+        )
+
+    def paginate_by_participante(
+        self,
+        colaborador_id: int,
+        ciclo_id: Optional[int] = None,
+        tipo: Optional[str] = None,
+        paginacao: Optional[PaginacaoParams] = None,
+        opcoes: Sequence[Any] = (),
+    ) -> Pagina[Avaliacao]:
+        """
+        Busca avaliações em que o colaborador é avaliador ou avaliado
+
+        Um ramo por papel (UNION ALL), cada um servido pelo índice
+        (avaliador_id, created_at) ou (avaliado_id, created_at). A
+        autoavaliação fica só no ramo do avaliador para os ramos não se repetirem.
+        """
+        base = self._build_filter_query(ciclo_id=ciclo_id, tipo=tipo)
+        return self.paginate_union(
+            [
+                base.filter(self.model.avaliador_id == colaborador_id),
+                base.filter(
+                    self.model.avaliado_id == colaborador_id,
+                    self.model.avaliador_id != colaborador_id,
+                ),
+            ],
+            paginacao,
+            order_by=self.model.created_at,
+            descending=True,
+            options=self._opcoes_carregamento(opcoes),
+        )
 
     def _build_filter_query(
         self,
@@ -57,6 +141,7 @@ class AvaliacaoRepository(BaseRepository[Avaliacao]):
     ) -> List[Avaliacao]:
         query = (
             self.db.query(self.model)
+            .options(*self._opcoes_carregamento())
             .filter(self.model.ciclo_id == ciclo_id)
             .filter(self.model.tipo == tipo)
         )
@@ -109,7 +194,7 @@ class AvaliacaoRepository(BaseRepository[Avaliacao]):
         )
 
         # Criar avaliações por eixo
-        eixos = self.db.query(EixoAvaliacao).all()
+        eixos = registro_referencia.obter(self.db).eixos
         for eixo in eixos:
             if str(eixo.id) in eixos_data:
                 eixo_data = eixos_data[str(eixo.id)]
@@ -146,7 +231,7 @@ class AvaliacaoRepository(BaseRepository[Avaliacao]):
             ).delete()
 
             # Criar novas avaliações de eixos
-            eixos = self.db.query(EixoAvaliacao).all()
+            eixos = registro_referencia.obter(self.db).eixos
             for eixo in eixos:
                 if str(eixo.id) in eixos_data:
                     eixo_data = eixos_data[str(eixo.id)]
@@ -172,25 +257,20 @@ class AvaliacaoRepository(BaseRepository[Avaliacao]):
             tipo=TipoAvaliacao.PAR,
         )
 
+        # Níveis por eixo a partir dos eixos já carregados com as avaliações
+        niveis_por_eixo: Dict[int, List[int]] = {}
+        for avaliacao_par in avaliacoes_pares:
+            for avaliacao_eixo in avaliacao_par.eixos:
+                niveis_por_eixo.setdefault(avaliacao_eixo.eixo_id, []).append(
+                    avaliacao_eixo.nivel
+                )
+
         # Calcular média dos pares por eixo
         media_pares_por_eixo: Dict[str, float] = {}
-        eixos = self.db.query(EixoAvaliacao).all()
+        eixos = registro_referencia.obter(self.db).eixos
 
         for eixo in eixos:
-            niveis = []
-            for avaliacao_par in avaliacoes_pares:
-                avaliacao_eixo = (
-                    self.db.query(AvaliacaoEixo)
-                    .filter(
-                        and_(
-                            AvaliacaoEixo.avaliacao_id == avaliacao_par.id,
-                            AvaliacaoEixo.eixo_id == eixo.id,
-                        )
-                    )
-                    .first()
-                )
-                if avaliacao_eixo:
-                    niveis.append(avaliacao_eixo.nivel)
+            niveis = niveis_por_eixo.get(eixo.id, [])
 
             if niveis:
                 media = sum(niveis) / len(niveis)
@@ -200,37 +280,12 @@ class AvaliacaoRepository(BaseRepository[Avaliacao]):
 
         return media_pares_por_eixo
 
-    def validate_ciclo_avaliacao(
-        self, ciclo_id: int, colaborador_id: int
-    ) -> Optional[CicloAvaliacao]:
-        """Valida se o ciclo de avaliação existe"""
-        return (
-            self.db.query(CicloAvaliacao)
-            .options(
-                joinedload(CicloAvaliacao.ciclo),
-            )
-            .filter(CicloAvaliacao.ciclo_id == ciclo_id)
-            .filter(CicloAvaliacao.colaborador_id == colaborador_id)
-            .first()
-        )
-
-    def validate_colaborador(self, colaborador_id: int) -> Optional[Colaborador]:
-        """Valida se o colaborador existe"""
-        return (
-            self.db.query(Colaborador).filter(Colaborador.id == colaborador_id).first()
-        )
-
     def get_all_by_colaborador(
         self, colaborador_id: int, ciclo_id: Optional[int] = None
     ) -> List[Avaliacao]:
         avaliacoes_completas = (
             self.db.query(self.model)
-            .options(
-                joinedload(self.model.avaliador),
-                joinedload(self.model.avaliado),
-                joinedload(self.model.ciclo),
-                joinedload(self.model.eixos).joinedload(AvaliacaoEixo.eixo),
-            )
+            .options(*self._opcoes_carregamento())
             .filter(self.model.avaliado_id == colaborador_id)
         )
 
@@ -244,3 +299,30 @@ class AvaliacaoRepository(BaseRepository[Avaliacao]):
         ).all()
 
         return avaliacoes_completas
+
+    def get_linhas_by_colaborador(
+        self, colaborador_id: int, ciclo_id: Optional[int] = None
+    ) -> List[Row]:
+        """Mesmo que get_all_by_colaborador, só as linhas de avaliacoes (Core)"""
+        stmt = self.selecionar(*COLUNAS_AVALIACAO).filter(
+            self.model.avaliado_id == colaborador_id
+        )
+        if ciclo_id:
+            stmt = stmt.filter(self.model.ciclo_id == ciclo_id)
+        return self.db.execute(stmt.order_by(self.model.created_at.desc())).all()
+
+    def get_linhas_eixos(self, avaliacoes_ids: Iterable[int]) -> Dict[int, List[Row]]:
+        """Linhas de avaliacoes_eixos das avaliações, agrupadas por avaliacao_id"""
+        avaliacoes_ids = set(avaliacoes_ids)
+        if not avaliacoes_ids:
+            return {}
+        tabela = AvaliacaoEixo.__table__
+        linhas = self.db.execute(
+            select(*(tabela.c[coluna] for coluna in COLUNAS_AVALIACAO_EIXO))
+            .where(tabela.c.avaliacao_id.in_(avaliacoes_ids))
+            .order_by(tabela.c.avaliacao_id, tabela.c.id)
+        ).all()
+        por_avaliacao: Dict[int, List[Row]] = {}
+        for linha in linhas:
+            por_avaliacao.setdefault(linha.avaliacao_id, []).append(linha)
+        return por_avaliacao
@@ -1,11 +1,11 @@
-from typing import List, Optional
+from typing import Any, List, Mapping, Optional, Sequence
 
+from app.core.dados_referencia import registro_referencia
+from app.core.pagination import Pagina, PaginacaoParams
 from app.models.avaliacao_gestor import AvaliacaoGestor, AvaliacaoGestorResposta
-from app.models.ciclo_avaliacao import CicloAvaliacao
-from app.models.colaborador import Colaborador
 from app.repositories.base import BaseRepository
 from sqlalchemy import and_
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 
 class AvaliacaoGestorRepository(BaseRepository[AvaliacaoGestor]):
@@ -14,6 +14,13 @@ class AvaliacaoGestorRepository(BaseRepository[AvaliacaoGestor]):
     def __init__(self, db: Session):
         super().__init__(AvaliacaoGestor, db)
 
+    def _opcoes_resposta(self) -> List[Any]:
+        """Relacionamentos lidos por AvaliacaoGestorResponse"""
+        return [
+            selectinload(self.model.respostas),
+            joinedload(self.model.gestor),
+        ]
+
     def get_by_filters(
         self,
         ciclo_id: Optional[int] = None,
@@ -23,7 +30,56 @@ class AvaliacaoGestorRepository(BaseRepository[AvaliacaoGestor]):
         """Busca avaliações de gestor com filtros"""
         query = self._build_filter_query(ciclo_id, colaborador_id, gestor_id)
 
-        return query.order_by(self.model.created_at.desc()).all()
+        return (
+            query.options(*self._opcoes_carregamento())
+            .order_by(self.model.created_at.desc())
+            .all()
+        )
+
+    def paginate_by_filters(
+        self,
+        ciclo_id: Optional[int] = None,
+        colaborador_id: Optional[int] = None,
+        gestor_id: Optional[int] = None,
+        paginacao: Optional[PaginacaoParams] = None,
+        opcoes: Sequence[Any] = (),
+    ) -> Pagina[AvaliacaoGestor]:
+        """Busca avaliações de gestor com filtros, mais recentes primeiro, com paginação por cursor"""
+        return self.paginate(
+            self._build_filter_query(ciclo_id, colaborador_id, gestor_id),
+            paginacao,
+            order_by=self.model.created_at,
+            descending=True,
+            options=self._opcoes_carregamento(opcoes),
+        )
+
+    def paginate_by_participante(
+        self,
+        colaborador_id: int,
+        ciclo_id: Optional[int] = None,
+        paginacao: Optional[PaginacaoParams] = None,
+        opcoes: Sequence[Any] = (),
+    ) -> Pagina[AvaliacaoGestor]:
+        """
+        Busca avaliações de gestor em que o colaborador é o avaliador ou o gestor avaliado
+
+        Um ramo por papel (UNION ALL), servidos pelos índices
+        (colaborador_id, created_at) e (gestor_id, created_at).
+        """
+        base = self._build_filter_query(ciclo_id=ciclo_id)
+        return self.paginate_union(
+            [
+                base.filter(self.model.colaborador_id == colaborador_id),
+                base.filter(
+                    self.model.gestor_id == colaborador_id,
+                    self.model.colaborador_id != colaborador_id,
+                ),
+            ],
+            paginacao,
+            order_by=self.model.created_at,
+            descending=True,
+            options=self._opcoes_carregamento(opcoes),
+        )
 
     def _build_filter_query(
         self,
@@ -185,16 +241,15 @@ class AvaliacaoGestorRepository(BaseRepository[AvaliacaoGestor]):
         )
 
     def get_all_by_colaborador(
-        self, colaborador_id: int, ciclo_id: Optional[int] = None
+        self,
+        colaborador_id: int,
+        ciclo_id: Optional[int] = None,
+        opcoes: Sequence[Any] = (),
     ) -> List[AvaliacaoGestor]:
         """Busca todas as avaliações de gestor realizadas por um colaborador"""
         query = (
             self.db.query(self.model)
-            .options(
-                joinedload(self.model.colaborador),
-                joinedload(self.model.gestor),
-                joinedload(self.model.respostas),
-            )
+            .options(*self._opcoes_carregamento(opcoes))
             .filter(self.model.colaborador_id == colaborador_id)
         )
 
@@ -204,16 +259,15 @@ class AvaliacaoGestorRepository(BaseRepository[AvaliacaoGestor]):
         return query.order_by(self.model.created_at.desc()).all()
 
     def get_all_by_gestor(
-        self, gestor_id: int, ciclo_id: Optional[int] = None
+        self,
+        gestor_id: int,
+        ciclo_id: Optional[int] = None,
+        opcoes: Sequence[Any] = (),
     ) -> List[AvaliacaoGestor]:
         """Busca todas as avaliações de gestor recebidas por um gestor"""
         query = (
             self.db.query(self.model)
-            .options(
-                joinedload(self.model.colaborador),
-                joinedload(self.model.gestor),
-                joinedload(self.model.respostas),
-            )
+            .options(*self._opcoes_carregamento(opcoes))
             .filter(self.model.gestor_id == gestor_id)
         )
 
@@ -222,30 +276,6 @@ class AvaliacaoGestorRepository(BaseRepository[AvaliacaoGestor]):
 
         return query.order_by(self.model.created_at.desc()).all()
 
-    def validate_ciclo_avaliacao(
-        self, ciclo_id: int, colaborador_id: int
-    ) -> Optional[CicloAvaliacao]:
-        """Valida se o ciclo de avaliação existe"""
-        return (
-            self.db.query(CicloAvaliacao)
-            .options(joinedload(CicloAvaliacao.ciclo))
-            .filter(CicloAvaliacao.ciclo_id == ciclo_id)
-            .filter(CicloAvaliacao.colaborador_id == colaborador_id)
-            .first()
-        )
-
-    def validate_colaborador(self, colaborador_id: int) -> Optional[Colaborador]:
-        """Valida se o colaborador existe"""
-        return (
-            self.db.query(Colaborador).filter(Colaborador.id == colaborador_id).first()
-        )
-
-    def _get_pergunta_info(self, pergunta_codigo: str) -> Optional[dict]:
+    def _get_pergunta_info(self, pergunta_codigo: str) -> Optional[Mapping[str, str]]:
         """Obtém informações de uma pergunta pelo código"""
-        from app.schemas.avaliacao_gestor import PERGUNTAS_ABERTAS, PERGUNTAS_FECHADAS
-
-        if pergunta_codigo in PERGUNTAS_FECHADAS:
-            return PERGUNTAS_FECHADAS[pergunta_codigo]
-        elif pergunta_codigo in PERGUNTAS_ABERTAS:
-            return PERGUNTAS_ABERTAS[pergunta_codigo]
-        return None
+        return registro_referencia.obter(self.db).get_pergunta(pergunta_codigo)
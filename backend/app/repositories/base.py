@@ -1,6 +1,30 @@
-from typing import Generic, List, Optional, Type, TypeVar
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+    Union,
+)
 
-from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.pagination import (
+    Pagina,
+    PaginacaoParams,
+    codificar_cursor,
+    decodificar_cursor,
+)
+from app.core.periodo import Janela
+from app.repositories.identidade import mapa_identidade
+from sqlalchemy import Select, and_, or_, select, union_all
+from sqlalchemy.engine import RowMapping
+from sqlalchemy.orm import Query, Session, raiseload
+from sqlalchemy.sql import func
 
 ModelType = TypeVar("ModelType")
 
@@ -19,9 +43,41 @@ class BaseRepository(Generic[ModelType]):
         self.model = model
         self.db = db
 
+    def _opcoes_resposta(self) -> List[Any]:
+        """
+        Opções de carregamento dos relacionamentos lidos pelo schema de resposta
+
+        Repositórios cujos schemas de resposta incluem relacionamentos
+        sobrescrevem este método, para que as listagens os carreguem em poucas
+        consultas em vez de um lazy load por linha durante a serialização.
+        """
+        return []
+
+    def _opcoes_carregamento(self, opcoes: Sequence[Any] = ()) -> List[Any]:
+        """
+        Opções de carregamento de uma query cujo resultado será serializado
+
+        Usa as opções recebidas (ex: seleção de campos) ou, sem elas, as da
+        resposta completa. Com SQLALCHEMY_RAISELOAD, acessar um relacionamento
+        não declarado levanta erro em vez de disparar um lazy load.
+        """
+        opcoes = list(opcoes) if opcoes else self._opcoes_resposta()
+        if settings.SQLALCHEMY_RAISELOAD:
+            opcoes.append(raiseload("*"))
+        return opcoes
+
     def get(self, id: int) -> Optional[ModelType]:
-        """Busca um registro por ID"""
-        return self.db.query(self.model).filter(self.model.id == id).first()
+        """Busca um registro por ID (sem consulta se já carregado na requisição)"""
+        return mapa_identidade(self.db).get(self.model, id)
+
+    def get_por_chave(self, **chave: Any) -> Optional[ModelType]:
+        """
+        Busca um registro por uma chave natural única (ex: email=...)
+
+        Reaproveita objetos já carregados na requisição por qualquer
+        repositório; consulta o banco só quando nenhum corresponde.
+        """
+        return mapa_identidade(self.db).get_por_chave(self.model, chave)
 
     def get_all(self, order_by=None, **filters) -> List[ModelType]:
         """
@@ -59,12 +115,367 @@ class BaseRepository(Generic[ModelType]):
 
         return query.count()
 
+    def filtrar_janela(self, query: Query, janela: Optional[Janela], coluna=None):
+        """
+        Restringe a query ao intervalo de datas da janela (limites inclusivos)
+
+        Args:
+            query: Query (ou SELECT) a filtrar
+            janela: Janela resolvida; None não filtra
+            coluna: Coluna de data (padrão: created_at)
+        """
+        if janela is None:
+            return query
+        coluna = coluna if coluna is not None else self.model.created_at
+        if janela.desde is not None:
+            query = query.filter(coluna >= janela.desde)
+        if janela.ate is not None:
+            query = query.filter(coluna <= janela.ate)
+        return query
+
+    def paginate(
+        self,
+        query: Query,
+        paginacao: Optional[PaginacaoParams] = None,
+        order_by=None,
+        descending: bool = False,
+        options: Sequence[Any] = (),
+    ) -> Pagina[ModelType]:
+        """
+        Executa a query com paginação por cursor (keyset)
+
+        A ordenação é feita por `order_by` com o id como desempate, na mesma
+        direção; a coluna de ordenação não pode ser nula. Sem paginação ativa
+        retorna todos os registros, com o total igual ao tamanho da lista.
+
+        Args:
+            query: Query já filtrada (sem ordenação)
+            paginacao: Parâmetros recebidos na requisição
+            order_by: Coluna de ordenação (padrão: id)
+            descending: Ordena de forma decrescente
+            options: Opções de carregamento (ex: load_only, selectinload)
+        """
+        if options:
+            query = query.options(*options)
+
+        coluna = order_by if order_by is not None else self.model.id
+        ordenacao = self._ordenacao(coluna, self.model.id, descending)
+
+        if paginacao is None or not paginacao.ativa:
+            itens = query.order_by(*ordenacao).all()
+            return Pagina(itens=itens, total=len(itens))
+
+        total = query.order_by(None).count() if paginacao.incluir_total else None
+
+        query = self._filtrar_cursor(query, paginacao, coluna, descending)
+        # Um item a mais indica se existe próxima página
+        itens = query.order_by(*ordenacao).limit(paginacao.limit + 1).all()
+        return self._montar_pagina(itens, paginacao, coluna, total)
+
+    def paginate_union(
+        self,
+        ramos: Sequence[Query],
+        paginacao: Optional[PaginacaoParams] = None,
+        order_by=None,
+        descending: bool = False,
+        options: Sequence[Any] = (),
+    ) -> Pagina[ModelType]:
+        """
+        Pagina a união (UNION ALL) de várias queries do modelo
+
+        Alternativa ao paginate com um OR entre colunas diferentes (ex: "sou
+        avaliador OU avaliado"), que não consegue usar um índice para ordenar.
+        Cada ramo é ordenado e limitado no banco pelo seu próprio índice, e a
+        página final é a junção dos ramos, também ordenada e limitada no banco.
+        Os ramos precisam ser disjuntos (nenhum registro em mais de um ramo).
+
+        Args:
+            ramos: Queries já filtradas (sem ordenação), uma por ramo
+            paginacao: Parâmetros recebidos na requisição
+            order_by: Coluna de ordenação (padrão: id)
+            descending: Ordena de forma decrescente
+            options: Opções de carregamento (ex: load_only, selectinload)
+        """
+        coluna = order_by if order_by is not None else self.model.id
+        paginada = paginacao is not None and paginacao.ativa
+
+        total = None
+        if paginada and paginacao.incluir_total:
+            total = sum(ramo.order_by(None).count() for ramo in ramos)
+
+        selects = []
+        for ramo in ramos:
+            ramo = ramo.with_entities(
+                self.model.id.label("id"), coluna.label("ordem")
+            )
+            if paginada:
+                ramo = self._filtrar_cursor(ramo, paginacao, coluna, descending)
+                ramo = ramo.order_by(
+                    *self._ordenacao(coluna, self.model.id, descending)
+                ).limit(paginacao.limit + 1)
+            subquery = ramo.subquery()
+            selects.append(select(subquery.c.id, subquery.c.ordem))
+        uniao = union_all(*selects).subquery()
+
+        query = self.db.query(self.model).join(uniao, uniao.c.id == self.model.id)
+        if options:
+            query = query.options(*options)
+        query = query.order_by(*self._ordenacao(uniao.c.ordem, uniao.c.id, descending))
+
+        if not paginada:
+            itens = query.all()
+            return Pagina(itens=itens, total=len(itens))
+
+        itens = query.limit(paginacao.limit + 1).all()
+        return self._montar_pagina(itens, paginacao, coluna, total)
+
+    # -----------------------------------------------------------------------
+    # Leitura por linhas (Core)
+    #
+    # Listagens que só serializam os dados não precisam de objetos ORM: a
+    # hidratação (identity map, estado de cada atributo, coleções dos
+    # relacionamentos) custa mais que a própria consulta. Estes métodos fazem
+    # SELECT apenas das colunas pedidas e devolvem os mapeamentos das linhas
+    # (RowMapping), que seguem direto para a montagem da resposta. Nada é
+    # carregado na sessão: não use o resultado para alterar registros.
+    # -----------------------------------------------------------------------
+
+    def selecionar(self, *colunas: str) -> Select:
+        """SELECT das colunas da tabela do modelo, pelo nome (sem repetir)"""
+        tabela = self.model.__table__
+        return select(*(tabela.c[coluna] for coluna in dict.fromkeys(colunas)))
+
+    def listar_linhas(self, stmt: Select) -> List[RowMapping]:
+        """Executa o SELECT e retorna as linhas como mapeamentos"""
+        return self.db.execute(stmt).mappings().all()
+
+    def get_linhas_by_ids(
+        self, ids: Iterable[int], colunas: Sequence[str]
+    ) -> Dict[int, RowMapping]:
+        """Linhas (só as colunas pedidas) dos IDs, indexadas pelo id"""
+        ids = set(ids)
+        if not ids:
+            return {}
+        stmt = self.selecionar("id", *colunas).where(self.model.__table__.c.id.in_(ids))
+        return {linha["id"]: linha for linha in self.listar_linhas(stmt)}
+
+    def paginate_linhas(
+        self,
+        stmt: Select,
+        paginacao: Optional[PaginacaoParams] = None,
+        order_by=None,
+        descending: bool = False,
+    ) -> Pagina[RowMapping]:
+        """
+        Equivalente a paginate para um SELECT de colunas (sem objetos ORM)
+
+        O SELECT precisa incluir o id e a coluna de ordenação, usados no cursor.
+
+        Args:
+            stmt: SELECT já filtrado (sem ordenação)
+            paginacao: Parâmetros recebidos na requisição
+            order_by: Coluna de ordenação (padrão: id)
+            descending: Ordena de forma decrescente
+        """
+        coluna = order_by if order_by is not None else self.model.id
+        ordenacao = self._ordenacao(coluna, self.model.id, descending)
+
+        if paginacao is None or not paginacao.ativa:
+            itens = self.listar_linhas(stmt.order_by(*ordenacao))
+            return Pagina(itens=itens, total=len(itens))
+
+        total = None
+        if paginacao.incluir_total:
+            total = self.db.execute(
+                select(func.count()).select_from(stmt.order_by(None).subquery())
+            ).scalar_one()
+
+        stmt = self._filtrar_cursor(stmt, paginacao, coluna, descending)
+        # Um item a mais indica se existe próxima página
+        itens = self.listar_linhas(
+            stmt.order_by(*ordenacao).limit(paginacao.limit + 1)
+        )
+        return self._montar_pagina(itens, paginacao, coluna, total)
+
+    @staticmethod
+    def _ordenacao(coluna, coluna_id, descending: bool) -> list:
+        """Ordenação pela coluna com o id como desempate, na mesma direção"""
+        colunas = [coluna] if coluna is coluna_id else [coluna, coluna_id]
+        return [c.desc() if descending else c.asc() for c in colunas]
+
+    def _filtrar_cursor(
+        self,
+        query: Union[Query, Select],
+        paginacao: PaginacaoParams,
+        coluna,
+        descending: bool,
+    ) -> Union[Query, Select]:
+        """Aplica o filtro keyset a partir do cursor da página anterior"""
+        if not paginacao.cursor:
+            return query
+
+        try:
+            tipo_ordem = coluna.type.python_type
+        except NotImplementedError:
+            tipo_ordem = None
+        valor_ordem, ultimo_id = decodificar_cursor(paginacao.cursor, tipo_ordem)
+        if coluna is self.model.id:
+            return query.filter(
+                coluna < ultimo_id if descending else coluna > ultimo_id
+            )
+        if descending:
+            return query.filter(
+                or_(
+                    coluna < valor_ordem,
+                    and_(coluna == valor_ordem, self.model.id < ultimo_id),
+                )
+            )
+        return query.filter(
+            or_(
+                coluna > valor_ordem,
+                and_(coluna == valor_ordem, self.model.id > ultimo_id),
+            )
+        )
+
+    @staticmethod
+    def _montar_pagina(
+        itens: list, paginacao: PaginacaoParams, coluna, total: Optional[int]
+    ) -> Pagina[ModelType]:
+        """Monta a página a partir de limit + 1 itens, gerando o próximo cursor"""
+        next_cursor = None
+        if len(itens) > paginacao.limit:
+            itens = itens[: paginacao.limit]
+            ultimo = itens[-1]
+            if isinstance(ultimo, Mapping):
+                next_cursor = codificar_cursor(ultimo[coluna.key], ultimo["id"])
+            else:
+                next_cursor = codificar_cursor(
+                    getattr(ultimo, coluna.key), ultimo.id
+                )
+
+        return Pagina(itens=itens, next_cursor=next_cursor, total=total)
+
     def create(self, db_obj: ModelType) -> ModelType:
         """Cria um novo registro"""
         self.db.add(db_obj)
         self.db.flush()
         return db_obj
 
+    def upsert(
+        self,
+        values: Union[Dict[str, Any], List[Dict[str, Any]]],
+        conflito: Sequence[str],
+        atualizar: Sequence[str] = (),
+        expressoes: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        """
+        Insere ou atualiza registros em um único comando
+
+        Args:
+            values: Registro (ou lista de registros) a inserir
+            conflito: Colunas da chave única que identifica o registro existente
+            atualizar: Colunas sobrescritas quando o registro já existe
+            expressoes: Colunas atualizadas com uma expressão sobre o registro
+                existente (ex: {"versao": table.c.versao + 1})
+
+        Returns:
+            Número de linhas afetadas informado pelo banco
+        """
+        table = self.model.__table__
+        dialect = self.db.get_bind().dialect.name
+
+        if dialect == "mysql":
+            from sqlalchemy.dialects.mysql import insert
+
+            stmt = insert(table).values(values)
+            novos_valores = stmt.inserted
+        elif dialect in ("postgresql", "sqlite"):
+            if dialect == "postgresql":
+                from sqlalchemy.dialects.postgresql import insert
+            else:
+                from sqlalchemy.dialects.sqlite import insert
+
+            stmt = insert(table).values(values)
+            novos_valores = stmt.excluded
+        else:
+            raise NotImplementedError(f"Upsert não suportado para o dialeto {dialect}")
+
+        set_ = {coluna: novos_valores[coluna] for coluna in atualizar}
+        set_.update(expressoes or {})
+        # O onupdate das colunas não é aplicado no ramo de conflito
+        if "updated_at" in table.c and "updated_at" not in set_:
+            set_["updated_at"] = func.now()
+
+        if dialect == "mysql":
+            stmt = stmt.on_duplicate_key_update(set_)
+        else:
+            stmt = stmt.on_conflict_do_update(index_elements=list(conflito), set_=set_)
+
+        return self.db.execute(stmt).rowcount
+
+    def get_values_by_ids(
+        self, ids: Sequence[int], column: str, for_update: bool = False
+    ) -> Dict[int, Any]:
+        """
+        Busca o valor de uma coluna para vários IDs em uma única consulta
+
+        Args:
+            ids: IDs dos registros
+            column: Nome da coluna a retornar
+            for_update: Bloqueia as linhas até o fim da transação (SELECT ... FOR UPDATE)
+        """
+        query = self.db.query(self.model.id, getattr(self.model, column)).filter(
+            self.model.id.in_(ids)
+        )
+        if for_update:
+            query = query.with_for_update()
+        return {id_: valor for id_, valor in query.all()}
+
+    def update_in_bulk(
+        self, ids: Sequence[int], values: Dict[str, Any], **filters
+    ) -> int:
+        """
+        Atualiza vários registros com um único UPDATE ... WHERE id IN (...)
+
+        Args:
+            ids: IDs dos registros
+            values: Colunas e valores a atualizar
+            **filters: Condições adicionais de guarda (ex: status="pendente")
+
+        Returns:
+            Número de linhas atualizadas
+        """
+        query = self.db.query(self.model).filter(self.model.id.in_(ids))
+        for key, value in filters.items():
+            query = query.filter(getattr(self.model, key) == value)
+        return query.update(values, synchronize_session=False)
+
+    def delete_batch(self, *criterion, limit: int) -> int:
+        """
+        Remove até `limit` registros que atendem aos critérios
+
+        Os IDs são selecionados antes do DELETE ... WHERE id IN (...), o que
+        mantém cada comando limitado e evita subconsultas na própria tabela.
+
+        Returns:
+            Número de linhas removidas (0 quando não há mais registros)
+        """
+        ids = [
+            id_
+            for (id_,) in self.db.query(self.model.id)
+            .filter(*criterion)
+            .order_by(self.model.id)
+            .limit(limit)
+            .all()
+        ]
+        if not ids:
+            return 0
+        return (
+            self.db.query(self.model)
+            .filter(self.model.id.in_(ids))
+            .delete(synchronize_session=False)
+        )
+
     def update(self, id: int, **kwargs) -> Optional[ModelType]:
         """Atualiza um registro existente"""
         db_obj = self.get(id)
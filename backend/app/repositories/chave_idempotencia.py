@@ -0,0 +1,66 @@
+from datetime import datetime
+from typing import Optional, Tuple
+
+from app.models.chave_idempotencia import ChaveIdempotencia
+from app.repositories.base import BaseRepository
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+
+class ChaveIdempotenciaRepository(BaseRepository[ChaveIdempotencia]):
+    """Repositório para operações com ChaveIdempotencia"""
+
+    def __init__(self, db: Session):
+        super().__init__(ChaveIdempotencia, db)
+
+    def get_by_chave(self, chave: str, principal: str) -> Optional[ChaveIdempotencia]:
+        """Busca o registro de uma chave de idempotência do principal"""
+        return (
+            self.db.query(self.model)
+            .filter(self.model.chave == chave, self.model.principal == principal)
+            .first()
+        )
+
+    def reservar(
+        self, registro: ChaveIdempotencia, agora: datetime
+    ) -> Tuple[ChaveIdempotencia, bool]:
+        """
+        Reserva a chave para a requisição atual
+
+        A unicidade de (chave, principal) garante que apenas uma requisição
+        concorrente consegue a reserva.
+
+        Returns:
+            Tupla (registro, reservado). Se a chave já existir e não estiver
+            expirada, retorna o registro existente e reservado=False.
+        """
+        try:
+            with self.db.begin_nested():
+                self.create(registro)
+            return registro, True
+        except IntegrityError:
+            pass
+
+        existente = self.get_by_chave(registro.chave, registro.principal)
+        if existente and _comparavel(existente.expira_em) > _comparavel(agora):
+            return existente, False
+
+        # Chave expirada ainda não removida pela limpeza: reaproveitar
+        if existente:
+            self.db.delete(existente)
+            self.db.flush()
+        self.create(registro)
+        return registro, True
+
+    def remover_expiradas(self, agora: datetime) -> int:
+        """Remove as chaves expiradas e retorna a quantidade removida"""
+        return (
+            self.db.query(self.model)
+            .filter(self.model.expira_em <= agora)
+            .delete(synchronize_session=False)
+        )
+
+
+def _comparavel(data: datetime) -> datetime:
+    """Remove o fuso para comparar datas lidas de bancos que não o armazenam"""
+    return data.replace(tzinfo=None)
@@ -1,7 +1,12 @@
-from typing import List, Optional
+import hashlib
+from datetime import datetime
+from typing import List, Optional, Tuple
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from app.core.estado_ciclos import CicloEstado, estado_ciclos
+from app.core.pagination import Pagina, PaginacaoParams
 from app.models.ciclo import Ciclo, StatusCiclo
 from app.repositories.base import BaseRepository
 
@@ -32,3 +37,46 @@ class CicloRepository(BaseRepository[Ciclo]):
             .order_by(self.model.created_at.desc())
             .first()
         )
+
+    def get_estado(self, ciclo_id: int) -> Optional[CicloEstado]:
+        """Estado de um ciclo (etapa, status, datas) lido da memória"""
+        return estado_ciclos.obter(self.db).get(ciclo_id)
+
+    def get_estado_aberto(self) -> Optional[CicloEstado]:
+        """Estado do ciclo aberto mais recente, lido da memória"""
+        return estado_ciclos.obter(self.db).aberto
+
+    def get_assinatura(self) -> Tuple[str, Optional[datetime]]:
+        """
+        Hash do conteúdo da tabela e data da última atualização
+
+        A tabela de ciclos é pequena: ler as colunas sem montar objetos custa
+        bem menos que montar e serializar a resposta, e o hash percebe
+        alterações no mesmo segundo, que max(updated_at) não distingue.
+        """
+        assinatura = hashlib.sha256()
+        ultima_atualizacao = None
+        linhas = self.db.execute(
+            select(*self.model.__table__.columns).order_by(self.model.id)
+        )
+        for linha in linhas:
+            assinatura.update(repr(tuple(linha)).encode())
+            atualizado_em = linha._mapping["updated_at"]
+            if atualizado_em is not None and (
+                ultima_atualizacao is None or atualizado_em > ultima_atualizacao
+            ):
+                ultima_atualizacao = atualizado_em
+        return assinatura.hexdigest(), ultima_atualizacao
+
+    def paginate_by_status(
+        self,
+        status: Optional[StatusCiclo] = None,
+        paginacao: Optional[PaginacaoParams] = None,
+    ) -> Pagina[Ciclo]:
+        """Busca ciclos (opcionalmente por status), mais recentes primeiro, com paginação por cursor"""
+        query = self.db.query(self.model)
+        if status is not None:
+            query = query.filter(self.model.status == status)
+        return self.paginate(
+            query, paginacao, order_by=self.model.created_at, descending=True
+        )
@@ -1,11 +1,15 @@
-from typing import List, Optional
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-from app.models.ciclo import Ciclo, StatusCiclo
+from app.core.estado_ciclos import estado_ciclos
 from app.models.ciclo_avaliacao import CicloAvaliacao, ParSelecionado
 from app.models.colaborador import Colaborador
 from app.repositories.base import BaseRepository
-from sqlalchemy import and_
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import and_, func, insert
+from sqlalchemy.orm import Session, joinedload, selectinload
+
+# Registros por comando nas gravações em lote da distribuição de pares
+PARES_LOTE = 1000
 
 
 class CicloAvaliacaoRepository(BaseRepository[CicloAvaliacao]):
@@ -14,6 +18,16 @@ class CicloAvaliacaoRepository(BaseRepository[CicloAvaliacao]):
     def __init__(self, db: Session):
         super().__init__(CicloAvaliacao, db)
 
+    def _opcoes_resposta(self) -> List[Any]:
+        """Relacionamentos lidos por CicloAvaliacaoResponse"""
+        return [
+            joinedload(self.model.ciclo),
+            joinedload(self.model.colaborador),
+            selectinload(self.model.pares_selecionados).joinedload(
+                ParSelecionado.par
+            ),
+        ]
+
     def get(self, id: int) -> Optional[CicloAvaliacao]:
         return (
             self.db.query(self.model)
@@ -31,15 +45,28 @@ class CicloAvaliacaoRepository(BaseRepository[CicloAvaliacao]):
             .all()
         )
 
+    def get_completos_by_colaborador(
+        self, colaborador_id: int
+    ) -> List[CicloAvaliacao]:
+        """Busca os ciclos de avaliação do colaborador com ciclo, colaborador e pares carregados"""
+        return (
+            self.db.query(self.model)
+            .options(*self._opcoes_carregamento())
+            .filter(self.model.colaborador_id == colaborador_id)
+            .order_by(self.model.created_at.desc())
+            .all()
+        )
+
+    def get_by_ciclo_e_colaborador(
+        self, ciclo_id: int, colaborador_id: int
+    ) -> Optional[CicloAvaliacao]:
+        """Ciclo de avaliação do colaborador em um ciclo (chave natural)"""
+        return self.get_por_chave(ciclo_id=ciclo_id, colaborador_id=colaborador_id)
+
     def get_ativo_by_colaborador(self, colaborador_id: int) -> Optional[CicloAvaliacao]:
         """Busca o ciclo de avaliação ativo de um colaborador"""
-        # Buscar ciclo aberto
-        ciclo_aberto = (
-            self.db.query(Ciclo)
-            .filter(Ciclo.status == StatusCiclo.ABERTO)
-            .order_by(Ciclo.created_at.desc())
-            .first()
-        )
+        # Ciclo aberto lido da memória
+        ciclo_aberto = estado_ciclos.obter(self.db).aberto
 
         if not ciclo_aberto:
             return None
@@ -64,13 +91,7 @@ class CicloAvaliacaoRepository(BaseRepository[CicloAvaliacao]):
     def get_completo(self, ciclo_id: int) -> Optional[CicloAvaliacao]:
         return (
             self.db.query(CicloAvaliacao)
-            .options(
-                joinedload(CicloAvaliacao.ciclo),
-                joinedload(CicloAvaliacao.colaborador),
-                joinedload(CicloAvaliacao.pares_selecionados).joinedload(
-                    ParSelecionado.par
-                ),
-            )
+            .options(*self._opcoes_carregamento())
             .filter(CicloAvaliacao.id == ciclo_id)
             .first()
         )
@@ -116,16 +137,6 @@ class CicloAvaliacaoRepository(BaseRepository[CicloAvaliacao]):
 
         return db_ciclo
 
-    def validate_colaborador(self, colaborador_id: int) -> Optional[Colaborador]:
-        """Valida se o colaborador existe"""
-        return (
-            self.db.query(Colaborador).filter(Colaborador.id == colaborador_id).first()
-        )
-
-    def validate_ciclo(self, ciclo_id: int) -> Optional[Ciclo]:
-        """Valida se o ciclo existe"""
-        return self.db.query(Ciclo).filter(Ciclo.id == ciclo_id).first()
-
     def validate_pares(self, pares_ids: List[int]) -> List[Colaborador]:
         """Valida se os pares existem"""
         return self.db.query(Colaborador).filter(Colaborador.id.in_(pares_ids)).all()
@@ -151,18 +162,123 @@ class CicloAvaliacaoRepository(BaseRepository[CicloAvaliacao]):
             .all()
         )
 
+    def get_pares_para_avaliar_por_ciclo(
+        self, avaliador_id: int, ciclos_ids: Sequence[int]
+    ) -> Dict[int, List[Colaborador]]:
+        """
+        Busca, em uma única consulta, os colaboradores que selecionaram o
+        avaliador_id como par em cada um dos ciclos
+
+        Returns:
+            Dicionário ciclo_id -> colaboradores (ciclos sem pares ficam de fora)
+        """
+        if not ciclos_ids:
+            return {}
+
+        linhas = (
+            self.db.query(self.model.ciclo_id, Colaborador)
+            .join(
+                self.model,
+                self.model.colaborador_id == Colaborador.id,
+            )
+            .join(
+                ParSelecionado,
+                ParSelecionado.ciclo_avaliacao_id == self.model.id,
+            )
+            .filter(ParSelecionado.par_id == avaliador_id)
+            .filter(self.model.ciclo_id.in_(ciclos_ids))
+            .filter(self.model.colaborador_id != avaliador_id)
+            .distinct()
+            .all()
+        )
+
+        pares_por_ciclo: Dict[int, List[Colaborador]] = defaultdict(list)
+        for ciclo_id, colaborador in linhas:
+            pares_por_ciclo[ciclo_id].append(colaborador)
+        return pares_por_ciclo
+
     def get_by_liderados(
         self, ciclo_id: int, liderados_ids: List[int]
     ) -> List[CicloAvaliacao]:
         return (
             self.db.query(self.model)
-            .options(
-                joinedload(self.model.colaborador),
-                joinedload(self.model.pares_selecionados).joinedload(
-                    ParSelecionado.par
-                ),
-            )
+            .options(*self._opcoes_carregamento())
             .filter(self.model.ciclo_id == ciclo_id)
             .filter(self.model.colaborador_id.in_(liderados_ids))
             .all()
         )
+
+    def get_selecoes_por_ciclo(
+        self, ciclo_id: int
+    ) -> Dict[int, Tuple[int, List[int]]]:
+        """
+        Pares escolhidos por todos os colaboradores de um ciclo, em uma consulta
+
+        Returns:
+            Dicionário colaborador_id -> (id do ciclo de avaliação, IDs dos pares)
+        """
+        linhas = (
+            self.db.query(
+                self.model.colaborador_id, self.model.id, ParSelecionado.par_id
+            )
+            .outerjoin(
+                ParSelecionado, ParSelecionado.ciclo_avaliacao_id == self.model.id
+            )
+            .filter(self.model.ciclo_id == ciclo_id)
+            .order_by(self.model.id, ParSelecionado.id)
+            .all()
+        )
+        selecoes: Dict[int, Tuple[int, List[int]]] = {}
+        for colaborador_id, ciclo_avaliacao_id, par_id in linhas:
+            # Registro duplicado do mesmo colaborador: vale o primeiro
+            registro = selecoes.setdefault(colaborador_id, (ciclo_avaliacao_id, []))
+            if registro[0] == ciclo_avaliacao_id and par_id is not None:
+                registro[1].append(par_id)
+        return selecoes
+
+    def substituir_pares_em_lote(
+        self,
+        ciclo_id: int,
+        pares: Dict[int, List[int]],
+        existentes: Dict[int, int],
+    ) -> None:
+        """
+        Grava os pares de vários colaboradores com INSERTs e DELETEs em lote
+
+        Args:
+            ciclo_id: ID do ciclo
+            pares: colaborador_id -> IDs dos novos pares
+            existentes: colaborador_id -> ID do ciclo de avaliação já existente
+        """
+        ids = {c: existentes[c] for c in pares if c in existentes}
+        novos = [c for c in pares if c not in existentes]
+        for inicio in range(0, len(novos), PARES_LOTE):
+            lote = novos[inicio : inicio + PARES_LOTE]
+            self.db.execute(
+                insert(self.model),
+                [{"ciclo_id": ciclo_id, "colaborador_id": c} for c in lote],
+            )
+            ids.update(
+                self.db.query(self.model.colaborador_id, self.model.id)
+                .filter(self.model.ciclo_id == ciclo_id)
+                .filter(self.model.colaborador_id.in_(lote))
+                .all()
+            )
+
+        ciclos_ids = list(ids.values())
+        for inicio in range(0, len(ciclos_ids), PARES_LOTE):
+            lote = ciclos_ids[inicio : inicio + PARES_LOTE]
+            self.db.query(ParSelecionado).filter(
+                ParSelecionado.ciclo_avaliacao_id.in_(lote)
+            ).delete(synchronize_session=False)
+            self.update_in_bulk(lote, {"updated_at": func.now()})
+
+        registros = [
+            {"ciclo_avaliacao_id": ids[colaborador_id], "par_id": par_id}
+            for colaborador_id, pares_ids in pares.items()
+            for par_id in pares_ids
+        ]
+        for inicio in range(0, len(registros), PARES_LOTE):
+            self.db.execute(
+                insert(ParSelecionado), registros[inicio : inicio + PARES_LOTE]
+            )
@@ -1,7 +1,11 @@
-from typing import List, Optional
+from typing import Any, List, Optional, Sequence, Tuple
 
+from app.core.pagination import Pagina, PaginacaoParams
 from app.models.colaborador import Colaborador
 from app.repositories.base import BaseRepository
+from app.repositories.colaborador_hierarquia import ColaboradorHierarquiaRepository
+from sqlalchemy import func
+from sqlalchemy.engine import RowMapping
 from sqlalchemy.orm import Session
 
 
@@ -13,13 +17,11 @@ class ColaboradorRepository(BaseRepository[Colaborador]):
 
     def get_by_email(self, email: str) -> Optional[Colaborador]:
         """Busca um colaborador por email"""
-        return self.db.query(self.model).filter(self.model.email == email).first()
+        return self.get_por_chave(email=email)
 
     def get_by_google_id(self, google_id: str) -> Optional[Colaborador]:
         """Busca um colaborador por google_id"""
-        return (
-            self.db.query(self.model).filter(self.model.google_id == google_id).first()
-        )
+        return self.get_por_chave(google_id=google_id)
 
     def get_active(
         self,
@@ -27,24 +29,128 @@ class ColaboradorRepository(BaseRepository[Colaborador]):
         email: Optional[str] = None,
     ) -> List[Colaborador]:
         """Busca colaboradores ativos com filtros opcionais"""
-        query = (
-            self.db.query(self.model)
-            .filter(self.model.is_active == True)
+        return (
+            self._build_active_query(departamento, email)
             .order_by(self.model.nome)
+            .all()
+        )
+
+    def paginate_active(
+        self,
+        departamento: Optional[str] = None,
+        email: Optional[str] = None,
+        paginacao: Optional[PaginacaoParams] = None,
+    ) -> Pagina[Colaborador]:
+        """Busca colaboradores ativos, ordenados por nome, com paginação por cursor"""
+        return self.paginate(
+            self._build_active_query(departamento, email),
+            paginacao,
+            order_by=self.model.nome,
+        )
+
+    def paginate_active_linhas(
+        self,
+        colunas: Sequence[str],
+        departamento: Optional[str] = None,
+        email: Optional[str] = None,
+        paginacao: Optional[PaginacaoParams] = None,
+    ) -> Pagina[RowMapping]:
+        """Mesmo que paginate_active, com as linhas das colunas pedidas (Core)"""
+        return self.paginate_linhas(
+            self._build_active_query(
+                departamento, email, base=self.selecionar("id", "nome", *colunas)
+            ),
+            paginacao,
+            order_by=self.model.nome,
         )
 
+    def _build_active_query(
+        self,
+        departamento: Optional[str] = None,
+        email: Optional[str] = None,
+        base=None,
+    ):
+        """
+        Constrói a query de colaboradores ativos com os filtros aplicados
+
+        Args:
+            base: SELECT de colunas a filtrar (padrão: query do modelo)
+        """
+        query = base if base is not None else self.db.query(self.model)
+        query = query.filter(self.model.is_active == True)
+
         if departamento:
             query = query.filter(self.model.departamento == departamento)
 
         if email:
             query = query.filter(self.model.email == email)
 
-        return query.all()
+        return query
 
     def get_by_ids(self, ids: List[int]) -> List[Colaborador]:
         """Busca colaboradores por uma lista de IDs"""
         return self.db.query(self.model).filter(self.model.id.in_(ids)).all()
 
+    def get_ids_ativos(
+        self,
+        ids: Optional[List[int]] = None,
+        departamento: Optional[str] = None,
+        subordinados_de: Optional[int] = None,
+    ) -> List[int]:
+        """
+        Busca os IDs dos colaboradores ativos com filtros opcionais
+
+        Args:
+            subordinados_de: Apenas quem está abaixo deste gestor, em qualquer nível
+        """
+        query = self.db.query(self.model.id).filter(self.model.is_active == True)
+
+        if ids is not None:
+            query = query.filter(self.model.id.in_(ids))
+
+        if departamento:
+            query = query.filter(self.model.departamento == departamento)
+
+        if subordinados_de is not None:
+            query = ColaboradorHierarquiaRepository(self.db).filtrar_subarvore(
+                query, self.model.id, subordinados_de
+            )
+
+        return [id_ for (id_,) in query.all()]
+
+    def get_nos_hierarquia(self) -> List[Any]:
+        """Busca os campos do organograma de todos os colaboradores ativos"""
+        return (
+            self.db.query(
+                self.model.id,
+                self.model.nome,
+                self.model.cargo,
+                self.model.departamento,
+                self.model.avatar,
+                self.model.perfil,
+                self.model.gestor_id,
+            )
+            .filter(self.model.is_active == True)
+            .order_by(self.model.nome, self.model.id)
+            .all()
+        )
+
+    def get_assinatura_hierarquia(self) -> Tuple[int, Any]:
+        """
+        Quantidade de colaboradores e última atualização
+
+        Muda sempre que um colaborador é criado ou alterado; usada para saber
+        se o índice em memória da hierarquia ainda está atualizado.
+        """
+        total, ultima_atualizacao = self.db.query(
+            func.count(self.model.id), func.max(self.model.updated_at)
+        ).one()
+        return total, ultima_atualizacao
+
+    def get_alterados_desde(self, momento: Any) -> List[Colaborador]:
+        """Colaboradores (ativos ou não) criados ou alterados a partir do momento"""
+        return self.db.query(self.model).filter(self.model.updated_at >= momento).all()
+
     def get_liderados(
         self, gestor_id: int, is_active: bool = True
     ) -> List[Colaborador]:
@@ -0,0 +1,171 @@
+from typing import Iterable, List, Optional, Set, Tuple
+
+from app.models.colaborador import Colaborador
+from app.models.colaborador_hierarquia import ColaboradorHierarquia
+from app.repositories.base import BaseRepository
+from sqlalchemy import and_, insert, literal, select
+from sqlalchemy.orm import Session, aliased
+
+# Registros por INSERT ao reconstruir a tabela
+HIERARQUIA_LOTE_INSERCAO = 1000
+
+
+class ColaboradorHierarquiaRepository(BaseRepository[ColaboradorHierarquia]):
+    """Repositório da tabela de fechamento da hierarquia (ancestral, descendente, profundidade)"""
+
+    def __init__(self, db: Session):
+        super().__init__(ColaboradorHierarquia, db)
+
+    def get_descendentes_ids(self, ancestral_id: int) -> List[int]:
+        """IDs de todos os colaboradores abaixo de um gestor, em qualquer nível"""
+        return list(
+            self.db.execute(
+                select(self.model.descendente_id)
+                .where(self.model.ancestral_id == ancestral_id)
+                .where(self.model.profundidade > 0)
+            ).scalars()
+        )
+
+    def get_ancestrais_ids(self, descendente_id: int) -> List[int]:
+        """IDs dos gestores de um colaborador, do gestor direto até o topo"""
+        return list(
+            self.db.execute(
+                select(self.model.ancestral_id)
+                .where(self.model.descendente_id == descendente_id)
+                .where(self.model.profundidade > 0)
+                .order_by(self.model.profundidade)
+            ).scalars()
+        )
+
+    def is_descendente(self, ancestral_id: int, descendente_id: int) -> bool:
+        """Verifica se o colaborador está abaixo do gestor (consulta pela chave primária)"""
+        return (
+            self.db.query(self.model.profundidade)
+            .filter(
+                self.model.ancestral_id == ancestral_id,
+                self.model.descendente_id == descendente_id,
+                self.model.profundidade > 0,
+            )
+            .first()
+            is not None
+        )
+
+    def filtrar_subarvore(
+        self, query, coluna, gestor_id: int, incluir_gestor: bool = False
+    ):
+        """
+        Restringe uma consulta aos registros cuja coluna aponta para alguém
+        abaixo do gestor, com um JOIN pela chave primária da tabela de fechamento
+
+        Ex: filtrar_subarvore(db.query(Avaliacao), Avaliacao.avaliado_id, 7)
+        """
+        fechamento = aliased(self.model)
+        condicao = and_(
+            fechamento.ancestral_id == gestor_id,
+            fechamento.descendente_id == coluna,
+        )
+        if not incluir_gestor:
+            condicao = and_(condicao, fechamento.profundidade > 0)
+        return query.join(fechamento, condicao)
+
+    def inserir_colaborador(
+        self, colaborador_id: int, gestor_id: Optional[int]
+    ) -> None:
+        """Registra um colaborador novo (sem subordinados) abaixo do gestor"""
+        self.db.execute(
+            insert(self.model).values(
+                ancestral_id=colaborador_id,
+                descendente_id=colaborador_id,
+                profundidade=0,
+            )
+        )
+        if gestor_id is not None:
+            self._ligar(colaborador_id, gestor_id)
+
+    def mover(self, colaborador_id: int, novo_gestor_id: Optional[int]) -> None:
+        """
+        Move o colaborador e toda a sua subárvore para baixo de outro gestor
+
+        Remove os vínculos da subárvore com os antigos gestores do colaborador
+        e cria os vínculos com a nova cadeia de gestores. Os vínculos internos
+        da subárvore não mudam.
+        """
+        subarvore = list(
+            self.db.execute(
+                select(self.model.descendente_id).where(
+                    self.model.ancestral_id == colaborador_id
+                )
+            ).scalars()
+        )
+        if not subarvore:
+            # Colaborador fora da tabela (ex: criado direto no banco)
+            self.inserir_colaborador(colaborador_id, novo_gestor_id)
+            return
+
+        # IDs já resolvidos: o MySQL não permite subconsulta na própria tabela do DELETE
+        self.db.query(self.model).filter(
+            self.model.descendente_id.in_(subarvore),
+            self.model.ancestral_id.notin_(subarvore),
+        ).delete(synchronize_session=False)
+
+        if novo_gestor_id is not None:
+            self._ligar(colaborador_id, novo_gestor_id)
+
+    def _ligar(self, colaborador_id: int, gestor_id: int) -> None:
+        """Liga a subárvore do colaborador a cada gestor da cadeia do novo gestor"""
+        acima = aliased(self.model)
+        abaixo = aliased(self.model)
+        self.db.execute(
+            insert(self.model).from_select(
+                ["ancestral_id", "descendente_id", "profundidade"],
+                select(
+                    acima.ancestral_id,
+                    abaixo.descendente_id,
+                    acima.profundidade + abaixo.profundidade + literal(1),
+                )
+                .select_from(acima)
+                # Produto cartesiano intencional: cadeia do gestor x subárvore
+                .join(abaixo, abaixo.ancestral_id == colaborador_id)
+                .where(acima.descendente_id == gestor_id),
+            )
+        )
+
+    def get_arestas(self) -> List[Tuple[int, Optional[int]]]:
+        """(id, gestor_id) de todos os colaboradores, origem para reconstruir a tabela"""
+        return [
+            (id_, gestor_id)
+            for id_, gestor_id in self.db.query(Colaborador.id, Colaborador.gestor_id)
+        ]
+
+    def get_registros(self) -> Set[Tuple[int, int, int]]:
+        """Todos os registros (ancestral, descendente, profundidade) da tabela"""
+        return {
+            tuple(registro)
+            for registro in self.db.query(
+                self.model.ancestral_id,
+                self.model.descendente_id,
+                self.model.profundidade,
+            )
+        }
+
+    def substituir(self, registros: Iterable[Tuple[int, int, int]]) -> int:
+        """Substitui todo o conteúdo da tabela, inserindo em lotes"""
+        self.db.query(self.model).delete(synchronize_session=False)
+        total = 0
+        lote = []
+        for ancestral_id, descendente_id, profundidade in registros:
+            lote.append(
+                {
+                    "ancestral_id": ancestral_id,
+                    "descendente_id": descendente_id,
+                    "profundidade": profundidade,
+                }
+            )
+            if len(lote) >= HIERARQUIA_LOTE_INSERCAO:
+                self.db.execute(insert(self.model), lote)
+                total += len(lote)
+                lote = []
+        if lote:
+            self.db.execute(insert(self.model), lote)
+            total += len(lote)
+        return total
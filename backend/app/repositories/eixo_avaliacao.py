@@ -1,6 +1,6 @@
-from typing import List
+from typing import Any, List
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 from app.models.eixo_avaliacao import EixoAvaliacao
 from app.repositories.base import BaseRepository
@@ -12,6 +12,10 @@ class EixoAvaliacaoRepository(BaseRepository[EixoAvaliacao]):
     def __init__(self, db: Session):
         super().__init__(EixoAvaliacao, db)
 
+    def _opcoes_resposta(self) -> List[Any]:
+        """Relacionamentos lidos por EixoAvaliacaoResponse"""
+        return [selectinload(self.model.niveis)]
+
     def get_all(self) -> List[EixoAvaliacao]:
         """Busca todos os eixos de avaliação"""
-        return self.db.query(self.model).all()
+        return self.db.query(self.model).options(*self._opcoes_carregamento()).all()
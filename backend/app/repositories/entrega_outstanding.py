@@ -1,9 +1,77 @@
-from sqlalchemy.orm import Session
+from typing import Any, List, Optional, Sequence
 
-from app.models.entrega_outstanding import EntregaOutstanding
+from sqlalchemy.engine import RowMapping
+from sqlalchemy.orm import Session, joinedload
+
+from app.core.pagination import Pagina, PaginacaoParams
+from app.core.periodo import Janela
+from app.models.entrega_outstanding import EntregaOutstanding, StatusAprovacao
 from app.repositories.base import BaseRepository
 
 
 class EntregaOutstandingRepository(BaseRepository[EntregaOutstanding]):
     def __init__(self, db: Session):
         super().__init__(EntregaOutstanding, db)
+
+    def _opcoes_resposta(self) -> List[Any]:
+        """Relacionamentos lidos por EntregaOutstandingResponse"""
+        return [
+            joinedload(self.model.colaborador),
+            joinedload(self.model.aprovado_por),
+        ]
+
+    def paginate_by_colaborador(
+        self,
+        colaborador_id: int,
+        paginacao: Optional[PaginacaoParams] = None,
+        janela: Optional[Janela] = None,
+    ) -> Pagina[EntregaOutstanding]:
+        """
+        Busca as entregas de um colaborador com paginação por cursor
+
+        O filtro usa o índice (colaborador_id, created_at).
+        """
+        query = self.db.query(self.model).filter(
+            self.model.colaborador_id == colaborador_id
+        )
+        return self.paginate(
+            self.filtrar_janela(query, janela),
+            paginacao,
+            options=self._opcoes_carregamento(),
+        )
+
+    def paginate_pendentes(
+        self,
+        paginacao: Optional[PaginacaoParams] = None,
+        janela: Optional[Janela] = None,
+    ) -> Pagina[EntregaOutstanding]:
+        """
+        Busca as entregas pendentes de aprovação, mais antigas primeiro, com paginação por cursor
+
+        Filtro e ordenação usam o índice (status_aprovacao, created_at).
+        """
+        query = self.db.query(self.model).filter(
+            self.model.status_aprovacao == StatusAprovacao.PENDENTE.value
+        )
+        return self.paginate(
+            self.filtrar_janela(query, janela),
+            paginacao,
+            order_by=self.model.created_at,
+            options=self._opcoes_carregamento(),
+        )
+
+    def paginate_pendentes_linhas(
+        self,
+        colunas: Sequence[str],
+        paginacao: Optional[PaginacaoParams] = None,
+        janela: Optional[Janela] = None,
+    ) -> Pagina[RowMapping]:
+        """Mesmo que paginate_pendentes, com as linhas das colunas pedidas (Core)"""
+        stmt = self.selecionar("id", "created_at", *colunas).filter(
+            self.model.status_aprovacao == StatusAprovacao.PENDENTE.value
+        )
+        return self.paginate_linhas(
+            self.filtrar_janela(stmt, janela),
+            paginacao,
+            order_by=self.model.created_at,
+        )
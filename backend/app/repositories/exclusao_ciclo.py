@@ -0,0 +1,34 @@
+from typing import List, Optional
+
+from app.models.exclusao_ciclo import ExclusaoCiclo, StatusExclusaoCiclo
+from app.repositories.base import BaseRepository
+from sqlalchemy.orm import Session
+
+
+class ExclusaoCicloRepository(BaseRepository[ExclusaoCiclo]):
+    """Repositório para operações com ExclusaoCiclo"""
+
+    def __init__(self, db: Session):
+        super().__init__(ExclusaoCiclo, db)
+
+    def get_ultima_by_ciclo(self, ciclo_id: int) -> Optional[ExclusaoCiclo]:
+        """Busca o job de exclusão mais recente de um ciclo"""
+        return (
+            self.db.query(self.model)
+            .filter(self.model.ciclo_id == ciclo_id)
+            .order_by(self.model.id.desc())
+            .first()
+        )
+
+    def get_pendentes(self) -> List[ExclusaoCiclo]:
+        """Busca os jobs que ainda não terminaram (pendentes ou interrompidos)"""
+        return (
+            self.db.query(self.model)
+            .filter(
+                self.model.status.in_(
+                    [StatusExclusaoCiclo.PENDENTE, StatusExclusaoCiclo.EM_ANDAMENTO]
+                )
+            )
+            .order_by(self.model.id)
+            .all()
+        )
@@ -1,11 +1,14 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Set
 
 from app.models.feedback_liberacao import FeedbackLiberacao
 from app.repositories.base import BaseRepository
 from sqlalchemy import and_
 from sqlalchemy.orm import Session
 
+# Quantidade máxima de colaboradores por comando nas operações em lote
+LOTE_MAX = 1000
+
 
 class FeedbackLiberacaoRepository(BaseRepository[FeedbackLiberacao]):
     """Repositório para operações com FeedbackLiberacao"""
@@ -79,6 +82,72 @@ class FeedbackLiberacaoRepository(BaseRepository[FeedbackLiberacao]):
 
         return feedback_liberacao
 
+    def get_colaboradores_liberados_ids(
+        self, ciclo_id: int, colaboradores_ids: List[int]
+    ) -> Set[int]:
+        """Busca, entre os colaboradores informados, os que já têm feedback liberado no ciclo"""
+        liberados = set()
+        for inicio in range(0, len(colaboradores_ids), LOTE_MAX):
+            lote = colaboradores_ids[inicio : inicio + LOTE_MAX]
+            liberados.update(
+                colaborador_id
+                for (colaborador_id,) in self.db.query(self.model.colaborador_id)
+                .filter(
+                    self.model.ciclo_id == ciclo_id,
+                    self.model.colaborador_id.in_(lote),
+                    self.model.liberado == True,
+                )
+                .all()
+            )
+        return liberados
+
+    def liberar_feedback_em_lote(
+        self, ciclo_id: int, colaboradores_ids: List[int], liberado_por_id: int
+    ) -> None:
+        """Libera o feedback de vários colaboradores com upsert em conjunto"""
+        agora = datetime.utcnow()
+        for inicio in range(0, len(colaboradores_ids), LOTE_MAX):
+            self.upsert(
+                [
+                    {
+                        "ciclo_id": ciclo_id,
+                        "colaborador_id": colaborador_id,
+                        "liberado": True,
+                        "liberado_por_id": liberado_por_id,
+                        "liberado_em": agora,
+                    }
+                    for colaborador_id in colaboradores_ids[inicio : inicio + LOTE_MAX]
+                ],
+                conflito=["ciclo_id", "colaborador_id"],
+                atualizar=["liberado", "liberado_por_id", "liberado_em"],
+            )
+
+    def revogar_feedback_em_lote(
+        self, ciclo_id: int, colaboradores_ids: List[int]
+    ) -> int:
+        """Revoga o feedback de vários colaboradores e retorna quantos foram revogados"""
+        revogados = 0
+        for inicio in range(0, len(colaboradores_ids), LOTE_MAX):
+            revogados += (
+                self.db.query(self.model)
+                .filter(
+                    self.model.ciclo_id == ciclo_id,
+                    self.model.colaborador_id.in_(
+                        colaboradores_ids[inicio : inicio + LOTE_MAX]
+                    ),
+                    self.model.liberado == True,
+                )
+                .update(
+                    {
+                        "liberado": False,
+                        "liberado_por_id": None,
+                        "liberado_em": None,
+                    },
+                    synchronize_session=False,
+                )
+            )
+        return revogados
+
     def is_feedback_liberado(self, ciclo_id: int, colaborador_id: int) -> bool:
         """Verifica se o feedback está liberado para um colaborador em um ciclo"""
         feedback_liberacao = self.get_by_ciclo_and_colaborador(ciclo_id, colaborador_id)
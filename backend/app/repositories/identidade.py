@@ -0,0 +1,154 @@
+"""
+Mapa de identidade da requisição, compartilhado pelos repositórios.
+
+Numa mesma requisição, services diferentes buscam as mesmas linhas várias
+vezes (o colaborador logado, já carregado por get_current_colaborador, é
+relido por ColaboradorService.get_by_id; o avaliado é validado pelo
+repositório de avaliações e depois lido de novo). Todos esses repositórios
+usam a mesma sessão, então o mapa fica em `session.info` e responde:
+
+- busca por id: pelo identity map da sessão (`Session.get`), sem consulta
+  quando o objeto já foi carregado;
+- busca por chave natural única (email, ciclo + colaborador): por um índice
+  dos objetos já carregados na sessão, consultando o banco só quando não há
+  nenhum. O índice de cada chave é montado na primeira busca da transação e
+  mantido pelos carregamentos seguintes (evento loaded_as_persistent).
+
+O mapa mantém referências fortes aos objetos que respondeu (o identity map da
+sessão é fraco) e é descartado no commit e no rollback, quando os objetos
+expiram ou são removidos da sessão.
+
+UPDATE / DELETE em lote com synchronize_session=False não atualizam os
+objetos da sessão: depois deles os objetos do modelo são expirados (com as
+alterações pendentes gravadas antes), e Session.get os relê do banco ou
+retorna None se a linha foi removida.
+"""
+
+import itertools
+import weakref
+from typing import Any, Dict, Mapping, Optional, Tuple, Type, TypeVar
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import ORMExecuteState, Session
+
+ModelType = TypeVar("ModelType")
+
+# Chave em session.info com o mapa da transação em andamento
+_MAPA = "mapa_identidade"
+
+
+class MapaIdentidade:
+    """Objetos já carregados na sessão, por id e por chave natural"""
+
+    def __init__(self, db: Session):
+        self.db = db
+        # Referências fortes aos objetos respondidos, pela identity key
+        self._carregados: Dict[Tuple[Any, ...], Any] = {}
+        # Por (modelo, campos da chave): valores da chave -> objeto
+        self._indices: Dict[
+            Tuple[type, Tuple[str, ...]], "weakref.WeakValueDictionary"
+        ] = {}
+
+    def get(self, model: Type[ModelType], id: Any) -> Optional[ModelType]:
+        """Busca por id, sem consulta se o objeto já estiver na sessão"""
+        obj = self.db.get(model, id)
+        if obj is not None:
+            self._carregados[inspect(obj).identity_key] = obj
+        return obj
+
+    def get_por_chave(
+        self, model: Type[ModelType], chave: Mapping[str, Any]
+    ) -> Optional[ModelType]:
+        """
+        Busca por uma chave natural única
+
+        Procura primeiro no índice dos objetos do modelo já carregados na
+        sessão (comparando só atributos carregados, sem disparar refresh) e só
+        então consulta o banco.
+        """
+        campos = tuple(sorted(chave))
+        indice = self._indices.get((model, campos))
+        if indice is None:
+            # Uma varredura por chave e transação; depois, pelo evento de carga
+            indice = self._indices[(model, campos)] = weakref.WeakValueDictionary()
+            for candidato in self.db.identity_map.values():
+                if isinstance(candidato, model):
+                    _indexar(indice, candidato, campos)
+
+        obj = indice.get(tuple(chave[campo] for campo in campos))
+        if obj is None or not _corresponde(obj, chave):
+            obj = self.db.query(model).filter_by(**chave).first()
+            if obj is not None:
+                _indexar(indice, obj, campos)
+        if obj is not None:
+            self._carregados[inspect(obj).identity_key] = obj
+        return obj
+
+    def indexar(self, obj: Any) -> None:
+        """Inclui um objeto recém-carregado nos índices de chave natural"""
+        for (model, campos), indice in self._indices.items():
+            if isinstance(obj, model):
+                _indexar(indice, obj, campos)
+
+
+def _indexar(
+    indice: "weakref.WeakValueDictionary", obj: Any, campos: Tuple[str, ...]
+) -> None:
+    valores = inspect(obj).dict
+    if all(campo in valores for campo in campos):
+        indice[tuple(valores[campo] for campo in campos)] = obj
+
+
+def _corresponde(obj: Any, chave: Mapping[str, Any]) -> bool:
+    estado = inspect(obj)
+    if estado.deleted or estado.detached:
+        return False
+    valores = estado.dict
+    return all(
+        campo in valores and valores[campo] == valor for campo, valor in chave.items()
+    )
+
+
+def _descartar(db: Session, *args) -> None:
+    db.info.pop(_MAPA, None)
+
+
+@event.listens_for(Session, "loaded_as_persistent")
+def _indexar_carregado(db: Session, obj: Any) -> None:
+    mapa = db.info.get(_MAPA)
+    if mapa is not None:
+        mapa.indexar(obj)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _expirar_apos_dml_em_lote(estado: ORMExecuteState):
+    """Expira os objetos do modelo após UPDATE / DELETE sem sincronização"""
+    if not (estado.is_update or estado.is_delete) or estado.bind_mapper is None:
+        return None
+    if estado.execution_options.get("synchronize_session", "auto") is not False:
+        return None
+
+    db = estado.session
+    modelo = estado.bind_mapper.class_
+    # Alterações pendentes do modelo vão antes do DML (expirar as descartaria)
+    if any(
+        isinstance(obj, modelo)
+        for obj in itertools.chain(db.new, db.dirty, db.deleted)
+    ):
+        db.flush()
+    resultado = estado.invoke_statement()
+    for obj in list(db.identity_map.values()):
+        if isinstance(obj, modelo):
+            db.expire(obj)
+    return resultado
+
+
+def mapa_identidade(db: Session) -> MapaIdentidade:
+    """Mapa de identidade da sessão, criado na primeira busca da transação"""
+    mapa = db.info.get(_MAPA)
+    if mapa is None:
+        mapa = db.info[_MAPA] = MapaIdentidade(db)
+        if not event.contains(db, "after_commit", _descartar):
+            event.listen(db, "after_commit", _descartar)
+            event.listen(db, "after_soft_rollback", _descartar)
+    return mapa
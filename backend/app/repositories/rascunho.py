@@ -0,0 +1,43 @@
+from typing import Any, Dict, Optional
+
+from app.models.rascunho import Rascunho
+from app.repositories.base import BaseRepository
+from sqlalchemy.orm import Session
+
+
+class RascunhoRepository(BaseRepository[Rascunho]):
+    """Repositório para operações com Rascunho"""
+
+    def __init__(self, db: Session):
+        super().__init__(Rascunho, db)
+
+    def get_by_chave(self, colaborador_id: int, chave: str) -> Optional[Rascunho]:
+        """Busca o rascunho de um colaborador pela chave do formulário"""
+        return (
+            self.db.query(self.model)
+            .filter(
+                self.model.colaborador_id == colaborador_id,
+                self.model.chave == chave,
+            )
+            .first()
+        )
+
+    def salvar(self, colaborador_id: int, chave: str, conteudo: Dict[str, Any]) -> None:
+        """Grava o conteúdo do rascunho com um único upsert"""
+        self.upsert(
+            {"colaborador_id": colaborador_id, "chave": chave, "conteudo": conteudo},
+            conflito=["colaborador_id", "chave"],
+            atualizar=["conteudo"],
+        )
+
+    def delete_by_chave(self, colaborador_id: int, chave: str) -> bool:
+        """Remove o rascunho de um colaborador pela chave do formulário"""
+        removidos = (
+            self.db.query(self.model)
+            .filter(
+                self.model.colaborador_id == colaborador_id,
+                self.model.chave == chave,
+            )
+            .delete(synchronize_session=False)
+        )
+        return removidos > 0
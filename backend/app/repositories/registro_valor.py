@@ -1,8 +1,16 @@
-from typing import List
+from typing import Any, Dict, Iterable, List, Optional, Sequence
 
-from app.models.registro_valor import RegistroValor
+from app.core.pagination import Pagina, PaginacaoParams
+from app.core.periodo import Janela
+from app.models.registro_valor import (
+    RegistroValor,
+    StatusAprovacao,
+    registro_valor_association,
+)
 from app.repositories.base import BaseRepository
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.engine import RowMapping
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 
 class RegistroValorRepository(BaseRepository[RegistroValor]):
@@ -11,10 +19,99 @@ class RegistroValorRepository(BaseRepository[RegistroValor]):
     def __init__(self, db: Session):
         super().__init__(RegistroValor, db)
 
-    def get_by_colaborador(self, colaborador_id: int) -> List[RegistroValor]:
+    def _opcoes_resposta(self) -> List[Any]:
+        """Relacionamentos lidos por RegistroValorResponse"""
+        return [
+            joinedload(self.model.colaborador),
+            joinedload(self.model.aprovado_por),
+            selectinload(self.model.valores),
+        ]
+
+    def get_by_colaborador(
+        self, colaborador_id: int, janela: Optional[Janela] = None
+    ) -> List[RegistroValor]:
+        query = self.db.query(self.model).filter(
+            self.model.colaborador_id == colaborador_id
+        )
         return (
-            self.db.query(self.model)
-            .filter(self.model.colaborador_id == colaborador_id)
+            self.filtrar_janela(query, janela)
+            .options(*self._opcoes_carregamento())
             .order_by(self.model.created_at.desc())
             .all()
         )
+
+    def paginate_by_colaborador(
+        self,
+        colaborador_id: int,
+        paginacao: Optional[PaginacaoParams] = None,
+        janela: Optional[Janela] = None,
+    ) -> Pagina[RegistroValor]:
+        """
+        Busca os registros de um colaborador, mais recentes primeiro, com paginação por cursor
+
+        Filtro e ordenação usam o índice (colaborador_id, created_at).
+        """
+        query = self.db.query(self.model).filter(
+            self.model.colaborador_id == colaborador_id
+        )
+        return self.paginate(
+            self.filtrar_janela(query, janela),
+            paginacao,
+            order_by=self.model.created_at,
+            descending=True,
+            options=self._opcoes_carregamento(),
+        )
+
+    def paginate_pendentes(
+        self,
+        paginacao: Optional[PaginacaoParams] = None,
+        janela: Optional[Janela] = None,
+    ) -> Pagina[RegistroValor]:
+        """
+        Busca os registros pendentes de aprovação, mais antigos primeiro, com paginação por cursor
+
+        Filtro e ordenação usam o índice (status_aprovacao, created_at).
+        """
+        query = self.db.query(self.model).filter(
+            self.model.status_aprovacao == StatusAprovacao.PENDENTE.value
+        )
+        return self.paginate(
+            self.filtrar_janela(query, janela),
+            paginacao,
+            order_by=self.model.created_at,
+            options=self._opcoes_carregamento(),
+        )
+
+    def paginate_pendentes_linhas(
+        self,
+        colunas: Sequence[str],
+        paginacao: Optional[PaginacaoParams] = None,
+        janela: Optional[Janela] = None,
+    ) -> Pagina[RowMapping]:
+        """Mesmo que paginate_pendentes, com as linhas das colunas pedidas (Core)"""
+        stmt = self.selecionar("id", "created_at", *colunas).filter(
+            self.model.status_aprovacao == StatusAprovacao.PENDENTE.value
+        )
+        return self.paginate_linhas(
+            self.filtrar_janela(stmt, janela),
+            paginacao,
+            order_by=self.model.created_at,
+        )
+
+    def get_valores_ids_por_registro(
+        self, registros_ids: Iterable[int]
+    ) -> Dict[int, List[int]]:
+        """IDs dos valores de cada registro, lidos da tabela de associação"""
+        registros_ids = set(registros_ids)
+        if not registros_ids:
+            return {}
+        associacao = registro_valor_association.c
+        linhas = self.db.execute(
+            select(associacao.registro_id, associacao.valor_id)
+            .where(associacao.registro_id.in_(registros_ids))
+            .order_by(associacao.registro_id, associacao.valor_id)
+        ).all()
+        valores_ids: Dict[int, List[int]] = {}
+        for registro_id, valor_id in linhas:
+            valores_ids.setdefault(registro_id, []).append(valor_id)
+        return valores_ids
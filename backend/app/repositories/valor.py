@@ -1,6 +1,9 @@
+from typing import List, Sequence
+
+from app.core.dados_referencia import ValorReferencia
 from app.models.registro_valor import Valor
 from app.repositories.base import BaseRepository
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, make_transient_to_detached
 
 
 class ValorRepository(BaseRepository[Valor]):
@@ -8,3 +11,23 @@ class ValorRepository(BaseRepository[Valor]):
 
     def __init__(self, db: Session):
         super().__init__(Valor, db)
+
+    def anexar(self, referencias: Sequence[ValorReferencia]) -> List[Valor]:
+        """
+        Instâncias persistentes dos valores a partir do registro de referência
+
+        Usadas para associar valores a um registro sem um SELECT em valores:
+        a instância é montada com os dados do registro e incluída na sessão
+        como já existente (merge sem carga).
+        """
+        valores = []
+        for referencia in referencias:
+            valor = Valor(
+                id=referencia.id,
+                codigo=referencia.codigo,
+                nome=referencia.nome,
+                icone=referencia.icone,
+            )
+            make_transient_to_detached(valor)
+            valores.append(self.db.merge(valor, load=False))
+        return valores
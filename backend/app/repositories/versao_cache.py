@@ -0,0 +1,42 @@
+from typing import Dict, Iterable, Optional
+
+from app.models.versao_cache import VersaoCache
+from app.repositories.base import BaseRepository
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+
+class VersaoCacheRepository(BaseRepository[VersaoCache]):
+    """Repositório para operações com VersaoCache"""
+
+    def __init__(self, db: Session):
+        super().__init__(VersaoCache, db)
+
+    def incrementar(self, nomes: Iterable[str]) -> Dict[str, int]:
+        """
+        Incrementa as versões dos canais (criando os que não existem)
+
+        Os canais são gravados em ordem, para que transações concorrentes
+        bloqueiem as linhas na mesma sequência e não entrem em deadlock.
+
+        Returns:
+            Versões gravadas por esta transação, por canal
+        """
+        nomes = sorted(set(nomes))
+        if not nomes:
+            return {}
+        incremento = {"versao": self.model.__table__.c.versao + 1}
+        for nome in nomes:
+            self.upsert(
+                {"nome": nome, "versao": 1}, conflito=["nome"], expressoes=incremento
+            )
+
+        # As linhas estão bloqueadas por esta transação até o commit
+        return self.get_versoes(nomes)
+
+    def get_versoes(self, nomes: Optional[Iterable[str]] = None) -> Dict[str, int]:
+        """Versões atuais dos canais (todos, se nomes não for informado)"""
+        stmt = select(self.model.nome, self.model.versao)
+        if nomes is not None:
+            stmt = stmt.where(self.model.nome.in_(list(nomes)))
+        return {nome: versao for nome, versao in self.db.execute(stmt)}
@@ -1,10 +1,16 @@
 from app.schemas import (
+    aprovacao,
     avaliacao,
     avaliacao_gestor,
     ciclo_avaliacao,
     colaborador,
+    dados_referencia,
+    distribuicao_pares,
     eixo_avaliacao,
     entrega_outstanding,
+    exclusao_ciclo,
+    organograma,
+    rascunho,
     registro_valor,
 )
 
@@ -16,4 +22,10 @@ __all__ = [
     "avaliacao_gestor",
     "entrega_outstanding",
     "registro_valor",
+    "rascunho",
+    "aprovacao",
+    "exclusao_ciclo",
+    "organograma",
+    "distribuicao_pares",
+    "dados_referencia",
 ]
@@ -0,0 +1,50 @@
+from enum import Enum
+from typing import List, Optional
+
+from app.core.validators import APROVACAO_LOTE_MAX, CAMPO_TEXTO_LONGO_MAX
+from pydantic import BaseModel, Field, field_validator
+
+
+class ResultadoAprovacaoLote(str, Enum):
+    APROVADO = "aprovado"
+    REPROVADO = "reprovado"
+    JA_PROCESSADO = "ja_processado"
+    NAO_ENCONTRADO = "nao_encontrado"
+
+
+class AprovacaoLoteBase(BaseModel):
+    ids: List[int] = Field(..., min_length=1, max_length=APROVACAO_LOTE_MAX)
+
+    @field_validator("ids")
+    @classmethod
+    def validate_ids(cls, v: List[int]) -> List[int]:
+        if any(id_ <= 0 for id_ in v):
+            raise ValueError("IDs devem ser números positivos")
+        # Remove repetidos mantendo a ordem enviada
+        return list(dict.fromkeys(v))
+
+
+class AprovarLoteRequest(AprovacaoLoteBase):
+    """Schema para aprovar vários itens pendentes de uma vez"""
+
+    observacao: Optional[str] = Field(None, max_length=CAMPO_TEXTO_LONGO_MAX)
+
+
+class ReprovarLoteRequest(AprovacaoLoteBase):
+    """Schema para reprovar vários itens pendentes de uma vez"""
+
+    observacao: str = Field(..., min_length=1, max_length=CAMPO_TEXTO_LONGO_MAX)
+
+
+class ResultadoAprovacaoLoteItem(BaseModel):
+    id: int
+    resultado: ResultadoAprovacaoLote
+    status_aprovacao: Optional[str] = None  # Status atual do item, quando encontrado
+
+
+class AprovacaoLoteResponse(BaseModel):
+    """Schema de resposta para aprovação/reprovação em lote"""
+
+    resultados: List[ResultadoAprovacaoLoteItem]
+    total_processados: int
+    total: int
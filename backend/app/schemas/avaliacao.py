@@ -1,11 +1,14 @@
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence
 
 from pydantic import BaseModel, Field, field_validator, model_validator
+from sqlalchemy.orm import selectinload
 
+from app.core.campos import Inclusao, ProjecaoRecurso
 from app.core.validators import CAMPO_TEXTO_LONGO_MAX
-from app.models.avaliacao import TipoAvaliacao
-from app.schemas.colaborador import ColaboradorResponse
+from app.models.avaliacao import Avaliacao, AvaliacaoEixo, TipoAvaliacao
+from app.models.eixo_avaliacao import EixoAvaliacao
+from app.schemas.colaborador import ColaboradorResponse, montar_colaborador
 from app.schemas.eixo_avaliacao import EixoAvaliacaoResponse
 
 
@@ -125,7 +128,219 @@ class AvaliacaoResponse(BaseModel):
 
 class AvaliacaoListResponse(BaseModel):
     avaliacoes: List[AvaliacaoResponse]
-    total: int
+    total: Optional[int] = None  # Nulo em páginas sem incluir_total
+    next_cursor: Optional[str] = None  # Cursor da próxima página (paginação por cursor)
+
+
+def _eixos_para_dict(avaliacao: Avaliacao) -> Dict[str, Dict[str, Any]]:
+    return {
+        str(eixo.eixo_id): {"nivel": eixo.nivel, "justificativa": eixo.justificativa}
+        for eixo in avaliacao.eixos
+    }
+
+
+class _MontagemAvaliacoes:
+    """
+    Monta AvaliacaoResponse no formato final, sem o model_validator
+
+    Cada colaborador e cada eixo aparecem em muitas avaliações e são montados
+    uma vez só. Avaliações e eixos avaliados são lidos por atributo: servem
+    tanto objetos ORM quanto linhas (Row) de um SELECT de colunas. Sem
+    embutir_colaboradores os itens saem só com avaliador_id e avaliado_id
+    (colaboradores enviados à parte, em included).
+    """
+
+    def __init__(self, embutir_colaboradores: bool = True) -> None:
+        self.embutir_colaboradores = embutir_colaboradores
+        self.colaboradores: Dict[int, Dict[str, Any]] = {}
+        self.eixos: Dict[int, Dict[str, Any]] = {}
+
+    def colaborador(self, obj: Any) -> Optional[Dict[str, Any]]:
+        if obj is None:
+            return None
+        dados = self.colaboradores.get(obj.id)
+        if dados is None:
+            dados = self.colaboradores[obj.id] = montar_colaborador(obj)
+        return dados
+
+    def eixo(self, obj: Any) -> Optional[Dict[str, Any]]:
+        """EixoAvaliacao (ORM) ou EixoReferencia (dados de referência)"""
+        if obj is None:
+            return None
+        dados = self.eixos.get(obj.id)
+        if dados is None:
+            dados = self.eixos[obj.id] = {
+                "codigo": obj.codigo,
+                "nome": obj.nome,
+                "id": obj.id,
+                "niveis": [
+                    {"nivel": n.nivel, "descricao": n.descricao, "id": n.id}
+                    for n in obj.niveis
+                ],
+            }
+        return dados
+
+    def avaliacao(
+        self,
+        avaliacao: Any,
+        avaliacao_eixos: Sequence[Any],
+        avaliador: Optional[Dict[str, Any]],
+        avaliado: Optional[Dict[str, Any]],
+        eixos_detalhes: Sequence[Optional[Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        dados = {
+            "id": avaliacao.id,
+            "ciclo_id": avaliacao.ciclo_id,
+            "avaliador_id": avaliacao.avaliador_id,
+            "avaliado_id": avaliacao.avaliado_id,
+            "tipo": avaliacao.tipo.value,
+            "avaliacao_geral": avaliacao.avaliacao_geral,
+            "eixos": {
+                str(e.eixo_id): {"nivel": e.nivel, "justificativa": e.justificativa}
+                for e in avaliacao_eixos
+            },
+        }
+        if self.embutir_colaboradores:
+            dados["avaliador"] = avaliador
+            dados["avaliado"] = avaliado
+        dados.update(
+            {
+                "eixos_detalhados": [
+                    {
+                        "eixo_id": e.eixo_id,
+                        "nivel": e.nivel,
+                        "justificativa": e.justificativa,
+                        "id": e.id,
+                        "eixo": detalhe,
+                        "created_at": e.created_at,
+                        "updated_at": e.updated_at,
+                    }
+                    for e, detalhe in zip(avaliacao_eixos, eixos_detalhes)
+                ],
+                "created_at": avaliacao.created_at,
+                "updated_at": avaliacao.updated_at,
+            }
+        )
+        return dados
+
+
+def montar_avaliacoes(
+    avaliacoes: Iterable[Avaliacao], embutir_colaboradores: bool = True
+) -> List[Dict[str, Any]]:
+    """
+    Lista de AvaliacaoResponse no formato final, direto dos objetos ORM
+
+    Mesmo resultado de validar cada avaliação com AvaliacaoResponse, sem o
+    model_validator e sem revalidar os colaboradores. Espera os
+    relacionamentos já carregados (AvaliacaoRepository._opcoes_carregamento);
+    sem embutir_colaboradores, avaliador e avaliado não são lidos.
+    """
+    montagem = _MontagemAvaliacoes(embutir_colaboradores)
+    resultado = []
+    for avaliacao in avaliacoes:
+        avaliacao_eixos = avaliacao.eixos
+        avaliador = avaliado = None
+        if embutir_colaboradores:
+            avaliador = montagem.colaborador(avaliacao.avaliador)
+            avaliado = montagem.colaborador(avaliacao.avaliado)
+        resultado.append(
+            montagem.avaliacao(
+                avaliacao,
+                avaliacao_eixos,
+                avaliador,
+                avaliado,
+                [montagem.eixo(e.eixo) for e in avaliacao_eixos],
+            )
+        )
+    return resultado
+
+
+def montar_avaliacoes_linhas(
+    avaliacoes: Iterable[Any],
+    eixos_por_avaliacao: Mapping[int, Sequence[Any]],
+    colaboradores: Mapping[int, Dict[str, Any]],
+    eixos_referencia: Mapping[int, Any],
+    embutir_colaboradores: bool = True,
+) -> List[Dict[str, Any]]:
+    """
+    Lista de AvaliacaoResponse no formato final, a partir das linhas do banco
+
+    Args:
+        avaliacoes: Linhas (Row) com as colunas de avaliacoes
+        eixos_por_avaliacao: Linhas de avaliacoes_eixos por avaliacao_id
+        colaboradores: ColaboradorResponse (dict) por id
+        eixos_referencia: Eixos dos dados de referência por id
+        embutir_colaboradores: False deixa só os IDs de avaliador e avaliado
+    """
+    montagem = _MontagemAvaliacoes(embutir_colaboradores)
+    resultado = []
+    for avaliacao in avaliacoes:
+        avaliacao_eixos = eixos_por_avaliacao.get(avaliacao.id, ())
+        resultado.append(
+            montagem.avaliacao(
+                avaliacao,
+                avaliacao_eixos,
+                colaboradores.get(avaliacao.avaliador_id),
+                colaboradores.get(avaliacao.avaliado_id),
+                [
+                    montagem.eixo(eixos_referencia.get(e.eixo_id))
+                    for e in avaliacao_eixos
+                ],
+            )
+        )
+    return resultado
+
+
+def montar_lista_avaliacoes(
+    resultado: Mapping[str, Any], embutir_colaboradores: bool = True
+) -> Dict[str, Any]:
+    """AvaliacaoListResponse no formato final a partir do resultado do service"""
+    return {
+        "avaliacoes": montar_avaliacoes(
+            resultado["avaliacoes"], embutir_colaboradores
+        ),
+        "total": resultado.get("total"),
+        "next_cursor": resultado.get("next_cursor"),
+    }
+
+
+# Campos selecionáveis com fields=/include= na listagem de avaliações
+PROJECAO_AVALIACAO = ProjecaoRecurso(
+    modelo=Avaliacao,
+    resposta=AvaliacaoResponse,
+    colunas=(
+        "id",
+        "ciclo_id",
+        "avaliador_id",
+        "avaliado_id",
+        "tipo",
+        "avaliacao_geral",
+        "created_at",
+        "updated_at",
+    ),
+    inclusoes={
+        "eixos": Inclusao(
+            carregar=lambda: [selectinload(Avaliacao.eixos)],
+            extrair=_eixos_para_dict,
+        ),
+        "eixos_detalhados": Inclusao(
+            carregar=lambda: [
+                selectinload(Avaliacao.eixos)
+                .selectinload(AvaliacaoEixo.eixo)
+                .selectinload(EixoAvaliacao.niveis)
+            ],
+            extrair=lambda avaliacao: avaliacao.eixos,
+        ),
+        "avaliador": Inclusao(
+            carregar=lambda: [selectinload(Avaliacao.avaliador)],
+            extrair=lambda avaliacao: avaliacao.avaliador,
+        ),
+        "avaliado": Inclusao(
+            carregar=lambda: [selectinload(Avaliacao.avaliado)],
+            extrair=lambda avaliacao: avaliacao.avaliado,
+        ),
+    },
+)
 
 
 class FeedbackResponse(BaseModel):
@@ -1,9 +1,12 @@
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
+from app.core.campos import Inclusao, ProjecaoRecurso
 from app.core.validators import CAMPO_TEXTO_LONGO_MAX
+from app.models.avaliacao_gestor import AvaliacaoGestor
 from app.schemas.colaborador import ColaboradorResponse
 from pydantic import BaseModel, Field, field_validator, model_validator
+from sqlalchemy.orm import selectinload
 
 # =============================================================================
 # Constantes das Perguntas
@@ -343,7 +346,55 @@ class AvaliacaoGestorListResponse(BaseModel):
     """Schema para lista de avaliações de gestor"""
 
     avaliacoes: List[AvaliacaoGestorResponse]
-    total: int
+    total: Optional[int] = None  # Nulo em páginas sem incluir_total
+    next_cursor: Optional[str] = None  # Cursor da próxima página (paginação por cursor)
+
+
+_CAMPOS_RESPOSTA = tuple(AvaliacaoGestorRespostaResponse.model_fields)
+
+
+def montar_avaliacoes_gestor(
+    avaliacoes: Iterable[AvaliacaoGestor],
+) -> List[Dict[str, Any]]:
+    """
+    Lista de AvaliacaoGestorResponse no formato final, só com gestor_id
+
+    Usada com included=colaboradores (gestor enviado à parte, em
+    included.colaboradores): lê as colunas e as respostas já carregadas,
+    sem tocar no relacionamento gestor.
+    """
+    return [
+        {
+            "id": avaliacao.id,
+            "ciclo_id": avaliacao.ciclo_id,
+            "gestor_id": avaliacao.gestor_id,
+            "respostas": [
+                {campo: getattr(resposta, campo) for campo in _CAMPOS_RESPOSTA}
+                for resposta in avaliacao.respostas
+            ],
+            "created_at": avaliacao.created_at,
+            "updated_at": avaliacao.updated_at,
+        }
+        for avaliacao in avaliacoes
+    ]
+
+
+# Campos selecionáveis com fields=/include= na listagem de avaliações de gestor
+PROJECAO_AVALIACAO_GESTOR = ProjecaoRecurso(
+    modelo=AvaliacaoGestor,
+    resposta=AvaliacaoGestorResponse,
+    colunas=("id", "ciclo_id", "gestor_id", "created_at", "updated_at"),
+    inclusoes={
+        "respostas": Inclusao(
+            carregar=lambda: [selectinload(AvaliacaoGestor.respostas)],
+            extrair=lambda avaliacao: avaliacao.respostas,
+        ),
+        "gestor": Inclusao(
+            carregar=lambda: [selectinload(AvaliacaoGestor.gestor)],
+            extrair=lambda avaliacao: avaliacao.gestor,
+        ),
+    },
+)
 
 
 class PerguntasAvaliacaoGestorResponse(BaseModel):
@@ -149,7 +149,8 @@ class CicloResponse(BaseModel):
 
 class CicloListResponse(BaseModel):
     ciclos: List[CicloResponse]
-    total: int
+    total: Optional[int] = None  # Nulo em páginas sem incluir_total
+    next_cursor: Optional[str] = None  # Cursor da próxima página (paginação por cursor)
 
 
 # =============================================================================
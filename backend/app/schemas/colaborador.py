@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, EmailStr, Field, field_validator
 
@@ -97,6 +97,20 @@ class ColaboradorResponse(BaseModel):
         from_attributes = True
 
 
+# Campos de ColaboradorResponse (mesmos nomes das colunas de colaboradores)
+CAMPOS_COLABORADOR_RESPONSE = tuple(ColaboradorResponse.model_fields)
+
+
+def montar_colaborador(colaborador: Any) -> Dict[str, Any]:
+    """
+    ColaboradorResponse no formato final, direto do objeto ORM
+
+    Dados vindos do banco: sem revalidar (a validação do EmailStr domina o
+    custo nas listagens grandes).
+    """
+    return {campo: getattr(colaborador, campo) for campo in CAMPOS_COLABORADOR_RESPONSE}
+
+
 class ColaboradorAuthResponse(BaseModel):
     """Schema para resposta de autenticação"""
 
@@ -113,4 +127,5 @@ class ColaboradorAuthResponse(BaseModel):
 
 class ColaboradorListResponse(BaseModel):
     colaboradores: List[ColaboradorResponse]
-    total: int
+    total: Optional[int] = None  # Nulo em páginas sem incluir_total
+    next_cursor: Optional[str] = None  # Cursor da próxima página (paginação por cursor)
@@ -0,0 +1,12 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class DadosReferenciaVersaoResponse(BaseModel):
+    """Versão dos dados de referência carregada neste processo"""
+
+    versao: int
+    carregado_em: datetime
+    total_eixos: int
+    total_valores: int
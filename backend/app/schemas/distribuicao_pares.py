@@ -0,0 +1,34 @@
+from typing import Dict, List, Optional
+
+from app.core.validators import NUMERO_PARES_OBRIGATORIO
+from pydantic import BaseModel, Field
+
+
+class DistribuicaoParesRequest(BaseModel):
+    # Avaliações de pares que cada colaborador pode receber para fazer
+    # (padrão: NUMERO_PARES_OBRIGATORIO, a distribuição mais equilibrada possível)
+    carga_max: Optional[int] = Field(None, ge=NUMERO_PARES_OBRIGATORIO, le=100)
+    aplicar: bool = False  # False = apenas propõe, sem gravar
+
+
+class AlteracaoParesResponse(BaseModel):
+    colaborador_id: int
+    pares_ids_anteriores: List[int]
+    pares_ids: List[int]
+
+
+class DistribuicaoParesResponse(BaseModel):
+    ciclo_id: int
+    aplicada: bool
+    carga_max: int
+    total_colaboradores: int
+    escolhas_mantidas: int  # Pares escolhidos pelos colaboradores que foram preservados
+    pares_atribuidos: int  # Pares definidos pela distribuição
+    # Quantidade de avaliadores por carga (avaliações de pares a fazer), antes e depois
+    cargas_anteriores: Dict[int, int]
+    cargas: Dict[int, int]
+    # Colaboradores para quem não houve pares válidos suficientes
+    incompletos: List[int]
+    # Pares escolhidos descartados por serem gestor ou liderado direto do colaborador
+    escolhas_restritas: Dict[int, List[int]]
+    alteracoes: List[AlteracaoParesResponse]
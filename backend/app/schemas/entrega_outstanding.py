@@ -49,9 +49,14 @@ class EntregaOutstandingResponse(EntregaOutstandingBase):
         from_attributes = True
 
 
+# Campos de EntregaOutstandingResponse, na ordem do schema
+CAMPOS_ENTREGA_OUTSTANDING_RESPONSE = tuple(EntregaOutstandingResponse.model_fields)
+
+
 class EntregaOutstandingListResponse(BaseModel):
     entregas: List[EntregaOutstandingResponse]
-    total: int
+    total: Optional[int] = None  # Nulo em páginas sem incluir_total
+    next_cursor: Optional[str] = None  # Cursor da próxima página (paginação por cursor)
 
 
 class AprovarEntregaOutstandingRequest(BaseModel):
@@ -0,0 +1,36 @@
+from datetime import datetime
+from typing import Optional
+
+from app.models.exclusao_ciclo import StatusExclusaoCiclo
+from pydantic import BaseModel, computed_field
+
+
+class ExclusaoCicloResponse(BaseModel):
+    """Schema de resposta para o job de exclusão de um ciclo"""
+
+    id: int
+    ciclo_id: int
+    ciclo_nome: str
+    status: StatusExclusaoCiclo
+    etapa: Optional[str] = None  # Tabela em processamento
+    total_registros: int
+    registros_removidos: int
+    erro: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    concluido_em: Optional[datetime] = None
+
+    @computed_field
+    @property
+    def progresso(self) -> float:
+        """Percentual de registros dependentes já removidos"""
+        if self.status == StatusExclusaoCiclo.CONCLUIDA:
+            return 100.0
+        if not self.total_registros:
+            return 0.0
+        return round(
+            min(self.registros_removidos / self.total_registros, 1.0) * 100, 1
+        )
+
+    class Config:
+        from_attributes = True
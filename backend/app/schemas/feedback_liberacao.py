@@ -1,7 +1,8 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from app.core.validators import APROVACAO_LOTE_MAX
+from pydantic import BaseModel, Field, model_validator
 
 
 class FeedbackLiberacaoBase(BaseModel):
@@ -37,3 +38,36 @@ class FeedbackLiberacaoListResponse(BaseModel):
     liberacoes: list[FeedbackLiberacaoResponse]
     total: int
 
+
+class FeedbackLiberacaoLoteRequest(BaseModel):
+    """
+    Schema para liberar ou revogar feedback em lote.
+    Informe exatamente um alvo: IDs explícitos, um departamento ou um gestor
+    (toda a sua subárvore de liderados).
+    """
+
+    colaboradores_ids: Optional[List[int]] = Field(
+        None, min_length=1, max_length=APROVACAO_LOTE_MAX
+    )
+    departamento: Optional[str] = Field(None, min_length=1, max_length=255)
+    gestor_id: Optional[int] = Field(None, gt=0)
+
+    @model_validator(mode="after")
+    def validate_alvo(self):
+        alvos = [self.colaboradores_ids, self.departamento, self.gestor_id]
+        if sum(alvo is not None for alvo in alvos) != 1:
+            raise ValueError(
+                "Informe exatamente um alvo: colaboradores_ids, departamento ou gestor_id"
+            )
+        if self.colaboradores_ids is not None:
+            self.colaboradores_ids = list(dict.fromkeys(self.colaboradores_ids))
+        return self
+
+
+class FeedbackLiberacaoLoteResponse(BaseModel):
+    """Schema de resposta para liberação/revogação de feedback em lote"""
+    ciclo_id: int
+    total_alvo: int
+    alterados: int  # Liberados (ou revogados) nesta operação
+    sem_alteracao: int  # Já estavam no estado pedido
+    nao_encontrados: List[int] = []  # IDs explícitos inexistentes
@@ -0,0 +1,41 @@
+from typing import List, Optional, Tuple
+
+from pydantic import BaseModel
+
+
+class OrganogramaNo(BaseModel):
+    """Colaborador no organograma, com seus liderados diretos"""
+
+    id: int
+    nome: str
+    cargo: Optional[str] = None
+    departamento: Optional[str] = None
+    avatar: Optional[str] = None
+    perfil: Optional[str] = None
+    gestor_id: Optional[int] = None
+    filhos: List["OrganogramaNo"] = []
+
+
+class OrganogramaResponse(BaseModel):
+    """Árvore do organograma (ou de parte dele)"""
+
+    raizes: List[OrganogramaNo]
+    total: int  # Colaboradores na árvore
+
+
+class HierarquiaVerificacaoResponse(BaseModel):
+    """Resultado da verificação da tabela de fechamento da hierarquia"""
+
+    consistente: bool
+    total_registros: int
+    total_faltando: int
+    total_sobrando: int
+    # (ancestral_id, descendente_id, profundidade), limitados a alguns exemplos
+    faltando: List[Tuple[int, int, int]]
+    sobrando: List[Tuple[int, int, int]]
+
+
+class HierarquiaReconstrucaoResponse(BaseModel):
+    """Resultado da reconstrução da tabela de fechamento da hierarquia"""
+
+    total_registros: int
@@ -0,0 +1,33 @@
+import json
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from app.core.validators import RASCUNHO_CONTEUDO_MAX
+from pydantic import BaseModel, field_validator
+
+
+class RascunhoSalvar(BaseModel):
+    """Schema para salvar o conteúdo de um rascunho"""
+
+    conteudo: Dict[str, Any]
+
+    @field_validator("conteudo")
+    @classmethod
+    def validate_tamanho(cls, v: Dict[str, Any]) -> Dict[str, Any]:
+        if len(json.dumps(v, ensure_ascii=False)) > RASCUNHO_CONTEUDO_MAX:
+            raise ValueError(
+                f"Rascunho deve ter no máximo {RASCUNHO_CONTEUDO_MAX} caracteres"
+            )
+        return v
+
+
+class RascunhoResponse(BaseModel):
+    """Schema de resposta para rascunho"""
+
+    chave: str
+    conteudo: Dict[str, Any]
+    updated_at: Optional[datetime] = None
+    persistido: bool = True  # False enquanto o salvamento aguarda a janela fechar
+
+    class Config:
+        from_attributes = True
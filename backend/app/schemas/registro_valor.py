@@ -66,9 +66,15 @@ class RegistroValorResponse(RegistroValorBase):
         from_attributes = True
 
 
+# Campos das respostas, na ordem dos schemas
+CAMPOS_VALOR_RESPONSE = tuple(ValorResponse.model_fields)
+CAMPOS_REGISTRO_VALOR_RESPONSE = tuple(RegistroValorResponse.model_fields)
+
+
 class RegistroValorListResponse(BaseModel):
     registros: List[RegistroValorResponse]
-    total: int
+    total: Optional[int] = None  # Nulo em páginas sem incluir_total
+    next_cursor: Optional[str] = None  # Cursor da próxima página (paginação por cursor)
 
 
 class AprovarRegistroValorRequest(BaseModel):
@@ -10,8 +10,12 @@ from app.services.avaliacao_gestor import AvaliacaoGestorService
 from app.services.ciclo import CicloService
 from app.services.ciclo_avaliacao import CicloAvaliacaoService
 from app.services.colaborador import ColaboradorService
+from app.services.dados_referencia import DadosReferenciaService
+from app.services.distribuicao_pares import DistribuicaoParesService
 from app.services.eixo_avaliacao import EixoAvaliacaoService
 from app.services.entrega_outstanding import EntregaOutstandingService
+from app.services.hierarquia import HierarquiaService
+from app.services.rascunho import RascunhoService
 from app.services.registro_valor import RegistroValorService
 from app.services.valor import ValorService
 
@@ -21,8 +25,12 @@ __all__ = [
     "CicloService",
     "CicloAvaliacaoService",
     "ColaboradorService",
+    "DadosReferenciaService",
+    "DistribuicaoParesService",
     "EixoAvaliacaoService",
     "EntregaOutstandingService",
+    "HierarquiaService",
+    "RascunhoService",
     "RegistroValorService",
     "ValorService",
 ]
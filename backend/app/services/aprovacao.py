@@ -0,0 +1,142 @@
+"""
+Aprovação e reprovação em lote.
+
+Registros de valor e entregas outstanding compartilham o mesmo fluxo de
+aprovação (status_aprovacao, aprovado_por_id, aprovado_em,
+observacao_aprovacao). Este módulo aplica a mudança de status a vários
+itens com um único UPDATE guardado por status_aprovacao='pendente' e
+informa o resultado de cada ID. Também monta as listas de pendentes lidas
+por linhas (Core), com o colaborador e quem aprovou.
+"""
+
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+from app.core.pagination import Pagina
+from app.core.serializacao import montar_linhas
+from app.models.entrega_outstanding import StatusAprovacao
+from app.repositories.base import BaseRepository
+from app.repositories.colaborador import ColaboradorRepository
+from app.schemas.aprovacao import (
+    AprovacaoLoteResponse,
+    ResultadoAprovacaoLote,
+    ResultadoAprovacaoLoteItem,
+)
+from app.schemas.colaborador import CAMPOS_COLABORADOR_RESPONSE
+from sqlalchemy.engine import RowMapping
+from sqlalchemy.orm import Session
+
+# Relacionamentos com colaboradores das respostas com aprovação: campo -> coluna
+RELACIONAMENTOS_APROVACAO = {
+    "colaborador": "colaborador_id",
+    "aprovado_por": "aprovado_por_id",
+}
+
+
+def alterar_status_aprovacao_em_lote(
+    repository: BaseRepository,
+    ids: List[int],
+    novo_status: StatusAprovacao,
+    aprovado_por_id: int,
+    observacao: Optional[str],
+) -> AprovacaoLoteResponse:
+    """
+    Aprova ou reprova os itens pendentes entre os IDs informados
+
+    Os itens encontrados são bloqueados (SELECT ... FOR UPDATE) antes do
+    UPDATE, então o resultado por ID reflete exatamente o que foi alterado,
+    mesmo com aprovações concorrentes.
+    """
+    status_atual = repository.get_values_by_ids(ids, "status_aprovacao", for_update=True)
+    pendentes = [
+        id_ for id_ in ids if status_atual.get(id_) == StatusAprovacao.PENDENTE.value
+    ]
+
+    if pendentes:
+        repository.update_in_bulk(
+            pendentes,
+            {
+                "status_aprovacao": novo_status.value,
+                "aprovado_por_id": aprovado_por_id,
+                "aprovado_em": datetime.now(),
+                "observacao_aprovacao": observacao,
+            },
+            status_aprovacao=StatusAprovacao.PENDENTE.value,
+        )
+
+    processados = set(pendentes)
+    resultados = []
+    for id_ in ids:
+        if id_ not in status_atual:
+            resultados.append(
+                ResultadoAprovacaoLoteItem(
+                    id=id_, resultado=ResultadoAprovacaoLote.NAO_ENCONTRADO
+                )
+            )
+        elif id_ in processados:
+            resultados.append(
+                ResultadoAprovacaoLoteItem(
+                    id=id_,
+                    resultado=ResultadoAprovacaoLote(novo_status.value),
+                    status_aprovacao=novo_status.value,
+                )
+            )
+        else:
+            resultados.append(
+                ResultadoAprovacaoLoteItem(
+                    id=id_,
+                    resultado=ResultadoAprovacaoLote.JA_PROCESSADO,
+                    status_aprovacao=status_atual[id_],
+                )
+            )
+
+    return AprovacaoLoteResponse(
+        resultados=resultados,
+        total_processados=len(processados),
+        total=len(ids),
+    )
+
+
+def montar_pendentes(
+    db: Session,
+    pagina: Pagina[RowMapping],
+    campos: List[str],
+    anexos: Optional[Mapping[str, Callable[[RowMapping], Any]]] = None,
+) -> Pagina[Dict[str, Any]]:
+    """
+    Página de linhas no formato final da resposta, sem objetos ORM
+
+    Os colaboradores referenciados (autor e quem aprovou) vêm em um único
+    SELECT das colunas de ColaboradorResponse.
+
+    Args:
+        pagina: Linhas com as colunas da resposta que não são relacionamentos
+        campos: Campos da resposta, na ordem do schema
+        anexos: Outros campos que não são colunas, montados a partir da linha
+    """
+    ids = {
+        linha[coluna]
+        for linha in pagina.itens
+        for coluna in RELACIONAMENTOS_APROVACAO.values()
+        if linha[coluna] is not None
+    }
+    colaboradores = {
+        id_: dict(linha)
+        for id_, linha in ColaboradorRepository(db)
+        .get_linhas_by_ids(ids, CAMPOS_COLABORADOR_RESPONSE)
+        .items()
+    }
+
+    def relacionado(coluna: str) -> Callable[[RowMapping], Any]:
+        return lambda linha: colaboradores.get(linha[coluna])
+
+    todos_anexos = {
+        campo: relacionado(coluna)
+        for campo, coluna in RELACIONAMENTOS_APROVACAO.items()
+    }
+    todos_anexos.update(anexos or {})
+    return Pagina(
+        itens=montar_linhas(pagina.itens, campos, todos_anexos),
+        next_cursor=pagina.next_cursor,
+        total=pagina.total,
+    )
@@ -1,15 +1,23 @@
 import logging
-from typing import Optional
+from typing import Any, Dict, Optional, Sequence
 
+from app.core.dados_referencia import registro_referencia
 from app.core.exceptions import (
     BusinessRuleException,
     ForbiddenException,
     NotFoundException,
 )
+from app.core.incluidos import com_incluidos
+from app.core.pagination import PaginacaoParams
 from app.models.avaliacao import Avaliacao, TipoAvaliacao
 from app.models.ciclo import EtapaCiclo
 from app.models.colaborador import Colaborador
-from app.repositories import AvaliacaoRepository, CicloRepository
+from app.repositories import (
+    AvaliacaoRepository,
+    CicloAvaliacaoRepository,
+    CicloRepository,
+    ColaboradorRepository,
+)
 from app.repositories.feedback_liberacao import FeedbackLiberacaoRepository
 from app.schemas.avaliacao import (
     AvaliacaoCreate,
@@ -17,6 +25,7 @@ from app.schemas.avaliacao import (
     AvaliacaoResponse,
     AvaliacaoUpdate,
     FeedbackResponse,
+    montar_avaliacoes_linhas,
 )
 from app.services.base import BaseService
 from app.services.colaborador import ColaboradorService
@@ -32,6 +41,8 @@ class AvaliacaoService(BaseService[Avaliacao]):
         self.repository = AvaliacaoRepository(db)
         self.colaborador_service = ColaboradorService(db)
         self.ciclo_repository = CicloRepository(db)
+        self.ciclo_avaliacao_repository = CicloAvaliacaoRepository(db)
+        self.colaborador_repository = ColaboradorRepository(db)
         self.feedback_liberacao_repository = FeedbackLiberacaoRepository(db)
 
     def create(
@@ -39,7 +50,7 @@ class AvaliacaoService(BaseService[Avaliacao]):
     ) -> AvaliacaoResponse:
         try:
             # Validar que o avaliado existe
-            avaliado = self.repository.validate_colaborador(avaliacao.avaliado_id)
+            avaliado = self.colaborador_repository.get(avaliacao.avaliado_id)
 
             if not avaliado:
                 logger.warning(
@@ -62,7 +73,7 @@ class AvaliacaoService(BaseService[Avaliacao]):
 
             if avaliacao.tipo != "gestor":
                 # Validar que o ciclo existe (agora que temos o avaliador_id)
-                ciclo = self.ciclo_repository.get(avaliacao.ciclo_id)
+                ciclo = self.ciclo_repository.get_estado(avaliacao.ciclo_id)
                 if not ciclo:
                     raise NotFoundException("Ciclo", avaliacao.ciclo_id)
 
@@ -137,31 +148,19 @@ class AvaliacaoService(BaseService[Avaliacao]):
         avaliado_id: Optional[int] = None,
         tipo: Optional[str] = None,
         current_colaborador: Colaborador = None,
+        paginacao: Optional[PaginacaoParams] = None,
+        opcoes: Sequence[Any] = (),
     ) -> AvaliacaoListResponse:
         # Se não especificado, filtrar por avaliador_id ou avaliado_id do usuário logado
         if avaliador_id is None and avaliado_id is None:
             # Retornar avaliações onde o usuário logado é avaliador ou avaliado
-            avaliacoes_como_avaliador = self.repository.get_by_filters(
+            pagina = self.repository.paginate_by_participante(
+                current_colaborador.id,
                 ciclo_id=ciclo_id,
-                avaliador_id=current_colaborador.id,
-                avaliado_id=None,
                 tipo=tipo,
+                paginacao=paginacao,
+                opcoes=opcoes,
             )
-            # Também buscar avaliações onde o usuário é avaliado
-            avaliacoes_como_avaliado = self.repository.get_by_filters(
-                ciclo_id=ciclo_id,
-                avaliador_id=None,
-                avaliado_id=current_colaborador.id,
-                tipo=tipo,
-            )
-            # Combinar e remover duplicatas
-            avaliacoes_ids = {a.id for a in avaliacoes_como_avaliador}
-            avaliacoes = avaliacoes_como_avaliador + [
-                a for a in avaliacoes_como_avaliado if a.id not in avaliacoes_ids
-            ]
-            # Ordenar por created_at desc
-            avaliacoes.sort(key=lambda x: x.created_at, reverse=True)
-            total = len(avaliacoes)
         else:
             # Validar que o usuário só pode ver suas próprias avaliações
             # Se avaliador_id for especificado, deve ser o usuário logado
@@ -197,15 +196,21 @@ class AvaliacaoService(BaseService[Avaliacao]):
                 f"GET /avaliacoes - Listando avaliações. Filtros: ciclo_id={ciclo_id}, avaliador_id={avaliador_id}, avaliado_id={avaliado_id}, tipo={tipo}"
             )
 
-            avaliacoes = self.repository.get_by_filters(
+            pagina = self.repository.paginate_by_filters(
                 ciclo_id=ciclo_id,
                 avaliador_id=avaliador_id,
                 avaliado_id=avaliado_id,
                 tipo=tipo,
+                paginacao=paginacao,
+                opcoes=opcoes,
             )
 
-        logger.debug(f"Retornando {len(avaliacoes)} avaliações")
-        return {"avaliacoes": avaliacoes, "total": len(avaliacoes)}
+        logger.debug(f"Retornando {len(pagina.itens)} avaliações")
+        return {
+            "avaliacoes": pagina.itens,
+            "total": pagina.total,
+            "next_cursor": pagina.next_cursor,
+        }
 
     def update(
         self,
@@ -225,7 +230,7 @@ class AvaliacaoService(BaseService[Avaliacao]):
                     "Você só pode atualizar avaliações onde você é o avaliador"
                 )
 
-            ciclo = db_avaliacao.ciclo
+            ciclo = self.ciclo_repository.get_estado(db_avaliacao.ciclo_id)
             if ciclo and ciclo.etapa_atual != EtapaCiclo.AVALIACOES:
                 raise BusinessRuleException(
                     "Só é possível alterar avaliações durante a etapa de avaliações"
@@ -253,7 +258,7 @@ class AvaliacaoService(BaseService[Avaliacao]):
     def get_feedback(
         self, ciclo_id: int, current_colaborador: Colaborador
     ) -> FeedbackResponse:
-        ciclo_avaliacao = self.repository.validate_ciclo_avaliacao(
+        ciclo_avaliacao = self.ciclo_avaliacao_repository.get_by_ciclo_e_colaborador(
             ciclo_id=ciclo_id, colaborador_id=current_colaborador.id
         )
 
@@ -283,7 +288,7 @@ class AvaliacaoService(BaseService[Avaliacao]):
         )
 
         # Verificar se o ciclo está na fase de feedback
-        ciclo = ciclo_avaliacao.ciclo
+        ciclo = self.ciclo_repository.get_estado(ciclo_avaliacao.ciclo_id)
         is_fase_feedback = ciclo and ciclo.etapa_atual == EtapaCiclo.FEEDBACK
 
         # Se não for admin, não estiver na fase de feedback, ou o feedback não foi liberado,
@@ -353,10 +358,10 @@ class AvaliacaoService(BaseService[Avaliacao]):
 
         niveis_esperados = []
         if colaborador and colaborador.nivel_carreira:
-            from app.api.v1.niveis_carreira import NIVEIS_ESPERADOS_POR_CARREIRA
-
-            niveis_esperados = NIVEIS_ESPERADOS_POR_CARREIRA.get(
-                colaborador.nivel_carreira, [0, 0, 0, 0]
+            niveis_esperados = list(
+                registro_referencia.obter(self.db).get_niveis_esperados(
+                    colaborador.nivel_carreira
+                )
             )
 
         logger.info(f"Feedback gerado com sucesso para ciclo. ID: {ciclo_id}")
@@ -373,7 +378,15 @@ class AvaliacaoService(BaseService[Avaliacao]):
         colaborador_id: int,
         ciclo_id: Optional[int] = None,
         current_colaborador: Colaborador = None,
-    ) -> AvaliacaoListResponse:
+        incluir_colaboradores: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        AvaliacaoListResponse já no formato final (sem validação)
+
+        Args:
+            incluir_colaboradores: Avaliador e avaliado uma vez só, em
+                included.colaboradores, em vez de dentro de cada avaliação
+        """
         # Verificar se o usuário é admin
         if not current_colaborador.is_admin:
             logger.warning(
@@ -387,13 +400,42 @@ class AvaliacaoService(BaseService[Avaliacao]):
             f"GET /avaliacoes/admin/colaborador/{colaborador_id} - Admin buscando avaliações do colaborador {colaborador_id}"
         )
 
-        avaliacoes_completas = self.repository.get_all_by_colaborador(
-            colaborador_id, ciclo_id
+        # Leitura por linhas (Core): avaliações, eixos avaliados e colaboradores
+        # em três SELECTs de colunas; detalhes dos eixos dos dados de referência
+        avaliacoes = self.repository.get_linhas_by_colaborador(colaborador_id, ciclo_id)
+        eixos_por_avaliacao = self.repository.get_linhas_eixos(
+            avaliacao.id for avaliacao in avaliacoes
+        )
+        colaboradores = self.colaborador_service.get_respostas_by_ids(
+            {avaliacao.avaliador_id for avaliacao in avaliacoes}
+            | {avaliacao.avaliado_id for avaliacao in avaliacoes}
         )
 
-        return AvaliacaoListResponse(
-            avaliacoes=avaliacoes_completas,
-            total=len(avaliacoes_completas),
+        conteudo = {
+            "avaliacoes": montar_avaliacoes_linhas(
+                avaliacoes,
+                eixos_por_avaliacao,
+                colaboradores,
+                registro_referencia.obter(self.db).eixos_por_id,
+                embutir_colaboradores=not incluir_colaboradores,
+            ),
+            "total": len(avaliacoes),
+            "next_cursor": None,
+        }
+        if incluir_colaboradores:
+            return com_incluidos(conteudo, colaboradores)
+        return conteudo
+
+    def incluir_colaboradores(
+        self, conteudo: Dict[str, Any], avaliacoes: Sequence[Avaliacao]
+    ) -> Dict[str, Any]:
+        """Listagem com avaliadores e avaliados em included.colaboradores"""
+        return com_incluidos(
+            conteudo,
+            self.colaborador_service.get_respostas_by_ids(
+                {avaliacao.avaliador_id for avaliacao in avaliacoes}
+                | {avaliacao.avaliado_id for avaliacao in avaliacoes}
+            ),
         )
 
     def get_feedback_admin(
@@ -467,10 +509,10 @@ class AvaliacaoService(BaseService[Avaliacao]):
 
         niveis_esperados = []
         if colaborador and colaborador.nivel_carreira:
-            from app.api.v1.niveis_carreira import NIVEIS_ESPERADOS_POR_CARREIRA
-
-            niveis_esperados = NIVEIS_ESPERADOS_POR_CARREIRA.get(
-                colaborador.nivel_carreira, [0, 0, 0, 0]
+            niveis_esperados = list(
+                registro_referencia.obter(self.db).get_niveis_esperados(
+                    colaborador.nivel_carreira
+                )
             )
 
         logger.info(
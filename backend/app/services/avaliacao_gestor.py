@@ -1,16 +1,19 @@
 import logging
-from typing import Optional
+from typing import Any, Dict, Optional, Sequence
 
+from app.core.dados_referencia import registro_referencia
 from app.core.exceptions import (
     BusinessRuleException,
     ForbiddenException,
     NotFoundException,
 )
+from app.core.incluidos import com_incluidos
+from app.core.pagination import PaginacaoParams
 from app.core.validators import PERFIL_GESTOR, PERFIL_LIDER
 from app.models.avaliacao_gestor import AvaliacaoGestor
 from app.models.ciclo import EtapaCiclo
 from app.models.colaborador import Colaborador
-from app.repositories import AvaliacaoGestorRepository
+from app.repositories import AvaliacaoGestorRepository, ColaboradorRepository
 from app.repositories.ciclo import CicloRepository
 from app.schemas.avaliacao_gestor import (
     AvaliacaoGestorCreate,
@@ -18,8 +21,10 @@ from app.schemas.avaliacao_gestor import (
     AvaliacaoGestorResponse,
     AvaliacaoGestorUpdate,
     PerguntasAvaliacaoGestorResponse,
+    montar_avaliacoes_gestor,
 )
 from app.services.base import BaseService
+from app.services.colaborador import ColaboradorService
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
@@ -31,6 +36,7 @@ class AvaliacaoGestorService(BaseService[AvaliacaoGestor]):
         super().__init__(db)
         self.repository = AvaliacaoGestorRepository(db)
         self.ciclo_repository = CicloRepository(db)
+        self.colaborador_repository = ColaboradorRepository(db)
 
     def _validar_justificativas_respostas_fechadas(
         self, respostas_fechadas: list, is_autoavaliacao: bool
@@ -77,11 +83,11 @@ class AvaliacaoGestorService(BaseService[AvaliacaoGestor]):
                 gestor_id = current_colaborador.gestor_id
 
             # Validar que o gestor existe
-            gestor = self.repository.validate_colaborador(gestor_id)
+            gestor = self.colaborador_repository.get(gestor_id)
             if not gestor:
                 raise NotFoundException("Gestor", gestor_id)
 
-            ciclo = self.ciclo_repository.get(avaliacao.ciclo_id)
+            ciclo = self.ciclo_repository.get_estado(avaliacao.ciclo_id)
 
             if not ciclo:
                 raise NotFoundException("Ciclo", avaliacao.ciclo_id)
@@ -168,28 +174,18 @@ class AvaliacaoGestorService(BaseService[AvaliacaoGestor]):
         colaborador_id: Optional[int] = None,
         gestor_id: Optional[int] = None,
         current_colaborador: Colaborador = None,
+        paginacao: Optional[PaginacaoParams] = None,
+        opcoes: Sequence[Any] = (),
     ) -> AvaliacaoGestorListResponse:
         # Se não especificado, filtrar por colaborador_id ou gestor_id do usuário logado
         if colaborador_id is None and gestor_id is None:
             # Retornar avaliações onde o usuário logado é colaborador ou gestor
-            avaliacoes_como_colaborador = self.repository.get_by_filters(
+            pagina = self.repository.paginate_by_participante(
+                current_colaborador.id,
                 ciclo_id=ciclo_id,
-                colaborador_id=current_colaborador.id,
-                gestor_id=None,
-            )
-            # Também buscar avaliações onde o usuário é gestor
-            avaliacoes_como_gestor = self.repository.get_by_filters(
-                ciclo_id=ciclo_id,
-                colaborador_id=None,
-                gestor_id=current_colaborador.id,
+                paginacao=paginacao,
+                opcoes=opcoes,
             )
-            # Combinar e remover duplicatas
-            avaliacoes_ids = {a.id for a in avaliacoes_como_colaborador}
-            avaliacoes = avaliacoes_como_colaborador + [
-                a for a in avaliacoes_como_gestor if a.id not in avaliacoes_ids
-            ]
-            # Ordenar por created_at desc
-            avaliacoes.sort(key=lambda x: x.created_at, reverse=True)
         else:
             # Validar que o usuário só pode ver suas próprias avaliações
             # Se colaborador_id for especificado, deve ser o usuário logado
@@ -221,14 +217,20 @@ class AvaliacaoGestorService(BaseService[AvaliacaoGestor]):
                 f"GET /avaliacoes-gestor - Listando avaliações. Filtros: ciclo_id={ciclo_id}, colaborador_id={colaborador_id}, gestor_id={gestor_id}"
             )
 
-            avaliacoes = self.repository.get_by_filters(
+            pagina = self.repository.paginate_by_filters(
                 ciclo_id=ciclo_id,
                 colaborador_id=colaborador_id,
                 gestor_id=gestor_id,
+                paginacao=paginacao,
+                opcoes=opcoes,
             )
 
-        logger.debug(f"Retornando {len(avaliacoes)} avaliações de gestor")
-        return {"avaliacoes": avaliacoes, "total": len(avaliacoes)}
+        logger.debug(f"Retornando {len(pagina.itens)} avaliações de gestor")
+        return {
+            "avaliacoes": pagina.itens,
+            "total": pagina.total,
+            "next_cursor": pagina.next_cursor,
+        }
 
     def update(
         self,
@@ -248,7 +250,7 @@ class AvaliacaoGestorService(BaseService[AvaliacaoGestor]):
                     "Você só pode atualizar avaliações de gestor onde você é o avaliador"
                 )
 
-            ciclo = self.ciclo_repository.get(db_avaliacao.ciclo_id)
+            ciclo = self.ciclo_repository.get_estado(db_avaliacao.ciclo_id)
             if not ciclo:
                 raise NotFoundException("Ciclo", db_avaliacao.ciclo_id)
 
@@ -294,18 +296,17 @@ class AvaliacaoGestorService(BaseService[AvaliacaoGestor]):
         except SQLAlchemyError:
             self._handle_database_error("atualizar avaliação de gestor")
 
+    def get_versao_perguntas(self) -> str:
+        """Assinatura dos dados de referência, que incluem as perguntas (ETag)"""
+        return registro_referencia.obter(self.db).assinatura
+
     def get_perguntas(self) -> PerguntasAvaliacaoGestorResponse:
         """Retorna as perguntas disponíveis para avaliação de gestor"""
-        from app.schemas.avaliacao_gestor import (
-            CATEGORIAS_PERGUNTAS,
-            PERGUNTAS_ABERTAS,
-            PERGUNTAS_FECHADAS,
-        )
-
+        dados = registro_referencia.obter(self.db)
         return {
-            "categorias": CATEGORIAS_PERGUNTAS,
-            "perguntas_fechadas": PERGUNTAS_FECHADAS,
-            "perguntas_abertas": PERGUNTAS_ABERTAS,
+            "categorias": dados.categorias_perguntas,
+            "perguntas_fechadas": dados.perguntas_fechadas,
+            "perguntas_abertas": dados.perguntas_abertas,
         }
 
     def get_avaliacoes_colaborador_admin(
@@ -313,6 +314,7 @@ class AvaliacaoGestorService(BaseService[AvaliacaoGestor]):
         colaborador_id: int,
         ciclo_id: Optional[int] = None,
         current_colaborador: Colaborador = None,
+        opcoes: Sequence[Any] = (),
     ) -> AvaliacaoGestorListResponse:
         # Verificar se o usuário é admin
         if not current_colaborador.is_admin:
@@ -328,19 +330,20 @@ class AvaliacaoGestorService(BaseService[AvaliacaoGestor]):
         )
 
         avaliacoes_completas = self.repository.get_all_by_colaborador(
-            colaborador_id, ciclo_id
+            colaborador_id, ciclo_id, opcoes=opcoes
         )
 
-        return AvaliacaoGestorListResponse(
-            avaliacoes=avaliacoes_completas,
-            total=len(avaliacoes_completas),
-        )
+        return {
+            "avaliacoes": avaliacoes_completas,
+            "total": len(avaliacoes_completas),
+        }
 
     def get_avaliacoes_gestor_admin(
         self,
         gestor_id: int,
         ciclo_id: Optional[int] = None,
         current_colaborador: Colaborador = None,
+        opcoes: Sequence[Any] = (),
     ) -> AvaliacaoGestorListResponse:
         # Verificar se o usuário é admin
         if not current_colaborador.is_admin:
@@ -355,9 +358,30 @@ class AvaliacaoGestorService(BaseService[AvaliacaoGestor]):
             f"GET /avaliacoes-gestor/admin/gestor/{gestor_id} - Admin buscando avaliações de gestor recebidas pelo gestor {gestor_id}"
         )
 
-        avaliacoes_completas = self.repository.get_all_by_gestor(gestor_id, ciclo_id)
+        avaliacoes_completas = self.repository.get_all_by_gestor(
+            gestor_id, ciclo_id, opcoes=opcoes
+        )
 
-        return AvaliacaoGestorListResponse(
-            avaliacoes=avaliacoes_completas,
-            total=len(avaliacoes_completas),
+        return {
+            "avaliacoes": avaliacoes_completas,
+            "total": len(avaliacoes_completas),
+        }
+
+    def incluir_colaboradores(self, resultado: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Listagem no formato final com os gestores em included.colaboradores
+
+        Espera as avaliações carregadas sem o gestor (PROJECAO_AVALIACAO_GESTOR,
+        inclusão respostas); os gestores vêm em um único SELECT das colunas.
+        """
+        avaliacoes = resultado["avaliacoes"]
+        return com_incluidos(
+            {
+                "avaliacoes": montar_avaliacoes_gestor(avaliacoes),
+                "total": resultado.get("total"),
+                "next_cursor": resultado.get("next_cursor"),
+            },
+            ColaboradorService(self.db).get_respostas_by_ids(
+                {avaliacao.gestor_id for avaliacao in avaliacoes}
+            ),
         )
@@ -0,0 +1,359 @@
+"""
+Busca de colaboradores por texto (typeahead do seletor de pares e das telas
+de administração).
+
+O índice fica em memória no processo: para cada palavra de nome, email, cargo
+e departamento são guardados os seus prefixos, cada um com a lista dos
+colaboradores ativos já ordenada por nome. Uma busca percorre apenas a lista
+do termo mais seletivo e para ao juntar `limite` resultados, sem consultar o
+banco. Nomes que contêm todos os termos vêm antes dos que só os contêm em
+email, cargo ou departamento. Sem nenhum resultado por prefixo (ex: erro de
+digitação), cada termo desconhecido é trocado pelas palavras de nome mais
+parecidas, comparando trigramas com o vocabulário de nomes do índice.
+
+Textos são comparados sem acentos e sem diferença de maiúsculas ("joao" acha
+"João"). O índice é carregado na inicialização da aplicação e atualizado
+quando a transação que cria ou altera um colaborador é confirmada; alterações
+feitas por outros processos são detectadas pela assinatura da tabela a cada
+BUSCA_COLABORADORES_VERIFICACAO_SEGUNDOS, ou logo que o barramento de cache
+avisa da escrita, e apenas os colaboradores alterados desde a última
+verificação são relidos.
+"""
+
+import bisect
+import heapq
+import logging
+import re
+import threading
+import time
+import unicodedata
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from app.core.barramento_cache import barramento_cache
+from app.core.config import settings
+from app.database import SessionLocal
+from app.models.colaborador import Colaborador
+from app.repositories.colaborador import ColaboradorRepository
+from app.schemas.colaborador import ColaboradorResponse
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import event
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# Tamanho máximo dos prefixos indexados; termos maiores são conferidos no documento
+BUSCA_PREFIXO_MAX = 15
+# Similaridade mínima (coeficiente de Dice dos trigramas) na busca aproximada
+BUSCA_SIMILARIDADE_MIN = 0.45
+# Palavras do vocabulário aceitas no lugar de um termo desconhecido
+BUSCA_CORRECOES_MAX = 5
+
+_NAO_ALFANUMERICO = re.compile(r"[^0-9a-z]+")
+_PENDENTES = "busca_colaboradores_pendentes"
+
+
+def normalizar(texto: Optional[str]) -> str:
+    """Minúsculas, sem acentos e com qualquer pontuação trocada por espaço"""
+    if not texto:
+        return ""
+    decomposto = unicodedata.normalize("NFKD", texto.casefold())
+    sem_acentos = "".join(c for c in decomposto if not unicodedata.combining(c))
+    return _NAO_ALFANUMERICO.sub(" ", sem_acentos).strip()
+
+
+def _trigramas(token: str) -> Set[str]:
+    preenchido = f"  {token} "
+    return {preenchido[i : i + 3] for i in range(len(preenchido) - 2)}
+
+
+def _serializar(colaborador: Colaborador) -> Dict[str, Any]:
+    # Dados vindos do banco: sem revalidar (a validação do EmailStr domina o custo)
+    return ColaboradorResponse.model_construct(
+        **{campo: getattr(colaborador, campo) for campo in ColaboradorResponse.model_fields}
+    ).model_dump(mode="json")
+
+
+@dataclass(frozen=True)
+class _Documento:
+    id: int
+    dados: Dict[str, Any]  # ColaboradorResponse já serializado
+    chave: Tuple[str, int]  # Ordenação dos resultados: nome normalizado, id
+    tokens_nome: Tuple[str, ...]
+    tokens: Tuple[str, ...]  # Nome, email, cargo e departamento
+
+
+def _documento(dados: Dict[str, Any]) -> _Documento:
+    nome = normalizar(dados["nome"])
+    tokens_nome = tuple(dict.fromkeys(nome.split()))
+    outros = " ".join(
+        normalizar(dados.get(campo)) for campo in ("email", "cargo", "departamento")
+    )
+    return _Documento(
+        id=dados["id"],
+        dados=dados,
+        chave=(nome, dados["id"]),
+        tokens_nome=tokens_nome,
+        tokens=tuple(dict.fromkeys(tokens_nome + tuple(outros.split()))),
+    )
+
+
+def _prefixos(tokens: Iterable[str]) -> Set[str]:
+    return {
+        token[:tamanho]
+        for token in tokens
+        for tamanho in range(1, min(len(token), BUSCA_PREFIXO_MAX) + 1)
+    }
+
+
+def _contem_termos(tokens: Tuple[str, ...], termos: List[Tuple[str, ...]]) -> bool:
+    """Cada termo (com suas alternativas) é prefixo de alguma palavra"""
+    return all(
+        any(token.startswith(alternativa) for token in tokens for alternativa in termo)
+        for termo in termos
+    )
+
+
+class _Tabelas:
+    """Estruturas do índice (substituídas por inteiro a cada recarga)"""
+
+    def __init__(self):
+        self.documentos: Dict[int, _Documento] = {}
+        # prefixo -> chaves (nome, id) ordenadas
+        self.prefixos_nome: Dict[str, List[Tuple[str, int]]] = {}
+        self.prefixos: Dict[str, List[Tuple[str, int]]] = {}
+        # Palavras de nome (com quantos colaboradores as usam) e seus trigramas
+        self.vocabulario: Counter = Counter()
+        self.trigramas: Dict[str, Set[str]] = {}
+
+    def adicionar(self, documento: _Documento, ordenar: bool = True) -> None:
+        self.documentos[documento.id] = documento
+        for indice, tokens in (
+            (self.prefixos_nome, documento.tokens_nome),
+            (self.prefixos, documento.tokens),
+        ):
+            for prefixo in _prefixos(tokens):
+                chaves = indice.setdefault(prefixo, [])
+                if ordenar:
+                    bisect.insort(chaves, documento.chave)
+                else:
+                    chaves.append(documento.chave)
+        for token in documento.tokens_nome:
+            self.vocabulario[token] += 1
+            if self.vocabulario[token] == 1:
+                for trigrama in _trigramas(token):
+                    self.trigramas.setdefault(trigrama, set()).add(token)
+
+    def ordenar(self) -> None:
+        """Ordena as listas após uma carga com adicionar(..., ordenar=False)"""
+        for indice in (self.prefixos_nome, self.prefixos):
+            for chaves in indice.values():
+                chaves.sort()
+
+    def remover(self, colaborador_id: int) -> None:
+        documento = self.documentos.pop(colaborador_id, None)
+        if documento is None:
+            return
+        for indice, tokens in (
+            (self.prefixos_nome, documento.tokens_nome),
+            (self.prefixos, documento.tokens),
+        ):
+            for prefixo in _prefixos(tokens):
+                chaves = indice[prefixo]
+                chaves.pop(bisect.bisect_left(chaves, documento.chave))
+                if not chaves:
+                    del indice[prefixo]
+        for token in documento.tokens_nome:
+            self.vocabulario[token] -= 1
+            if not self.vocabulario[token]:
+                del self.vocabulario[token]
+                for trigrama in _trigramas(token):
+                    tokens = self.trigramas[trigrama]
+                    tokens.discard(token)
+                    if not tokens:
+                        del self.trigramas[trigrama]
+
+    def buscar(self, termos: List[str], limite: int) -> List[Dict[str, Any]]:
+        encontrados = self._buscar_prefixos([(termo,) for termo in termos], limite)
+        if not encontrados:
+            corrigidos = []
+            for termo in termos:
+                if termo[:BUSCA_PREFIXO_MAX] in self.prefixos:
+                    corrigidos.append((termo,))
+                    continue
+                correcoes = self._corrigir(termo)
+                if not correcoes:
+                    return []
+                corrigidos.append(correcoes)
+            encontrados = self._buscar_prefixos(corrigidos, limite)
+        return [documento.dados for documento in encontrados]
+
+    def _buscar_prefixos(
+        self, termos: List[Tuple[str, ...]], limite: int
+    ) -> List[_Documento]:
+        """
+        Percorre, em ordem de nome, os colaboradores do termo mais seletivo
+
+        Cada termo traz as palavras aceitas para ele (o próprio termo ou as
+        correções da busca aproximada).
+        """
+        encontrados: List[_Documento] = []
+        vistos: Set[int] = set()
+        # Primeiro quem tem todos os termos no nome, depois em qualquer campo
+        for indice, campo in (
+            (self.prefixos_nome, "tokens_nome"),
+            (self.prefixos, "tokens"),
+        ):
+            listas_por_termo = [
+                [indice.get(alternativa[:BUSCA_PREFIXO_MAX], ()) for alternativa in termo]
+                for termo in termos
+            ]
+            listas = min(listas_por_termo, key=lambda ls: sum(map(len, ls)))
+            chaves = listas[0] if len(listas) == 1 else heapq.merge(*listas)
+            for _, colaborador_id in chaves:
+                if colaborador_id in vistos:
+                    continue
+                documento = self.documentos[colaborador_id]
+                if _contem_termos(getattr(documento, campo), termos):
+                    vistos.add(colaborador_id)
+                    encontrados.append(documento)
+                    if len(encontrados) >= limite:
+                        return encontrados
+        return encontrados
+
+    def _corrigir(self, termo: str) -> Tuple[str, ...]:
+        """Palavras de nome mais parecidas com o termo, por trigramas"""
+        trigramas = _trigramas(termo)
+        ocorrencias: Counter = Counter()
+        for trigrama in trigramas:
+            ocorrencias.update(self.trigramas.get(trigrama, ()))
+
+        candidatos = []
+        for token, comuns in ocorrencias.items():
+            similaridade = 2 * comuns / (len(trigramas) + len(token) + 1)
+            if similaridade >= BUSCA_SIMILARIDADE_MIN:
+                candidatos.append((-similaridade, token))
+        return tuple(token for _, token in heapq.nsmallest(BUSCA_CORRECOES_MAX, candidatos))
+
+
+class IndiceBusca:
+    """Índice de busca por processo dos colaboradores ativos"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._tabelas: Optional[_Tabelas] = None
+        self._assinatura: Optional[Tuple[int, Any]] = None
+        self._verificado_em = 0.0
+
+    def carregar(self, repository: ColaboradorRepository) -> None:
+        """Monta o índice a partir do banco e substitui o atual"""
+        assinatura = repository.get_assinatura_hierarquia()
+        tabelas = _Tabelas()
+        for colaborador in repository.get_active():
+            tabelas.adicionar(_documento(_serializar(colaborador)), ordenar=False)
+        tabelas.ordenar()
+        with self._lock:
+            self._tabelas = tabelas
+            self._assinatura = assinatura
+            self._verificado_em = time.monotonic()
+        logger.debug(
+            f"Índice de busca de colaboradores carregado. Colaboradores: {len(tabelas.documentos)}"
+        )
+
+    def garantir_atualizado(self, repository: ColaboradorRepository) -> None:
+        """Carrega o índice se ainda não existe ou se outro processo alterou colaboradores"""
+        if self._tabelas is None:
+            self.carregar(repository)
+            return
+        if (
+            time.monotonic() - self._verificado_em
+            < settings.BUSCA_COLABORADORES_VERIFICACAO_SEGUNDOS
+        ):
+            return
+        assinatura = repository.get_assinatura_hierarquia()
+        total_anterior, atualizado_anterior = self._assinatura
+        if assinatura == self._assinatura:
+            self._verificado_em = time.monotonic()
+        elif assinatura[0] < total_anterior or atualizado_anterior is None:
+            # Colaborador removido do banco: só uma carga completa percebe
+            self.carregar(repository)
+        else:
+            # Mesma precisão do updated_at: relê também os do último instante
+            alterados = repository.get_alterados_desde(atualizado_anterior)
+            for colaborador in alterados:
+                self.atualizar(_serializar(colaborador))
+            with self._lock:
+                self._assinatura = assinatura
+                self._verificado_em = time.monotonic()
+            logger.debug(
+                f"Índice de busca de colaboradores atualizado. Colaboradores relidos: {len(alterados)}"
+            )
+
+    def expirar(self) -> None:
+        """Faz a próxima busca conferir a assinatura da tabela"""
+        with self._lock:
+            self._verificado_em = 0.0
+
+    def buscar(self, termo: str, limite: int) -> List[Dict[str, Any]]:
+        """Colaboradores ativos que correspondem ao termo, já serializados"""
+        termos = normalizar(termo).split()
+        if not termos:
+            return []
+        with self._lock:
+            if self._tabelas is None:
+                return []
+            return self._tabelas.buscar(termos, limite)
+
+    def atualizar(self, dados: Dict[str, Any]) -> None:
+        """Aplica um colaborador criado ou alterado (inativos saem do índice)"""
+        with self._lock:
+            if self._tabelas is None:
+                return
+            self._tabelas.remover(dados["id"])
+            if dados["is_active"]:
+                self._tabelas.adicionar(_documento(dados))
+
+    def agendar(self, db: Session, colaborador: Colaborador) -> None:
+        """Atualiza o índice com o colaborador quando a transação de `db` for confirmada"""
+        dados = _serializar(colaborador)
+        pendentes = db.info.get(_PENDENTES)
+        if pendentes is None:
+            pendentes = db.info[_PENDENTES] = []
+            event.listen(db, "after_commit", self._aplicar_pendentes)
+            event.listen(db, "after_rollback", self._descartar_pendentes)
+        pendentes.append(dados)
+
+    def _aplicar_pendentes(self, db: Session) -> None:
+        pendentes = db.info.get(_PENDENTES, [])
+        for dados in pendentes:
+            self.atualizar(dados)
+        pendentes.clear()
+
+    def _descartar_pendentes(self, db: Session) -> None:
+        db.info.get(_PENDENTES, []).clear()
+
+
+indice_busca = IndiceBusca()
+barramento_cache.inscrever({"colaboradores"}, lambda canais: indice_busca.expirar())
+
+
+def carregar_indice_busca() -> None:
+    """Carrega o índice de busca de colaboradores"""
+    db = SessionLocal()
+    try:
+        indice_busca.carregar(ColaboradorRepository(db))
+    except SQLAlchemyError as e:
+        # A primeira busca tenta de novo
+        logger.error(f"Erro ao carregar índice de busca de colaboradores: {str(e)}")
+    finally:
+        db.close()
+
+
+async def carregar_indice_busca_em_segundo_plano() -> None:
+    """Carrega o índice na inicialização sem bloquear a aplicação"""
+    try:
+        await run_in_threadpool(carregar_indice_busca)
+    except Exception as e:
+        logger.error(f"Erro ao carregar índice de busca de colaboradores: {str(e)}")
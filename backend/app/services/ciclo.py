@@ -5,21 +5,26 @@ Este service contém a lógica de negócio para ciclos,
 separando-a dos controllers e repositories.
 """
 
-from typing import List, Optional
+from datetime import datetime
+from typing import Optional, Tuple
 
+from app.core.estado_ciclos import estado_ciclos
 from app.core.exceptions import (
     BusinessRuleException,
     ForbiddenException,
     NotFoundException,
     ValidationException,
 )
+from app.core.pagination import Pagina, PaginacaoParams
 from app.core.validators import NUMERO_PARES_OBRIGATORIO
 from app.models.avaliacao import Avaliacao, TipoAvaliacao
 from app.models.avaliacao_gestor import AvaliacaoGestor
 from app.models.ciclo import Ciclo, EtapaCiclo, StatusCiclo
 from app.models.ciclo_avaliacao import CicloAvaliacao, ParSelecionado
 from app.models.colaborador import Colaborador
+from app.models.exclusao_ciclo import ExclusaoCiclo, StatusExclusaoCiclo
 from app.repositories.ciclo import CicloRepository
+from app.repositories.exclusao_ciclo import ExclusaoCicloRepository
 from app.schemas.ciclo import (
     AcompanhamentoCicloResponse,
     CicloCreate,
@@ -47,23 +52,25 @@ class CicloService(BaseService[Ciclo]):
     def __init__(self, db: Session):
         super().__init__(db)
         self.repository = CicloRepository(db)
-
-    def get_ciclos(self, status: Optional[str] = None) -> tuple[List[Ciclo], int]:
+        self.exclusao_repository = ExclusaoCicloRepository(db)
+
+    def get_ciclos(
+        self,
+        status: Optional[str] = None,
+        paginacao: Optional[PaginacaoParams] = None,
+    ) -> Pagina[Ciclo]:
+        status_enum = None
         if status:
             try:
                 status_enum = StatusCiclo(status)
-                ciclos = self.repository.get_by_status(status_enum)
             except ValueError:
                 valid_values = [s.value for s in StatusCiclo]
                 raise ValidationException(
                     f"Status inválido. Valores aceitos: {', '.join(valid_values)}",
                     field="status",
                 )
-        else:
-            ciclos = self.repository.get_all(order_by=Ciclo.created_at.desc())
 
-        total = len(ciclos)
-        return ciclos, total
+        return self.repository.paginate_by_status(status_enum, paginacao)
 
     def get_ciclo_by_id(self, ciclo_id: int) -> Ciclo:
         ciclo = self.repository.get(ciclo_id)
@@ -87,6 +94,7 @@ class CicloService(BaseService[Ciclo]):
                 data_fim=ciclo_data.data_fim,
             )
             db_ciclo = self.repository.create(db_ciclo)
+            estado_ciclos.invalidar_ao_confirmar(self.db)
             return db_ciclo
         except SQLAlchemyError:
             self._handle_database_error("criar ciclo")
@@ -110,10 +118,15 @@ class CicloService(BaseService[Ciclo]):
                 if value is not None:
                     setattr(db_ciclo, field, value)
 
+            estado_ciclos.invalidar_ao_confirmar(self.db)
             return self.repository.update(ciclo_id, **update_data)
         except SQLAlchemyError:
             self._handle_database_error("atualizar ciclo")
 
+    def get_versao(self) -> Tuple[str, Optional[datetime]]:
+        """Assinatura e última alteração dos ciclos (ETag / Last-Modified)"""
+        return self.repository.get_assinatura()
+
     def get_ciclo_aberto(self) -> Ciclo:
         ciclo = self.repository.get_aberto()
         if not ciclo:
@@ -140,6 +153,7 @@ class CicloService(BaseService[Ciclo]):
                 )
 
             try:
+                estado_ciclos.invalidar_ao_confirmar(self.db)
                 return self.repository.update(
                     ciclo_id, etapa_atual=self.ETAPAS_SEQUENCIA[etapa_atual_idx + 1]
                 )
@@ -152,7 +166,16 @@ class CicloService(BaseService[Ciclo]):
                 field="etapa_atual",
             )
 
-    def delete_ciclo(self, ciclo_id: int, current_colaborador: Colaborador) -> bool:
+    def delete_ciclo(
+        self, ciclo_id: int, current_colaborador: Colaborador
+    ) -> ExclusaoCiclo:
+        """
+        Solicita a exclusão do ciclo e de todos os seus dados.
+
+        A remoção é feita em segundo plano, em lotes (ver
+        app.services.exclusao_ciclo); este método apenas fecha o ciclo e
+        registra o job. Se já houver um job em andamento, ele é retornado.
+        """
         if not current_colaborador.is_admin:
             raise ForbiddenException("Apenas administradores podem deletar ciclos")
 
@@ -160,7 +183,46 @@ class CicloService(BaseService[Ciclo]):
         if not db_ciclo:
             raise NotFoundException("Ciclo", ciclo_id)
 
-        return self.repository.delete(ciclo_id)
+        exclusao = self.exclusao_repository.get_ultima_by_ciclo(ciclo_id)
+        if exclusao and exclusao.status in (
+            StatusExclusaoCiclo.PENDENTE,
+            StatusExclusaoCiclo.EM_ANDAMENTO,
+        ):
+            return exclusao
+
+        try:
+            # Ciclo fechado deixa de ser o ciclo aberto enquanto os dados são removidos
+            db_ciclo.status = StatusCiclo.FECHADO
+            exclusao = self.exclusao_repository.create(
+                ExclusaoCiclo(
+                    ciclo_id=ciclo_id,
+                    ciclo_nome=db_ciclo.nome,
+                    status=StatusExclusaoCiclo.PENDENTE,
+                    total_registros=0,
+                    registros_removidos=0,
+                    solicitado_por_id=current_colaborador.id,
+                )
+            )
+            # Confirmar antes de o job começar em segundo plano
+            estado_ciclos.invalidar_ao_confirmar(self.db)
+            self.db.commit()
+            return exclusao
+        except SQLAlchemyError:
+            self._handle_database_error("solicitar exclusão do ciclo")
+
+    def get_exclusao(
+        self, ciclo_id: int, current_colaborador: Colaborador
+    ) -> ExclusaoCiclo:
+        """Retorna o job de exclusão mais recente do ciclo (o ciclo pode já ter sido removido)"""
+        if not current_colaborador.is_admin:
+            raise ForbiddenException(
+                "Apenas administradores podem acompanhar a exclusão de ciclos"
+            )
+
+        exclusao = self.exclusao_repository.get_ultima_by_ciclo(ciclo_id)
+        if not exclusao:
+            raise NotFoundException("Exclusão do ciclo", ciclo_id)
+        return exclusao
 
     def get_acompanhamento(
         self, ciclo_id: int, current_colaborador: Colaborador
@@ -42,12 +42,12 @@ class CicloAvaliacaoService(BaseService[CicloAvaliacao]):
         colaborador_id = current_colaborador.id
 
         # Validar que o colaborador existe
-        colaborador = self.repository.validate_colaborador(colaborador_id)
+        colaborador = self.colaborador_service.repository.get(colaborador_id)
         if not colaborador:
             raise NotFoundException("Colaborador", colaborador_id)
 
         # Validar que o ciclo existe
-        ciclo_obj = self.repository.validate_ciclo(ciclo_avaliacao.ciclo_id)
+        ciclo_obj = self.ciclo_repository.get_estado(ciclo_avaliacao.ciclo_id)
         if not ciclo_obj:
             raise NotFoundException("Ciclo", ciclo_avaliacao.ciclo_id)
 
@@ -73,18 +73,17 @@ class CicloAvaliacaoService(BaseService[CicloAvaliacao]):
     def get_ciclos_avaliacao(self, colaborador_id: int) -> CicloAvaliacaoListResponse:
         """Lista ciclos de avaliação do usuário logado"""
         logger.debug(f"Aplicando filtro por colaborador_id: {colaborador_id}")
-        ciclos = self.repository.get_by_colaborador(colaborador_id=colaborador_id)
+        ciclos = self.repository.get_completos_by_colaborador(colaborador_id)
 
-        ciclos_enriched = []
-        for ciclo in ciclos:
-            logger.debug(f"Buscando pares para avaliar para o ciclo {ciclo.id}")
+        # Pares para avaliar de todos os ciclos em uma única consulta
+        pares_por_ciclo = self.repository.get_pares_para_avaliar_por_ciclo(
+            colaborador_id, list({ciclo.ciclo_id for ciclo in ciclos})
+        )
 
-            ciclo_completo = self.repository.get_completo(ciclo.id)
-            ciclo_enriched = self._enrich_ciclo_avaliacao_with_pares_para_avaliar(
-                ciclo_completo, colaborador_id
-            )
-            if ciclo_enriched:
-                ciclos_enriched.append(ciclo_enriched)
+        ciclos_enriched = [
+            self._montar_ciclo_avaliacao(ciclo, pares_por_ciclo.get(ciclo.ciclo_id, []))
+            for ciclo in ciclos
+        ]
 
         logger.debug(f"Retornando {len(ciclos_enriched)} ciclos")
         return {"ciclos": ciclos_enriched, "total": len(ciclos_enriched)}
@@ -95,14 +94,15 @@ class CicloAvaliacaoService(BaseService[CicloAvaliacao]):
 
         if ciclo:
             ciclo_completo = self.repository.get_completo(ciclo.id)
-            return self._enrich_ciclo_avaliacao_with_pares_para_avaliar(
-                ciclo_completo, colaborador_id
+            pares_para_avaliar = self.repository.get_pares_para_avaliar(
+                avaliador_id=colaborador_id, ciclo_id=ciclo_completo.ciclo_id
             )
+            return self._montar_ciclo_avaliacao(ciclo_completo, pares_para_avaliar)
 
         # Colaborador sem registro próprio no ciclo aberto (ex.: líderes/gestores, que
         # não passam pela etapa de escolha de pares) ainda pode ter sido escolhido como
         # par por outros colaboradores. Retornamos os pares para avaliar mesmo assim.
-        ciclo_aberto = self.ciclo_repository.get_aberto()
+        ciclo_aberto = self.ciclo_repository.get_estado_aberto()
         if not ciclo_aberto:
             raise NotFoundException("Ciclo de avaliação ativo", colaborador_id)
 
@@ -137,7 +137,8 @@ class CicloAvaliacaoService(BaseService[CicloAvaliacao]):
                 "Você só pode atualizar seus próprios ciclos de avaliação"
             )
 
-        if db_ciclo.ciclo.etapa_atual != EtapaCiclo.ESCOLHA_PARES:
+        ciclo = self.ciclo_repository.get_estado(db_ciclo.ciclo_id)
+        if ciclo and ciclo.etapa_atual != EtapaCiclo.ESCOLHA_PARES:
             raise BusinessRuleException(
                 "Não é possível alterar os pares. A alteração só é permitida durante a etapa de escolha de pares."
             )
@@ -188,8 +189,10 @@ class CicloAvaliacaoService(BaseService[CicloAvaliacao]):
         if not db_ciclo:
             raise NotFoundException("Ciclo de avaliação", ciclo_avaliacao_id)
 
-        # Verificar se o colaborador do ciclo é liderado do gestor
-        if db_ciclo.colaborador.gestor_id != current_colaborador.id:
+        # Verificar se o colaborador do ciclo é liderado (direto ou indireto) do gestor
+        if not self.colaborador_service.is_subordinado(
+            current_colaborador.id, db_ciclo.colaborador_id
+        ):
             logger.warning(
                 f"Tentativa de atualizar pares de colaborador que não é liderado. "
                 f"Ciclo ID: {ciclo_avaliacao_id}, "
@@ -211,61 +214,32 @@ class CicloAvaliacaoService(BaseService[CicloAvaliacao]):
 
         return db_ciclo
 
-    def _enrich_ciclo_avaliacao_with_pares_para_avaliar(
+    def _montar_ciclo_avaliacao(
         self,
-        ciclo_avaliacao,
-        avaliador_id: int,
-    ):
-        """Enriquece o ciclo de avaliação com os pares para avaliar"""
-        if not ciclo_avaliacao:
-            return None
-
-        # Buscar pares para avaliar
-        pares_para_avaliar = self.repository.get_pares_para_avaliar(
-            avaliador_id=avaliador_id, ciclo_id=ciclo_avaliacao.ciclo_id
-        )
-
-        # Converter para dict e adicionar pares_para_avaliar
-        from app.schemas.colaborador import ColaboradorResponse
-
-        ciclo_dict = {
+        ciclo_avaliacao: CicloAvaliacao,
+        pares_para_avaliar: List[Colaborador],
+    ) -> dict:
+        """
+        Monta a resposta do ciclo de avaliação com os pares para avaliar
+
+        Os objetos ORM vão direto na resposta: o response_model da rota valida
+        tudo uma única vez (from_attributes), sem model_validate intermediários.
+        """
+        return {
             "id": ciclo_avaliacao.id,
             "ciclo_id": ciclo_avaliacao.ciclo_id,
+            "ciclo": ciclo_avaliacao.ciclo,
             "colaborador_id": ciclo_avaliacao.colaborador_id,
+            "colaborador": ciclo_avaliacao.colaborador,
+            "pares_selecionados": ciclo_avaliacao.pares_selecionados,
+            "pares_para_avaliar": pares_para_avaliar,
             "created_at": ciclo_avaliacao.created_at,
             "updated_at": ciclo_avaliacao.updated_at,
-            "pares_para_avaliar": [
-                ColaboradorResponse.model_validate(par) for par in pares_para_avaliar
-            ],
         }
 
-        # Adicionar relacionamentos se existirem
-        if ciclo_avaliacao.ciclo:
-            from app.schemas.ciclo import CicloResponse
-
-            ciclo_dict["ciclo"] = CicloResponse.model_validate(ciclo_avaliacao.ciclo)
-
-        if ciclo_avaliacao.colaborador:
-            ciclo_dict["colaborador"] = ColaboradorResponse.model_validate(
-                ciclo_avaliacao.colaborador
-            )
-
-        if ciclo_avaliacao.pares_selecionados:
-            from app.schemas.ciclo_avaliacao import ParSelecionadoResponse
-
-            ciclo_dict["pares_selecionados"] = [
-                ParSelecionadoResponse.model_validate(ps)
-                for ps in ciclo_avaliacao.pares_selecionados
-            ]
-
-        return CicloAvaliacaoResponse.model_validate(ciclo_dict)
-
     def _build_ciclo_avaliacao_sem_registro(self, ciclo_aberto, avaliador_id: int):
         """Monta a resposta do ciclo ativo para um colaborador que não possui registro
         próprio de ciclo de avaliação, mas foi escolhido como par por outros."""
-        from app.schemas.ciclo import CicloResponse
-        from app.schemas.colaborador import ColaboradorResponse
-
         pares_para_avaliar = self.repository.get_pares_para_avaliar(
             avaliador_id=avaliador_id, ciclo_id=ciclo_aberto.id
         )
@@ -273,14 +247,12 @@ class CicloAvaliacaoService(BaseService[CicloAvaliacao]):
         ciclo_dict = {
             "id": None,
             "ciclo_id": ciclo_aberto.id,
-            "ciclo": CicloResponse.model_validate(ciclo_aberto),
+            "ciclo": ciclo_aberto,
             "colaborador_id": avaliador_id,
             "created_at": None,
             "updated_at": None,
             "pares_selecionados": [],
-            "pares_para_avaliar": [
-                ColaboradorResponse.model_validate(par) for par in pares_para_avaliar
-            ],
+            "pares_para_avaliar": pares_para_avaliar,
         }
 
-        return CicloAvaliacaoResponse.model_validate(ciclo_dict)
+        return ciclo_dict
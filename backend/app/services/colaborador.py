@@ -1,15 +1,25 @@
 import logging
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from app.core.exceptions import (
+    BusinessRuleException,
     DuplicateResourceException,
     ForbiddenException,
     NotFoundException,
 )
+from app.core.pagination import Pagina, PaginacaoParams
 from app.models.colaborador import Colaborador
 from app.repositories.colaborador import ColaboradorRepository
-from app.schemas.colaborador import ColaboradorCreate, ColaboradorUpdate
+from app.repositories.colaborador_hierarquia import ColaboradorHierarquiaRepository
+from app.schemas.colaborador import (
+    CAMPOS_COLABORADOR_RESPONSE,
+    ColaboradorCreate,
+    ColaboradorUpdate,
+)
 from app.services.base import BaseService
+from app.services.busca_colaboradores import indice_busca
+from app.services.hierarquia import indice_hierarquia
+from sqlalchemy.engine import RowMapping
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
@@ -20,17 +30,38 @@ class ColaboradorService(BaseService[Colaborador]):
     def __init__(self, db: Session):
         super().__init__(db)
         self.repository = ColaboradorRepository(db)
+        self.hierarquia_repository = ColaboradorHierarquiaRepository(db)
 
     def get_colaboradores(
         self,
         departamento: Optional[str] = None,
         email: Optional[str] = None,
-    ) -> tuple[List[Colaborador], int]:
-        colaboradores = self.repository.get_active(
-            departamento=departamento, email=email
+        paginacao: Optional[PaginacaoParams] = None,
+    ) -> Pagina[Colaborador]:
+        return self.repository.paginate_active(
+            departamento=departamento, email=email, paginacao=paginacao
+        )
+
+    def get_colaboradores_linhas(
+        self,
+        departamento: Optional[str] = None,
+        email: Optional[str] = None,
+        paginacao: Optional[PaginacaoParams] = None,
+    ) -> Pagina[RowMapping]:
+        """Mesmo que get_colaboradores, com as linhas de ColaboradorResponse (Core)"""
+        return self.repository.paginate_active_linhas(
+            CAMPOS_COLABORADOR_RESPONSE,
+            departamento=departamento,
+            email=email,
+            paginacao=paginacao,
+        )
+
+    def get_respostas_by_ids(self, ids: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+        """ColaboradorResponse (dict) dos IDs, com um único SELECT das colunas"""
+        linhas = self.repository.get_linhas_by_ids(
+            (id_ for id_ in ids if id_ is not None), CAMPOS_COLABORADOR_RESPONSE
         )
-        total = len(colaboradores)
-        return colaboradores, total
+        return {id_: dict(linha) for id_, linha in linhas.items()}
 
     def get_by_id(self, colaborador_id: int) -> Colaborador:
         colaborador = self.repository.get(colaborador_id)
@@ -41,6 +72,15 @@ class ColaboradorService(BaseService[Colaborador]):
     def get_liderados(self, gestor_id: int) -> List[Colaborador]:
         return self.repository.get_liderados(gestor_id)
 
+    def buscar(self, termo: str, limite: int) -> List[Dict[str, Any]]:
+        """Busca textual nos colaboradores ativos (nome, email, cargo e departamento)"""
+        indice_busca.garantir_atualizado(self.repository)
+        return indice_busca.buscar(termo, limite)
+
+    def is_subordinado(self, gestor_id: int, colaborador_id: int) -> bool:
+        """Verifica se o colaborador está abaixo do gestor, direta ou indiretamente"""
+        return self.hierarquia_repository.is_descendente(gestor_id, colaborador_id)
+
     def create_colaborador(
         self, colaborador_data: ColaboradorCreate, current_colaborador: Colaborador
     ) -> Colaborador:
@@ -56,6 +96,12 @@ class ColaboradorService(BaseService[Colaborador]):
         try:
             colaborador = Colaborador(**colaborador_data.model_dump())
             self.repository.create(colaborador)
+            # Na mesma transação do colaborador
+            self.hierarquia_repository.inserir_colaborador(
+                colaborador.id, colaborador.gestor_id
+            )
+            indice_hierarquia.invalidar()
+            indice_busca.agendar(self.db, colaborador)
             return colaborador
         except SQLAlchemyError:
             self._handle_database_error("criar colaborador")
@@ -83,12 +129,39 @@ class ColaboradorService(BaseService[Colaborador]):
                     "Colaborador", "email", update_data["email"]
                 )
 
+        muda_gestor = (
+            "gestor_id" in update_data
+            and update_data["gestor_id"] != db_colaborador.gestor_id
+        )
+        if muda_gestor:
+            self._validar_novo_gestor(colaborador_id, update_data["gestor_id"])
+
         try:
             colaborador = self.repository.update(colaborador_id, **update_data)
+            if muda_gestor:
+                # Na mesma transação do colaborador
+                self.hierarquia_repository.mover(
+                    colaborador_id, update_data["gestor_id"]
+                )
+            indice_hierarquia.invalidar()
+            indice_busca.agendar(self.db, colaborador)
             return colaborador
         except SQLAlchemyError:
             self._handle_database_error("atualizar colaborador")
 
+    def _validar_novo_gestor(
+        self, colaborador_id: int, gestor_id: Optional[int]
+    ) -> None:
+        """Impede que a mudança de gestor crie um ciclo na hierarquia"""
+        if gestor_id is None:
+            return
+        if gestor_id == colaborador_id or self.hierarquia_repository.is_descendente(
+            colaborador_id, gestor_id
+        ):
+            raise BusinessRuleException(
+                "O gestor não pode ser o próprio colaborador nem alguém abaixo dele na hierarquia"
+            )
+
     def get_colaborador_by_email(self, email: str) -> Optional[Colaborador]:
         return self.repository.get_by_email(email)
 
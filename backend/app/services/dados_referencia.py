@@ -0,0 +1,44 @@
+from typing import Any, Dict
+
+from app.core.dados_referencia import (
+    DadosReferencia,
+    RegistroReferencia,
+    registro_referencia,
+)
+from app.core.exceptions import ForbiddenException
+from app.models.colaborador import Colaborador
+from app.services.base import BaseService
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+
+def _resumo(dados: DadosReferencia) -> Dict[str, Any]:
+    return {
+        "versao": dados.versao,
+        "carregado_em": dados.carregado_em,
+        "total_eixos": len(dados.eixos),
+        "total_valores": len(dados.valores),
+    }
+
+
+class DadosReferenciaService(BaseService[DadosReferencia]):
+    def __init__(
+        self, db: Session, registro: RegistroReferencia = registro_referencia
+    ):
+        super().__init__(db)
+        self.registro = registro
+
+    def get_versao(self) -> Dict[str, Any]:
+        """Versão dos dados de referência em uso"""
+        return _resumo(self.registro.obter(self.db))
+
+    def recarregar(self, current_colaborador: Colaborador) -> Dict[str, Any]:
+        """Relê eixos e valores do banco e publica uma nova versão (apenas admin)"""
+        if not current_colaborador.is_admin:
+            raise ForbiddenException(
+                "Apenas administradores podem recarregar os dados de referência"
+            )
+        try:
+            return _resumo(self.registro.recarregar(self.db))
+        except SQLAlchemyError:
+            self._handle_database_error("recarregar dados de referência")
@@ -0,0 +1,353 @@
+"""
+Distribuição de pares de um ciclo com carga limitada por avaliador.
+
+Na escolha livre, colaboradores populares acabam com dezenas de avaliações de
+pares para fazer enquanto outros não recebem nenhuma. A distribuição parte das
+escolhas do ciclo (`pares_selecionados`) e do organograma e define
+NUMERO_PARES_OBRIGATORIO pares para cada colaborador ativo, sem que ninguém
+fique com mais de `carga_max` avaliações de pares:
+
+1. Escolhas: cada avaliador mantém até `carga_max` dos colaboradores que o
+   escolheram, com prioridade para o mesmo departamento e a mesma equipe.
+   Escolhas do gestor direto ou de liderados diretos são descartadas (e
+   informadas), pela mesma regra do preenchimento.
+2. Preenchimento: as vagas restantes são ocupadas, em rodízio, pelos
+   avaliadores com capacidade sobrando, preferindo colegas com o mesmo gestor,
+   depois do mesmo departamento e depois qualquer um. Gestor direto e liderados
+   diretos (que já se avaliam na avaliação de gestor) não são atribuídos.
+3. Reparo: quem ficou sem pares válidos (ex: a capacidade que sobrou é só a
+   dele) recebe um par de outro colaborador, que em troca recebe um avaliador
+   com capacidade sobrando.
+
+O administrador pode apenas ver a proposta ou aplicá-la, o que regrava os
+pares alterados com INSERTs em lote.
+"""
+
+import logging
+from collections import Counter, defaultdict, deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Iterable, List, Optional
+
+from app.core.exceptions import (
+    BusinessRuleException,
+    ForbiddenException,
+    NotFoundException,
+)
+from app.core.validators import NUMERO_PARES_OBRIGATORIO
+from app.models.ciclo import EtapaCiclo
+from app.models.ciclo_avaliacao import CicloAvaliacao
+from app.models.colaborador import Colaborador
+from app.repositories import (
+    CicloAvaliacaoRepository,
+    CicloRepository,
+    ColaboradorRepository,
+)
+from app.schemas.distribuicao_pares import DistribuicaoParesRequest
+from app.services.base import BaseService
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# Etapas em que os pares ainda podem ser redistribuídos
+ETAPAS_DISTRIBUICAO = (EtapaCiclo.ESCOLHA_PARES, EtapaCiclo.APROVACAO_PARES)
+
+
+@dataclass(frozen=True)
+class Participante:
+    id: int
+    departamento: Optional[str]
+    gestor_id: Optional[int]
+
+
+@dataclass
+class Distribuicao:
+    """Resultado da distribuição de pares"""
+
+    pares: Dict[int, List[int]]  # colaborador_id -> pares (seus avaliadores)
+    cargas: Dict[int, int]  # avaliador -> avaliações de pares a fazer
+    escolhas_mantidas: int
+    incompletos: List[int]  # Colaboradores com menos pares que o necessário
+    # colaborador_id -> pares escolhidos descartados por serem gestor / liderado direto
+    escolhas_restritas: Dict[int, List[int]]
+
+
+class _Distribuidor:
+    def __init__(
+        self,
+        participantes: Iterable[Participante],
+        pares_por_colaborador: int,
+        carga_max: int,
+    ):
+        self.participantes: Dict[int, Participante] = {
+            p.id: p for p in participantes
+        }
+        self.pares_por_colaborador = pares_por_colaborador
+        self.carga_max = carga_max
+        self.pares: Dict[int, List[int]] = {id_: [] for id_ in self.participantes}
+        self.cargas: Dict[int, int] = {id_: 0 for id_ in self.participantes}
+        self.escolhas_restritas: Dict[int, List[int]] = {}
+
+    def restrito(self, avaliado_id: int, avaliador_id: int) -> bool:
+        """O próprio colaborador, seu gestor direto e seus liderados diretos"""
+        return (
+            avaliador_id == avaliado_id
+            or self.participantes[avaliado_id].gestor_id == avaliador_id
+            or self.participantes[avaliador_id].gestor_id == avaliado_id
+        )
+
+    def afinidade(self, avaliado_id: int, avaliador_id: int) -> int:
+        """Menor = melhor: mesma equipe e departamento, só um deles, nenhum"""
+        avaliado = self.participantes[avaliado_id]
+        avaliador = self.participantes[avaliador_id]
+        mesma_equipe = (
+            avaliado.gestor_id is not None and avaliado.gestor_id == avaliador.gestor_id
+        )
+        mesmo_departamento = (
+            avaliado.departamento is not None
+            and avaliado.departamento == avaliador.departamento
+        )
+        return 2 - mesma_equipe - mesmo_departamento
+
+    def atribuir(self, avaliado_id: int, avaliador_id: int) -> None:
+        self.pares[avaliado_id].append(avaliador_id)
+        self.cargas[avaliador_id] += 1
+
+    def manter_escolhas(self, selecoes: Dict[int, List[int]]) -> None:
+        pedidos: Dict[int, List[int]] = defaultdict(list)
+        for avaliado_id, escolhidos in selecoes.items():
+            if avaliado_id not in self.participantes:
+                continue
+            validos = []
+            for avaliador_id in dict.fromkeys(escolhidos):
+                if avaliador_id not in self.participantes:
+                    continue
+                if self.restrito(avaliado_id, avaliador_id):
+                    self.escolhas_restritas.setdefault(avaliado_id, []).append(
+                        avaliador_id
+                    )
+                else:
+                    validos.append(avaliador_id)
+            for avaliador_id in validos[: self.pares_por_colaborador]:
+                pedidos[avaliador_id].append(avaliado_id)
+
+        for avaliador_id, avaliados in pedidos.items():
+            avaliados.sort(key=lambda a: (self.afinidade(a, avaliador_id), a))
+            for avaliado_id in avaliados[: self.carga_max]:
+                self.atribuir(avaliado_id, avaliador_id)
+
+    def preencher(self) -> List[int]:
+        """Completa os pares em rodízio; retorna quem não pôde ser completado"""
+        # Menos carregados primeiro, para equilibrar quem já foi escolhido
+        ordem = sorted(self.participantes, key=lambda id_: (self.cargas[id_], id_))
+        por_equipe: Dict[int, Deque[int]] = defaultdict(deque)
+        por_departamento: Dict[str, Deque[int]] = defaultdict(deque)
+        for id_ in ordem:
+            participante = self.participantes[id_]
+            if participante.gestor_id is not None:
+                por_equipe[participante.gestor_id].append(id_)
+            if participante.departamento is not None:
+                por_departamento[participante.departamento].append(id_)
+        todos = deque(ordem)
+
+        faltando = []
+        for avaliado_id in sorted(self.participantes):
+            avaliado = self.participantes[avaliado_id]
+            filas = [
+                por_equipe.get(avaliado.gestor_id),
+                por_departamento.get(avaliado.departamento),
+                todos,
+            ]
+            while len(self.pares[avaliado_id]) < self.pares_por_colaborador:
+                avaliador_id = None
+                for fila in filas:
+                    if fila:
+                        avaliador_id = self._proximo(fila, avaliado_id)
+                        if avaliador_id is not None:
+                            break
+                if avaliador_id is None:
+                    faltando.append(avaliado_id)
+                    break
+                self.atribuir(avaliado_id, avaliador_id)
+        return faltando
+
+    def _proximo(self, fila: Deque[int], avaliado_id: int) -> Optional[int]:
+        """Próximo avaliador da fila com capacidade e válido para o avaliado"""
+        for _ in range(len(fila)):
+            candidato = fila[0]
+            if self.cargas[candidato] >= self.carga_max:
+                fila.popleft()
+                continue
+            # Rodízio: o escolhido (ou o inválido para este avaliado) vai para o fim
+            fila.rotate(-1)
+            if candidato not in self.pares[avaliado_id] and not self.restrito(
+                avaliado_id, candidato
+            ):
+                return candidato
+        return None
+
+    def reparar(self, faltando: List[int]) -> List[int]:
+        """Completa por trocas quem ficou sem avaliadores válidos disponíveis"""
+        incompletos = []
+        for avaliado_id in faltando:
+            while len(self.pares[avaliado_id]) < self.pares_por_colaborador:
+                if not self._trocar(avaliado_id):
+                    incompletos.append(avaliado_id)
+                    break
+        return incompletos
+
+    def _trocar(self, avaliado_id: int) -> bool:
+        livres = [c for c, carga in self.cargas.items() if carga < self.carga_max]
+        for livre in livres:
+            for outro_id, pares_outro in self.pares.items():
+                if (
+                    outro_id == avaliado_id
+                    or livre in pares_outro
+                    or self.restrito(outro_id, livre)
+                ):
+                    continue
+                for par_id in pares_outro:
+                    if par_id not in self.pares[avaliado_id] and not self.restrito(
+                        avaliado_id, par_id
+                    ):
+                        pares_outro[pares_outro.index(par_id)] = livre
+                        self.cargas[livre] += 1
+                        self.pares[avaliado_id].append(par_id)
+                        return True
+        return False
+
+
+def distribuir_pares(
+    participantes: Iterable[Participante],
+    selecoes: Dict[int, List[int]],
+    pares_por_colaborador: int = NUMERO_PARES_OBRIGATORIO,
+    carga_max: Optional[int] = None,
+) -> Distribuicao:
+    """
+    Define os pares de cada participante respeitando a carga máxima por avaliador
+
+    Args:
+        participantes: Colaboradores ativos do ciclo
+        selecoes: colaborador_id -> pares escolhidos por ele
+        pares_por_colaborador: Pares (avaliadores) de cada colaborador
+        carga_max: Avaliações de pares por avaliador (padrão: pares_por_colaborador)
+    """
+    carga_max = carga_max or pares_por_colaborador
+    distribuidor = _Distribuidor(participantes, pares_por_colaborador, carga_max)
+    distribuidor.manter_escolhas(selecoes)
+    incompletos = distribuidor.reparar(distribuidor.preencher())
+
+    escolhas_mantidas = sum(
+        len(set(pares) & set(selecoes.get(id_, ())))
+        for id_, pares in distribuidor.pares.items()
+    )
+    return Distribuicao(
+        pares=distribuidor.pares,
+        cargas=distribuidor.cargas,
+        escolhas_mantidas=escolhas_mantidas,
+        incompletos=incompletos,
+        escolhas_restritas=distribuidor.escolhas_restritas,
+    )
+
+
+def _histograma(cargas: Iterable[int]) -> Dict[int, int]:
+    return dict(sorted(Counter(cargas).items()))
+
+
+class DistribuicaoParesService(BaseService[CicloAvaliacao]):
+    def __init__(self, db: Session):
+        super().__init__(db)
+        self.repository = CicloAvaliacaoRepository(db)
+        self.ciclo_repository = CicloRepository(db)
+        self.colaborador_repository = ColaboradorRepository(db)
+
+    def distribuir(
+        self,
+        ciclo_id: int,
+        request: DistribuicaoParesRequest,
+        current_colaborador: Colaborador,
+    ) -> Dict[str, Any]:
+        """Propõe (ou aplica) a distribuição de pares do ciclo"""
+        if not current_colaborador.is_admin:
+            raise ForbiddenException("Apenas administradores podem distribuir pares")
+
+        ciclo = self.ciclo_repository.get_estado(ciclo_id)
+        if not ciclo:
+            raise NotFoundException("Ciclo", ciclo_id)
+        if ciclo.etapa_atual not in ETAPAS_DISTRIBUICAO:
+            raise BusinessRuleException(
+                "Os pares só podem ser distribuídos nas etapas de escolha e de aprovação de pares"
+            )
+
+        participantes = [
+            Participante(
+                id=no.id, departamento=no.departamento, gestor_id=no.gestor_id
+            )
+            for no in self.colaborador_repository.get_nos_hierarquia()
+        ]
+        if len(participantes) <= NUMERO_PARES_OBRIGATORIO:
+            raise BusinessRuleException(
+                f"São necessários mais de {NUMERO_PARES_OBRIGATORIO} colaboradores ativos para distribuir pares"
+            )
+
+        registros = self.repository.get_selecoes_por_ciclo(ciclo_id)
+        selecoes = {c: pares for c, (_, pares) in registros.items()}
+        carga_max = request.carga_max or NUMERO_PARES_OBRIGATORIO
+
+        distribuicao = distribuir_pares(
+            participantes, selecoes, NUMERO_PARES_OBRIGATORIO, carga_max
+        )
+        alterados = {
+            colaborador_id: pares
+            for colaborador_id, pares in distribuicao.pares.items()
+            if pares and sorted(pares) != sorted(selecoes.get(colaborador_id, []))
+        }
+
+        if request.aplicar:
+            existentes = {c: registro[0] for c, registro in registros.items()}
+            try:
+                self.repository.substituir_pares_em_lote(
+                    ciclo_id, alterados, existentes
+                )
+            except SQLAlchemyError:
+                self._handle_database_error("aplicar distribuição de pares")
+
+        restritas = sum(len(p) for p in distribuicao.escolhas_restritas.values())
+        logger.info(
+            f"Distribuição de pares do ciclo {ciclo_id}. Aplicada: {request.aplicar}, "
+            f"Colaboradores: {len(participantes)}, Alterados: {len(alterados)}, "
+            f"Incompletos: {len(distribuicao.incompletos)}, "
+            f"Escolhas restritas: {restritas}"
+        )
+
+        ativos = set(distribuicao.cargas)
+        cargas_anteriores = Counter(
+            par_id
+            for colaborador_id, pares in selecoes.items()
+            if colaborador_id in ativos
+            for par_id in pares
+            if par_id in ativos
+        )
+        return {
+            "ciclo_id": ciclo_id,
+            "aplicada": request.aplicar,
+            "carga_max": carga_max,
+            "total_colaboradores": len(participantes),
+            "escolhas_mantidas": distribuicao.escolhas_mantidas,
+            "pares_atribuidos": sum(len(p) for p in distribuicao.pares.values())
+            - distribuicao.escolhas_mantidas,
+            "cargas_anteriores": _histograma(
+                cargas_anteriores.get(id_, 0) for id_ in ativos
+            ),
+            "cargas": _histograma(distribuicao.cargas.values()),
+            "incompletos": distribuicao.incompletos,
+            "escolhas_restritas": dict(sorted(distribuicao.escolhas_restritas.items())),
+            "alteracoes": [
+                {
+                    "colaborador_id": colaborador_id,
+                    "pares_ids_anteriores": selecoes.get(colaborador_id, []),
+                    "pares_ids": pares,
+                }
+                for colaborador_id, pares in sorted(alterados.items())
+            ],
+        }
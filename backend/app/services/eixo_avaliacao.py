@@ -1,18 +1,23 @@
-from typing import List
+from typing import Tuple
 
+from app.core.dados_referencia import EixoReferencia, registro_referencia
+from app.core.exceptions import NotFoundException
 from app.models.eixo_avaliacao import EixoAvaliacao
-from app.repositories.eixo_avaliacao import EixoAvaliacaoRepository
 from app.services.base import BaseService
-from sqlalchemy.orm import Session
 
 
 class EixoAvaliacaoService(BaseService[EixoAvaliacao]):
-    def __init__(self, db: Session):
-        super().__init__(db)
-        self.repository = EixoAvaliacaoRepository(db)
+    """Eixos de avaliação lidos do registro de dados de referência"""
 
-    def get_all(self) -> List[EixoAvaliacao]:
-        return self.repository.get_all()
+    def get_versao(self) -> str:
+        """Assinatura dos dados de referência (ETag)"""
+        return registro_referencia.obter(self.db).assinatura
 
-    def get(self, eixo_id: int) -> EixoAvaliacao:
-        return self.repository.get(eixo_id)
+    def get_all(self) -> Tuple[EixoReferencia, ...]:
+        return registro_referencia.obter(self.db).eixos
+
+    def get(self, eixo_id: int) -> EixoReferencia:
+        eixo = registro_referencia.obter(self.db).eixos_por_id.get(eixo_id)
+        if eixo is None:
+            raise NotFoundException("Eixo de avaliação", eixo_id)
+        return eixo
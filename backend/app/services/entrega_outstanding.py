@@ -1,15 +1,26 @@
 from datetime import datetime
-from typing import List
+from typing import Any, Dict, List, Optional
 
 from app.core.exceptions import NotFoundException, UnauthorizedActionException
+from app.core.pagination import Pagina, PaginacaoParams
+from app.core.periodo import PeriodoParams
 from app.models.colaborador import Colaborador
 from app.models.entrega_outstanding import EntregaOutstanding, StatusAprovacao
+from app.repositories.ciclo import CicloRepository
 from app.repositories.entrega_outstanding import EntregaOutstandingRepository
+from app.schemas.aprovacao import AprovacaoLoteResponse
 from app.schemas.entrega_outstanding import (
+    CAMPOS_ENTREGA_OUTSTANDING_RESPONSE,
     EntregaOutstandingCreate,
     EntregaOutstandingUpdate,
 )
+from app.services.aprovacao import (
+    RELACIONAMENTOS_APROVACAO,
+    alterar_status_aprovacao_em_lote,
+    montar_pendentes,
+)
 from app.services.base import BaseService
+from app.services.periodo import resolver_janela
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
@@ -18,6 +29,7 @@ class EntregaOutstandingService(BaseService[EntregaOutstanding]):
     def __init__(self, db: Session):
         super().__init__(db)
         self.repository = EntregaOutstandingRepository(db)
+        self.ciclo_repository = CicloRepository(db)
 
     def create(
         self, entrega_data: EntregaOutstandingCreate, current_colaborador: Colaborador
@@ -48,14 +60,25 @@ class EntregaOutstandingService(BaseService[EntregaOutstanding]):
             self._handle_database_error("atualizar entrega outstanding")
 
     def get_by_colaborador(
-        self, current_colaborador: Colaborador
-    ) -> List[EntregaOutstanding]:
-        # Filtra corretamente usando kwargs, compatível com BaseRepository.get_all
-        return self.repository.get_all(colaborador_id=current_colaborador.id)
+        self,
+        current_colaborador: Colaborador,
+        paginacao: Optional[PaginacaoParams] = None,
+        periodo: Optional[PeriodoParams] = None,
+    ) -> Pagina[EntregaOutstanding]:
+        return self.get_by_colaborador_id(current_colaborador.id, paginacao, periodo)
 
-    def get_by_colaborador_id(self, colaborador_id: int) -> List[EntregaOutstanding]:
-        """Retorna entregas de um colaborador específico (usado por admin)"""
-        return self.repository.get_all(colaborador_id=colaborador_id)
+    def get_by_colaborador_id(
+        self,
+        colaborador_id: int,
+        paginacao: Optional[PaginacaoParams] = None,
+        periodo: Optional[PeriodoParams] = None,
+    ) -> Pagina[EntregaOutstanding]:
+        """Retorna entregas de um colaborador específico no período (padrão: ciclo aberto)"""
+        return self.repository.paginate_by_colaborador(
+            colaborador_id,
+            paginacao,
+            janela=resolver_janela(self.ciclo_repository, periodo),
+        )
 
     def get_by_id(
         self, entrega_id: int, current_colaborador: Colaborador
@@ -86,9 +109,37 @@ class EntregaOutstandingService(BaseService[EntregaOutstanding]):
 
         return entrega
 
-    def get_all_pendentes(self) -> List[EntregaOutstanding]:
-        """Retorna todas as entregas outstanding pendentes de aprovação"""
-        return self.repository.get_all(status_aprovacao=StatusAprovacao.PENDENTE.value)
+    def get_all_pendentes(
+        self,
+        paginacao: Optional[PaginacaoParams] = None,
+        periodo: Optional[PeriodoParams] = None,
+    ) -> Pagina[EntregaOutstanding]:
+        """Retorna as entregas outstanding pendentes de aprovação no período (padrão: todos)"""
+        return self.repository.paginate_pendentes(
+            paginacao,
+            janela=resolver_janela(
+                self.ciclo_repository, periodo, padrao_ciclo_aberto=False
+            ),
+        )
+
+    def get_all_pendentes_linhas(
+        self,
+        paginacao: Optional[PaginacaoParams] = None,
+        periodo: Optional[PeriodoParams] = None,
+    ) -> Pagina[Dict[str, Any]]:
+        """Mesmo que get_all_pendentes, já no formato de EntregaOutstandingResponse (Core)"""
+        pagina = self.repository.paginate_pendentes_linhas(
+            [
+                campo
+                for campo in CAMPOS_ENTREGA_OUTSTANDING_RESPONSE
+                if campo not in RELACIONAMENTOS_APROVACAO
+            ],
+            paginacao,
+            janela=resolver_janela(
+                self.ciclo_repository, periodo, padrao_ciclo_aberto=False
+            ),
+        )
+        return montar_pendentes(self.db, pagina, CAMPOS_ENTREGA_OUTSTANDING_RESPONSE)
 
     def aprovar(
         self, entrega_id: int, admin_colaborador: Colaborador, observacao: str = None
@@ -148,3 +199,45 @@ class EntregaOutstandingService(BaseService[EntregaOutstanding]):
             return entrega
         except SQLAlchemyError:
             self._handle_database_error("reprovar entrega outstanding")
+
+    def aprovar_em_lote(
+        self,
+        ids: List[int],
+        admin_colaborador: Colaborador,
+        observacao: Optional[str] = None,
+    ) -> AprovacaoLoteResponse:
+        """Aprova de uma vez as entregas pendentes entre os IDs informados"""
+        if not admin_colaborador.is_admin:
+            raise UnauthorizedActionException()
+
+        try:
+            return alterar_status_aprovacao_em_lote(
+                self.repository,
+                ids,
+                StatusAprovacao.APROVADO,
+                admin_colaborador.id,
+                observacao,
+            )
+        except SQLAlchemyError:
+            self._handle_database_error("aprovar entregas outstanding em lote")
+
+    def reprovar_em_lote(
+        self, ids: List[int], admin_colaborador: Colaborador, observacao: str
+    ) -> AprovacaoLoteResponse:
+        """Reprova de uma vez as entregas pendentes entre os IDs informados"""
+        if not admin_colaborador.is_admin:
+            raise UnauthorizedActionException()
+
+        if not observacao or not observacao.strip():
+            raise ValueError("Observação é obrigatória para reprovar entregas")
+
+        try:
+            return alterar_status_aprovacao_em_lote(
+                self.repository,
+                ids,
+                StatusAprovacao.REPROVADO,
+                admin_colaborador.id,
+                observacao,
+            )
+        except SQLAlchemyError:
+            self._handle_database_error("reprovar entregas outstanding em lote")
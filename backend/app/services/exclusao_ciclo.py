@@ -0,0 +1,229 @@
+"""
+Execução dos jobs de exclusão de ciclos.
+
+Um ciclo concentra dezenas de milhares de avaliações, pares e liberações de
+feedback. Em vez de removê-lo em uma única transação (travando as tabelas ou
+falhando nas FKs), o DELETE /ciclos/{id} cria um job em `exclusoes_ciclo` e
+os dependentes são removidos aqui em lotes de EXCLUSAO_CICLO_LOTE registros,
+cada lote em sua própria transação, dos netos para os filhos. O ciclo é
+removido por último.
+
+Como cada lote só remove o que ainda existe, o job pode ser retomado a
+qualquer momento: os jobs não concluídos são retomados na inicialização da
+aplicação. Dois processos executando o mesmo job apenas dividem o trabalho.
+"""
+
+import logging
+import threading
+from datetime import datetime, timezone
+from typing import Callable, List, Set, Tuple
+
+from app.core.config import settings
+from app.core.estado_ciclos import estado_ciclos
+from app.database import SessionLocal
+from app.models.avaliacao import Avaliacao, AvaliacaoEixo
+from app.models.avaliacao_gestor import AvaliacaoGestor, AvaliacaoGestorResposta
+from app.models.ciclo import Ciclo
+from app.models.ciclo_avaliacao import CicloAvaliacao, ParSelecionado
+from app.models.exclusao_ciclo import ExclusaoCiclo, StatusExclusaoCiclo
+from app.models.feedback_liberacao import FeedbackLiberacao
+from app.models.rascunho import Rascunho
+from app.repositories.base import BaseRepository
+from app.repositories.exclusao_ciclo import ExclusaoCicloRepository
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import or_, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# (tabela, modelo, critério dos registros do ciclo) na ordem de remoção
+ETAPAS_EXCLUSAO: List[Tuple[str, type, Callable[[int], object]]] = [
+    (
+        "avaliacoes_eixos",
+        AvaliacaoEixo,
+        lambda ciclo_id: AvaliacaoEixo.avaliacao_id.in_(
+            select(Avaliacao.id).where(Avaliacao.ciclo_id == ciclo_id)
+        ),
+    ),
+    ("avaliacoes", Avaliacao, lambda ciclo_id: Avaliacao.ciclo_id == ciclo_id),
+    (
+        "avaliacoes_gestor_respostas",
+        AvaliacaoGestorResposta,
+        lambda ciclo_id: AvaliacaoGestorResposta.avaliacao_id.in_(
+            select(AvaliacaoGestor.id).where(AvaliacaoGestor.ciclo_id == ciclo_id)
+        ),
+    ),
+    (
+        "avaliacoes_gestor",
+        AvaliacaoGestor,
+        lambda ciclo_id: AvaliacaoGestor.ciclo_id == ciclo_id,
+    ),
+    (
+        "pares_selecionados",
+        ParSelecionado,
+        lambda ciclo_id: ParSelecionado.ciclo_avaliacao_id.in_(
+            select(CicloAvaliacao.id).where(CicloAvaliacao.ciclo_id == ciclo_id)
+        ),
+    ),
+    (
+        "ciclos_avaliacao",
+        CicloAvaliacao,
+        lambda ciclo_id: CicloAvaliacao.ciclo_id == ciclo_id,
+    ),
+    (
+        "feedback_liberacao",
+        FeedbackLiberacao,
+        lambda ciclo_id: FeedbackLiberacao.ciclo_id == ciclo_id,
+    ),
+    # Rascunhos dos formulários do ciclo (chaves "<formulario>:ciclo-<id>[:...]")
+    (
+        "rascunhos",
+        Rascunho,
+        lambda ciclo_id: or_(
+            Rascunho.chave.like(f"%:ciclo-{ciclo_id}"),
+            Rascunho.chave.like(f"%:ciclo-{ciclo_id}:%"),
+        ),
+    ),
+]
+
+# Jobs em execução neste processo
+_em_execucao: Set[int] = set()
+_em_execucao_lock = threading.Lock()
+
+
+def contar_registros_ciclo(db: Session, ciclo_id: int) -> int:
+    """Conta os registros dependentes de um ciclo que serão removidos"""
+    return sum(
+        db.query(modelo).filter(criterio(ciclo_id)).count()
+        for _, modelo, criterio in ETAPAS_EXCLUSAO
+    )
+
+
+def executar_exclusao_ciclo(exclusao_id: int) -> None:
+    """Executa (ou retoma) um job de exclusão de ciclo"""
+    with _em_execucao_lock:
+        if exclusao_id in _em_execucao:
+            return
+        _em_execucao.add(exclusao_id)
+
+    try:
+        _executar(exclusao_id, settings.EXCLUSAO_CICLO_LOTE)
+    finally:
+        with _em_execucao_lock:
+            _em_execucao.discard(exclusao_id)
+
+
+def _executar(exclusao_id: int, lote: int) -> None:
+    db = SessionLocal()
+    try:
+        repository = ExclusaoCicloRepository(db)
+        exclusao = repository.get(exclusao_id)
+        if not exclusao or exclusao.status not in (
+            StatusExclusaoCiclo.PENDENTE,
+            StatusExclusaoCiclo.EM_ANDAMENTO,
+        ):
+            return
+
+        ciclo_id = exclusao.ciclo_id
+        if exclusao.status == StatusExclusaoCiclo.PENDENTE:
+            exclusao.total_registros = contar_registros_ciclo(db, ciclo_id)
+            exclusao.status = StatusExclusaoCiclo.EM_ANDAMENTO
+            db.commit()
+
+        logger.info(
+            f"Executando exclusão do ciclo {ciclo_id}. Job: {exclusao_id}, Registros: {exclusao.total_registros}"
+        )
+
+        # Repetir até uma passagem não remover nada: registros gravados no ciclo
+        # durante a exclusão também são removidos antes do próprio ciclo
+        while _remover_dependentes(db, repository, exclusao_id, ciclo_id, lote):
+            pass
+
+        repository.update_in_bulk([exclusao_id], {"etapa": "ciclos"})
+        BaseRepository(Ciclo, db).delete_batch(Ciclo.id == ciclo_id, limit=1)
+        estado_ciclos.invalidar_ao_confirmar(db)
+        repository.update_in_bulk(
+            [exclusao_id],
+            {
+                "status": StatusExclusaoCiclo.CONCLUIDA,
+                "etapa": None,
+                "concluido_em": datetime.now(timezone.utc),
+            },
+        )
+        db.commit()
+
+        logger.info(f"Ciclo {ciclo_id} excluído. Job: {exclusao_id}")
+
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.error(f"Erro na exclusão do ciclo. Job: {exclusao_id}, Erro: {str(e)}")
+        try:
+            ExclusaoCicloRepository(db).update_in_bulk(
+                [exclusao_id],
+                {"status": StatusExclusaoCiclo.FALHOU, "erro": str(e)[:2000]},
+            )
+            db.commit()
+        except SQLAlchemyError:
+            db.rollback()
+    finally:
+        db.close()
+
+
+def _remover_dependentes(
+    db: Session,
+    repository: ExclusaoCicloRepository,
+    exclusao_id: int,
+    ciclo_id: int,
+    lote: int,
+) -> int:
+    """Remove em lotes os dependentes do ciclo e retorna o total removido na passagem"""
+    total = 0
+    for etapa, modelo, criterio in ETAPAS_EXCLUSAO:
+        tabela = BaseRepository(modelo, db)
+        while True:
+            removidos = tabela.delete_batch(criterio(ciclo_id), limit=lote)
+            if not removidos:
+                break
+            # Incremento no banco: outro processo pode estar no mesmo job
+            repository.update_in_bulk(
+                [exclusao_id],
+                {
+                    "etapa": etapa,
+                    "registros_removidos": ExclusaoCiclo.registros_removidos
+                    + removidos,
+                },
+            )
+            db.commit()
+            total += removidos
+            logger.debug(
+                f"Exclusão do ciclo {ciclo_id}: {removidos} registro(s) removido(s) de {etapa}"
+            )
+    return total
+
+
+def retomar_exclusoes_pendentes() -> int:
+    """Retoma os jobs de exclusão interrompidos (ex: reinício da aplicação)"""
+    db = SessionLocal()
+    try:
+        pendentes = [
+            exclusao.id for exclusao in ExclusaoCicloRepository(db).get_pendentes()
+        ]
+    except SQLAlchemyError as e:
+        logger.error(f"Erro ao buscar exclusões de ciclo pendentes: {str(e)}")
+        return 0
+    finally:
+        db.close()
+
+    for exclusao_id in pendentes:
+        logger.info(f"Retomando exclusão de ciclo. Job: {exclusao_id}")
+        executar_exclusao_ciclo(exclusao_id)
+    return len(pendentes)
+
+
+async def retomar_exclusoes_pendentes_em_segundo_plano() -> None:
+    """Retoma as exclusões pendentes sem bloquear a inicialização da aplicação"""
+    try:
+        await run_in_threadpool(retomar_exclusoes_pendentes)
+    except Exception as e:
+        logger.error(f"Erro ao retomar exclusões de ciclo: {str(e)}")
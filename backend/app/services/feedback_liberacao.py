@@ -1,5 +1,5 @@
 import logging
-from typing import List
+from typing import List, Tuple
 
 from app.core.exceptions import (
     BusinessRuleException,
@@ -13,6 +13,8 @@ from app.repositories import CicloRepository, ColaboradorRepository
 from app.repositories.feedback_liberacao import FeedbackLiberacaoRepository
 from app.schemas.feedback_liberacao import (
     FeedbackLiberacaoListResponse,
+    FeedbackLiberacaoLoteRequest,
+    FeedbackLiberacaoLoteResponse,
     FeedbackLiberacaoResponse,
 )
 from app.services.base import BaseService
@@ -47,7 +49,7 @@ class FeedbackLiberacaoService(BaseService[FeedbackLiberacao]):
                 )
 
             # Validar que o ciclo existe
-            ciclo = self.ciclo_repository.get(ciclo_id)
+            ciclo = self.ciclo_repository.get_estado(ciclo_id)
             if not ciclo:
                 raise NotFoundException("Ciclo", ciclo_id)
 
@@ -101,7 +103,7 @@ class FeedbackLiberacaoService(BaseService[FeedbackLiberacao]):
                 )
 
             # Validar que o ciclo existe
-            ciclo = self.ciclo_repository.get(ciclo_id)
+            ciclo = self.ciclo_repository.get_estado(ciclo_id)
             if not ciclo:
                 raise NotFoundException("Ciclo", ciclo_id)
 
@@ -136,6 +138,149 @@ class FeedbackLiberacaoService(BaseService[FeedbackLiberacao]):
         except SQLAlchemyError:
             self._handle_database_error("revogar feedback")
 
+    def liberar_em_lote(
+        self,
+        ciclo_id: int,
+        request: FeedbackLiberacaoLoteRequest,
+        current_colaborador: Colaborador,
+    ) -> FeedbackLiberacaoLoteResponse:
+        """
+        Libera o feedback de um conjunto de colaboradores em um ciclo.
+        Os já liberados são mantidos; os demais são gravados em um único upsert.
+        """
+        try:
+            if not current_colaborador.is_admin:
+                logger.warning(
+                    f"Tentativa de liberar feedback em lote sem permissão. Colaborador ID: {current_colaborador.id}"
+                )
+                raise ForbiddenException(
+                    "Apenas administradores podem liberar feedbacks"
+                )
+
+            ciclo = self.ciclo_repository.get_estado(ciclo_id)
+            if not ciclo:
+                raise NotFoundException("Ciclo", ciclo_id)
+
+            if ciclo.etapa_atual != EtapaCiclo.FEEDBACK:
+                raise BusinessRuleException(
+                    "Só é possível liberar feedback durante a etapa de feedback"
+                )
+
+            alvo_ids, nao_encontrados = self._resolver_alvo(request)
+            ja_liberados = self.repository.get_colaboradores_liberados_ids(
+                ciclo_id, alvo_ids
+            )
+            a_liberar = [id_ for id_ in alvo_ids if id_ not in ja_liberados]
+
+            logger.info(
+                f"Liberando feedback em lote. Ciclo: {ciclo_id}, Alvo: {len(alvo_ids)}, A liberar: {len(a_liberar)}, Liberado por: {current_colaborador.id}"
+            )
+
+            if a_liberar:
+                self.repository.liberar_feedback_em_lote(
+                    ciclo_id=ciclo_id,
+                    colaboradores_ids=a_liberar,
+                    liberado_por_id=current_colaborador.id,
+                )
+                self.db.commit()
+
+            return FeedbackLiberacaoLoteResponse(
+                ciclo_id=ciclo_id,
+                total_alvo=len(alvo_ids),
+                alterados=len(a_liberar),
+                sem_alteracao=len(alvo_ids) - len(a_liberar),
+                nao_encontrados=nao_encontrados,
+            )
+
+        except SQLAlchemyError:
+            self._handle_database_error("liberar feedback em lote")
+
+    def revogar_em_lote(
+        self,
+        ciclo_id: int,
+        request: FeedbackLiberacaoLoteRequest,
+        current_colaborador: Colaborador,
+    ) -> FeedbackLiberacaoLoteResponse:
+        """Revoga o feedback de um conjunto de colaboradores em um ciclo"""
+        try:
+            if not current_colaborador.is_admin:
+                logger.warning(
+                    f"Tentativa de revogar feedback em lote sem permissão. Colaborador ID: {current_colaborador.id}"
+                )
+                raise ForbiddenException(
+                    "Apenas administradores podem revogar feedbacks"
+                )
+
+            ciclo = self.ciclo_repository.get_estado(ciclo_id)
+            if not ciclo:
+                raise NotFoundException("Ciclo", ciclo_id)
+
+            alvo_ids, nao_encontrados = self._resolver_alvo(request)
+
+            logger.info(
+                f"Revogando feedback em lote. Ciclo: {ciclo_id}, Alvo: {len(alvo_ids)}"
+            )
+
+            revogados = 0
+            if alvo_ids:
+                revogados = self.repository.revogar_feedback_em_lote(
+                    ciclo_id, alvo_ids
+                )
+                self.db.commit()
+
+            return FeedbackLiberacaoLoteResponse(
+                ciclo_id=ciclo_id,
+                total_alvo=len(alvo_ids),
+                alterados=revogados,
+                sem_alteracao=len(alvo_ids) - revogados,
+                nao_encontrados=nao_encontrados,
+            )
+
+        except SQLAlchemyError:
+            self._handle_database_error("revogar feedback em lote")
+
+    def _resolver_alvo(
+        self, request: FeedbackLiberacaoLoteRequest
+    ) -> Tuple[List[int], List[int]]:
+        """
+        Resolve o alvo do lote em IDs de colaboradores ativos
+
+        Returns:
+            (IDs do alvo, IDs explícitos não encontrados)
+        """
+        if request.colaboradores_ids is not None:
+            encontrados = set(
+                self.colaborador_repository.get_ids_ativos(
+                    ids=request.colaboradores_ids
+                )
+            )
+            alvo_ids = [
+                id_ for id_ in request.colaboradores_ids if id_ in encontrados
+            ]
+            nao_encontrados = [
+                id_ for id_ in request.colaboradores_ids if id_ not in encontrados
+            ]
+            return alvo_ids, nao_encontrados
+
+        if request.departamento is not None:
+            return (
+                self.colaborador_repository.get_ids_ativos(
+                    departamento=request.departamento
+                ),
+                [],
+            )
+
+        gestor = self.colaborador_repository.get(request.gestor_id)
+        if not gestor:
+            raise NotFoundException("Gestor", request.gestor_id)
+
+        return (
+            self.colaborador_repository.get_ids_ativos(
+                subordinados_de=request.gestor_id
+            ),
+            [],
+        )
+
     def get_by_ciclo(
         self, ciclo_id: int, current_colaborador: Colaborador
     ) -> FeedbackLiberacaoListResponse:
@@ -150,7 +295,7 @@ class FeedbackLiberacaoService(BaseService[FeedbackLiberacao]):
             )
 
         # Validar que o ciclo existe
-        ciclo = self.ciclo_repository.get(ciclo_id)
+        ciclo = self.ciclo_repository.get_estado(ciclo_id)
         if not ciclo:
             raise NotFoundException("Ciclo", ciclo_id)
 
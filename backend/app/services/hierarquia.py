@@ -0,0 +1,235 @@
+"""
+Hierarquia de colaboradores (organograma).
+
+A árvore completa é montada a partir de um índice de adjacência em memória,
+construído com uma única consulta e reaproveitado entre requisições. Antes de
+usar o índice, uma consulta leve (quantidade de colaboradores e última
+atualização) confirma que ele ainda corresponde ao banco; criar ou alterar um
+colaborador também invalida o índice do processo na hora.
+
+Subárvore de um gestor e cadeia de gestores de um colaborador, usadas nas
+verificações de permissão e nos filtros por equipe, vêm da tabela de
+fechamento `colaboradores_hierarquia` (um registro por par gestor/colaborador
+em qualquer nível). O ColaboradorService a mantém na mesma transação em que
+gestor_id muda; reconstruir_fechamento a recalcula do zero a partir de
+gestor_id e verificar_fechamento aponta as divergências.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from app.core.exceptions import ForbiddenException, NotFoundException
+from app.models.colaborador import Colaborador
+from app.repositories.colaborador import ColaboradorRepository
+from app.repositories.colaborador_hierarquia import ColaboradorHierarquiaRepository
+from app.services.base import BaseService
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# Divergências listadas na verificação da tabela de fechamento (o total vai sempre)
+HIERARQUIA_DIVERGENCIAS_MAX = 100
+
+
+@dataclass(frozen=True)
+class ArvoreHierarquia:
+    """Organograma montado a partir do índice de adjacência"""
+
+    raizes: List[Dict[str, Any]]  # Nós sem gestor ativo, com os filhos aninhados
+    nos: Dict[int, Dict[str, Any]]  # id -> nó (o mesmo objeto aninhado na árvore)
+
+
+def montar_arvore(linhas: List[Any]) -> ArvoreHierarquia:
+    """
+    Monta a árvore a partir das linhas (id, nome, ..., gestor_id)
+
+    Colaboradores cujo gestor não está entre as linhas (sem gestor ou gestor
+    inativo) viram raízes. Um ciclo em gestor_id é cortado no primeiro
+    colaborador do ciclo, que também vira raiz.
+    """
+    nos: Dict[int, Dict[str, Any]] = {}
+    filhos: Dict[int, List[int]] = {}
+    for linha in linhas:
+        no = dict(linha._mapping)
+        no["filhos"] = []
+        nos[no["id"]] = no
+    for no in nos.values():
+        if no["gestor_id"] in nos:
+            filhos.setdefault(no["gestor_id"], []).append(no["id"])
+
+    raizes: List[Dict[str, Any]] = []
+    visitados = set()
+
+    def percorrer(raiz_id: int) -> None:
+        visitados.add(raiz_id)
+        pilha = [raiz_id]
+        while pilha:
+            atual = nos[pilha.pop()]
+            for filho_id in filhos.get(atual["id"], []):
+                if filho_id not in visitados:
+                    visitados.add(filho_id)
+                    atual["filhos"].append(nos[filho_id])
+                    pilha.append(filho_id)
+
+    for no in nos.values():
+        if no["gestor_id"] not in nos:
+            raizes.append(no)
+            percorrer(no["id"])
+
+    # Nós alcançáveis apenas por um ciclo
+    for no_id, no in nos.items():
+        if no_id not in visitados:
+            logger.warning(f"Ciclo na hierarquia de colaboradores. Colaborador: {no_id}")
+            raizes.append(no)
+            percorrer(no_id)
+
+    return ArvoreHierarquia(raizes=raizes, nos=nos)
+
+
+def calcular_fechamento(
+    arestas: Iterable[Tuple[int, Optional[int]]],
+) -> Set[Tuple[int, int, int]]:
+    """
+    Calcula a tabela de fechamento a partir dos pares (id, gestor_id)
+
+    Cada colaborador sobe a própria cadeia de gestores. Em um ciclo em
+    gestor_id a subida para ao encontrar alguém já visitado nessa cadeia.
+
+    Returns:
+        Registros (ancestral, descendente, profundidade), incluindo (id, id, 0)
+    """
+    gestores = dict(arestas)
+    registros: Set[Tuple[int, int, int]] = set()
+    for colaborador_id in gestores:
+        atual: Optional[int] = colaborador_id
+        profundidade = 0
+        vistos = set()
+        while atual is not None and atual in gestores and atual not in vistos:
+            vistos.add(atual)
+            registros.add((atual, colaborador_id, profundidade))
+            atual = gestores[atual]
+            profundidade += 1
+    return registros
+
+
+class IndiceHierarquia:
+    """Cache por processo do organograma, validado pela assinatura da tabela"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._assinatura: Optional[Tuple[int, Any]] = None
+        self._arvore: Optional[ArvoreHierarquia] = None
+
+    def obter(self, repository: ColaboradorRepository) -> ArvoreHierarquia:
+        """Retorna a árvore atual, reconstruindo o índice se o banco mudou"""
+        assinatura = repository.get_assinatura_hierarquia()
+        with self._lock:
+            if self._arvore is not None and self._assinatura == assinatura:
+                return self._arvore
+
+        arvore = montar_arvore(repository.get_nos_hierarquia())
+        with self._lock:
+            self._arvore = arvore
+            self._assinatura = assinatura
+        logger.debug(f"Índice da hierarquia reconstruído. Colaboradores: {len(arvore.nos)}")
+        return arvore
+
+    def invalidar(self) -> None:
+        """Descarta o índice (ex: colaborador criado ou alterado)"""
+        with self._lock:
+            self._arvore = None
+            self._assinatura = None
+
+
+indice_hierarquia = IndiceHierarquia()
+
+
+def _contar(raizes: List[Dict[str, Any]]) -> int:
+    total = 0
+    pilha = list(raizes)
+    while pilha:
+        no = pilha.pop()
+        total += 1
+        pilha.extend(no["filhos"])
+    return total
+
+
+class HierarquiaService(BaseService[Colaborador]):
+    def __init__(self, db: Session, indice: IndiceHierarquia = indice_hierarquia):
+        super().__init__(db)
+        self.repository = ColaboradorRepository(db)
+        self.fechamento_repository = ColaboradorHierarquiaRepository(db)
+        self.indice = indice
+
+    def get_organograma(self) -> Dict[str, Any]:
+        """Organograma completo dos colaboradores ativos"""
+        arvore = self.indice.obter(self.repository)
+        return {"raizes": arvore.raizes, "total": len(arvore.nos)}
+
+    def get_subarvore(self, colaborador_id: int) -> Dict[str, Any]:
+        """Organograma a partir de um colaborador (ele e todos abaixo dele)"""
+        arvore = self.indice.obter(self.repository)
+        no = arvore.nos.get(colaborador_id)
+        if no is None:
+            raise NotFoundException("Colaborador", colaborador_id)
+        return {"raizes": [no], "total": _contar([no])}
+
+    def get_cadeia_gestores(self, colaborador_id: int) -> List[Colaborador]:
+        """Gestores de um colaborador, do gestor direto até o topo"""
+        if not self.repository.get(colaborador_id):
+            raise NotFoundException("Colaborador", colaborador_id)
+
+        ids = self.fechamento_repository.get_ancestrais_ids(colaborador_id)
+        por_id = {c.id: c for c in self.repository.get_by_ids(ids)} if ids else {}
+        return [por_id[id_] for id_ in ids if id_ in por_id]
+
+    def is_subordinado(self, gestor_id: int, colaborador_id: int) -> bool:
+        """Verifica se o colaborador está abaixo do gestor em qualquer nível"""
+        return self.fechamento_repository.is_descendente(gestor_id, colaborador_id)
+
+    def verificar_fechamento(self, current_colaborador: Colaborador) -> Dict[str, Any]:
+        """
+        Compara a tabela de fechamento com a recalculada a partir de gestor_id
+
+        Returns:
+            Quantidade e exemplos dos registros que faltam e dos que sobram,
+            como (ancestral, descendente, profundidade)
+        """
+        self._validar_admin(current_colaborador)
+        esperados = calcular_fechamento(self.fechamento_repository.get_arestas())
+        atuais = self.fechamento_repository.get_registros()
+        faltando = sorted(esperados - atuais)
+        sobrando = sorted(atuais - esperados)
+        if faltando or sobrando:
+            logger.warning(
+                f"Tabela de fechamento da hierarquia divergente. Faltando: {len(faltando)}, Sobrando: {len(sobrando)}"
+            )
+        return {
+            "consistente": not faltando and not sobrando,
+            "total_registros": len(atuais),
+            "total_faltando": len(faltando),
+            "total_sobrando": len(sobrando),
+            "faltando": faltando[:HIERARQUIA_DIVERGENCIAS_MAX],
+            "sobrando": sobrando[:HIERARQUIA_DIVERGENCIAS_MAX],
+        }
+
+    def reconstruir_fechamento(self, current_colaborador: Colaborador) -> int:
+        """Recalcula toda a tabela de fechamento a partir de gestor_id"""
+        self._validar_admin(current_colaborador)
+        try:
+            registros = calcular_fechamento(self.fechamento_repository.get_arestas())
+            total = self.fechamento_repository.substituir(sorted(registros))
+            self.db.flush()
+        except SQLAlchemyError:
+            self._handle_database_error("reconstruir hierarquia")
+        logger.info(f"Tabela de fechamento da hierarquia reconstruída. Registros: {total}")
+        return total
+
+    def _validar_admin(self, current_colaborador: Colaborador) -> None:
+        if not current_colaborador.is_admin:
+            raise ForbiddenException(
+                "Apenas administradores podem manter a tabela de hierarquia"
+            )
@@ -0,0 +1,46 @@
+from typing import Optional
+
+from app.core.exceptions import NotFoundException
+from app.core.periodo import Janela, PeriodoParams
+from app.repositories.ciclo import CicloRepository
+
+
+def resolver_janela(
+    ciclo_repository: CicloRepository,
+    periodo: Optional[PeriodoParams],
+    padrao_ciclo_aberto: bool = True,
+) -> Optional[Janela]:
+    """
+    Converte os parâmetros de período na janela de created_at a filtrar
+
+    - desde/ate: usados como recebidos
+    - ciclo_id: de data_inicio até data_fim do ciclo (aberta se data_fim for nula)
+    - nenhum: a partir de data_inicio do ciclo aberto, sem limite final, para
+      incluir o que for criado enquanto o ciclo continuar aberto
+
+    Retorna None (sem filtro) com `todos=true`, se não houver ciclo aberto ou,
+    sem parâmetros, com padrao_ciclo_aberto=False (filas de pendentes, em que
+    itens antigos ainda aguardam aprovação).
+
+    Raises:
+        NotFoundException: Se ciclo_id não existir
+    """
+    if periodo is None:
+        return None
+
+    if periodo.ciclo_id is not None:
+        ciclo = ciclo_repository.get_estado(periodo.ciclo_id)
+        if not ciclo:
+            raise NotFoundException("Ciclo", periodo.ciclo_id)
+        return Janela(desde=ciclo.data_inicio, ate=ciclo.data_fim)
+
+    if periodo.explicito:
+        return Janela(desde=periodo.desde, ate=periodo.ate)
+
+    if periodo.todos or not padrao_ciclo_aberto:
+        return None
+
+    ciclo = ciclo_repository.get_estado_aberto()
+    if not ciclo or ciclo.data_inicio is None:
+        return None
+    return Janela(desde=ciclo.data_inicio)
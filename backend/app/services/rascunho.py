@@ -0,0 +1,270 @@
+"""
+Service de rascunhos de formulário.
+
+O autosave dos formulários de avaliação dispara vários salvamentos em
+sequência. Em vez de gravar cada um, o primeiro salvamento abre uma janela
+curta (RASCUNHO_JANELA_SEGUNDOS) e os seguintes apenas substituem o conteúdo
+pendente em memória. O conteúdo mais recente é gravado com um único upsert
+quando a janela fecha (descarga periódica) ou quando o cliente pede a
+gravação imediata, por exemplo ao enviar o formulário.
+
+O buffer é por processo: com vários workers, uma leitura atendida por outro
+processo pode ver o rascunho com até uma janela de atraso. Se a gravação
+falhar, o conteúdo volta para o buffer e é gravado na próxima descarga.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from app.core.config import settings
+from app.core.exceptions import NotFoundException
+from app.database import SessionLocal
+from app.models.colaborador import Colaborador
+from app.models.rascunho import Rascunho
+from app.repositories.rascunho import RascunhoRepository
+from app.schemas.rascunho import RascunhoResponse
+from app.services.base import BaseService
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+ChaveRascunho = Tuple[int, str]
+
+
+@dataclass
+class RascunhoPendente:
+    """Conteúdo de rascunho aguardando o fechamento da janela"""
+
+    conteudo: Dict[str, Any]
+    aberto_em: float  # time.monotonic() do primeiro salvamento da janela
+    atualizado_em: datetime
+
+
+class BufferRascunhos:
+    """Agrupa em memória os salvamentos de rascunho feitos dentro da janela"""
+
+    def __init__(self, janela_segundos: float):
+        self.janela_segundos = janela_segundos
+        self._pendentes: Dict[ChaveRascunho, RascunhoPendente] = {}
+        self._lock = threading.Lock()
+        # Chaves com gravação em andamento: uma gravação por chave de cada vez,
+        # para que um conteúdo antigo nunca seja gravado depois de um mais novo.
+        # Gravações de chaves diferentes não esperam umas pelas outras
+        self._gravando: Set[ChaveRascunho] = set()
+        self._gravacao_concluida = threading.Condition(self._lock)
+
+    def registrar(self, chave: ChaveRascunho, conteudo: Dict[str, Any]) -> bool:
+        """
+        Registra um salvamento no buffer
+
+        Returns:
+            True se a janela do rascunho já fechou e ele deve ser gravado
+        """
+        agora = time.monotonic()
+        with self._lock:
+            pendente = self._pendentes.get(chave)
+            if pendente is None:
+                pendente = RascunhoPendente(
+                    conteudo=conteudo,
+                    aberto_em=agora,
+                    atualizado_em=datetime.now(timezone.utc),
+                )
+                self._pendentes[chave] = pendente
+            else:
+                pendente.conteudo = conteudo
+                pendente.atualizado_em = datetime.now(timezone.utc)
+            return agora - pendente.aberto_em >= self.janela_segundos
+
+    def obter(self, chave: ChaveRascunho) -> Optional[RascunhoPendente]:
+        """Retorna o conteúdo pendente de uma chave, se houver"""
+        with self._lock:
+            return self._pendentes.get(chave)
+
+    @contextmanager
+    def gravacao(self, chave: ChaveRascunho) -> Iterator[Optional[RascunhoPendente]]:
+        """
+        Retira o conteúdo pendente de uma chave para gravá-lo
+
+        Espera apenas uma gravação em andamento da mesma chave. Se a gravação
+        falhar (exceção no bloco), o conteúdo volta para o buffer.
+        """
+        with self._gravacao_concluida:
+            self._gravacao_concluida.wait_for(lambda: chave not in self._gravando)
+            self._gravando.add(chave)
+            pendente = self._pendentes.pop(chave, None)
+        try:
+            yield pendente
+        except BaseException:
+            if pendente:
+                self.devolver([(chave, pendente)])
+            raise
+        finally:
+            self.concluir_gravacao([chave])
+
+    def retirar_expirados(
+        self, forcar: bool = False
+    ) -> List[Tuple[ChaveRascunho, RascunhoPendente]]:
+        """
+        Remove e retorna os rascunhos cuja janela fechou (ou todos, se forcar)
+
+        Chaves com gravação em andamento ficam para a próxima descarga. As
+        chaves retornadas ficam reservadas até concluir_gravacao.
+        """
+        limite = time.monotonic() - self.janela_segundos
+        with self._lock:
+            chaves = [
+                chave
+                for chave, pendente in self._pendentes.items()
+                if (forcar or pendente.aberto_em <= limite)
+                and chave not in self._gravando
+            ]
+            self._gravando.update(chaves)
+            return [(chave, self._pendentes.pop(chave)) for chave in chaves]
+
+    def concluir_gravacao(self, chaves: Iterable[ChaveRascunho]) -> None:
+        """Libera as chaves reservadas para gravação"""
+        with self._gravacao_concluida:
+            self._gravando.difference_update(chaves)
+            self._gravacao_concluida.notify_all()
+
+    def devolver(self, itens: List[Tuple[ChaveRascunho, RascunhoPendente]]) -> None:
+        """Devolve ao buffer itens cuja gravação falhou, sem sobrescrever conteúdo mais novo"""
+        with self._lock:
+            for chave, pendente in itens:
+                self._pendentes.setdefault(chave, pendente)
+
+
+buffer_rascunhos = BufferRascunhos(settings.RASCUNHO_JANELA_SEGUNDOS)
+
+
+class RascunhoService(BaseService[Rascunho]):
+    def __init__(self, db: Session, buffer: BufferRascunhos = buffer_rascunhos):
+        super().__init__(db)
+        self.repository = RascunhoRepository(db)
+        self.buffer = buffer
+
+    def get(self, chave: str, current_colaborador: Colaborador) -> RascunhoResponse:
+        """Busca o rascunho do usuário logado, priorizando o conteúdo pendente"""
+        pendente = self.buffer.obter((current_colaborador.id, chave))
+        if pendente:
+            return RascunhoResponse(
+                chave=chave,
+                conteudo=pendente.conteudo,
+                updated_at=pendente.atualizado_em,
+                persistido=False,
+            )
+
+        rascunho = self.repository.get_by_chave(current_colaborador.id, chave)
+        if not rascunho:
+            raise NotFoundException("Rascunho", chave)
+
+        return RascunhoResponse.model_validate(rascunho)
+
+    def salvar(
+        self,
+        chave: str,
+        conteudo: Dict[str, Any],
+        current_colaborador: Colaborador,
+        imediato: bool = False,
+    ) -> RascunhoResponse:
+        """
+        Salva o rascunho do usuário logado
+
+        Dentro da janela o conteúdo fica apenas no buffer; a gravação acontece
+        quando a janela fecha ou imediatamente se `imediato` for True.
+        """
+        chave_buffer = (current_colaborador.id, chave)
+        janela_fechada = self.buffer.registrar(chave_buffer, conteudo)
+
+        if not (imediato or janela_fechada):
+            return RascunhoResponse(
+                chave=chave,
+                conteudo=conteudo,
+                updated_at=datetime.now(timezone.utc),
+                persistido=False,
+            )
+
+        try:
+            with self.buffer.gravacao(chave_buffer) as pendente:
+                if pendente:
+                    self.repository.salvar(
+                        current_colaborador.id, chave, pendente.conteudo
+                    )
+                    conteudo = pendente.conteudo
+            logger.debug(
+                f"Rascunho gravado. Colaborador: {current_colaborador.id}, Chave: {chave}"
+            )
+            return RascunhoResponse(
+                chave=chave,
+                conteudo=conteudo,
+                updated_at=datetime.now(timezone.utc),
+                persistido=True,
+            )
+        except SQLAlchemyError:
+            self._handle_database_error("salvar rascunho")
+
+    def descartar(self, chave: str, current_colaborador: Colaborador) -> None:
+        """Descarta o rascunho do usuário logado (ex: após enviar o formulário)"""
+        try:
+            with self.buffer.gravacao((current_colaborador.id, chave)) as pendente:
+                removido = self.repository.delete_by_chave(
+                    current_colaborador.id, chave
+                )
+            if not (pendente or removido):
+                raise NotFoundException("Rascunho", chave)
+        except SQLAlchemyError:
+            self._handle_database_error("descartar rascunho")
+
+
+def descarregar_rascunhos_pendentes(
+    forcar: bool = False, buffer: BufferRascunhos = buffer_rascunhos
+) -> int:
+    """
+    Grava os rascunhos cuja janela fechou, em uma única transação
+
+    Args:
+        forcar: Grava todos os pendentes, mesmo com a janela aberta (ex: no shutdown)
+
+    Returns:
+        Quantidade de rascunhos gravados
+    """
+    itens = buffer.retirar_expirados(forcar=forcar)
+    if not itens:
+        return 0
+
+    db = SessionLocal()
+    try:
+        repository = RascunhoRepository(db)
+        for (colaborador_id, chave), pendente in itens:
+            repository.salvar(colaborador_id, chave, pendente.conteudo)
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        buffer.devolver(itens)
+        logger.error(f"Erro ao gravar rascunhos pendentes: {str(e)}")
+        return 0
+    finally:
+        db.close()
+        buffer.concluir_gravacao(chave for chave, _ in itens)
+
+    logger.debug(f"{len(itens)} rascunho(s) gravado(s) após o fechamento da janela")
+    return len(itens)
+
+
+async def descarregar_rascunhos_periodicamente() -> None:
+    """Loop de descarga do buffer de rascunhos, executado durante o lifespan da aplicação"""
+    intervalo = max(settings.RASCUNHO_JANELA_SEGUNDOS / 2, 0.5)
+    while True:
+        await asyncio.sleep(intervalo)
+        try:
+            await run_in_threadpool(descarregar_rascunhos_pendentes)
+        except Exception as e:
+            logger.error(f"Erro na descarga periódica de rascunhos: {str(e)}")
@@ -1,13 +1,29 @@
 from datetime import datetime
-from typing import List
+from typing import Any, Dict, List, Optional
 
+from app.core.dados_referencia import registro_referencia
 from app.core.exceptions import NotFoundException, UnauthorizedActionException
+from app.core.pagination import Pagina, PaginacaoParams
+from app.core.periodo import PeriodoParams
 from app.models.colaborador import Colaborador
-from app.models.registro_valor import RegistroValor, StatusAprovacao
+from app.models.registro_valor import RegistroValor, StatusAprovacao, Valor
+from app.repositories.ciclo import CicloRepository
 from app.repositories.registro_valor import RegistroValorRepository
 from app.repositories.valor import ValorRepository
-from app.schemas.registro_valor import RegistroValorCreate, RegistroValorUpdate
+from app.schemas.aprovacao import AprovacaoLoteResponse
+from app.schemas.registro_valor import (
+    CAMPOS_REGISTRO_VALOR_RESPONSE,
+    CAMPOS_VALOR_RESPONSE,
+    RegistroValorCreate,
+    RegistroValorUpdate,
+)
+from app.services.aprovacao import (
+    RELACIONAMENTOS_APROVACAO,
+    alterar_status_aprovacao_em_lote,
+    montar_pendentes,
+)
 from app.services.base import BaseService
+from app.services.periodo import resolver_janela
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
@@ -17,6 +33,17 @@ class RegistroValorService(BaseService[RegistroValor]):
         super().__init__(db)
         self.repository = RegistroValorRepository(db)
         self.valor_repository = ValorRepository(db)
+        self.ciclo_repository = CicloRepository(db)
+
+    def _resolver_valores(self, valores_ids: List[int]) -> List[Valor]:
+        """Valores selecionados, validados contra o registro de dados de referência"""
+        por_id = registro_referencia.obter(self.db).valores_por_id
+        referencias = [por_id.get(valor_id) for valor_id in dict.fromkeys(valores_ids)]
+
+        if None in referencias or len(referencias) != len(valores_ids):
+            raise ValueError("Um ou mais valores selecionados não foram encontrados")
+
+        return self.valor_repository.anexar(referencias)
 
     def get(self, registro_id: int, current_colaborador: Colaborador) -> RegistroValor:
         registro = self.repository.get(registro_id)
@@ -32,10 +59,7 @@ class RegistroValorService(BaseService[RegistroValor]):
     def create(
         self, registro_valor_data: RegistroValorCreate, current_colaborador: Colaborador
     ) -> RegistroValor:
-        valores = self.valor_repository.get_all(id__in=registro_valor_data.valores_ids)
-
-        if len(valores) != len(registro_valor_data.valores_ids):
-            raise ValueError("Um ou mais valores selecionados não foram encontrados")
+        valores = self._resolver_valores(registro_valor_data.valores_ids)
 
         try:
             db_registro_valor = RegistroValor(
@@ -50,8 +74,18 @@ class RegistroValorService(BaseService[RegistroValor]):
         except SQLAlchemyError:
             self._handle_database_error("criar registro de valor")
 
-    def get_by_colaborador(self, colaborador_id: int) -> List[RegistroValor]:
-        return self.repository.get_by_colaborador(colaborador_id)
+    def get_by_colaborador(
+        self,
+        colaborador_id: int,
+        paginacao: Optional[PaginacaoParams] = None,
+        periodo: Optional[PeriodoParams] = None,
+    ) -> Pagina[RegistroValor]:
+        """Retorna os registros do colaborador no período (padrão: ciclo aberto)"""
+        return self.repository.paginate_by_colaborador(
+            colaborador_id,
+            paginacao,
+            janela=resolver_janela(self.ciclo_repository, periodo),
+        )
 
     def update(
         self,
@@ -79,17 +113,10 @@ class RegistroValorService(BaseService[RegistroValor]):
 
             # Atualizar valores se fornecidos
             if registro_valor_data.valores_ids is not None:
-                valores = self.valor_repository.get_all(
-                    id__in=registro_valor_data.valores_ids
+                registro.valores = self._resolver_valores(
+                    registro_valor_data.valores_ids
                 )
 
-                if len(valores) != len(registro_valor_data.valores_ids):
-                    raise ValueError(
-                        "Um ou mais valores selecionados não foram encontrados"
-                    )
-
-                registro.valores = valores
-
             # Deixar o SQLAlchemy persistir as mudanças deste registro
             self.db.flush()
             return registro
@@ -112,9 +139,61 @@ class RegistroValorService(BaseService[RegistroValor]):
 
         return self.repository.delete(registro_id)
 
-    def get_all_pendentes(self) -> List[RegistroValor]:
-        """Retorna todos os registros de valor pendentes de aprovação"""
-        return self.repository.get_all(status_aprovacao=StatusAprovacao.PENDENTE.value)
+    def get_all_pendentes(
+        self,
+        paginacao: Optional[PaginacaoParams] = None,
+        periodo: Optional[PeriodoParams] = None,
+    ) -> Pagina[RegistroValor]:
+        """Retorna os registros de valor pendentes de aprovação no período (padrão: todos)"""
+        return self.repository.paginate_pendentes(
+            paginacao,
+            janela=resolver_janela(
+                self.ciclo_repository, periodo, padrao_ciclo_aberto=False
+            ),
+        )
+
+    def get_all_pendentes_linhas(
+        self,
+        paginacao: Optional[PaginacaoParams] = None,
+        periodo: Optional[PeriodoParams] = None,
+    ) -> Pagina[Dict[str, Any]]:
+        """
+        Mesmo que get_all_pendentes, já no formato de RegistroValorResponse (Core)
+
+        Os valores vêm da tabela de associação e dos dados de referência em
+        memória, sem consultar a tabela de valores.
+        """
+        pagina = self.repository.paginate_pendentes_linhas(
+            [
+                campo
+                for campo in CAMPOS_REGISTRO_VALOR_RESPONSE
+                if campo not in RELACIONAMENTOS_APROVACAO and campo != "valores"
+            ],
+            paginacao,
+            janela=resolver_janela(
+                self.ciclo_repository, periodo, padrao_ciclo_aberto=False
+            ),
+        )
+        valores_ids = self.repository.get_valores_ids_por_registro(
+            linha["id"] for linha in pagina.itens
+        )
+        por_id = registro_referencia.obter(self.db).valores_por_id
+        valores = {
+            id_: {campo: getattr(valor, campo) for campo in CAMPOS_VALOR_RESPONSE}
+            for id_, valor in por_id.items()
+        }
+        return montar_pendentes(
+            self.db,
+            pagina,
+            CAMPOS_REGISTRO_VALOR_RESPONSE,
+            anexos={
+                "valores": lambda linha: [
+                    valores[id_]
+                    for id_ in valores_ids.get(linha["id"], [])
+                    if id_ in valores
+                ]
+            },
+        )
 
     def aprovar(
         self, registro_id: int, admin_colaborador: Colaborador, observacao: str = None
@@ -174,3 +253,45 @@ class RegistroValorService(BaseService[RegistroValor]):
             return registro
         except SQLAlchemyError:
             self._handle_database_error("reprovar registro de valor")
+
+    def aprovar_em_lote(
+        self,
+        ids: List[int],
+        admin_colaborador: Colaborador,
+        observacao: Optional[str] = None,
+    ) -> AprovacaoLoteResponse:
+        """Aprova de uma vez os registros pendentes entre os IDs informados"""
+        if not admin_colaborador.is_admin:
+            raise UnauthorizedActionException()
+
+        try:
+            return alterar_status_aprovacao_em_lote(
+                self.repository,
+                ids,
+                StatusAprovacao.APROVADO,
+                admin_colaborador.id,
+                observacao,
+            )
+        except SQLAlchemyError:
+            self._handle_database_error("aprovar registros em lote")
+
+    def reprovar_em_lote(
+        self, ids: List[int], admin_colaborador: Colaborador, observacao: str
+    ) -> AprovacaoLoteResponse:
+        """Reprova de uma vez os registros pendentes entre os IDs informados"""
+        if not admin_colaborador.is_admin:
+            raise UnauthorizedActionException()
+
+        if not observacao or not observacao.strip():
+            raise ValueError("Observação é obrigatória para reprovar registros")
+
+        try:
+            return alterar_status_aprovacao_em_lote(
+                self.repository,
+                ids,
+                StatusAprovacao.REPROVADO,
+                admin_colaborador.id,
+                observacao,
+            )
+        except SQLAlchemyError:
+            self._handle_database_error("reprovar registros em lote")
@@ -1,22 +1,33 @@
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
+from app.core.dados_referencia import ValorReferencia, registro_referencia
+from app.core.exceptions import NotFoundException
 from app.models.registro_valor import Valor
-from app.repositories.valor import ValorRepository
 from app.services.base import BaseService
-from sqlalchemy.orm import Session
 
 
 class ValorService(BaseService[Valor]):
-    def __init__(self, db: Session):
-        super().__init__(db)
-        self.repository = ValorRepository(db)
+    """Valores lidos do registro de dados de referência"""
 
-    def get_valores(self, valores_ids: Optional[List[int]] = None) -> List[Valor]:
+    def get_versao(self) -> str:
+        """Assinatura dos dados de referência (ETag)"""
+        return registro_referencia.obter(self.db).assinatura
+
+    def get_valores(
+        self, valores_ids: Optional[List[int]] = None
+    ) -> Sequence[ValorReferencia]:
+        dados = registro_referencia.obter(self.db)
         if valores_ids:
-            valores = self.repository.get_all(id__in=valores_ids)
-            return valores
+            return [
+                dados.valores_por_id[valor_id]
+                for valor_id in valores_ids
+                if valor_id in dados.valores_por_id
+            ]
         else:
-            return self.repository.get_all()
+            return dados.valores
 
-    def get_valor(self, valor_id: int) -> Valor:
-        return self.repository.get(valor_id)
+    def get_valor(self, valor_id: int) -> ValorReferencia:
+        valor = registro_referencia.obter(self.db).valores_por_id.get(valor_id)
+        if valor is None:
+            raise NotFoundException("Valor", valor_id)
+        return valor
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Benchmark das requisições condicionais (ETag / 304) nos GETs cacheáveis.
+
+Para cada rota mede bytes e tempo de CPU por requisição sem cache (200
+com corpo) e com If-None-Match da resposta anterior (304 sem corpo). As
+requisições vão direto para a aplicação ASGI, sem cliente HTTP, e o custo
+fixo do framework (medido em /health/live) é descontado.
+Usa um SQLite temporário com dados de exemplo; não toca no banco da aplicação.
+
+Uso: python scripts/benchmark_cache_http.py [--repeticoes 500]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Adicionar o diretório raiz ao path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+_banco = os.path.join(tempfile.mkdtemp(), "benchmark_cache_http.db")
+os.environ["DB_URL"] = f"sqlite:///{_banco}"
+os.environ.setdefault("SECRET_KEY", "benchmark")
+os.environ["DEBUG"] = "false"
+
+import app.models  # noqa: E402,F401
+from app.database import Base, SessionLocal, engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.ciclo import Ciclo, StatusCiclo  # noqa: E402
+from app.models.eixo_avaliacao import EixoAvaliacao, NivelEixo  # noqa: E402
+from app.models.registro_valor import Valor  # noqa: E402
+
+ROTAS = [
+    "/api/v1/eixos-avaliacao/",
+    "/api/v1/valores/",
+    "/api/v1/niveis-carreira/",
+    "/api/v1/avaliacoes-gestor/perguntas",
+    "/api/v1/ciclos/",
+    "/api/v1/ciclos/ativo/aberto",
+]
+
+
+def popular() -> None:
+    """Dados no tamanho real: 4 eixos x 5 níveis, 6 valores, alguns ciclos"""
+    Base.metadata.create_all(engine)
+    db = SessionLocal()
+    try:
+        for i in range(1, 5):
+            eixo = EixoAvaliacao(codigo=f"eixo-{i}", nome=f"Eixo {i}")
+            db.add(eixo)
+            db.flush()
+            for nivel in range(1, 6):
+                db.add(
+                    NivelEixo(
+                        eixo_id=eixo.id,
+                        nivel=nivel,
+                        descricao=f"Descrição do nível {nivel} do eixo {i}. " * 8,
+                    )
+                )
+        for i in range(1, 7):
+            db.add(Valor(codigo=f"valor-{i}", nome=f"Valor {i}", icone="⭐"))
+        for ano in range(2020, 2026):
+            for semestre in range(1, 3):
+                db.add(
+                    Ciclo(nome=f"Ciclo {ano} S{semestre}", status=StatusCiclo.FECHADO)
+                )
+        db.add(Ciclo(nome="Ciclo atual", status=StatusCiclo.ABERTO))
+        db.commit()
+    finally:
+        db.close()
+
+
+async def requisitar(rota: str, headers: dict):
+    """GET direto na aplicação ASGI; retorna status, headers e corpo"""
+    caminho, _, query = rota.partition("?")
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": caminho,
+        "raw_path": caminho.encode(),
+        "query_string": query.encode(),
+        "root_path": "",
+        "headers": [(k.lower().encode(), v.encode()) for k, v in headers.items()],
+        "client": ("127.0.0.1", 50000),
+        "server": ("testserver", 80),
+    }
+    resposta = {"status": None, "headers": {}, "corpo": b""}
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(mensagem):
+        if mensagem["type"] == "http.response.start":
+            resposta["status"] = mensagem["status"]
+            resposta["headers"] = {
+                k.decode(): v.decode() for k, v in mensagem["headers"]
+            }
+        elif mensagem["type"] == "http.response.body":
+            resposta["corpo"] += mensagem.get("body", b"")
+
+    await app(scope, receive, send)
+    return resposta
+
+
+async def medir(rota: str, headers: dict, repeticoes: int):
+    """Média de bytes do corpo e de CPU (ms) por requisição"""
+    inicio = time.process_time()
+    total_bytes = 0
+    for _ in range(repeticoes):
+        resposta = await requisitar(rota, headers)
+        total_bytes += len(resposta["corpo"])
+    cpu_ms = (time.process_time() - inicio) * 1000 / repeticoes
+    return resposta["status"], total_bytes / repeticoes, cpu_ms
+
+
+async def executar(repeticoes: int) -> None:
+    _, _, cpu_base = await medir("/health/live", {}, repeticoes)
+    print(f"Custo fixo por requisição (/health/live): {cpu_base:.3f} ms de CPU\n")
+    print(
+        f"{'rota':40} {'200 bytes':>10} {'200 cpu ms':>11} "
+        f"{'304 bytes':>10} {'304 cpu ms':>11} {'cpu salvo':>10}"
+    )
+    for rota in ROTAS:
+        etag = (await requisitar(rota, {}))["headers"]["etag"]
+        _, bytes_200, cpu_200 = await medir(rota, {}, repeticoes)
+        status_304, bytes_304, cpu_304 = await medir(
+            rota, {"If-None-Match": etag}, repeticoes
+        )
+        assert status_304 == 304, f"{rota} respondeu {status_304} com If-None-Match"
+        cpu_200 = max(cpu_200 - cpu_base, 0.001)
+        cpu_304 = max(cpu_304 - cpu_base, 0.0)
+        print(
+            f"{rota:40} {bytes_200:>10.0f} {cpu_200:>11.3f} "
+            f"{bytes_304:>10.0f} {cpu_304:>11.3f} {1 - cpu_304 / cpu_200:>9.0%}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeticoes", type=int, default=500)
+    args = parser.parse_args()
+
+    popular()
+    asyncio.run(executar(args.repeticoes))
+
+
+if __name__ == "__main__":
+    main()
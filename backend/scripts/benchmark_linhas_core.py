@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Benchmark da leitura por linhas (Core) contra a leitura com objetos ORM.
+
+Para cada listagem adotada, mede consulta + montagem + JSON por dois
+caminhos e confere que o JSON é o mesmo:
+
+- ORM: o caminho anterior (objetos hidratados com os relacionamentos e
+  validados pelo schema de resposta);
+- ORM + montagem direta: objetos hidratados, formato final montado sem
+  validação (isola o custo da hidratação; só nas avaliações, onde existe);
+- Core: SELECT apenas das colunas da resposta, linhas direto para a montagem.
+
+Listagens: colaboradores ativos, entregas outstanding e registros de valor
+pendentes de aprovação e avaliações de um colaborador (calibração). Cada
+chamada usa uma sessão nova (identity map vazio), como uma requisição.
+Usa um SQLite temporário; não toca no banco da aplicação.
+
+Uso: python scripts/benchmark_linhas_core.py [--linhas 1000] [--repeticoes 20]
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Adicionar o diretório raiz ao path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+_banco = os.path.join(tempfile.mkdtemp(), "benchmark_linhas_core.db")
+os.environ["DB_URL"] = f"sqlite:///{_banco}"
+os.environ.setdefault("SECRET_KEY", "benchmark")
+os.environ["DEBUG"] = "false"
+
+import app.models  # noqa: E402,F401
+from app.core.periodo import PeriodoParams  # noqa: E402
+from app.core.serializacao import RespostaJSON, serializar_modelo  # noqa: E402
+from app.database import Base, SessionLocal, engine  # noqa: E402
+from app.models.avaliacao import Avaliacao, AvaliacaoEixo, TipoAvaliacao  # noqa: E402
+from app.models.ciclo import Ciclo, StatusCiclo  # noqa: E402
+from app.models.colaborador import Colaborador  # noqa: E402
+from app.models.eixo_avaliacao import EixoAvaliacao, NivelEixo  # noqa: E402
+from app.models.entrega_outstanding import EntregaOutstanding  # noqa: E402
+from app.models.registro_valor import RegistroValor, Valor  # noqa: E402
+from app.repositories.avaliacao import AvaliacaoRepository  # noqa: E402
+from app.schemas.avaliacao import (  # noqa: E402
+    AvaliacaoListResponse,
+    montar_lista_avaliacoes,
+)
+from app.schemas.colaborador import ColaboradorListResponse  # noqa: E402
+from app.schemas.entrega_outstanding import (  # noqa: E402
+    EntregaOutstandingListResponse,
+)
+from app.schemas.registro_valor import RegistroValorListResponse  # noqa: E402
+from app.services.avaliacao import AvaliacaoService  # noqa: E402
+from app.services.colaborador import ColaboradorService  # noqa: E402
+from app.services.entrega_outstanding import EntregaOutstandingService  # noqa: E402
+from app.services.registro_valor import RegistroValorService  # noqa: E402
+
+AVALIADORES = 50
+# Sem filtro de período: todos os pendentes
+PERIODO = PeriodoParams(todos=True)
+
+
+def popular(linhas: int) -> None:
+    """`linhas` colaboradores, entregas, registros e avaliações de pares"""
+    Base.metadata.create_all(engine)
+    db = SessionLocal()
+    try:
+        eixos = []
+        for i in range(1, 5):
+            eixo = EixoAvaliacao(codigo=f"eixo-{i}", nome=f"Eixo {i}")
+            db.add(eixo)
+            db.flush()
+            eixos.append(eixo)
+            for nivel in range(1, 6):
+                db.add(
+                    NivelEixo(
+                        eixo_id=eixo.id,
+                        nivel=nivel,
+                        descricao=f"Descrição do nível {nivel} do eixo {i}. " * 4,
+                    )
+                )
+        valores = [
+            Valor(codigo=f"valor-{i}", nome=f"Valor {i}", icone="estrela")
+            for i in range(1, 6)
+        ]
+        db.add_all(valores)
+        colaboradores = [
+            Colaborador(
+                nome=f"Colaborador {i:05d}",
+                email=f"colaborador{i}@empresa.com",
+                cargo="Engenheiro de Software",
+                departamento="Tecnologia",
+                nivel_carreira="P2",
+                is_admin=i == 0,
+            )
+            for i in range(linhas)
+        ]
+        db.add_all(colaboradores)
+        ciclo = Ciclo(nome="Ciclo atual", status=StatusCiclo.ABERTO)
+        db.add(ciclo)
+        db.flush()
+
+        for i, colaborador in enumerate(colaboradores):
+            db.add(
+                EntregaOutstanding(
+                    colaborador_id=colaborador.id,
+                    descricao="Migração do sistema de pagamentos. " * 4,
+                    impacto="Redução de custos de infraestrutura. " * 4,
+                    evidencias="Relatório de custos do trimestre. " * 4,
+                )
+            )
+            registro = RegistroValor(
+                colaborador_id=colaborador.id,
+                descricao="Ajudou o time em um incidente. " * 4,
+                impacto="Incidente resolvido antes do prazo. " * 4,
+            )
+            registro.valores = valores[: 1 + i % len(valores)]
+            db.add(registro)
+
+        avaliado = colaboradores[1]
+        for i in range(linhas):
+            avaliacao = Avaliacao(
+                ciclo_id=ciclo.id,
+                avaliador_id=colaboradores[1 + i % AVALIADORES].id,
+                avaliado_id=avaliado.id,
+                tipo=TipoAvaliacao.PAR,
+                avaliacao_geral="Contribui muito com o time. " * 6,
+            )
+            db.add(avaliacao)
+            db.flush()
+            for eixo in eixos:
+                db.add(
+                    AvaliacaoEixo(
+                        avaliacao_id=avaliacao.id,
+                        eixo_id=eixo.id,
+                        nivel=1 + (i + eixo.id) % 5,
+                        justificativa="Entrega consistente e com qualidade. " * 3,
+                    )
+                )
+        db.commit()
+    finally:
+        db.close()
+
+
+def em_sessao(funcao):
+    """Executa a função com uma sessão nova, como uma requisição"""
+
+    def executar() -> bytes:
+        db = SessionLocal()
+        try:
+            return funcao(db)
+        finally:
+            db.close()
+
+    return executar
+
+
+def colaboradores_orm(db) -> bytes:
+    pagina = ColaboradorService(db).get_colaboradores()
+    return serializar_modelo(
+        {"colaboradores": pagina.itens, "total": pagina.total},
+        ColaboradorListResponse,
+    )
+
+
+def colaboradores_core(db) -> bytes:
+    pagina = ColaboradorService(db).get_colaboradores_linhas()
+    return RespostaJSON(
+        {
+            "colaboradores": [dict(linha) for linha in pagina.itens],
+            "total": pagina.total,
+            "next_cursor": pagina.next_cursor,
+        }
+    ).body
+
+
+def entregas_orm(db) -> bytes:
+    pagina = EntregaOutstandingService(db).get_all_pendentes(None, PERIODO)
+    return serializar_modelo(
+        {"entregas": pagina.itens, "total": pagina.total},
+        EntregaOutstandingListResponse,
+    )
+
+
+def entregas_core(db) -> bytes:
+    pagina = EntregaOutstandingService(db).get_all_pendentes_linhas(None, PERIODO)
+    return RespostaJSON(
+        {"entregas": pagina.itens, "total": pagina.total, "next_cursor": None}
+    ).body
+
+
+def registros_orm(db) -> bytes:
+    pagina = RegistroValorService(db).get_all_pendentes(None, PERIODO)
+    return serializar_modelo(
+        {"registros": pagina.itens, "total": pagina.total},
+        RegistroValorListResponse,
+    )
+
+
+def registros_core(db) -> bytes:
+    pagina = RegistroValorService(db).get_all_pendentes_linhas(None, PERIODO)
+    return RespostaJSON(
+        {"registros": pagina.itens, "total": pagina.total, "next_cursor": None}
+    ).body
+
+
+def avaliacoes_orm(db) -> bytes:
+    itens = AvaliacaoRepository(db).get_all_by_colaborador(2)
+    return serializar_modelo(
+        {"avaliacoes": itens, "total": len(itens)}, AvaliacaoListResponse
+    )
+
+
+def avaliacoes_orm_montagem(db) -> bytes:
+    itens = AvaliacaoRepository(db).get_all_by_colaborador(2)
+    return RespostaJSON(
+        montar_lista_avaliacoes({"avaliacoes": itens, "total": len(itens)})
+    ).body
+
+
+def avaliacoes_core(db) -> bytes:
+    admin = db.get(Colaborador, 1)
+    return RespostaJSON(
+        AvaliacaoService(db).get_avaliacoes_colaborador_admin(2, None, admin)
+    ).body
+
+
+LISTAGENS = {
+    "colaboradores": {"ORM": colaboradores_orm, "Core": colaboradores_core},
+    "entregas pendentes": {"ORM": entregas_orm, "Core": entregas_core},
+    "registros pendentes": {"ORM": registros_orm, "Core": registros_core},
+    "avaliações (calibração)": {
+        "ORM": avaliacoes_orm,
+        "ORM + montagem direta": avaliacoes_orm_montagem,
+        "Core": avaliacoes_core,
+    },
+}
+
+
+def medir(funcao, repeticoes: int) -> float:
+    """Mediana do tempo (ms) por chamada"""
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append((time.perf_counter() - inicio) * 1000)
+    tempos.sort()
+    return tempos[len(tempos) // 2]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--linhas", type=int, default=1000)
+    parser.add_argument("--repeticoes", type=int, default=20)
+    args = parser.parse_args()
+
+    popular(args.linhas)
+    print(f"Consulta + montagem + JSON, {args.linhas} linhas (mediana)\n")
+    print(f"{'listagem':24} {'caminho':22} {'ms':>9} {'ganho':>7}")
+    for listagem, caminhos in LISTAGENS.items():
+        esperado = json.loads(em_sessao(caminhos["ORM"])())
+        for nome, funcao in caminhos.items():
+            corpo = em_sessao(funcao)()
+            assert json.loads(corpo) == esperado, f"{listagem}, {nome}: JSON diferente"
+
+        base = None
+        for nome, funcao in caminhos.items():
+            ms = medir(em_sessao(funcao), args.repeticoes)
+            base = base or ms
+            print(f"{listagem:24} {nome:22} {ms:>9.2f} {base / ms:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Benchmark dos formatos negociados nas respostas grandes (bytes e CPU).
+
+Monta o corpo JSON de duas listagens de admin (avaliações de um colaborador
+na calibração e entregas pendentes de aprovação) e mede, para cada formato
+que o NegociacaoConteudoMiddleware pode enviar:
+
+- bytes trafegados;
+- CPU do servidor (ms) para produzir o formato a partir do JSON;
+- CPU (ms) para decodificar de volta ao conteúdo, como faria o cliente.
+
+Formatos: json, json+gzip, json+br, msgpack, msgpack+gzip e msgpack+br,
+com os níveis de COMPRESSAO_GZIP_NIVEL e COMPRESSAO_BROTLI_QUALIDADE. Ao
+final, confere de ponta a ponta (pela aplicação, com Accept e
+Accept-Encoding) que o conteúdo decodificado é o mesmo do JSON.
+Usa um SQLite temporário; não toca no banco da aplicação.
+
+Uso: python scripts/benchmark_negociacao.py [--linhas 2000] [--repeticoes 10]
+"""
+import argparse
+import gzip
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Adicionar o diretório raiz ao path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+_banco = os.path.join(tempfile.mkdtemp(), "benchmark_negociacao.db")
+os.environ["DB_URL"] = f"sqlite:///{_banco}"
+os.environ.setdefault("SECRET_KEY", "benchmark")
+os.environ["DEBUG"] = "false"
+
+import brotli  # noqa: E402
+import msgpack  # noqa: E402
+import orjson  # noqa: E402
+
+import app.models  # noqa: E402,F401
+from app.core.negociacao import comprimir, json_para_msgpack  # noqa: E402
+from app.core.periodo import PeriodoParams  # noqa: E402
+from app.core.security import create_access_token  # noqa: E402
+from app.core.serializacao import RespostaJSON  # noqa: E402
+from app.database import Base, SessionLocal, engine  # noqa: E402
+from app.main import app as aplicacao  # noqa: E402
+from app.models.avaliacao import Avaliacao, AvaliacaoEixo, TipoAvaliacao  # noqa: E402
+from app.models.ciclo import Ciclo, StatusCiclo  # noqa: E402
+from app.models.colaborador import Colaborador  # noqa: E402
+from app.models.eixo_avaliacao import EixoAvaliacao, NivelEixo  # noqa: E402
+from app.models.entrega_outstanding import EntregaOutstanding  # noqa: E402
+from app.services.avaliacao import AvaliacaoService  # noqa: E402
+from app.services.entrega_outstanding import EntregaOutstandingService  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+AVALIADORES = 50
+# Sem filtro de período: todos os pendentes
+PERIODO = PeriodoParams(todos=True)
+
+# Formato: (produzir a partir do JSON, decodificar de volta ao conteúdo)
+FORMATOS = {
+    "json": (lambda corpo: corpo, orjson.loads),
+    "json+gzip": (
+        lambda corpo: comprimir(corpo, "gzip"),
+        lambda corpo: orjson.loads(gzip.decompress(corpo)),
+    ),
+    "json+br": (
+        lambda corpo: comprimir(corpo, "br"),
+        lambda corpo: orjson.loads(brotli.decompress(corpo)),
+    ),
+    "msgpack": (json_para_msgpack, msgpack.unpackb),
+    "msgpack+gzip": (
+        lambda corpo: comprimir(json_para_msgpack(corpo), "gzip"),
+        lambda corpo: msgpack.unpackb(gzip.decompress(corpo)),
+    ),
+    "msgpack+br": (
+        lambda corpo: comprimir(json_para_msgpack(corpo), "br"),
+        lambda corpo: msgpack.unpackb(brotli.decompress(corpo)),
+    ),
+}
+
+
+def popular(linhas: int) -> None:
+    """`linhas` colaboradores com entregas pendentes e avaliações de pares"""
+    Base.metadata.create_all(engine)
+    db = SessionLocal()
+    try:
+        eixos = []
+        for i in range(1, 5):
+            eixo = EixoAvaliacao(codigo=f"eixo-{i}", nome=f"Eixo {i}")
+            db.add(eixo)
+            db.flush()
+            eixos.append(eixo)
+            for nivel in range(1, 6):
+                db.add(
+                    NivelEixo(
+                        eixo_id=eixo.id,
+                        nivel=nivel,
+                        descricao=f"Descrição do nível {nivel} do eixo {i}. " * 4,
+                    )
+                )
+        colaboradores = [
+            Colaborador(
+                nome=f"Colaborador {i:05d}",
+                email=f"colaborador{i}@empresa.com",
+                cargo="Engenheiro de Software",
+                departamento="Tecnologia",
+                nivel_carreira="P2",
+                is_admin=i == 0,
+            )
+            for i in range(linhas)
+        ]
+        db.add_all(colaboradores)
+        ciclo = Ciclo(nome="Ciclo atual", status=StatusCiclo.ABERTO)
+        db.add(ciclo)
+        db.flush()
+
+        for colaborador in colaboradores:
+            db.add(
+                EntregaOutstanding(
+                    colaborador_id=colaborador.id,
+                    descricao="Migração do sistema de pagamentos. " * 4,
+                    impacto="Redução de custos de infraestrutura. " * 4,
+                    evidencias="Relatório de custos do trimestre. " * 4,
+                )
+            )
+
+        avaliado = colaboradores[1]
+        for i in range(linhas):
+            avaliacao = Avaliacao(
+                ciclo_id=ciclo.id,
+                avaliador_id=colaboradores[1 + i % AVALIADORES].id,
+                avaliado_id=avaliado.id,
+                tipo=TipoAvaliacao.PAR,
+                avaliacao_geral="Contribui muito com o time. " * 6,
+            )
+            db.add(avaliacao)
+            db.flush()
+            for eixo in eixos:
+                db.add(
+                    AvaliacaoEixo(
+                        avaliacao_id=avaliacao.id,
+                        eixo_id=eixo.id,
+                        nivel=1 + (i + eixo.id) % 5,
+                        justificativa="Entrega consistente e com qualidade. " * 3,
+                    )
+                )
+        db.commit()
+    finally:
+        db.close()
+
+
+def corpos_json() -> dict:
+    """Corpo JSON de cada listagem, como a rota envia"""
+    db = SessionLocal()
+    try:
+        admin = db.get(Colaborador, 1)
+        avaliacoes = AvaliacaoService(db).get_avaliacoes_colaborador_admin(
+            2, None, admin
+        )
+        entregas = EntregaOutstandingService(db).get_all_pendentes_linhas(
+            None, PERIODO
+        )
+        return {
+            "avaliações (calibração)": RespostaJSON(avaliacoes).body,
+            "entregas pendentes": RespostaJSON(
+                {"entregas": entregas.itens, "total": entregas.total}
+            ).body,
+        }
+    finally:
+        db.close()
+
+
+def medir(funcao, repeticoes: int) -> float:
+    """Mediana do tempo de CPU (ms) por chamada"""
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.process_time()
+        funcao()
+        tempos.append((time.process_time() - inicio) * 1000)
+    tempos.sort()
+    return tempos[len(tempos) // 2]
+
+
+def conferir_ponta_a_ponta() -> None:
+    """Cada formato, pedido à aplicação, decodifica para o mesmo conteúdo"""
+    cliente = TestClient(aplicacao)
+    token = create_access_token({"sub": "1", "email": "colaborador0@empresa.com"})
+    url = "/api/v1/avaliacoes/admin/colaborador/2"
+    autorizacao = {"Authorization": f"Bearer {token}"}
+    esperado = cliente.get(
+        url, headers={**autorizacao, "Accept-Encoding": "identity"}
+    ).json()
+    for codificacao in ("gzip", "br"):
+        for accept, decodificar in (
+            ("application/json", orjson.loads),
+            ("application/msgpack", msgpack.unpackb),
+        ):
+            resposta = cliente.get(
+                url,
+                headers={
+                    **autorizacao,
+                    "Accept": accept,
+                    "Accept-Encoding": codificacao,
+                },
+            )
+            assert resposta.headers["content-encoding"] == codificacao
+            assert resposta.headers["content-type"].startswith(accept)
+            # O httpx já desfaz o Content-Encoding
+            assert decodificar(resposta.content) == esperado, (accept, codificacao)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--linhas", type=int, default=2000)
+    parser.add_argument("--repeticoes", type=int, default=10)
+    args = parser.parse_args()
+
+    popular(args.linhas)
+    print(f"{args.linhas} linhas, CPU em ms (mediana)\n")
+    print(
+        f"{'listagem':24} {'formato':14} {'bytes':>10} {'%':>6} "
+        f"{'produzir':>9} {'decodificar':>12}"
+    )
+    for listagem, corpo in corpos_json().items():
+        esperado = json.loads(corpo)
+        for formato, (produzir, decodificar) in FORMATOS.items():
+            saida = produzir(corpo)
+            assert decodificar(saida) == esperado, f"{listagem}, {formato}"
+            ms_produzir = medir(lambda: produzir(corpo), args.repeticoes)
+            ms_decodificar = medir(lambda: decodificar(saida), args.repeticoes)
+            print(
+                f"{listagem:24} {formato:14} {len(saida):>10} "
+                f"{100 * len(saida) / len(corpo):>5.1f}% "
+                f"{ms_produzir:>9.2f} {ms_decodificar:>12.2f}"
+            )
+
+    conferir_ponta_a_ponta()
+    print("\nPonta a ponta (Accept / Accept-Encoding): conteúdo conferido")
+
+
+if __name__ == "__main__":
+    main()
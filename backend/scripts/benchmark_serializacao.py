@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Benchmark da serialização das listagens grandes de avaliações.
+
+Serializa a mesma lista de 1.000 avaliações (com eixos, níveis, avaliador e
+avaliado já carregados) por três caminhos e confere que o JSON é o mesmo:
+
+- response_model: o que o FastAPI fazia com o retorno do service
+  (AvaliacaoListResponse montado no service, model_dump, nova validação,
+  model_dump em modo JSON e json da biblioteca padrão);
+- adaptador: TypeAdapter em cache, uma validação e bytes gerados no
+  pydantic-core (`serializar_modelo`);
+- montagem direta: formato final montado dos objetos ORM
+  (`montar_lista_avaliacoes`) e codificado com orjson (`RespostaJSON`).
+
+Também mede a rota GET /api/v1/avaliacoes/admin/colaborador/{id} de ponta a
+ponta (consulta incluída). Usa um SQLite temporário; não toca no banco da
+aplicação.
+
+Uso: python scripts/benchmark_serializacao.py [--linhas 1000] [--repeticoes 20]
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Adicionar o diretório raiz ao path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+_banco = os.path.join(tempfile.mkdtemp(), "benchmark_serializacao.db")
+os.environ["DB_URL"] = f"sqlite:///{_banco}"
+os.environ.setdefault("SECRET_KEY", "benchmark")
+os.environ["DEBUG"] = "false"
+
+import app.models  # noqa: E402,F401
+from app.core.security import create_access_token  # noqa: E402
+from app.core.serializacao import RespostaJSON, serializar_modelo  # noqa: E402
+from app.database import Base, SessionLocal, engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.avaliacao import Avaliacao, AvaliacaoEixo, TipoAvaliacao  # noqa: E402
+from app.models.ciclo import Ciclo, StatusCiclo  # noqa: E402
+from app.models.colaborador import Colaborador  # noqa: E402
+from app.models.eixo_avaliacao import EixoAvaliacao, NivelEixo  # noqa: E402
+from app.repositories.avaliacao import AvaliacaoRepository  # noqa: E402
+from app.schemas.avaliacao import (  # noqa: E402
+    AvaliacaoListResponse,
+    montar_lista_avaliacoes,
+)
+from fastapi.responses import JSONResponse  # noqa: E402
+
+AVALIADORES = 50
+
+
+def popular(linhas: int) -> None:
+    """Um avaliado com `linhas` avaliações de pares, 4 eixos cada"""
+    Base.metadata.create_all(engine)
+    db = SessionLocal()
+    try:
+        eixos = []
+        for i in range(1, 5):
+            eixo = EixoAvaliacao(codigo=f"eixo-{i}", nome=f"Eixo {i}")
+            db.add(eixo)
+            db.flush()
+            eixos.append(eixo)
+            for nivel in range(1, 6):
+                db.add(
+                    NivelEixo(
+                        eixo_id=eixo.id,
+                        nivel=nivel,
+                        descricao=f"Descrição do nível {nivel} do eixo {i}. " * 4,
+                    )
+                )
+        colaboradores = [
+            Colaborador(
+                nome=f"Colaborador {i}",
+                email=f"colaborador{i}@empresa.com",
+                cargo="Engenheiro de Software",
+                departamento="Tecnologia",
+                nivel_carreira="P2",
+                is_admin=i == 0,
+            )
+            for i in range(AVALIADORES + 1)
+        ]
+        db.add_all(colaboradores)
+        ciclo = Ciclo(nome="Ciclo atual", status=StatusCiclo.ABERTO)
+        db.add(ciclo)
+        db.flush()
+
+        avaliado = colaboradores[1]
+        for i in range(linhas):
+            avaliacao = Avaliacao(
+                ciclo_id=ciclo.id,
+                avaliador_id=colaboradores[1 + i % AVALIADORES].id,
+                avaliado_id=avaliado.id,
+                tipo=TipoAvaliacao.PAR,
+                avaliacao_geral="Contribui muito com o time. " * 6,
+            )
+            db.add(avaliacao)
+            db.flush()
+            for eixo in eixos:
+                db.add(
+                    AvaliacaoEixo(
+                        avaliacao_id=avaliacao.id,
+                        eixo_id=eixo.id,
+                        nivel=1 + (i + eixo.id) % 5,
+                        justificativa="Entrega consistente e com qualidade. " * 3,
+                    )
+                )
+        db.commit()
+    finally:
+        db.close()
+
+
+def via_response_model(itens) -> bytes:
+    resposta = AvaliacaoListResponse(avaliacoes=itens, total=len(itens))
+    dados = resposta.model_dump()
+    conteudo = AvaliacaoListResponse.model_validate(dados).model_dump(mode="json")
+    return JSONResponse(conteudo).body
+
+
+def via_adaptador(itens) -> bytes:
+    return serializar_modelo(
+        {"avaliacoes": itens, "total": len(itens)}, AvaliacaoListResponse
+    )
+
+
+def via_montagem_direta(itens) -> bytes:
+    return RespostaJSON(
+        montar_lista_avaliacoes({"avaliacoes": itens, "total": len(itens)})
+    ).body
+
+
+def medir(funcao, repeticoes: int) -> float:
+    """Mediana do tempo (ms) por chamada"""
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append((time.perf_counter() - inicio) * 1000)
+    tempos.sort()
+    return tempos[len(tempos) // 2]
+
+
+async def requisitar(caminho: str, token: str) -> bytes:
+    """GET direto na aplicação ASGI; retorna o corpo"""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": caminho,
+        "raw_path": caminho.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"authorization", f"Bearer {token}".encode())],
+        "client": ("127.0.0.1", 50000),
+        "server": ("testserver", 80),
+    }
+    corpo = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(mensagem):
+        if mensagem["type"] == "http.response.start":
+            assert mensagem["status"] == 200, mensagem["status"]
+        elif mensagem["type"] == "http.response.body":
+            corpo.append(mensagem.get("body", b""))
+
+    await app(scope, receive, send)
+    return b"".join(corpo)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--linhas", type=int, default=1000)
+    parser.add_argument("--repeticoes", type=int, default=20)
+    args = parser.parse_args()
+
+    popular(args.linhas)
+    db = SessionLocal()
+    try:
+        itens = AvaliacaoRepository(db).get_all_by_colaborador(2)
+        caminhos = {
+            "response_model": via_response_model,
+            "adaptador": via_adaptador,
+            "montagem direta": via_montagem_direta,
+        }
+        esperado = json.loads(via_response_model(itens))
+        for nome, funcao in caminhos.items():
+            assert json.loads(funcao(itens)) == esperado, f"{nome}: JSON diferente"
+
+        print(f"Serialização de {len(itens)} avaliações (mediana por resposta)\n")
+        print(f"{'caminho':20} {'ms':>9} {'KB':>8} {'ganho':>7}")
+        base = None
+        for nome, funcao in caminhos.items():
+            ms = medir(lambda: funcao(itens), args.repeticoes)
+            base = base or ms
+            kb = len(funcao(itens)) / 1024
+            print(f"{nome:20} {ms:>9.2f} {kb:>8.0f} {base / ms:>6.1f}x")
+    finally:
+        db.close()
+
+    token = create_access_token({"sub": "1", "email": "colaborador0@empresa.com"})
+    caminho = "/api/v1/avaliacoes/admin/colaborador/2"
+    corpo = asyncio.run(requisitar(caminho, token))
+    assert json.loads(corpo) == esperado, "rota: JSON diferente"
+    ms = medir(lambda: asyncio.run(requisitar(caminho, token)), args.repeticoes)
+    print(f"\nGET {caminho} de ponta a ponta: {ms:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Teste do barramento de invalidação dos caches com vários processos.
+
+Sobe N processos worker (como os workers do uvicorn), cada um com o estado
+dos ciclos carregado em memória e o sincronizador do barramento rodando. O
+processo principal altera a etapa de um ciclo e cada worker informa quando
+foi avisado e qual etapa passou a ver. A rodada falha se algum worker não
+perceber a alteração dentro do limite (intervalo de consulta + folga).
+
+Duas rodadas: só consulta periódica à tabela versoes_cache, e com aviso por
+socket UNIX entre os workers. A assinatura da tabela de ciclos (outra forma
+de perceber a alteração) fica desligada nos workers.
+Usa um SQLite temporário; não toca no banco da aplicação.
+
+Uso: python scripts/harness_barramento_cache.py [--workers 4] [--intervalo 1]
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import queue
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Adicionar o diretório raiz ao path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+# Os workers herdam o ambiente (mesmo banco)
+os.environ.setdefault(
+    "HARNESS_BARRAMENTO_BANCO",
+    os.path.join(tempfile.mkdtemp(), "harness_barramento_cache.db"),
+)
+os.environ["DB_URL"] = f"sqlite:///{os.environ['HARNESS_BARRAMENTO_BANCO']}"
+os.environ.setdefault("SECRET_KEY", "harness")
+os.environ["DEBUG"] = "false"
+
+# Tempo além do intervalo de consulta aceito para a invalidação chegar
+FOLGA_SEGUNDOS = 0.5
+
+
+def worker(socket_dir: str, intervalo: float, ciclo_id: int, fila, parar) -> None:
+    """Processo com o estado dos ciclos em memória e o barramento rodando"""
+    os.environ["CACHE_BARRAMENTO_SOCKET_DIR"] = socket_dir
+    os.environ["CACHE_BARRAMENTO_INTERVALO_SEGUNDOS"] = str(intervalo)
+    os.environ["CICLOS_ESTADO_VERIFICACAO_SEGUNDOS"] = "3600"
+
+    import app.models  # noqa: F401
+    from app.core.barramento_cache import (
+        barramento_cache,
+        inicializar_barramento,
+        sincronizar_barramento_periodicamente,
+    )
+    from app.core.estado_ciclos import estado_ciclos
+    from app.database import SessionLocal
+
+    def ler_etapa() -> str:
+        db = SessionLocal()
+        try:
+            return estado_ciclos.obter(db).get(ciclo_id).etapa_atual.value
+        finally:
+            db.close()
+
+    def ao_alterar(canais) -> None:
+        # Inscrito depois do estado dos ciclos: a fotografia já foi descartada
+        fila.put(("invalidado", os.getpid(), time.time(), ler_etapa()))
+
+    barramento_cache.inscrever({"ciclos"}, ao_alterar)
+
+    async def executar() -> None:
+        inicializar_barramento()
+        ler_etapa()
+        sincronizacao = asyncio.create_task(sincronizar_barramento_periodicamente())
+        # Tempo para o socket de aviso ser criado
+        await asyncio.sleep(0.3)
+        fila.put(("pronto", os.getpid(), time.time(), ler_etapa()))
+        while not parar.is_set():
+            await asyncio.sleep(0.05)
+        sincronizacao.cancel()
+
+    asyncio.run(executar())
+
+
+def popular() -> int:
+    from app.database import Base, SessionLocal, engine
+    from app.models.ciclo import Ciclo, EtapaCiclo, StatusCiclo
+
+    Base.metadata.create_all(engine)
+    db = SessionLocal()
+    try:
+        ciclo = Ciclo(
+            nome="Ciclo atual",
+            status=StatusCiclo.ABERTO,
+            etapa_atual=EtapaCiclo.ESCOLHA_PARES,
+        )
+        db.add(ciclo)
+        db.commit()
+        return ciclo.id
+    finally:
+        db.close()
+
+
+def rodada(nome: str, socket_dir: str, workers: int, intervalo: float, ciclo_id: int):
+    from app.core.barramento_cache import TransporteSocketUnix, configurar_transporte
+    from app.database import SessionLocal
+    from app.models.ciclo import Ciclo, EtapaCiclo
+
+    contexto = multiprocessing.get_context("spawn")
+    fila = contexto.Queue()
+    parar = contexto.Event()
+    processos = [
+        contexto.Process(
+            target=worker, args=(socket_dir, intervalo, ciclo_id, fila, parar)
+        )
+        for _ in range(workers)
+    ]
+    for processo in processos:
+        processo.start()
+    try:
+        prontos = {}
+        while len(prontos) < workers:
+            _, pid, _, etapa = fila.get(timeout=60)
+            prontos[pid] = etapa
+
+        configurar_transporte(TransporteSocketUnix(socket_dir) if socket_dir else None)
+        db = SessionLocal()
+        try:
+            ciclo = db.get(Ciclo, ciclo_id)
+            nova_etapa = (
+                EtapaCiclo.APROVACAO_PARES
+                if ciclo.etapa_atual != EtapaCiclo.APROVACAO_PARES
+                else EtapaCiclo.ESCOLHA_PARES
+            )
+            ciclo.etapa_atual = nova_etapa
+            inicio = time.time()
+            db.commit()
+        finally:
+            db.close()
+
+        limite = intervalo + FOLGA_SEGUNDOS
+        atrasos = {}
+        while len(atrasos) < workers:
+            try:
+                _, pid, momento, etapa = fila.get(timeout=limite * 2)
+            except queue.Empty:
+                break
+            if etapa == nova_etapa.value:
+                atrasos.setdefault(pid, momento - inicio)
+    finally:
+        parar.set()
+        for processo in processos:
+            processo.join(timeout=10)
+
+    ordenados = sorted(atrasos.values())
+    print(
+        f"{nome:24} workers avisados: {len(atrasos)}/{workers}  "
+        f"atraso mín/máx: {ordenados[0] * 1000 if ordenados else 0:.0f}/"
+        f"{ordenados[-1] * 1000 if ordenados else 0:.0f} ms  "
+        f"(limite {limite * 1000:.0f} ms)"
+    )
+    assert len(atrasos) == workers, f"{nome}: workers sem a alteração"
+    assert ordenados[-1] <= limite, f"{nome}: invalidação acima do limite"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--intervalo", type=float, default=1.0)
+    args = parser.parse_args()
+
+    os.environ["CACHE_BARRAMENTO_INTERVALO_SEGUNDOS"] = str(args.intervalo)
+    import app.core.estado_ciclos  # noqa: F401  (rastreia escritas em ciclos)
+    import app.models  # noqa: F401
+
+    ciclo_id = popular()
+    rodada("consulta periódica", "", args.workers, args.intervalo, ciclo_id)
+    rodada(
+        "aviso por socket UNIX",
+        tempfile.mkdtemp(),
+        args.workers,
+        args.intervalo,
+        ciclo_id,
+    )
+
+
+if __name__ == "__main__":
+    main()
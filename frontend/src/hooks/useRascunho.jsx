@@ -0,0 +1,91 @@
+import { useCallback, useEffect, useRef } from 'react'
+import { rascunhosAPI } from '../services/api'
+
+/**
+ * Hook de autosave de rascunho de formulário
+ *
+ * Salva o conteúdo do formulário no servidor alguns instantes depois da última
+ * alteração. O servidor ainda agrupa salvamentos próximos antes de gravar, então
+ * o autosave custa um upsert pequeno em vez de regravar a avaliação inteira.
+ *
+ * O autosave só começa depois de `carregarRascunho` ser chamado, para que o
+ * carregamento inicial do formulário não seja salvo como rascunho.
+ *
+ * @param {string | null} chave - Chave do formulário (ex: autoavaliacao:ciclo-3)
+ * @param {object} conteudo - Estado atual do formulário
+ * @param {number} atraso - Tempo sem alterações antes de salvar, em ms
+ *
+ * @example
+ * const { carregarRascunho, descartarRascunho } = useRascunho(chave, avaliacao)
+ *
+ * const rascunho = await carregarRascunho()
+ * if (rascunho) setAvaliacao(rascunho)
+ *
+ * // Após enviar o formulário
+ * descartarRascunho()
+ */
+export function useRascunho(chave, conteudo, atraso = 1500) {
+    const pronto = useRef(false)
+    const ultimoSalvo = useRef(null)
+    const pendente = useRef(null)
+    const timer = useRef(null)
+
+    useEffect(() => {
+        pronto.current = false
+        ultimoSalvo.current = null
+    }, [chave])
+
+    useEffect(() => {
+        if (!chave || !pronto.current) return
+
+        const json = JSON.stringify(conteudo)
+        if (json === ultimoSalvo.current) return
+
+        pendente.current = conteudo
+        clearTimeout(timer.current)
+        timer.current = setTimeout(() => {
+            ultimoSalvo.current = json
+            pendente.current = null
+            rascunhosAPI.salvar(chave, conteudo).catch(() => null)
+        }, atraso)
+    }, [chave, conteudo, atraso])
+
+    // Ao sair do formulário, grava imediatamente o que ainda não foi enviado
+    useEffect(() => () => {
+        clearTimeout(timer.current)
+        if (chave && pendente.current) {
+            rascunhosAPI.salvar(chave, pendente.current, { imediato: true }).catch(() => null)
+            pendente.current = null
+        }
+    }, [chave])
+
+    const carregarRascunho = useCallback(async () => {
+        if (!chave) return null
+
+        try {
+            const rascunho = await rascunhosAPI.get(chave)
+            ultimoSalvo.current = JSON.stringify(rascunho.conteudo)
+            return rascunho.conteudo
+        } catch (error) {
+            // 404: ainda não existe rascunho para este formulário
+            return null
+        } finally {
+            pronto.current = true
+        }
+    }, [chave])
+
+    const descartarRascunho = useCallback(() => {
+        if (!chave) return
+
+        clearTimeout(timer.current)
+        pendente.current = null
+        ultimoSalvo.current = null
+        pronto.current = false
+        rascunhosAPI.descartar(chave).catch(() => null)
+    }, [chave])
+
+    return {
+        carregarRascunho,
+        descartarRascunho
+    }
+}
@@ -42,6 +42,24 @@ function AprovacaoEntregasAdmin() {
         setShowModal(true)
     }
 
+    const handleAprovarTodos = () => {
+        setSelectedRegistro(null)
+        setModalAction('aprovar')
+        setObservacao('')
+        setShowModal(true)
+    }
+
+    const aprovarTodos = async () => {
+        const resultado = await registrosValorAPI.aprovarLote({
+            ids: registros.map(item => item.id),
+            observacao: observacao || null,
+        })
+        showToast(`${resultado.total_processados} de ${resultado.total} registros aprovados`, 'success')
+        setShowModal(false)
+        setObservacao('')
+        carregarRegistrosPendentes()
+    }
+
     const confirmarAcao = async () => {
         if (modalAction === 'reprovar' && !observacao.trim()) {
             showToast('Observação é obrigatória para reprovar', 'error')
@@ -49,6 +67,11 @@ function AprovacaoEntregasAdmin() {
         }
 
         try {
+            if (!selectedRegistro) {
+                await aprovarTodos()
+                return
+            }
+
             if (modalAction === 'aprovar') {
                 await registrosValorAPI.aprovar(selectedRegistro.id, { observacao: observacao || null })
             } else {
@@ -106,6 +129,11 @@ function AprovacaoEntregasAdmin() {
                 <p className="section-subtitle">
                     {registros.length} {registros.length === 1 ? 'registro pendente' : 'registros pendentes'}
                 </p>
+                {registros.length > 1 && (
+                    <button className="btn-aprovar" onClick={handleAprovarTodos}>
+                        ✓ Aprovar todos
+                    </button>
+                )}
             </div>
 
             {registros.length === 0 ? (
@@ -178,8 +206,14 @@ function AprovacaoEntregasAdmin() {
 
                         <div className="modal-body">
                             <div className="registro-resumo">
-                                <p><strong>Colaborador:</strong> {selectedRegistro?.colaborador?.nome}</p>
-                                <p><strong>Descrição:</strong> {selectedRegistro?.descricao}</p>
+                                {selectedRegistro ? (
+                                    <>
+                                        <p><strong>Colaborador:</strong> {selectedRegistro.colaborador?.nome}</p>
+                                        <p><strong>Descrição:</strong> {selectedRegistro.descricao}</p>
+                                    </>
+                                ) : (
+                                    <p><strong>{registros.length}</strong> registros pendentes serão aprovados.</p>
+                                )}
                             </div>
 
                             <div className="form-group">
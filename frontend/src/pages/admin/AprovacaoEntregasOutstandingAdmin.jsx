@@ -42,6 +42,24 @@ function AprovacaoEntregasOutstandingAdmin() {
         setShowModal(true)
     }
 
+    const handleAprovarTodos = () => {
+        setSelectedEntrega(null)
+        setModalAction('aprovar')
+        setObservacao('')
+        setShowModal(true)
+    }
+
+    const aprovarTodos = async () => {
+        const resultado = await entregasOutstandingAPI.aprovarLote({
+            ids: entregas.map(item => item.id),
+            observacao: observacao || null,
+        })
+        showToast(`${resultado.total_processados} de ${resultado.total} entregas aprovadas`, 'success')
+        setShowModal(false)
+        setObservacao('')
+        carregarEntregasPendentes()
+    }
+
     const confirmarAcao = async () => {
         if (modalAction === 'reprovar' && !observacao.trim()) {
             showToast('Observação é obrigatória para reprovar', 'error')
@@ -49,6 +67,11 @@ function AprovacaoEntregasOutstandingAdmin() {
         }
 
         try {
+            if (!selectedEntrega) {
+                await aprovarTodos()
+                return
+            }
+
             if (modalAction === 'aprovar') {
                 await entregasOutstandingAPI.aprovar(selectedEntrega.id, { observacao: observacao || null })
             } else {
@@ -106,6 +129,11 @@ function AprovacaoEntregasOutstandingAdmin() {
                 <p className="section-subtitle">
                     {entregas.length} {entregas.length === 1 ? 'entrega pendente' : 'entregas pendentes'}
                 </p>
+                {entregas.length > 1 && (
+                    <button className="btn-aprovar" onClick={handleAprovarTodos}>
+                        ✓ Aprovar todos
+                    </button>
+                )}
             </div>
 
             {entregas.length === 0 ? (
@@ -175,8 +203,14 @@ function AprovacaoEntregasOutstandingAdmin() {
 
                         <div className="modal-body">
                             <div className="entrega-resumo">
-                                <p><strong>Colaborador:</strong> {selectedEntrega?.colaborador?.nome}</p>
-                                <p><strong>Descrição:</strong> {selectedEntrega?.descricao}</p>
+                                {selectedEntrega ? (
+                                    <>
+                                        <p><strong>Colaborador:</strong> {selectedEntrega.colaborador?.nome}</p>
+                                        <p><strong>Descrição:</strong> {selectedEntrega.descricao}</p>
+                                    </>
+                                ) : (
+                                    <p><strong>{entregas.length}</strong> entregas pendentes serão aprovadas.</p>
+                                )}
                             </div>
 
                             <div className="form-group">
@@ -79,13 +79,30 @@ function CiclosAdmin() {
     setMostrarFormulario(true)
   }
 
+  // A exclusão roda em segundo plano no servidor; acompanhar até terminar
+  const acompanharExclusao = async (id) => {
+    let exclusao = null
+    do {
+      await new Promise(resolve => setTimeout(resolve, 2000))
+      exclusao = await ciclosAPI.getExclusao(id)
+    } while (exclusao.status === 'pendente' || exclusao.status === 'em_andamento')
+
+    if (exclusao.status === 'concluida') {
+      success(`Ciclo "${exclusao.ciclo_nome}" excluído com sucesso!`)
+    } else {
+      showError(`Falha ao excluir o ciclo "${exclusao.ciclo_nome}". Tente novamente.`)
+    }
+    await loadCiclos()
+  }
+
   const handleExcluir = async (id) => {
     if (window.confirm('Tem certeza que deseja excluir este ciclo?')) {
       try {
         setError(null)
         await ciclosAPI.delete(id)
-        success('Ciclo excluído com sucesso!')
+        success('Exclusão do ciclo iniciada. Os dados serão removidos em segundo plano.')
         await loadCiclos()
+        await acompanharExclusao(id)
       } catch (err) {
         const { message } = handleApiError(err, 'excluir ciclo', '/ciclos', showError)
         setError(message)
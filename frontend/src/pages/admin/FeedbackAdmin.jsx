@@ -120,6 +120,30 @@ function FeedbackAdmin() {
     }
   }
 
+  const handleLote = async (acao) => {
+    const colaboradoresIds = colaboradoresFiltrados.map(col => col.id)
+    const verbo = acao === 'liberar' ? 'Liberar' : 'Revogar'
+    if (!window.confirm(`${verbo} o feedback de ${colaboradoresIds.length} colaborador(es)?`)) {
+      return
+    }
+
+    try {
+      setLoading(true)
+      const lote = acao === 'liberar' ? feedbackLiberacaoAPI.liberarLote : feedbackLiberacaoAPI.revogarLote
+      const resultado = await lote(cicloSelecionado.id, { colaboradores_ids: colaboradoresIds })
+      showSuccess(
+        acao === 'liberar'
+          ? `${resultado.alterados} feedback(s) liberado(s), ${resultado.sem_alteracao} já liberado(s)`
+          : `${resultado.alterados} feedback(s) revogado(s), ${resultado.sem_alteracao} sem liberação`
+      )
+      await loadDados()
+    } catch (err) {
+      handleApiError(err, `${acao} feedback em lote`, '/feedback-liberacao', showError)
+    } finally {
+      setLoading(false)
+    }
+  }
+
   // Criar mapa de liberações por colaborador
   const liberacoesMap = liberacoes.reduce((map, lib) => {
     map[lib.colaborador_id] = lib
@@ -205,6 +229,16 @@ function FeedbackAdmin() {
               : 'Selecione um ciclo na etapa de feedback'}
           </p>
         </div>
+        {cicloSelecionado && colaboradoresFiltrados.length > 1 && (
+          <div style={{ display: 'flex', gap: '8px' }}>
+            <button className="adicionar-button" onClick={() => handleLote('liberar')} disabled={loading}>
+              ✓ Liberar filtrados
+            </button>
+            <button className="adicionar-button" onClick={() => handleLote('revogar')} disabled={loading}>
+              ✕ Revogar filtrados
+            </button>
+          </div>
+        )}
       </div>
 
       {error && (
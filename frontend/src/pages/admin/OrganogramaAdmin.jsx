@@ -5,7 +5,7 @@ import EstadoVazio from '../../components/EstadoVazio'
 import MensagemErro from '../../components/MensagemErro'
 import { PERFIL_COLABORADOR, PERFIL_GESTOR, PERFIL_LIDER, getPerfilLabel } from '../../constants/perfis'
 import { useToast } from '../../contexts/ToastContext'
-import { colaboradoresAPI } from '../../services/api'
+import { organogramaAPI } from '../../services/api'
 import { handleApiError } from '../../utils/errorHandler'
 import './Organograma.css'
 
@@ -25,11 +25,16 @@ function classePerfil(perfil) {
   return 'colaborador'
 }
 
-// Nó recursivo da árvore. `ancestrais` evita loops caso a hierarquia tenha ciclos.
-function NoOrganograma({ colaborador, filhosPorGestor, ancestrais }) {
-  const filhos = (filhosPorGestor.get(colaborador.id) || []).filter(
-    (f) => !ancestrais.has(f.id)
-  )
+// Ordena cada nível da árvore recebida do backend
+function ordenarArvore(nos) {
+  return [...nos]
+    .sort(ordenar)
+    .map((no) => ({ ...no, filhos: ordenarArvore(no.filhos || []) }))
+}
+
+// Nó recursivo da árvore (o backend já corta ciclos na hierarquia)
+function NoOrganograma({ colaborador }) {
+  const filhos = colaborador.filhos
   const variante = classePerfil(colaborador.perfil)
 
   return (
@@ -45,12 +50,7 @@ function NoOrganograma({ colaborador, filhosPorGestor, ancestrais }) {
       {filhos.length > 0 && (
         <ul>
           {filhos.map((filho) => (
-            <NoOrganograma
-              key={filho.id}
-              colaborador={filho}
-              filhosPorGestor={filhosPorGestor}
-              ancestrais={new Set([...ancestrais, colaborador.id])}
-            />
+            <NoOrganograma key={filho.id} colaborador={filho} />
           ))}
         </ul>
       )}
@@ -60,49 +60,29 @@ function NoOrganograma({ colaborador, filhosPorGestor, ancestrais }) {
 
 function OrganogramaAdmin() {
   const { error: showError } = useToast()
-  const [colaboradores, setColaboradores] = useState([])
+  const [organograma, setOrganograma] = useState({ raizes: [], total: 0 })
   const [loading, setLoading] = useState(true)
   const [error, setError] = useState(null)
 
   useEffect(() => {
-    loadColaboradores()
+    loadOrganograma()
   }, [])
 
-  const loadColaboradores = async () => {
+  const loadOrganograma = async () => {
     try {
       setLoading(true)
       setError(null)
-      const response = await colaboradoresAPI.getAll()
-      setColaboradores(response.colaboradores || [])
+      const response = await organogramaAPI.get()
+      setOrganograma({ raizes: response.raizes || [], total: response.total || 0 })
     } catch (err) {
-      const { message } = handleApiError(err, 'carregar organograma', '/colaboradores', showError)
+      const { message } = handleApiError(err, 'carregar organograma', '/organograma', showError)
       setError(message)
     } finally {
       setLoading(false)
     }
   }
 
-  // Monta a hierarquia: raízes (topo ou sem gestor no conjunto) e filhos por gestor.
-  const { raizes, filhosPorGestor } = useMemo(() => {
-    const porId = new Map(colaboradores.map((c) => [c.id, c]))
-    const filhos = new Map()
-    const topo = []
-
-    for (const c of colaboradores) {
-      const gestorId = c.gestor_id
-      if (gestorId != null && porId.has(gestorId)) {
-        if (!filhos.has(gestorId)) filhos.set(gestorId, [])
-        filhos.get(gestorId).push(c)
-      } else {
-        topo.push(c)
-      }
-    }
-
-    filhos.forEach((lista) => lista.sort(ordenar))
-    topo.sort(ordenar)
-
-    return { raizes: topo, filhosPorGestor: filhos }
-  }, [colaboradores])
+  const raizes = useMemo(() => ordenarArvore(organograma.raizes), [organograma])
 
   return (
     <>
@@ -129,7 +109,7 @@ function OrganogramaAdmin() {
           Colaborador
         </span>
         <span className="organograma-legenda-item" style={{ marginLeft: 'auto' }}>
-          {colaboradores.length} colaboradores
+          {organograma.total} colaboradores
         </span>
       </div>
 
@@ -144,12 +124,7 @@ function OrganogramaAdmin() {
           <div className="org-tree">
             <ul>
               {raizes.map((raiz) => (
-                <NoOrganograma
-                  key={raiz.id}
-                  colaborador={raiz}
-                  filhosPorGestor={filhosPorGestor}
-                  ancestrais={new Set()}
-                />
+                <NoOrganograma key={raiz.id} colaborador={raiz} />
               ))}
             </ul>
           </div>
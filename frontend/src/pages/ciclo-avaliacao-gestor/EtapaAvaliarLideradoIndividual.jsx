@@ -1,5 +1,6 @@
 import { useEffect, useState } from 'react'
 import { useToast } from '../../contexts/ToastContext'
+import { useRascunho } from '../../hooks/useRascunho'
 import { avaliacoesAPI, eixosAvaliacaoAPI } from '../../services/api'
 import { handleApiError } from '../../utils/errorHandler'
 import '../CicloAvaliacao.css'
@@ -13,6 +14,10 @@ function EtapaAvaliarLideradoIndividual({ colaboradorId, cicloAberto, lideradoSe
   })
   const [loading, setLoading] = useState(true)
   const [salvando, setSalvando] = useState(false)
+  const chaveRascunho = cicloAberto && lideradoSendoAvaliado
+    ? `avaliacao-liderado:ciclo-${cicloAberto.id}:liderado-${lideradoSendoAvaliado.id}`
+    : null
+  const { carregarRascunho, descartarRascunho } = useRascunho(chaveRascunho, avaliacao)
 
   useEffect(() => {
     if (lideradoSendoAvaliado) {
@@ -75,6 +80,12 @@ function EtapaAvaliarLideradoIndividual({ colaboradorId, cicloAberto, lideradoSe
     } catch (error) {
       handleApiError(error, 'carregar avaliação existente', '/avaliacoes', showError)
     }
+
+    // Rascunho salvo automaticamente tem prioridade sobre a versão enviada
+    const rascunho = await carregarRascunho()
+    if (rascunho) {
+      setAvaliacao(rascunho)
+    }
   }
 
   const handleSelecionarNivel = (eixoId, nivel) => {
@@ -188,6 +199,7 @@ function EtapaAvaliarLideradoIndividual({ colaboradorId, cicloAberto, lideradoSe
             throw createError
           }
         }
+        descartarRascunho()
       } catch (error) {
         handleApiError(error, 'salvar avaliação do liderado', '/avaliacoes', showError)
       } finally {
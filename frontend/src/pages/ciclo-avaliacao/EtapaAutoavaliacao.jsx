@@ -1,5 +1,6 @@
 import { useEffect, useState } from 'react'
 import { useToast } from '../../contexts/ToastContext'
+import { useRascunho } from '../../hooks/useRascunho'
 import { avaliacoesAPI, eixosAvaliacaoAPI } from '../../services/api'
 import { handleApiError } from '../../utils/errorHandler'
 import '../CicloAvaliacao.css'
@@ -13,6 +14,8 @@ function EtapaAutoavaliacao({ colaboradorId, cicloAberto, onFinalizado, onVoltar
   })
   const [loading, setLoading] = useState(true)
   const [salvando, setSalvando] = useState(false)
+  const chaveRascunho = cicloAberto ? `autoavaliacao:ciclo-${cicloAberto.id}` : null
+  const { carregarRascunho, descartarRascunho } = useRascunho(chaveRascunho, autoavaliacao)
 
   useEffect(() => {
     loadEixosAvaliacao()
@@ -72,6 +75,12 @@ function EtapaAutoavaliacao({ colaboradorId, cicloAberto, onFinalizado, onVoltar
     } catch (error) {
       handleApiError(error, 'carregar autoavaliação existente', '/avaliacoes', showError)
     }
+
+    // Rascunho salvo automaticamente tem prioridade sobre a versão enviada
+    const rascunho = await carregarRascunho()
+    if (rascunho) {
+      setAutoavaliacao(rascunho)
+    }
   }
 
   const handleSelecionarNivel = (eixoId, nivel) => {
@@ -182,6 +191,7 @@ function EtapaAutoavaliacao({ colaboradorId, cicloAberto, onFinalizado, onVoltar
             throw createError
           }
         }
+        descartarRascunho()
       } catch (error) {
         handleApiError(error, 'salvar autoavaliação', '/avaliacoes', showError)
       } finally {
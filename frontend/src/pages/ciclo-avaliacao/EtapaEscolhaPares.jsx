@@ -6,52 +6,60 @@ import { handleApiError } from '../../utils/errorHandler'
 import '../CicloAvaliacao.css'
 
 const NUMERO_PARES = 2
+const BUSCA_ATRASO_MS = 250
+const BUSCA_LIMITE = 20
 
 function EtapaEscolhaPares({ colaboradorId, cicloAberto, cicloAtivo, onParesSalvos, onVoltar }) {
   const { success, error: showError, warning, info } = useToast()
   const [colaboradores, setColaboradores] = useState([])
   const [paresSelecionados, setParesSelecionados] = useState([])
-  const [loading, setLoading] = useState(true)
+  const [termoBusca, setTermoBusca] = useState('')
+  const [buscando, setBuscando] = useState(false)
   const [salvando, setSalvando] = useState(false)
 
   useEffect(() => {
-    loadColaboradores()
-    loadParesSalvos()
+    // O ciclo de avaliação já traz os dados dos pares selecionados
+    if (cicloAtivo?.pares_selecionados) {
+      setParesSelecionados(
+        cicloAtivo.pares_selecionados
+          .filter(ps => ps.par)
+          .map(ps => ps.par)
+      )
+    }
   }, [cicloAtivo, cicloAberto])
 
-  const loadParesSalvos = async () => {
-    if (cicloAtivo?.pares_selecionados) {
-      try {
-        // Buscar os dados completos dos colaboradores
-        const response = await colaboradoresAPI.getAll()
-        const todosColaboradores = response.colaboradores || []
+  // Busca no servidor enquanto o usuário digita, em vez de carregar todos os colaboradores
+  useEffect(() => {
+    const termo = termoBusca.trim()
+    if (!termo) {
+      setColaboradores([])
+      return
+    }
 
-        const paresIds = cicloAtivo.pares_selecionados.map(ps => ps.par_id || ps.par?.id)
-        const pares = todosColaboradores.filter(c => paresIds.includes(c.id))
-        setParesSelecionados(pares)
+    let cancelada = false
+    const timer = setTimeout(async () => {
+      setBuscando(true)
+      try {
+        const response = await colaboradoresAPI.busca(termo, BUSCA_LIMITE)
+        if (!cancelada) {
+          setColaboradores(response.colaboradores || [])
+        }
       } catch (error) {
-        console.error('Erro ao carregar pares salvos:', error)
-        // Fallback: usar dados do cicloAtivo se disponível
-        if (cicloAtivo.pares_selecionados) {
-          const pares = cicloAtivo.pares_selecionados
-            .filter(ps => ps.par)
-            .map(ps => ps.par)
-          setParesSelecionados(pares)
+        if (!cancelada) {
+          handleApiError(error, 'buscar colaboradores', '/colaboradores/busca', showError)
+        }
+      } finally {
+        if (!cancelada) {
+          setBuscando(false)
         }
       }
-    }
-  }
+    }, BUSCA_ATRASO_MS)
 
-  const loadColaboradores = async () => {
-    try {
-      const response = await colaboradoresAPI.getAll()
-      setColaboradores(response.colaboradores || [])
-    } catch (error) {
-      handleApiError(error, 'carregar colaboradores', '/colaboradores', showError)
-    } finally {
-      setLoading(false)
+    return () => {
+      cancelada = true
+      clearTimeout(timer)
     }
-  }
+  }, [termoBusca])
 
   // Verificar se está na etapa de aprovação de pares
   const isAprovacaoPares = cicloAberto?.etapa_atual === 'aprovacao_pares'
@@ -122,10 +130,6 @@ function EtapaEscolhaPares({ colaboradorId, cicloAberto, cicloAtivo, onParesSalv
     }
   }
 
-  if (loading) {
-    return <div>Carregando colaboradores...</div>
-  }
-
   return (
     <>
       <div className="ciclo-header">
@@ -187,6 +191,18 @@ function EtapaEscolhaPares({ colaboradorId, cicloAberto, cicloAtivo, onParesSalv
 
       <div className="colaboradores-section">
         <h3 className="colaboradores-title">Colaboradores Disponíveis</h3>
+        <input
+          type="search"
+          className="busca-colaboradores-input"
+          placeholder="Busque por nome, email, cargo ou departamento"
+          value={termoBusca}
+          onChange={(e) => setTermoBusca(e.target.value)}
+          disabled={isAprovacaoPares}
+        />
+        {buscando && <p className="busca-colaboradores-status">Buscando...</p>}
+        {!buscando && termoBusca.trim() && colaboradores.length === 0 && (
+          <p className="busca-colaboradores-status">Nenhum colaborador encontrado</p>
+        )}
         <div className="colaboradores-grid">
           {colaboradores.filter(c => c.id !== colaboradorId).map((colaborador) => {
             const isSelecionado = paresSelecionados.find(p => p.id === colaborador.id)
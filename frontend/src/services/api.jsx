@@ -1,3 +1,4 @@
+import { decodeMsgpack } from '../utils/msgpack'
 import { clearSession, getAuthToken } from '../utils/storage'
 
 // Configuração da API
@@ -9,12 +10,12 @@ async function request(endpoint, options = {}) {
   const token = getAuthToken()
 
   const config = {
+    ...options,
     headers: {
       'Content-Type': 'application/json',
       ...(token && { 'Authorization': `Bearer ${token}` }),
       ...options.headers,
     },
-    ...options,
   }
 
   try {
@@ -40,12 +41,56 @@ async function request(endpoint, options = {}) {
       return null
     }
 
+    // Respostas em MessagePack (ver requestCompacto)
+    if (response.headers.get('Content-Type')?.includes('application/msgpack')) {
+      return decodeMsgpack(await response.arrayBuffer())
+    }
+
     return await response.json()
   } catch (error) {
     throw error
   }
 }
 
+// GET de agregados e listagens de admin pedindo MessagePack, mais compacto e
+// rápido de decodificar que JSON; o servidor responde em JSON se não puder.
+// A compressão (gzip/br) é negociada e desfeita pelo próprio navegador
+function requestCompacto(endpoint, options = {}) {
+  return request(endpoint, {
+    ...options,
+    headers: { 'Accept': 'application/msgpack, application/json;q=0.9', ...options.headers },
+  })
+}
+
+function gerarChaveIdempotencia() {
+  if (window.crypto?.randomUUID) {
+    return window.crypto.randomUUID()
+  }
+  return `${Date.now()}-${Math.random().toString(36).slice(2)}`
+}
+
+// Requisição de criação com Idempotency-Key: as retentativas após falha de rede
+// reutilizam a mesma chave e o servidor devolve a resposta original
+async function requestIdempotente(endpoint, options = {}, tentativas = 3) {
+  const chave = gerarChaveIdempotencia()
+
+  for (let tentativa = 1; ; tentativa++) {
+    try {
+      return await request(endpoint, {
+        ...options,
+        headers: { 'Idempotency-Key': chave, ...options.headers },
+      })
+    } catch (error) {
+      // Repetir apenas falhas sem resposta HTTP e requisições ainda em processamento (409)
+      const repetir = error.status === undefined || error.status === 409
+      if (!repetir || tentativa >= tentativas) {
+        throw error
+      }
+      await new Promise(resolve => setTimeout(resolve, 500 * tentativa))
+    }
+  }
+}
+
 // API de Autenticação
 export const authAPI = {
   googleLogin: (googleToken) => request('/auth/google', {
@@ -61,6 +106,10 @@ export const colaboradoresAPI = {
     const queryParams = new URLSearchParams(params).toString()
     return request(`/colaboradores?${queryParams}`)
   },
+  busca: (termo, limit = 10) => {
+    const queryParams = new URLSearchParams({ q: termo, limit }).toString()
+    return request(`/colaboradores/busca?${queryParams}`)
+  },
   getById: (id) => request(`/colaboradores/${id}`),
   getLiderados: (id) => request(`/colaboradores/${id}/liderados`),
   create: (data) => request('/colaboradores', {
@@ -77,6 +126,13 @@ export const colaboradoresAPI = {
   }),
 }
 
+// API do Organograma (árvore montada no backend)
+export const organogramaAPI = {
+  get: () => request('/organograma'),
+  getSubarvore: (colaboradorId) => request(`/organograma/${colaboradorId}`),
+  getGestores: (colaboradorId) => request(`/organograma/${colaboradorId}/gestores`),
+}
+
 // API de Eixos de Avaliação
 export const eixosAvaliacaoAPI = {
   getAll: () => request('/eixos-avaliacao'),
@@ -97,7 +153,7 @@ export const ciclosAPI = {
   },
   getById: (id) => request(`/ciclos/${id}`),
   getAtivoAberto: () => request('/ciclos/ativo/aberto'),
-  getAcompanhamento: (cicloId) => request(`/ciclos/${cicloId}/acompanhamento`),
+  getAcompanhamento: (cicloId) => requestCompacto(`/ciclos/${cicloId}/acompanhamento`),
   create: (data) => request('/ciclos', {
     method: 'POST',
     body: JSON.stringify(data),
@@ -112,6 +168,7 @@ export const ciclosAPI = {
   delete: (id) => request(`/ciclos/${id}`, {
     method: 'DELETE',
   }),
+  getExclusao: (id) => request(`/ciclos/${id}/exclusao`),
 }
 
 // API de Ciclos de Avaliação
@@ -141,7 +198,7 @@ export const avaliacoesAPI = {
     return request(`/avaliacoes?${queryParams}`)
   },
   getById: (id) => request(`/avaliacoes/${id}`),
-  create: (data) => request('/avaliacoes', {
+  create: (data) => requestIdempotente('/avaliacoes/', {
     method: 'POST',
     body: JSON.stringify(data),
   }),
@@ -150,10 +207,10 @@ export const avaliacoesAPI = {
     body: JSON.stringify(data),
   }),
   getFeedback: (cicloId) => request(`/avaliacoes/ciclo/${cicloId}/feedback`),
-  getFeedbackAdmin: (colaboradorId, cicloId) => request(`/avaliacoes/admin/colaborador/${colaboradorId}/ciclo/${cicloId}/feedback`),
+  getFeedbackAdmin: (colaboradorId, cicloId) => requestCompacto(`/avaliacoes/admin/colaborador/${colaboradorId}/ciclo/${cicloId}/feedback`),
   getAvaliacoesColaboradorAdmin: (colaboradorId, cicloId = null) => {
     const params = cicloId ? `?ciclo_id=${cicloId}` : ''
-    return request(`/avaliacoes/admin/colaborador/${colaboradorId}${params}`)
+    return requestCompacto(`/avaliacoes/admin/colaborador/${colaboradorId}${params}`)
   },
 }
 
@@ -164,7 +221,7 @@ export const entregasOutstandingAPI = {
     return request(`/entregas-outstanding?${queryParams}`)
   },
   getById: (id) => request(`/entregas-outstanding/${id}`),
-  create: (colaboradorId, data) => request(`/entregas-outstanding?colaborador_id=${colaboradorId}`, {
+  create: (colaboradorId, data) => requestIdempotente(`/entregas-outstanding/?colaborador_id=${colaboradorId}`, {
     method: 'POST',
     body: JSON.stringify(data),
   }),
@@ -175,7 +232,7 @@ export const entregasOutstandingAPI = {
   delete: (id) => request(`/entregas-outstanding/${id}`, {
     method: 'DELETE',
   }),
-  getAdminPendentes: () => request('/entregas-outstanding/admin/pendentes'),
+  getAdminPendentes: () => requestCompacto('/entregas-outstanding/admin/pendentes'),
   aprovar: (entregaId, data = {}) => request(`/entregas-outstanding/${entregaId}/aprovar`, {
     method: 'POST',
     body: JSON.stringify(data),
@@ -184,6 +241,14 @@ export const entregasOutstandingAPI = {
     method: 'POST',
     body: JSON.stringify(data),
   }),
+  aprovarLote: (data) => request('/entregas-outstanding/admin/aprovar-lote', {
+    method: 'POST',
+    body: JSON.stringify(data),
+  }),
+  reprovarLote: (data) => request('/entregas-outstanding/admin/reprovar-lote', {
+    method: 'POST',
+    body: JSON.stringify(data),
+  }),
 }
 
 // API de Valores
@@ -199,7 +264,7 @@ export const registrosValorAPI = {
     return request(`/registros-valor?${queryParams}`)
   },
   getById: (id) => request(`/registros-valor/${id}`),
-  create: (colaboradorId, data) => request(`/registros-valor?colaborador_id=${colaboradorId}`, {
+  create: (colaboradorId, data) => requestIdempotente(`/registros-valor/?colaborador_id=${colaboradorId}`, {
     method: 'POST',
     body: JSON.stringify(data),
   }),
@@ -210,7 +275,7 @@ export const registrosValorAPI = {
   delete: (id) => request(`/registros-valor/${id}`, {
     method: 'DELETE',
   }),
-  getAdminPendentes: () => request('/registros-valor/admin/pendentes'),
+  getAdminPendentes: () => requestCompacto('/registros-valor/admin/pendentes'),
   aprovar: (registroId, data = {}) => request(`/registros-valor/${registroId}/aprovar`, {
     method: 'POST',
     body: JSON.stringify(data),
@@ -219,6 +284,14 @@ export const registrosValorAPI = {
     method: 'POST',
     body: JSON.stringify(data),
   }),
+  aprovarLote: (data) => request('/registros-valor/admin/aprovar-lote', {
+    method: 'POST',
+    body: JSON.stringify(data),
+  }),
+  reprovarLote: (data) => request('/registros-valor/admin/reprovar-lote', {
+    method: 'POST',
+    body: JSON.stringify(data),
+  }),
 }
 
 // API de Avaliações de Gestor (colaborador avalia gestor)
@@ -240,10 +313,22 @@ export const avaliacoesGestorAPI = {
   // Admin: buscar avaliações que os liderados fizeram de um gestor
   getAvaliacoesGestorAdmin: (gestorId, cicloId = null) => {
     const params = cicloId ? `?ciclo_id=${cicloId}` : ''
-    return request(`/avaliacoes-gestor/admin/gestor/${gestorId}${params}`)
+    return requestCompacto(`/avaliacoes-gestor/admin/gestor/${gestorId}${params}`)
   },
   // Admin: buscar feedback de gestor (similar ao endpoint acima, específico para ciclo)
-  getFeedbackGestorAdmin: (gestorId, cicloId) => request(`/avaliacoes-gestor/admin/gestor/${gestorId}/ciclo/${cicloId}/feedback`),
+  getFeedbackGestorAdmin: (gestorId, cicloId) => requestCompacto(`/avaliacoes-gestor/admin/gestor/${gestorId}/ciclo/${cicloId}/feedback`),
+}
+
+// API de Rascunhos de formulário (autosave)
+export const rascunhosAPI = {
+  get: (chave) => request(`/rascunhos/${encodeURIComponent(chave)}`),
+  salvar: (chave, conteudo, { imediato = false } = {}) => request(`/rascunhos/${encodeURIComponent(chave)}${imediato ? '?imediato=true' : ''}`, {
+    method: 'PUT',
+    body: JSON.stringify({ conteudo }),
+  }),
+  descartar: (chave) => request(`/rascunhos/${encodeURIComponent(chave)}`, {
+    method: 'DELETE',
+  }),
 }
 
 // API de Liberação de Feedback
@@ -255,5 +340,13 @@ export const feedbackLiberacaoAPI = {
   revogar: (cicloId, colaboradorId) => request(`/feedback-liberacao/ciclo/${cicloId}/colaborador/${colaboradorId}/revogar`, {
     method: 'POST',
   }),
+  liberarLote: (cicloId, data) => request(`/feedback-liberacao/ciclo/${cicloId}/liberar-lote`, {
+    method: 'POST',
+    body: JSON.stringify(data),
+  }),
+  revogarLote: (cicloId, data) => request(`/feedback-liberacao/ciclo/${cicloId}/revogar-lote`, {
+    method: 'POST',
+    body: JSON.stringify(data),
+  }),
 }
 
@@ -0,0 +1,92 @@
+/**
+ * Decodificador de MessagePack (https://msgpack.org) para as respostas da API
+ *
+ * O backend converte as respostas JSON das rotas de admin e do acompanhamento
+ * para MessagePack quando o cliente pede (Accept: application/msgpack). Como o
+ * conteúdo vem de JSON, só aparecem os tipos equivalentes: nil, bool, inteiros,
+ * floats, strings, arrays e mapas (bin é aceito por completude; ext não).
+ */
+
+const textDecoder = new TextDecoder()
+
+/**
+ * Decodifica um corpo MessagePack
+ * @param {ArrayBuffer} buffer - Corpo da resposta
+ * @returns {*} Valor decodificado, no mesmo formato que response.json() retornaria
+ */
+export function decodeMsgpack(buffer) {
+  const view = new DataView(buffer)
+  const bytes = new Uint8Array(buffer)
+  let offset = 0
+
+  const readString = (length) => {
+    const value = textDecoder.decode(bytes.subarray(offset, offset + length))
+    offset += length
+    return value
+  }
+
+  const readBinary = (length) => {
+    const value = bytes.slice(offset, offset + length)
+    offset += length
+    return value
+  }
+
+  const readArray = (length) => {
+    const value = new Array(length)
+    for (let i = 0; i < length; i++) {
+      value[i] = read()
+    }
+    return value
+  }
+
+  const readMap = (length) => {
+    const value = {}
+    for (let i = 0; i < length; i++) {
+      const key = read()
+      value[key] = read()
+    }
+    return value
+  }
+
+  const read = () => {
+    const byte = view.getUint8(offset++)
+    let value
+
+    // Formatos de tamanho fixo no próprio byte
+    if (byte <= 0x7f) return byte
+    if (byte >= 0xe0) return byte - 0x100
+    if (byte >= 0xa0 && byte <= 0xbf) return readString(byte & 0x1f)
+    if (byte >= 0x90 && byte <= 0x9f) return readArray(byte & 0x0f)
+    if (byte >= 0x80 && byte <= 0x8f) return readMap(byte & 0x0f)
+
+    switch (byte) {
+      case 0xc0: return null
+      case 0xc2: return false
+      case 0xc3: return true
+      case 0xc4: value = view.getUint8(offset); offset += 1; return readBinary(value)
+      case 0xc5: value = view.getUint16(offset); offset += 2; return readBinary(value)
+      case 0xc6: value = view.getUint32(offset); offset += 4; return readBinary(value)
+      case 0xca: value = view.getFloat32(offset); offset += 4; return value
+      case 0xcb: value = view.getFloat64(offset); offset += 8; return value
+      case 0xcc: value = view.getUint8(offset); offset += 1; return value
+      case 0xcd: value = view.getUint16(offset); offset += 2; return value
+      case 0xce: value = view.getUint32(offset); offset += 4; return value
+      case 0xcf: value = Number(view.getBigUint64(offset)); offset += 8; return value
+      case 0xd0: value = view.getInt8(offset); offset += 1; return value
+      case 0xd1: value = view.getInt16(offset); offset += 2; return value
+      case 0xd2: value = view.getInt32(offset); offset += 4; return value
+      case 0xd3: value = Number(view.getBigInt64(offset)); offset += 8; return value
+      case 0xd9: value = view.getUint8(offset); offset += 1; return readString(value)
+      case 0xda: value = view.getUint16(offset); offset += 2; return readString(value)
+      case 0xdb: value = view.getUint32(offset); offset += 4; return readString(value)
+      case 0xdc: value = view.getUint16(offset); offset += 2; return readArray(value)
+      case 0xdd: value = view.getUint32(offset); offset += 4; return readArray(value)
+      case 0xde: value = view.getUint16(offset); offset += 2; return readMap(value)
+      case 0xdf: value = view.getUint32(offset); offset += 4; return readMap(value)
+      default:
+        throw new Error(`MessagePack: tipo 0x${byte.toString(16)} não suportado`)
+    }
+  }
+
+  return read()
+}